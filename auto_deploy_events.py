@@ -1,8 +1,11 @@
 import subprocess
-import json
 import os
 from datetime import datetime
 
+from event_json import load_file
+from event_table import EventTable
+from institution_aliases import canonicalize_events
+
 EVENT_FILES = ["cultural_events.json", "csv_based_events.json"]
 
 def detect_events_file():
@@ -12,27 +15,26 @@ def detect_events_file():
             return fname
     return None
 
-def load_events_from_file():
-    """Load events from whichever JSON file is available."""
-    events_file = detect_events_file()
+def load_events_from_file(events_file=None):
+    """Load events from the given file, or whichever JSON file is available."""
+    events_file = events_file or detect_events_file()
     if not events_file:
         print("❌ No events file found.")
         return []
 
     try:
-        with open(events_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_file(events_file)
         print(f"🔍 Loaded {events_file}. Type: {type(data)}")
         
         # Handle both old format (array) and new format (object with events)
         if isinstance(data, list):
             print(f"📊 Found array format with {len(data)} events")
-            return data
+            return canonicalize_events(data)
         elif isinstance(data, dict):
             if 'events' in data:
                 events = data['events']
                 print(f"📊 Found object format with {len(events)} events")
-                return events
+                return canonicalize_events(events)
             else:
                 print(f"❌ Dictionary format but no 'events' key. Keys: {list(data.keys())}")
                 return []
@@ -172,6 +174,34 @@ if __name__ == "__main__":
         f.write(react_integration_code)
     print("✅ Created react_integration.py")
 
+def integrate_with_react():
+    """Write the detected events file into App.js via react_integration.py"""
+    if not os.path.exists('react_integration.py'):
+        print("❌ react_integration.py not found. Creating it...")
+        create_react_integration_script()
+    
+    print("⚛️ Integrating events with React app...")
+    try:
+        result = subprocess.run(['python', 'react_integration.py'], 
+                              capture_output=True, text=True, timeout=60)
+        
+        if result.returncode == 0:
+            print("✅ React integration successful!")
+            if result.stdout.strip():
+                print(f"   Output: {result.stdout.strip()}")
+            return True
+        
+        print(f"❌ React integration failed:")
+        print(f"   Error: {result.stderr}")
+        return False
+            
+    except subprocess.TimeoutExpired:
+        print("❌ React integration timed out")
+        return False
+    except Exception as e:
+        print(f"❌ Error running React integration: {e}")
+        return False
+
 def auto_deploy_scraped_events():
     """Automatically integrate scraped events and deploy to GitHub"""
     
@@ -193,18 +223,13 @@ def auto_deploy_scraped_events():
     
     print(f"📊 Found {len(events)} events to deploy")
     
-    # Count events by institution - with proper error handling
-    institution_counts = {}
-    valid_events = 0
+    # Count events by institution - non-dict entries are skipped by the table
+    table = EventTable(events)
+    for i, event in table.skipped:
+        print(f"⚠️ Warning: Event at index {i} is not a dictionary: {type(event)} - {str(event)[:100]}")
     
-    for i, event in enumerate(events):
-        if not isinstance(event, dict):
-            print(f"⚠️ Warning: Event at index {i} is not a dictionary: {type(event)} - {str(event)[:100]}")
-            continue
-            
-        museum = event.get('museum', 'unknown')
-        institution_counts[museum] = institution_counts.get(museum, 0) + 1
-        valid_events += 1
+    institution_counts = table.count_by('museum')
+    valid_events = len(table)
     
     print(f"✅ Found {valid_events} valid events")
     
@@ -215,66 +240,68 @@ def auto_deploy_scraped_events():
     
     print("\n" + "=" * 60)
     
-    # Step 1: Check if React integration script exists
-    if not os.path.exists('react_integration.py'):
-        print("❌ react_integration.py not found. Creating it...")
-        create_react_integration_script()
-    
-    # Step 2: Run React integration
-    print("⚛️ Integrating events with React app...")
-    try:
-        result = subprocess.run(['python', 'react_integration.py'], 
-                              capture_output=True, text=True, timeout=60)
-        
-        if result.returncode == 0:
-            print("✅ React integration successful!")
-            if result.stdout.strip():
-                print(f"   Output: {result.stdout.strip()}")
-        else:
-            print(f"❌ React integration failed:")
-            print(f"   Error: {result.stderr}")
-            return False
-            
-    except subprocess.TimeoutExpired:
-        print("❌ React integration timed out")
-        return False
-    except Exception as e:
-        print(f"❌ Error running React integration: {e}")
+    # Steps 1-2: Create the React integration script if needed and run it
+    if not integrate_with_react():
         return False
     
-    # Step 3: Check git status
-    print("\n📦 Checking git status...")
-    try:
-        result = subprocess.run(['git', 'status', '--porcelain'], 
-                              capture_output=True, text=True, check=True)
-        
+    # Step 2b: Merge into the month-partitioned archive the frontend reads
+    from event_archive import write_archive
+    written, unchanged = write_archive(events)
+    print(f"📚 Archive: {len(written)} partitions updated, {len(unchanged)} unchanged")
+    
+    # Step 2c: Publish a feed version so cached browsers fetch only the patch
+    from event_feed import publish_feed
+    feed = publish_feed(events)
+    if feed:
+        print(f"📡 Feed version {feed['version']} published")
+    
+    # Step 2d: Precompute the query shards the site's filters fetch
+    from build_shards import build_shards
+    written, unchanged, removed = build_shards(events)
+    print(f"🧩 Shards: {len(written)} written, {len(unchanged)} unchanged, {len(removed)} removed")
+    
+    # Step 2e: Rebuild the search index the site queries
+    from search_index import write_index
+    index, written = write_index(events)
+    if written:
+        print(f"🔎 Search index: {len(index['docs'])} events, {len(index['terms'])} terms")
+    
+    # Step 3: Compare with the committed events; formatting and ids do not count
+    from event_diff import committed_events, diff_events
+
+    print("\n📦 Comparing with the deployed events...")
+    previous = committed_events(events_file)
+    if previous is None:
+        print(f"ℹ️ {events_file} is not committed yet; deploying every event")
+        previous = []
+    diff = diff_events(canonicalize_events(previous), events)
+    if diff.is_empty:
+        # The archive, feed, shards or index written above may still be new
+        try:
+            result = subprocess.run(['git', 'status', '--porcelain'],
+                                  capture_output=True, text=True, check=True, timeout=30)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            print(f"❌ Git status failed: {e}")
+            return False
         if not result.stdout.strip():
-            print("ℹ️ No changes detected. Events may already be up to date.")
+            print("ℹ️ No changes detected. Events are already up to date.")
             return True
-            
-        print("📝 Changes detected, proceeding with deployment...")
-        
-    except subprocess.CalledProcessError:
-        print("❌ Not in a git repository or git error")
-        return False
+        print("📝 No event changes, but published files changed; proceeding with deployment...")
+    else:
+        print(f"📝 {diff.summary()}, proceeding with deployment...")
+        for line in diff.describe(limit=5):
+            print(f"   {line}")
     
     # Step 4: Git add, commit, and push
     try:
         print("📦 Adding files to git...")
         subprocess.run(['git', 'add', '.'], check=True, timeout=30)
         
-        # Create detailed commit message
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        commit_message = f"""🎭 Auto-update with {len(events)} scraped cultural events
-
-📅 Scraped: {timestamp}
-�� Total Events: {len(events)}
+        commit_message = f"""{diff.commit_message()}
 🏛️ Institutions: {len(institution_counts)}
+📅 Scraped: {timestamp}
 
-📍 Event Breakdown:
-{chr(10).join([f'   • {museum.replace("_", " ").title()}: {count} events' for museum, count in institution_counts.items()])}
-
-🤖 Deployed via: Enhanced Scraper + Fixed Auto-Deploy Script
 🌐 Live Site: https://jchua003.github.io/Marcet-Society-Curated-Calendar-of-Events"""
         
         print("💾 Committing changes...")
@@ -0,0 +1,81 @@
+"""
+Benchmark the event_json codec against plain `json` across file sizes.
+
+    python bench_event_json.py --sizes 100 1000 10000 100000
+
+Events are sampled from cultural_events.json and repeated to each size.
+Reports the best of --repeat runs for load and pretty dump, per backend.
+"""
+
+import json
+import os
+import tempfile
+import time
+
+import event_json
+from auto_deploy_events import load_events_from_file
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def stdlib_load(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def stdlib_dump(data, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def run(sizes, repeat):
+    sample = load_events_from_file()
+    if not sample:
+        print("❌ No events to sample")
+        return
+
+    backends = [('json', None)]
+    if event_json.orjson is not None:
+        backends.append(('orjson', event_json.orjson))
+
+    print(f"{'events':>8} {'size':>10} {'method':<22} {'load ms':>9} {'dump ms':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'events.json')
+        for size in sizes:
+            events = [dict(sample[i % len(sample)], id=i + 1) for i in range(size)]
+            data = {'events': events, 'metadata': {'total_events': size}}
+            stdlib_dump(data, path)
+            file_size = os.path.getsize(path)
+
+            rows = [('json.load / json.dump', best_of(repeat, lambda: stdlib_load(path)),
+                     best_of(repeat, lambda: stdlib_dump(data, path)))]
+            saved = event_json.orjson
+            for name, module in backends:
+                event_json.orjson = module
+                rows.append((f'event_json ({name})', best_of(repeat, lambda: event_json.load_file(path)),
+                             best_of(repeat, lambda: event_json.dump_file(data, path))))
+            event_json.orjson = saved
+
+            for method, load_s, dump_s in rows:
+                print(f"{size:>8} {file_size:>10,} {method:<22} {load_s * 1000:>9.2f} {dump_s * 1000:>9.2f}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark event JSON loading and saving')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Precomputed query shards for the static site.
+
+GitHub Pages cannot filter events server-side, so the filters the app
+offers are precomputed as small JSON files:
+
+    frontend/public/shards/
+        manifest.json                          every shard with its count, size and hash
+        city/new-york/2025-08/lectures.json    one city, month and event type
+        institution/moma/2025-08.json          one institution and month
+
+The app reads the manifest and fetches only the shards for the selected
+city, type and institutions in the months it shows (see
+frontend/src/shardQuery.js). Only shards whose content changed are
+rewritten, and shards that no longer have events are deleted.
+
+    python build_shards.py                 # shard the current events file
+"""
+
+import hashlib
+import os
+from datetime import date, datetime
+
+from event_feed import feed_events
+from event_json import dump_file, dumps, load_file
+from slugs import slugify
+
+SHARD_DIR = os.path.join('frontend', 'public', 'shards')
+MANIFEST_NAME = 'manifest.json'
+UNDATED = 'undated'
+DEFAULT_CITY = 'New York'
+DEFAULT_TYPE = 'other'
+
+
+def event_month(event):
+    """'YYYY-MM' for an event's date, or 'undated'."""
+    try:
+        day = date.fromisoformat(event.get('date'))
+    except (TypeError, ValueError):
+        return UNDATED
+    return f'{day.year:04d}-{day.month:02d}'
+
+
+def shard_groups(events):
+    """{('city', city, month, type) | ('institution', museum, month): [events]}"""
+    groups = {}
+    for event in feed_events(events):
+        month = event_month(event)
+        city = event.get('city') or DEFAULT_CITY
+        groups.setdefault(('city', city, month, event.get('type') or DEFAULT_TYPE), []).append(event)
+        if event.get('museum'):
+            groups.setdefault(('institution', event['museum'], month), []).append(event)
+    return groups
+
+
+def shard_file(key):
+    if key[0] == 'city':
+        _, city, month, event_type = key
+        return f'city/{slugify(city)}/{month}/{slugify(event_type)}.json'
+    _, museum, month = key
+    return f'institution/{slugify(museum)}/{month}.json'
+
+
+def load_manifest(shard_dir=SHARD_DIR):
+    try:
+        return load_file(os.path.join(shard_dir, MANIFEST_NAME))
+    except (OSError, ValueError):
+        return {}
+
+
+def _existing_files(manifest):
+    files = {}
+    for months in manifest.get('by_city', {}).values():
+        for types in months.values():
+            for entry in types.values():
+                files[entry['file']] = entry
+    for months in manifest.get('by_institution', {}).values():
+        for entry in months.values():
+            files[entry['file']] = entry
+    return files
+
+
+def build_shards(events, shard_dir=SHARD_DIR):
+    """Write changed shards and the manifest. Returns (written, unchanged, removed) file lists."""
+    previous = _existing_files(load_manifest(shard_dir))
+    by_city, by_institution = {}, {}
+    written, unchanged = [], []
+
+    for key, shard_events in sorted(shard_groups(events).items()):
+        filename = shard_file(key)
+        data = dumps(shard_events)
+        entry = {
+            'file': filename,
+            'count': len(shard_events),
+            'bytes': len(data),
+            'hash': hashlib.sha256(data).hexdigest(),
+        }
+        old = previous.get(filename)
+        path = os.path.join(shard_dir, filename)
+        if old and old['hash'] == entry['hash'] and os.path.exists(path):
+            unchanged.append(filename)
+        else:
+            dump_file(shard_events, path, pretty=False)
+            written.append(filename)
+
+        if key[0] == 'city':
+            _, city, month, event_type = key
+            by_city.setdefault(city, {}).setdefault(month, {})[event_type] = entry
+        else:
+            _, museum, month = key
+            by_institution.setdefault(museum, {})[month] = entry
+
+    current = set(written) | set(unchanged)
+    removed = sorted(filename for filename in previous if filename not in current)
+    for filename in removed:
+        try:
+            os.remove(os.path.join(shard_dir, filename))
+        except OSError:
+            pass
+
+    if written or removed:
+        dump_file({
+            'version': 1,
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'total_events': sum(entry['count'] for months in by_city.values()
+                                for types in months.values() for entry in types.values()),
+            'by_city': by_city,
+            'by_institution': by_institution,
+        }, os.path.join(shard_dir, MANIFEST_NAME))
+    return written, unchanged, removed
+
+
+def main():
+    import argparse
+
+    from auto_deploy_events import load_events_from_file
+
+    parser = argparse.ArgumentParser(description='Precompute city/month/type and institution/month shards')
+    parser.add_argument('--shard-dir', default=SHARD_DIR)
+    parser.add_argument('--events-file', help='Events JSON to shard (default: detected events file)')
+    args = parser.parse_args()
+
+    events = load_events_from_file(args.events_file)
+    if not events:
+        print("❌ No events found to shard")
+        return False
+    written, unchanged, removed = build_shards(events, args.shard_dir)
+    print(f"🧩 Shards: {len(written)} written, {len(unchanged)} unchanged, {len(removed)} removed")
+    return True
+
+
+if __name__ == "__main__":
+    main()
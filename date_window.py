@@ -0,0 +1,172 @@
+"""
+Date window for a scrape run.
+
+A listing card's date is cheap to read: it is in the card text the scraper
+already has. `DateWindow.classify` reads it before anything else is
+extracted, so cards outside the window cost no title, description or link
+lookups. `HorizonScan` tracks one listing page. Calendars list events in
+date order, so after a run of cards past the end of the window, the rest
+of the page and any following pages are skipped.
+
+    window = DateWindow.from_args(args)       # --start / --end / --days
+    status, date = window.classify(card_text)  # (INSIDE, '2025-08-14')
+"""
+
+import re
+from datetime import date, datetime, timedelta
+
+DEFAULT_DAYS = 45
+# Consecutive cards past the window end before a listing counts as past it
+HORIZON_RUN = 3
+
+BEFORE = 'before'
+INSIDE = 'inside'
+AFTER = 'after'
+UNDATED = 'undated'
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+# Full names and abbreviations only: "Marketing 12" is not March 12
+_MONTH_NAME = (r'(january|february|march|april|may|june|july|august|september|october|november|december'
+               r'|jan|feb|mar|apr|jun|jul|aug|sept|sep|oct|nov|dec)\.?')
+_ISO = re.compile(r'\b(\d{4})-(\d{1,2})-(\d{1,2})\b')
+_NUMERIC = re.compile(r'\b(\d{1,2})/(\d{1,2})/(\d{4})\b')
+_MONTH_DAY = re.compile(
+    r'\b' + _MONTH_NAME + r'\s+(\d{1,2})(?:st|nd|rd|th)?\b(?:,?\s+(\d{4}))?',
+    re.IGNORECASE,
+)
+_DAY_MONTH = re.compile(
+    r'\b(\d{1,2})(?:st|nd|rd|th)?\s+' + _MONTH_NAME + r'(?!\w)(?:,?\s+(\d{4}))?\b',
+    re.IGNORECASE,
+)
+# Exhibition cards say "On view through August 31"; the date is still the one to use
+_PREFIXES = re.compile(r'\b(on view|through|ongoing|opens|closes)\b', re.IGNORECASE)
+
+
+def _as_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+class DateWindow:
+    """Inclusive [start, end] range of event dates a run collects."""
+
+    def __init__(self, start=None, end=None, days=DEFAULT_DAYS):
+        self.start = _as_date(start) if start else date.today()
+        self.end = _as_date(end) if end else self.start + timedelta(days=days)
+        if self.end < self.start:
+            raise ValueError(f'date window ends before it starts: {self.start} > {self.end}')
+
+    @classmethod
+    def from_args(cls, args):
+        return cls(args.start, args.end, args.days)
+
+    def __contains__(self, value):
+        return self.start <= _as_date(value) <= self.end
+
+    def __repr__(self):
+        return f'DateWindow({self.start.isoformat()}, {self.end.isoformat()})'
+
+    def describe(self):
+        return f"{self.start.strftime('%B %d')} - {self.end.strftime('%B %d, %Y')}"
+
+    def parse(self, text):
+        """The first date in `text`, or None.
+
+        Dates without a year are placed in the year that puts them nearest
+        the window, so a "January 10" seen in December means next January.
+        """
+        if not text:
+            return None
+        text = _PREFIXES.sub(' ', text)
+        candidates = []
+        patterns = ((_ISO, self._iso), (_NUMERIC, self._numeric),
+                    (_MONTH_DAY, self._month_day), (_DAY_MONTH, self._day_month))
+        for pattern, build in patterns:
+            match = pattern.search(text)
+            if match:
+                parsed = build(*match.groups())
+                if parsed:
+                    candidates.append((match.start(), parsed))
+        return min(candidates)[1] if candidates else None
+
+    def classify(self, text):
+        """(BEFORE | INSIDE | AFTER | UNDATED, 'YYYY-MM-DD' or None) for a card's text."""
+        parsed = self.parse(text)
+        if parsed is None:
+            return UNDATED, None
+        if parsed < self.start:
+            return BEFORE, parsed.isoformat()
+        if parsed > self.end:
+            return AFTER, parsed.isoformat()
+        return INSIDE, parsed.isoformat()
+
+    @staticmethod
+    def _iso(year, month, day):
+        return _safe_date(int(year), int(month), int(day))
+
+    @staticmethod
+    def _numeric(month, day, year):
+        return _safe_date(int(year), int(month), int(day))
+
+    def _month_day(self, month, day, year):
+        month = MONTHS[month[:3].lower()]
+        if year:
+            return _safe_date(int(year), month, int(day))
+        parsed = _safe_date(self.start.year, month, int(day))
+        # More than half a year before the window: it is next year's date
+        if parsed and parsed < self.start - timedelta(days=182):
+            parsed = _safe_date(self.start.year + 1, month, int(day))
+        return parsed
+
+    def _day_month(self, day, month, year):
+        return self._month_day(month, day, year)
+
+
+def _safe_date(year, month, day):
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+class HorizonScan:
+    """Skip counts for one listing page, and whether it has run past the window."""
+
+    def __init__(self, run=HORIZON_RUN):
+        self.run = run
+        self.counts = {BEFORE: 0, INSIDE: 0, AFTER: 0, UNDATED: 0}
+        self._after_run = 0
+
+    def record(self, status):
+        self.counts[status] += 1
+        if status == AFTER:
+            self._after_run += 1
+        elif status != UNDATED:
+            self._after_run = 0
+
+    @property
+    def past_horizon(self):
+        return self._after_run >= self.run
+
+    @property
+    def skipped(self):
+        return self.counts[BEFORE] + self.counts[AFTER] + self.counts[UNDATED]
+
+    def summary(self):
+        return (f"{self.counts[INSIDE]} in window, {self.counts[BEFORE]} before, "
+                f"{self.counts[AFTER]} after, {self.counts[UNDATED]} undated")
+
+
+def add_window_arguments(parser):
+    """--start, --end and --days options for a scraper's command line."""
+    parser.add_argument('--start', help='First event date to collect, YYYY-MM-DD (default: today)')
+    parser.add_argument('--end', help='Last event date to collect, YYYY-MM-DD (default: start + --days)')
+    parser.add_argument('--days', type=int, default=DEFAULT_DAYS,
+                        help=f'Window length when --end is not given (default: {DEFAULT_DAYS})')
@@ -5,6 +5,14 @@ from datetime import datetime
 def simple_deploy():
     print("🚀 Simple deployment to GitHub Pages...")
     
+    # Precompute the shards the site's filters fetch; the build copies them
+    from auto_deploy_events import load_events_from_file
+    from build_shards import build_shards
+    events = load_events_from_file()
+    if events:
+        written, unchanged, removed = build_shards(events)
+        print(f"🧩 Shards: {len(written)} written, {len(unchanged)} unchanged, {len(removed)} removed")
+    
     # Check if frontend builds
     print("🧪 Testing React build...")
     try:
@@ -0,0 +1,230 @@
+"""
+Pinned Chrome / ChromeDriver pair for the Selenium scrapers.
+
+`ChromeDriverManager().install()` checks versions online, and sometimes
+downloads, on every scraper start. The resolver instead finds the local
+Chrome (or Chromium) and a ChromeDriver with the same major version once,
+and pins both in scraper_output/chromedriver.json. Later starts only stat
+the two files: no subprocesses and no network. If either binary changed
+since it was pinned (say Chrome auto-updated), its version is read again
+locally, and a major-version mismatch raises DriverMismatchError with the
+paths, versions and the fix, before a browser is launched.
+
+webdriver-manager is used only when no matching local driver exists, and
+only while resolving.
+
+    python driver_resolver.py            # show (or create) the pinned pair
+    python driver_resolver.py --refresh  # rediscover after upgrading Chrome
+"""
+
+import os
+import re
+import shutil
+import subprocess
+from datetime import datetime
+
+from event_json import dump_file, load_file
+
+MANIFEST_PATH = os.path.join('scraper_output', 'chromedriver.json')
+
+# Environment overrides, checked before the well-known locations
+CHROME_ENV = 'CHROME_BINARY'
+DRIVER_ENV = 'CHROMEDRIVER'
+
+CHROME_NAMES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome')
+CHROME_PATHS = (
+    '/usr/bin/google-chrome',
+    '/opt/google/chrome/chrome',
+    '/usr/bin/chromium',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+    '/Applications/Chromium.app/Contents/MacOS/Chromium',
+)
+DRIVER_PATHS = (
+    '/usr/bin/chromedriver',
+    '/usr/lib/chromium/chromedriver',
+    '/usr/lib/chromium-browser/chromedriver',
+    '/opt/homebrew/bin/chromedriver',
+)
+
+VERSION_RE = re.compile(r'(\d+)\.(\d+)\.(\d+)(?:\.(\d+))?')
+
+
+class DriverResolutionError(RuntimeError):
+    """No usable Chrome or ChromeDriver could be found."""
+
+
+class DriverMismatchError(DriverResolutionError):
+    """Chrome and the pinned ChromeDriver have different major versions."""
+
+
+def binary_version(path):
+    """Version string reported by `path --version`, or None."""
+    try:
+        result = subprocess.run([path, '--version'], capture_output=True, text=True, timeout=15)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_RE.search(result.stdout or result.stderr)
+    return match.group(0) if match else None
+
+
+def major(version):
+    return int(version.split('.')[0]) if version else None
+
+
+def _fingerprint(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _candidates(env, names, paths):
+    seen = []
+    for path in [os.environ.get(env)] + [shutil.which(name) for name in names] + list(paths):
+        if path and path not in seen and os.path.isfile(path) and os.access(path, os.X_OK):
+            seen.append(path)
+    return seen
+
+
+def find_chrome():
+    """(path, version) of the first local Chrome/Chromium that reports a version."""
+    for path in _candidates(CHROME_ENV, CHROME_NAMES, CHROME_PATHS):
+        version = binary_version(path)
+        if version:
+            return path, version
+    raise DriverResolutionError(
+        f"No Chrome or Chromium found. Install one or set {CHROME_ENV} to its path.")
+
+
+def find_driver(chrome_major):
+    """(path, version) of a local chromedriver matching chrome_major, or (None, None)."""
+    for path in _candidates(DRIVER_ENV, ('chromedriver',), DRIVER_PATHS):
+        version = binary_version(path)
+        if major(version) == chrome_major:
+            return path, version
+    return None, None
+
+
+def download_driver(chrome_version):
+    """Fetch a matching driver with webdriver-manager (network, first run only)."""
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+    except ImportError:
+        raise DriverResolutionError(
+            f"No local ChromeDriver {major(chrome_version)} found and webdriver-manager is not "
+            f"installed. Install a matching chromedriver or set {DRIVER_ENV}.")
+    path = ChromeDriverManager(driver_version=chrome_version).install()
+    return path, binary_version(path)
+
+
+def mismatch_message(pin):
+    return (
+        f"Chrome {pin['chrome_version']} ({pin['chrome_path']}) needs ChromeDriver "
+        f"{major(pin['chrome_version'])}, but the pinned driver {pin['driver_path']} is "
+        f"{pin['driver_version']}. Run `python driver_resolver.py --refresh` to pin a "
+        f"matching pair.")
+
+
+class DriverResolver:
+    """Resolves the Chrome/ChromeDriver pair once and reuses the pin afterwards."""
+
+    def __init__(self, manifest_path=MANIFEST_PATH):
+        self.manifest_path = manifest_path
+
+    def load_pin(self):
+        try:
+            pin = load_file(self.manifest_path)
+        except (OSError, ValueError):
+            return None
+        required = ('chrome_path', 'chrome_version', 'driver_path', 'driver_version')
+        return pin if all(pin.get(key) for key in required) else None
+
+    def save_pin(self, pin):
+        directory = os.path.dirname(self.manifest_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        dump_file(pin, self.manifest_path)
+
+    def discover(self):
+        """Find the local pair (downloading a driver only if needed) and pin it."""
+        chrome_path, chrome_version = find_chrome()
+        driver_path, driver_version = find_driver(major(chrome_version))
+        source = 'local'
+        if not driver_path:
+            driver_path, driver_version = download_driver(chrome_version)
+            source = 'webdriver-manager'
+        pin = {
+            'chrome_path': chrome_path,
+            'chrome_version': chrome_version,
+            'chrome_fingerprint': _fingerprint(chrome_path),
+            'driver_path': driver_path,
+            'driver_version': driver_version,
+            'driver_fingerprint': _fingerprint(driver_path),
+            'source': source,
+            'resolved_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        if major(driver_version) != major(chrome_version):
+            raise DriverMismatchError(mismatch_message(pin))
+        self.save_pin(pin)
+        return pin
+
+    def verify(self, pin):
+        """Check a pin against the files on disk; re-read versions only if they changed."""
+        changed = False
+        for kind in ('chrome', 'driver'):
+            path = pin[f'{kind}_path']
+            if not os.path.isfile(path):
+                raise DriverResolutionError(
+                    f"Pinned {kind} {path} no longer exists. "
+                    f"Run `python driver_resolver.py --refresh`.")
+            fingerprint = _fingerprint(path)
+            if fingerprint != pin.get(f'{kind}_fingerprint'):
+                pin[f'{kind}_version'] = binary_version(path) or pin[f'{kind}_version']
+                pin[f'{kind}_fingerprint'] = fingerprint
+                changed = True
+        if major(pin['driver_version']) != major(pin['chrome_version']):
+            raise DriverMismatchError(mismatch_message(pin))
+        if changed:
+            self.save_pin(pin)
+        return pin
+
+    def resolve(self, refresh=False):
+        """The pinned pair as a dict with chrome_path and driver_path."""
+        pin = None if refresh else self.load_pin()
+        if pin is None:
+            return self.discover()
+        return self.verify(pin)
+
+
+def chrome_service(options, resolver=None):
+    """Point `options` at the pinned Chrome and return a Service for its driver.
+
+    Raises DriverResolutionError (or DriverMismatchError) before any
+    browser is started when the pair cannot be used.
+    """
+    from selenium.webdriver.chrome.service import Service
+
+    pin = (resolver or DriverResolver()).resolve()
+    options.binary_location = pin['chrome_path']
+    return Service(executable_path=pin['driver_path'])
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Resolve and pin the Chrome/ChromeDriver pair')
+    parser.add_argument('--refresh', action='store_true', help='Rediscover instead of reusing the pin')
+    parser.add_argument('--manifest', default=MANIFEST_PATH)
+    args = parser.parse_args()
+
+    try:
+        pin = DriverResolver(args.manifest).resolve(refresh=args.refresh)
+    except DriverResolutionError as e:
+        print(f"❌ {e}")
+        return False
+    print(f"✅ Chrome {pin['chrome_version']}: {pin['chrome_path']}")
+    print(f"✅ ChromeDriver {pin['driver_version']}: {pin['driver_path']} ({pin['source']})")
+    print(f"📌 Pinned in {args.manifest}")
+    return True
+
+
+if __name__ == "__main__":
+    main()
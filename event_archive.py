@@ -0,0 +1,250 @@
+"""
+Event archive partitioned by city and month.
+
+    frontend/public/archive/
+        manifest.json              partition list with counts, date bounds, hashes
+        new-york/2025-08.json      events for one (city, YYYY-MM)
+
+Each scrape is merged into the archive instead of replacing one flat file:
+an institution's events in the months a scrape covers replace what was
+archived for it there, and other institutions' events are kept. Readers open only the partitions that overlap the date window they ask
+for, so "the next two weeks" reads one or two small files no matter how
+many years are archived. Events without a parseable date go to an
+'undated' partition that windowed reads skip.
+
+    python event_archive.py                  # archive the current events file
+    python event_archive.py --start 2025-08-01 --end 2025-08-14
+"""
+
+import hashlib
+import os
+from datetime import date, datetime
+
+from event_json import dump_file, dumps, load_file
+from event_keys import event_uid
+from slugs import slugify
+
+ARCHIVE_DIR = os.path.join('frontend', 'public', 'archive')
+MANIFEST_NAME = 'manifest.json'
+UNDATED = 'undated'
+DEFAULT_CITY = 'New York'
+
+
+def partition_key(event):
+    """(city, 'YYYY-MM') for an event, or (city, 'undated')."""
+    city = event.get('city') or DEFAULT_CITY
+    value = event.get('date')
+    try:
+        day = date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return city, UNDATED
+    return city, f'{day.year:04d}-{day.month:02d}'
+
+
+def partition_file(city, month):
+    return f'{slugify(city)}/{month}.json'
+
+
+def month_bounds(month):
+    """First and last day of a 'YYYY-MM' month."""
+    year, number = int(month[:4]), int(month[5:7])
+    first = date(year, number, 1)
+    following = date(year + number // 12, number % 12 + 1, 1)
+    return first, date.fromordinal(following.toordinal() - 1)
+
+
+def _as_date(value):
+    if value is None or isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    return date.fromisoformat(value)
+
+
+def _sort_key(event):
+    return str(event.get('date', '')), str(event.get('time', '')), str(event.get('title', ''))
+
+
+def _content_hash(events):
+    return hashlib.sha256(dumps(events)).hexdigest()
+
+
+def load_manifest(archive_dir=ARCHIVE_DIR):
+    try:
+        return load_file(os.path.join(archive_dir, MANIFEST_NAME))
+    except (OSError, ValueError):
+        return {'partitions': []}
+
+
+def _coverage(events):
+    """{museum: [first month, last month, has undated events]} of a scrape's events."""
+    covered = {}
+    for event in events:
+        month = partition_key(event)[1]
+        span = covered.setdefault(event.get('museum'), [None, None, False])
+        if month == UNDATED:
+            span[2] = True
+        else:
+            span[0] = month if span[0] is None else min(span[0], month)
+            span[1] = month if span[1] is None else max(span[1], month)
+    return covered
+
+
+def _covers(span, month):
+    if span is None:
+        return False
+    if month == UNDATED:
+        return span[2]
+    return span[0] is not None and span[0] <= month <= span[1]
+
+
+def write_archive(events, archive_dir=ARCHIVE_DIR, replace=False):
+    """Merge events into their partitions and rewrite only partitions that changed.
+
+    For each institution in `events`, its archived events from the month of
+    its first event through the month of its last (and its undated ones)
+    are replaced by the new ones, so rescheduled, retitled and cancelled
+    events drop out. Other institutions' events are kept. With
+    replace=True the touched partitions are overwritten instead. Partitions
+    left empty are deleted. Returns (written, unchanged) file lists.
+    """
+    manifest = load_manifest(archive_dir)
+    entries = {(p['city'], p['month']): p for p in manifest.get('partitions', [])}
+
+    grouped = {}
+    for event in events:
+        event = event.to_json() if hasattr(event, 'to_json') else event
+        grouped.setdefault(partition_key(event), []).append(event)
+    covered = _coverage(event for group in grouped.values() for event in group)
+    if not replace:
+        for city, month in entries:
+            if any(_covers(span, month) for span in covered.values()):
+                grouped.setdefault((city, month), [])
+
+    written, unchanged = [], []
+    for (city, month), new_events in sorted(grouped.items()):
+        filename = partition_file(city, month)
+        path = os.path.join(archive_dir, filename)
+        merged = {}
+        if not replace and (city, month) in entries:
+            try:
+                for event in load_file(path):
+                    if not _covers(covered.get(event.get('museum')), month):
+                        merged[event_uid(event)] = event
+            except (OSError, ValueError):
+                pass
+        for event in new_events:
+            merged[event_uid(event)] = event
+
+        partition = sorted(merged.values(), key=_sort_key)
+        previous = entries.get((city, month))
+        if not partition:
+            if previous:
+                del entries[(city, month)]
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                written.append(filename)
+            continue
+        content_hash = _content_hash(partition)
+        if previous and previous.get('hash') == content_hash and os.path.exists(path):
+            unchanged.append(filename)
+            continue
+
+        dump_file(partition, path)
+        entries[(city, month)] = {
+            'city': city,
+            'month': month,
+            'file': filename,
+            'count': len(partition),
+            'first_date': partition[0].get('date') if month != UNDATED else None,
+            'last_date': partition[-1].get('date') if month != UNDATED else None,
+            'hash': content_hash,
+        }
+        written.append(filename)
+
+    if written:
+        dump_file({
+            'version': 1,
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'total_events': sum(p['count'] for p in entries.values()),
+            'partitions': [entries[key] for key in sorted(entries)],
+        }, os.path.join(archive_dir, MANIFEST_NAME))
+    return written, unchanged
+
+
+class ArchiveReader:
+    """Reads events for a date window, opening only the overlapping partitions."""
+
+    def __init__(self, archive_dir=ARCHIVE_DIR):
+        self.archive_dir = archive_dir
+        self.manifest = load_manifest(archive_dir)
+
+    def partitions(self, start=None, end=None, city=None):
+        """Manifest entries whose month overlaps [start, end] (dates or ISO strings)."""
+        start, end = _as_date(start), _as_date(end)
+        selected = []
+        for entry in self.manifest.get('partitions', []):
+            if city and entry['city'] != city:
+                continue
+            if entry['month'] == UNDATED:
+                if start is None and end is None:
+                    selected.append(entry)
+                continue
+            first, last = month_bounds(entry['month'])
+            if (start is None or last >= start) and (end is None or first <= end):
+                selected.append(entry)
+        return selected
+
+    def load(self, start=None, end=None, city=None):
+        """Events dated within [start, end], in date order."""
+        start, end = _as_date(start), _as_date(end)
+        low = start.isoformat() if start else ''
+        high = end.isoformat() if end else '9999-12-31'
+        events = []
+        for entry in self.partitions(start, end, city):
+            partition = load_file(os.path.join(self.archive_dir, entry['file']))
+            if entry['month'] == UNDATED:
+                events.extend(partition)
+            else:
+                events.extend(e for e in partition if low <= str(e.get('date', '')) <= high)
+        return sorted(events, key=_sort_key)
+
+
+def main():
+    import argparse
+
+    from auto_deploy_events import load_events_from_file
+
+    parser = argparse.ArgumentParser(description='Maintain the month-partitioned event archive')
+    parser.add_argument('--archive-dir', default=ARCHIVE_DIR)
+    parser.add_argument('--events-file', help='Events JSON to archive (default: detected events file)')
+    parser.add_argument('--replace', action='store_true', help='Overwrite touched partitions instead of merging')
+    parser.add_argument('--start', help='Only read: first date of the window (YYYY-MM-DD)')
+    parser.add_argument('--end', help='Only read: last date of the window (YYYY-MM-DD)')
+    parser.add_argument('--city', help='Only read: restrict to one city')
+    args = parser.parse_args()
+
+    if args.start or args.end or args.city:
+        reader = ArchiveReader(args.archive_dir)
+        partitions = reader.partitions(args.start, args.end, args.city)
+        events = reader.load(args.start, args.end, args.city)
+        print(f"📚 {len(events)} events from {len(partitions)} partitions:")
+        for entry in partitions:
+            print(f"   {entry['file']} ({entry['count']} events)")
+        return True
+
+    events = load_events_from_file(args.events_file)
+    if not events:
+        print("❌ No events found to archive")
+        return False
+    written, unchanged = write_archive(events, args.archive_dir, replace=args.replace)
+    print(f"✅ {len(written)} partitions written, {len(unchanged)} unchanged")
+    for filename in written:
+        print(f"   📝 {filename}")
+    return True
+
+
+if __name__ == "__main__":
+    main()
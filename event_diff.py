@@ -0,0 +1,301 @@
+"""
+Semantic diff of two event snapshots.
+
+Events are matched by `event_uid`, so reordering, renumbered `id`s or a
+reformatted file are not changes. Both snapshots are indexed once, so a
+diff is linear in their size. An event whose uid disappeared is paired
+with a new one at the same institution that has the same link, or failing
+that the same title: a moved date or time is a modification, not a
+removal plus an addition.
+
+    diff = diff_events(old_events, new_events)
+    diff.summary()            # '3 added, 1 removed, 2 changed'
+    patch = diff.patch()      # compact, JSON-serializable
+    apply_patch(old_events, patch) == new_events (up to order and ids)
+
+Patch format, version 1:
+
+    {"version": 1, "base": <snapshot hash>, "target": <snapshot hash>,
+     "added": [event, ...],
+     "removed": [uid, ...],
+     "modified": {uid: {field: new value, ...}, ...},
+     "unset": {uid: [field, ...]}}              # only if fields were dropped
+
+`modified` keys are the uids in the base snapshot. Applying them in
+place may change an event's uid when a key field (museum, date, time,
+title) changed.
+"""
+
+import hashlib
+import json
+from collections.abc import Mapping
+
+from event_keys import event_uid, normalize_key_part
+
+PATCH_VERSION = 1
+# Positions in the file, renumbered on every write
+IGNORED_FIELDS = frozenset({'id'})
+
+
+def _content(event):
+    return {field: value for field, value in event.items() if field not in IGNORED_FIELDS}
+
+
+def _canonical(value):
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+
+def index_events(events):
+    """{uid: event} for the dict and Event entries of a snapshot; later duplicates win."""
+    return {event_uid(event): event for event in events if isinstance(event, Mapping)}
+
+
+def snapshot_hash(events):
+    """Order- and id-independent hash of a snapshot's content."""
+    index = events if isinstance(events, dict) else index_events(events)
+    digest = hashlib.sha1()
+    for uid in sorted(index):
+        digest.update(uid.encode('utf-8'))
+        digest.update(_canonical(_content(index[uid])).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def field_changes(old, new):
+    """{field: (old value, new value)} for the fields that differ, ids ignored."""
+    changes = {}
+    for field in old.keys() | new.keys():
+        if field in IGNORED_FIELDS:
+            continue
+        before, after = old.get(field), new.get(field)
+        if before != after:
+            changes[field] = (before, after)
+    return changes
+
+
+def _pair_key(event, field):
+    value = normalize_key_part(event.get(field))
+    return (normalize_key_part(event.get('museum')), value) if value else None
+
+
+class EventDiff:
+    """Added, removed and modified events between two snapshots."""
+
+    def __init__(self, base, target, added, removed, modified):
+        self.base = base          # {uid: event}
+        self.target = target      # {uid: event}
+        self.added = added        # [uid in target]
+        self.removed = removed    # [uid in base]
+        self.modified = modified  # [(base uid, target uid, {field: (old, new)})]
+
+    @property
+    def is_empty(self):
+        return not (self.added or self.removed or self.modified)
+
+    def __bool__(self):
+        return not self.is_empty
+
+    def summary(self):
+        if self.is_empty:
+            return 'no changes'
+        return f'{len(self.added)} added, {len(self.removed)} removed, {len(self.modified)} changed'
+
+    def by_institution(self):
+        """{museum: {'added': n, 'removed': n, 'modified': n}} for institutions with changes."""
+        counts = {}
+
+        def bump(event, kind):
+            museum = event.get('museum') or 'unknown'
+            counts.setdefault(museum, {'added': 0, 'removed': 0, 'modified': 0})[kind] += 1
+
+        for uid in self.added:
+            bump(self.target[uid], 'added')
+        for uid in self.removed:
+            bump(self.base[uid], 'removed')
+        for _, target_uid, _ in self.modified:
+            bump(self.target[target_uid], 'modified')
+        return dict(sorted(counts.items()))
+
+    def patch(self):
+        """The compact patch that turns the base snapshot into the target."""
+        modified, unset = {}, {}
+        for base_uid, _, changes in self.modified:
+            modified[base_uid] = {field: new for field, (_, new) in changes.items() if new is not None}
+            dropped = [field for field, (_, new) in changes.items() if new is None]
+            if dropped:
+                unset[base_uid] = sorted(dropped)
+        patch = {
+            'version': PATCH_VERSION,
+            'base': snapshot_hash(self.base),
+            'target': snapshot_hash(self.target),
+            'added': [_content(self.target[uid]) for uid in self.added],
+            'removed': list(self.removed),
+            'modified': modified,
+        }
+        if unset:
+            patch['unset'] = unset
+        return patch
+
+    def describe(self, limit=10):
+        """Lines naming what changed, at most `limit` per kind."""
+        lines = []
+
+        def section(title, items):
+            if not items:
+                return
+            lines.append(f'{title}:')
+            lines.extend(f'   • {item}' for item in items[:limit])
+            if len(items) > limit:
+                lines.append(f'   … and {len(items) - limit} more')
+
+        def label(event):
+            return f"{event.get('title', '?')} ({event.get('museum', '?')}, {event.get('date', '?')})"
+
+        section('Added', [label(self.target[uid]) for uid in self.added])
+        section('Removed', [label(self.base[uid]) for uid in self.removed])
+        section('Changed', [f"{label(self.target[target_uid])}: {', '.join(sorted(changes))}"
+                            for _, target_uid, changes in self.modified])
+        return lines
+
+    def commit_message(self, limit=10):
+        """A commit message summarizing the diff by institution and event."""
+        lines = [f'🎭 Update events: {self.summary()}', '']
+        for museum, counts in self.by_institution().items():
+            parts = [f'+{counts["added"]}' if counts['added'] else '',
+                     f'-{counts["removed"]}' if counts['removed'] else '',
+                     f'~{counts["modified"]}' if counts['modified'] else '']
+            lines.append(f'   {museum}: {" ".join(p for p in parts if p)}')
+        lines.append('')
+        lines.extend(self.describe(limit))
+        lines.append('')
+        lines.append(f'📊 Total Events: {len(self.target)}')
+        return '\n'.join(lines)
+
+
+def diff_events(old_events, new_events):
+    """EventDiff between two snapshots (lists of event dicts)."""
+    base = index_events(old_events)
+    target = index_events(new_events)
+
+    modified = []
+    for uid, event in target.items():
+        if uid in base:
+            changes = field_changes(base[uid], event)
+            if changes:
+                modified.append((uid, uid, changes))
+    gone = [uid for uid in base if uid not in target]
+    new = [uid for uid in target if uid not in base]
+
+    # Pair events whose key fields changed: same institution and link, else same title
+    paired = set()
+    for field in ('link', 'title'):
+        candidates = {}
+        for uid in new:
+            if uid in paired:
+                continue
+            key = _pair_key(target[uid], field)
+            if key is not None:
+                candidates.setdefault(key, []).append(uid)
+        counts = {}
+        for uid in gone:
+            if uid not in paired:
+                key = _pair_key(base[uid], field)
+                counts[key] = counts.get(key, 0) + 1
+        for uid in gone:
+            if uid in paired:
+                continue
+            key = _pair_key(base[uid], field)
+            matches = candidates.get(key) if key is not None else None
+            # Only unambiguous one-to-one pairs
+            if matches and len(matches) == 1 and counts[key] == 1:
+                match = matches[0]
+                paired.update((uid, match))
+                modified.append((uid, match, field_changes(base[uid], target[match])))
+
+    added = [uid for uid in new if uid not in paired]
+    removed = [uid for uid in gone if uid not in paired]
+    return EventDiff(base, target, added, removed, modified)
+
+
+def apply_patch(events, patch):
+    """A new list of events with `patch` applied; unknown uids raise KeyError.
+
+    Unchanged and modified events keep their order; added events follow.
+    Callers renumber `id`s if they need them.
+    """
+    if patch.get('version') != PATCH_VERSION:
+        raise ValueError(f"unsupported patch version: {patch.get('version')}")
+    index = index_events(events)
+    missing = [uid for uid in (*patch['removed'], *patch['modified']) if uid not in index]
+    if missing:
+        raise KeyError(f'patch refers to events not in the snapshot: {", ".join(missing[:5])}')
+
+    removed = set(patch['removed'])
+    unset = patch.get('unset', {})
+    result = []
+    for uid, event in index.items():
+        if uid in removed:
+            continue
+        if uid in patch['modified'] or uid in unset:
+            event = {**event, **patch['modified'].get(uid, {})}
+            for field in unset.get(uid, ()):
+                event.pop(field, None)
+        result.append(event)
+    result.extend(dict(event) for event in patch['added'])
+    return result
+
+
+def committed_events(path, rev='HEAD'):
+    """The events in `path` as committed at `rev`, or None if git has no such file."""
+    import subprocess
+
+    from event_json import loads
+    from event_metadata import split_store
+
+    try:
+        result = subprocess.run(['git', 'show', f'{rev}:{path}'], capture_output=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    try:
+        events, _ = split_store(loads(result.stdout))
+    except ValueError:
+        return None
+    return events
+
+
+def main():
+    import argparse
+
+    from event_json import load_file
+    from event_metadata import split_store
+
+    parser = argparse.ArgumentParser(description='Compare two event snapshots by stable event key')
+    parser.add_argument('old', help='Base events file, or git:REV:PATH for a committed one')
+    parser.add_argument('new', help='Target events file')
+    parser.add_argument('--patch', metavar='FILE', help='Write the patch to FILE')
+    parser.add_argument('--limit', type=int, default=10, help='Events listed per kind of change')
+    args = parser.parse_args()
+
+    if args.old.startswith('git:'):
+        _, rev, path = args.old.split(':', 2)
+        old = committed_events(path, rev)
+        if old is None:
+            parser.error(f'{path} not found at {rev}')
+    else:
+        old, _ = split_store(load_file(args.old))
+    new, _ = split_store(load_file(args.new))
+
+    diff = diff_events(old, new)
+    print(f"🔍 {diff.summary()}")
+    for line in diff.describe(args.limit):
+        print(line)
+    if args.patch:
+        from event_json import dump_file
+
+        dump_file(diff.patch(), args.patch, pretty=False)
+        print(f"💾 Patch written to {args.patch}")
+
+
+if __name__ == "__main__":
+    main()
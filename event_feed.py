@@ -0,0 +1,174 @@
+"""
+Versioned event feed: full snapshots plus patches between versions.
+
+    frontend/public/data/
+        version.json               current version, snapshot and patch list
+        snapshots/12.json          every event as of version 12
+        patches/13.json            event_diff patch from version 12 to 13
+
+Each publish that changes events adds one version with the event_diff
+patch from the previous one. A new full snapshot is written every
+SNAPSHOT_EVERY versions, or sooner once the patches since the last one
+outweigh it. The last KEEP_PATCHES patches are kept, so a browser whose
+cached copy is that recent downloads only the patches (see
+frontend/src/eventFeed.js). Anything older starts again from the snapshot.
+
+    python event_feed.py                 # publish the current events file
+    python event_feed.py --status
+"""
+
+import os
+from datetime import datetime
+
+from event_diff import IGNORED_FIELDS, apply_patch, diff_events, snapshot_hash
+from event_json import dump_file, load_file
+
+FEED_DIR = os.path.join('frontend', 'public', 'data')
+VERSION_NAME = 'version.json'
+SNAPSHOT_EVERY = 20
+KEEP_PATCHES = 60
+
+
+def _sort_key(event):
+    return str(event.get('date', '')), str(event.get('time', '')), str(event.get('title', ''))
+
+
+def feed_events(events):
+    """Events as the feed stores them: plain dicts without positional ids, in date order."""
+    plain = []
+    for event in events:
+        event = event.to_json() if hasattr(event, 'to_json') else event
+        if isinstance(event, dict):
+            plain.append({field: value for field, value in event.items() if field not in IGNORED_FIELDS})
+    return sorted(plain, key=_sort_key)
+
+
+def load_manifest(feed_dir=FEED_DIR):
+    try:
+        return load_file(os.path.join(feed_dir, VERSION_NAME))
+    except (OSError, ValueError):
+        return None
+
+
+def published_events(manifest, feed_dir=FEED_DIR):
+    """The events at the manifest's version: its snapshot with the later patches applied."""
+    snapshot = manifest['snapshot']
+    events = load_file(os.path.join(feed_dir, snapshot['file']))
+    for entry in manifest['patches']:
+        if entry['version'] > snapshot['version']:
+            events = apply_patch(events, load_file(os.path.join(feed_dir, entry['file'])))
+    return events
+
+
+def _write(obj, feed_dir, filename):
+    """Write compact JSON and return its size in bytes."""
+    path = os.path.join(feed_dir, filename)
+    dump_file(obj, path, pretty=False)
+    return os.path.getsize(path)
+
+
+def _remove(feed_dir, filename):
+    try:
+        os.remove(os.path.join(feed_dir, filename))
+    except OSError:
+        pass
+
+
+def publish_feed(events, feed_dir=FEED_DIR):
+    """Add a feed version if `events` differ from the published ones.
+
+    Returns the new version.json contents, or None when nothing changed.
+    """
+    events = feed_events(events)
+    manifest = load_manifest(feed_dir)
+    # Versions keep counting across a restart, so no client mistakes a new feed for its cache
+    last_version = manifest.get('version', 0) if manifest else 0
+    previous = None
+    if manifest:
+        try:
+            previous = published_events(manifest, feed_dir)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ Published feed is unreadable ({e}); starting a new snapshot")
+            manifest = None
+
+    target_hash = snapshot_hash(events)
+    if manifest is None:
+        version, patches = last_version + 1, []
+    else:
+        diff = diff_events(previous, events)
+        if diff.is_empty:
+            return None
+        version, patches = last_version + 1, list(manifest['patches'])
+        patch = diff.patch()
+        patch.update({'from': version - 1, 'to': version})
+        filename = f'patches/{version}.json'
+        patches.append({
+            'version': version,
+            'file': filename,
+            'base': patch['base'],
+            'target': patch['target'],
+            'bytes': _write(patch, feed_dir, filename),
+            'summary': diff.summary(),
+        })
+
+    snapshot = manifest['snapshot'] if manifest else None
+    since_snapshot = [p for p in patches if snapshot and p['version'] > snapshot['version']]
+    if (snapshot is None or len(since_snapshot) >= SNAPSHOT_EVERY
+            or sum(p['bytes'] for p in since_snapshot) > snapshot['bytes']):
+        filename = f'snapshots/{version}.json'
+        if snapshot:
+            _remove(feed_dir, snapshot['file'])
+        snapshot = {'version': version, 'file': filename, 'hash': target_hash,
+                    'bytes': _write(events, feed_dir, filename)}
+
+    for entry in patches[:-KEEP_PATCHES]:
+        _remove(feed_dir, entry['file'])
+    manifest = {
+        'version': version,
+        'hash': target_hash,
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'total_events': len(events),
+        'snapshot': snapshot,
+        'patches': patches[-KEEP_PATCHES:],
+    }
+    dump_file(manifest, os.path.join(feed_dir, VERSION_NAME))
+    return manifest
+
+
+def main():
+    import argparse
+
+    from auto_deploy_events import load_events_from_file
+
+    parser = argparse.ArgumentParser(description='Publish events as a versioned snapshot-and-patch feed')
+    parser.add_argument('--feed-dir', default=FEED_DIR)
+    parser.add_argument('--events-file', help='Events JSON to publish (default: detected events file)')
+    parser.add_argument('--status', action='store_true', help='Show the published versions and exit')
+    args = parser.parse_args()
+
+    if args.status:
+        manifest = load_manifest(args.feed_dir)
+        if not manifest:
+            print("📭 No feed published yet")
+            return True
+        snapshot = manifest['snapshot']
+        print(f"📡 Version {manifest['version']}: {manifest['total_events']} events")
+        print(f"   snapshot {snapshot['version']} ({snapshot['bytes']} bytes)")
+        for entry in manifest['patches']:
+            print(f"   patch {entry['version']}: {entry['summary']} ({entry['bytes']} bytes)")
+        return True
+
+    events = load_events_from_file(args.events_file)
+    if not events:
+        print("❌ No events found to publish")
+        return False
+    manifest = publish_feed(events, args.feed_dir)
+    if manifest is None:
+        print("ℹ️ Feed already up to date")
+    else:
+        print(f"✅ Feed version {manifest['version']} published ({manifest['total_events']} events)")
+    return True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Shared JSON codec for event files.
+
+Uses orjson when it is installed and the standard library otherwise; both
+produce the same document shapes. Pretty output matches the
+`json.dump(indent=2, ensure_ascii=False)` files the scripts have always
+written, so diffs of cultural_events.json stay readable.
+
+    data = load_file('cultural_events.json')            # mmap read
+    dump_file(data, 'cultural_events.json')              # pretty, atomic
+
+event_model.Event objects are serialized through their to_json().
+"""
+
+import json
+import mmap
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = 'orjson' if orjson is not None else 'json'
+
+
+def _default(obj):
+    to_json = getattr(obj, 'to_json', None)
+    if to_json is None:
+        raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+    return to_json()
+
+
+def dumps(obj, pretty=False):
+    """Encode to UTF-8 bytes; pretty uses two-space indentation."""
+    if orjson is not None:
+        # Non-string keys become strings, as json.dumps does
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, default=_default, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_default).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_default).encode('utf-8')
+
+
+def loads(data):
+    """Decode JSON from bytes, bytearray, memoryview or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def load_file(path):
+    """Read a JSON file through a memory map instead of a Python-level read buffer."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return loads(b'')  # raises the backend's usual decode error
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if orjson is not None:
+                view = memoryview(mapped)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    view.release()
+            return json.loads(mapped[:])
+
+
+def _replace_atomically(path, write):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def dump_file(obj, path, pretty=True):
+    """Write obj to path; readers never see a half-written file."""
+    _replace_atomically(path, lambda f: f.write(dumps(obj, pretty=pretty)))
+
@@ -0,0 +1,35 @@
+"""Stable event identifiers.
+
+`event_uid` must stay byte-for-byte compatible with `stableEventId` in
+frontend/src/calendarExport.js: the same event gets the same id whether it
+was exported to Google Calendar from the browser or published in a feed.
+"""
+
+import re
+
+FNV_OFFSET = 0xcbf29ce484222325
+FNV_PRIME = 0x100000001b3
+MASK_64 = 0xffffffffffffffff
+
+KEY_FIELDS = ('museum', 'date', 'time', 'title')
+
+
+def fnv1a64(text):
+    """64-bit FNV-1a of the UTF-8 bytes of text, as 16 hex characters."""
+    h = FNV_OFFSET
+    for byte in text.encode('utf-8'):
+        h ^= byte
+        h = (h * FNV_PRIME) & MASK_64
+    return f'{h:016x}'
+
+
+def normalize_key_part(value):
+    """Lowercase, trim and collapse whitespace, as the frontend does."""
+    return re.sub(r'\s+', ' ', str(value or '').strip().lower())
+
+
+def event_uid(event):
+    """Return the stable id of an event dict, preferring an explicit 'uid'."""
+    if event.get('uid'):
+        return event['uid']
+    return fnv1a64('|'.join(normalize_key_part(event.get(field)) for field in KEY_FIELDS))
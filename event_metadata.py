@@ -0,0 +1,180 @@
+"""
+Incrementally maintained `metadata` block for event files.
+
+The scrapers used to rebuild events_by_institution / events_by_type by
+rescanning every event on each save, and each wrote its own metadata shape.
+`MetadataAggregator` keeps the counts, the date range and per-source
+freshness up to date as events are added, replaced or removed. Each change
+costs the same however many events are stored, and every event file gets
+the same block:
+
+    {
+      "total_events": 49,
+      "scrape_timestamp": "2025-07-22 18:00:15",
+      "institutions_scraped": 14,
+      "events_by_institution": {"moma": 6, ...},
+      "events_by_type": {"tours": 13, ...},
+      "events_by_city": {"New York": 49},
+      "date_range": {"first": "2025-07-28", "last": "2025-09-20"},
+      "sources": {"moma": {"events": 6, "last_updated": "2025-07-22 18:00:15"}, ...},
+      ...scraper-specific keys such as scraper_version or scrape_method
+    }
+
+The block is stored in the events file itself. `load_store` rebuilds the
+counts from the events and restores the per-source timestamps from it.
+"""
+
+import os
+from bisect import bisect_left, insort
+from collections import Counter
+from datetime import datetime
+
+from event_json import dump_file, load_file
+from event_keys import event_uid
+
+COUNTED_FIELDS = {
+    'museum': 'events_by_institution',
+    'type': 'events_by_type',
+    'city': 'events_by_city',
+}
+MISSING = 'unknown'
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _now():
+    return datetime.now().strftime(TIMESTAMP_FORMAT)
+
+
+def _value(event, field):
+    value = event.get(field)
+    return value if isinstance(value, str) and value else MISSING
+
+
+class MetadataAggregator:
+    """Running counts, date bounds and per-source freshness for an event store.
+
+    Events are identified by event_keys.event_uid. Adding an event whose uid
+    is already counted replaces the old one.
+    """
+
+    def __init__(self, events=(), sources=None):
+        self.counts = {field: Counter() for field in COUNTED_FIELDS}
+        self.date_counts = Counter()
+        self.dates = []  # distinct dates, sorted, so the bounds are the two ends
+        self.sources = {}
+        self._contributions = {}
+        self.updated_at = None
+        for source, info in (sources or {}).items():
+            self.sources[source] = {'events': 0, 'last_updated': info.get('last_updated')}
+        for event in events:
+            self._add(event, None)
+
+    def __len__(self):
+        return len(self._contributions)
+
+    def __contains__(self, event):
+        return event_uid(event) in self._contributions
+
+    def _add(self, event, timestamp):
+        uid = event_uid(event)
+        if uid in self._contributions:
+            self._remove(uid)
+        values = tuple(_value(event, field) for field in COUNTED_FIELDS)
+        date = event.get('date') if isinstance(event.get('date'), str) else None
+        self._contributions[uid] = (values, date)
+
+        for field, value in zip(COUNTED_FIELDS, values):
+            self.counts[field][value] += 1
+        if date:
+            self.date_counts[date] += 1
+            if self.date_counts[date] == 1:
+                insort(self.dates, date)
+
+        source = self.sources.setdefault(values[0], {'events': 0, 'last_updated': None})
+        source['events'] += 1
+        if timestamp:
+            source['last_updated'] = timestamp
+
+    def _remove(self, uid):
+        values, date = self._contributions.pop(uid)
+        for field, value in zip(COUNTED_FIELDS, values):
+            counter = self.counts[field]
+            counter[value] -= 1
+            if not counter[value]:
+                del counter[value]
+        if date:
+            self.date_counts[date] -= 1
+            if not self.date_counts[date]:
+                del self.date_counts[date]
+                del self.dates[bisect_left(self.dates, date)]
+        self.sources[values[0]]['events'] -= 1
+
+    def add(self, event, timestamp=None):
+        """Count a new or updated event and mark its source as just updated."""
+        self.updated_at = timestamp or _now()
+        self._add(event, self.updated_at)
+
+    def keep(self, event):
+        """Count an event carried over from an earlier run; its source's freshness is unchanged."""
+        self._add(event, None)
+
+    def add_many(self, events, timestamp=None):
+        self.updated_at = timestamp or _now()
+        for event in events:
+            self._add(event, self.updated_at)
+
+    def remove(self, event):
+        """Stop counting an event (or uid). Returns False if it was not counted."""
+        uid = event if isinstance(event, str) else event_uid(event)
+        if uid not in self._contributions:
+            return False
+        self._remove(uid)
+        self.updated_at = _now()
+        return True
+
+    def metadata(self, **extra):
+        """The uniform metadata block, plus any scraper-specific keys."""
+        block = {
+            'total_events': len(self),
+            'scrape_timestamp': self.updated_at or _now(),
+            'institutions_scraped': len(self.counts['museum']),
+        }
+        for field, key in COUNTED_FIELDS.items():
+            block[key] = dict(self.counts[field])
+        block['date_range'] = {
+            'first': self.dates[0] if self.dates else None,
+            'last': self.dates[-1] if self.dates else None,
+        }
+        block['sources'] = {source: dict(info) for source, info in sorted(self.sources.items())
+                            if info['events']}
+        block.update(extra)
+        return block
+
+
+def split_store(data):
+    """(events, metadata) from an events file's contents, old array format included."""
+    if isinstance(data, list):
+        return data, {}
+    if isinstance(data, dict):
+        return data.get('events', []), data.get('metadata') or {}
+    return [], {}
+
+
+def load_store(path):
+    """(events, aggregator, metadata) for an events file; empty if it is missing."""
+    if not os.path.exists(path):
+        return [], MetadataAggregator(), {}
+    events, metadata = split_store(load_file(path))
+    aggregator = MetadataAggregator(events, sources=metadata.get('sources'))
+    aggregator.updated_at = metadata.get('scrape_timestamp')
+    # Files written before per-source freshness: the whole file is as fresh as its timestamp
+    for source in aggregator.sources.values():
+        source['last_updated'] = source['last_updated'] or aggregator.updated_at
+    return events, aggregator, metadata
+
+
+def save_store(path, events, aggregator, **extra):
+    """Write {"events": ..., "metadata": ...} using the aggregator's current block."""
+    data = {'events': events, 'metadata': aggregator.metadata(**extra)}
+    dump_file(data, path)
+    return data['metadata']
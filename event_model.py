@@ -0,0 +1,123 @@
+"""
+Compact record type for events.
+
+An `Event` stores the standard event fields in `__slots__` instead of a
+per-event dict, and interns the categorical values (museum, type, city,
+price, duration, date, time) so thousands of events share one copy of
+'New York' or 'See website'. Unknown keys from the JSON are kept in `extra`
+and written back out, so a load/save round trip is lossless.
+
+Events are also read-only Mappings: code written against event dicts
+(`event.get('museum')`, `event['date']`) works unchanged.
+"""
+
+import sys
+from collections.abc import Mapping
+
+FIELDS = ('id', 'title', 'museum', 'date', 'time', 'type', 'description', 'city', 'price', 'duration', 'link')
+INTERNED_FIELDS = ('museum', 'date', 'time', 'type', 'city', 'price', 'duration')
+
+_FIELD_SET = frozenset(FIELDS)
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class Event(Mapping):
+    """One event. Absent fields are None and are left out of to_json()."""
+
+    __slots__ = FIELDS + ('extra',)
+
+    def __init__(self, title=None, museum=None, date=None, time=None, type=None, description=None,
+                 city=None, price=None, duration=None, link=None, id=None, extra=None):
+        self.id = id
+        self.title = title
+        self.museum = _intern(museum)
+        self.date = _intern(date)
+        self.time = _intern(time)
+        self.type = _intern(type)
+        self.description = description
+        self.city = _intern(city)
+        self.price = _intern(price)
+        self.duration = _intern(duration)
+        self.link = link
+        self.extra = extra or None
+
+    @classmethod
+    def from_json(cls, data):
+        """Build an Event from a decoded JSON object."""
+        if isinstance(data, cls):
+            return data
+        event = cls.__new__(cls)
+        get = data.get
+        event.id = get('id')
+        event.title = get('title')
+        event.museum = _intern(get('museum'))
+        event.date = _intern(get('date'))
+        event.time = _intern(get('time'))
+        event.type = _intern(get('type'))
+        event.description = get('description')
+        event.city = _intern(get('city'))
+        event.price = _intern(get('price'))
+        event.duration = _intern(get('duration'))
+        event.link = get('link')
+        if len(data) > sum(1 for field in FIELDS if field in data):
+            event.extra = {key: value for key, value in data.items() if key not in _FIELD_SET}
+        else:
+            event.extra = None
+        return event
+
+    def to_json(self):
+        """Plain dict for json.dump, standard fields first."""
+        data = {}
+        for field in FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                data[field] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    # -- Mapping interface ----------------------------------------------------
+
+    def __getitem__(self, key):
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        elif self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+            return default if value is None else value
+        if self.extra:
+            return self.extra.get(key, default)
+        return default
+
+    def __iter__(self):
+        for field in FIELDS:
+            if getattr(self, field) is not None:
+                yield field
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f'Event({self.museum!r}, {self.date!r}, {self.title!r})'
+
+
+def events_from_json(items):
+    """Bulk-convert decoded JSON objects (or Events) to Events, skipping non-objects."""
+    from_json = Event.from_json
+    return [from_json(item) for item in items if isinstance(item, Mapping)]
+
+
+def events_to_json(events):
+    """Plain dicts for serialization; dicts pass through unchanged."""
+    return [event.to_json() if isinstance(event, Event) else event for event in events]
@@ -0,0 +1,198 @@
+"""
+Precomputed query index over the event store.
+
+`EventIndex` sorts the events once by date and keeps posting lists per
+museum, type and city, so a query is a bisect on the date column plus a walk
+over the smallest matching posting list instead of a scan of every event.
+The module is framework-free; events_api.py puts it behind Flask.
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+from bisect import bisect_left, bisect_right
+
+from event_model import events_from_json
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+FILTER_FIELDS = ('museum', 'type', 'city')
+
+
+class QueryError(ValueError):
+    """Raised for malformed query parameters or cursors."""
+
+
+class EventIndex:
+    def __init__(self, events):
+        self.events = sorted(
+            events_from_json(events),
+            key=lambda e: (str(e.get('date', '')), str(e.get('time', '')), str(e.get('title', '')))
+        )
+        self.dates = [str(e.get('date', '')) for e in self.events]
+
+        # field -> value -> ascending list of positions in self.events
+        self.postings = {field: {} for field in FILTER_FIELDS}
+        for pos, event in enumerate(self.events):
+            for field in FILTER_FIELDS:
+                value = event.get(field)
+                if value is not None:
+                    self.postings[field].setdefault(str(value), []).append(pos)
+
+        digest = hashlib.sha256()
+        for event in self.events:
+            digest.update(json.dumps(event.to_json(), sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        self.version = digest.hexdigest()[:16]
+
+    def __len__(self):
+        return len(self.events)
+
+    def _candidates(self, lo, hi, filters):
+        """Yield positions in [lo, hi) matching every filter, in order."""
+        if not filters:
+            yield from range(lo, hi)
+            return
+
+        # field -> merged posting list of the requested values
+        lists = []
+        for field, values in filters.items():
+            merged = []
+            for value in values:
+                merged.extend(self.postings[field].get(value, ()))
+            if not merged:
+                return
+            if len(values) > 1:
+                merged.sort()
+            lists.append(merged)
+
+        lists.sort(key=len)
+        driver, others = lists[0], [set(p) for p in lists[1:]]
+        for pos in driver[bisect_left(driver, lo):bisect_left(driver, hi)]:
+            if all(pos in other for other in others):
+                yield pos
+
+    def query(self, start=None, end=None, filters=None, limit=DEFAULT_LIMIT, after=-1):
+        """Return (events, last_position, total) for one page of results.
+
+        start/end are inclusive YYYY-MM-DD strings; filters maps a field in
+        FILTER_FIELDS to a list of accepted values; after is the position of
+        the last event on the previous page.
+        """
+        lo = bisect_left(self.dates, start) if start else 0
+        hi = bisect_right(self.dates, end) if end else len(self.dates)
+        lo = max(lo, after + 1)
+
+        page, total, last = [], 0, None
+        for pos in self._candidates(lo, hi, filters or {}):
+            total += 1
+            if len(page) < limit:
+                page.append(self.events[pos])
+                last = pos
+        return page, last, total
+
+
+def parse_query_args(args):
+    """Normalize request args (any mapping with .get) into query keywords."""
+    def listed(name):
+        raw = args.get(name)
+        return [v.strip() for v in raw.split(',') if v.strip()] if raw else []
+
+    try:
+        limit = int(args.get('limit', DEFAULT_LIMIT))
+    except (TypeError, ValueError):
+        raise QueryError('limit must be an integer')
+    if not 1 <= limit <= MAX_LIMIT:
+        raise QueryError(f'limit must be between 1 and {MAX_LIMIT}')
+
+    filters = {field: listed(field) for field in FILTER_FIELDS if listed(field)}
+    return {
+        'start': args.get('start') or None,
+        'end': args.get('end') or None,
+        'filters': filters,
+        'limit': limit,
+        'cursor': args.get('cursor') or None,
+    }
+
+
+def encode_cursor(index, position):
+    raw = json.dumps({'v': index.version, 'p': position}).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(index, cursor):
+    """Return the position stored in a cursor issued for this index version."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        version, position = data['v'], int(data['p'])
+    except (ValueError, KeyError, TypeError):
+        raise QueryError('invalid cursor')
+    if version != index.version:
+        raise QueryError('cursor expired; the event store has changed')
+    return position
+
+
+def run_query(index, params):
+    """Run parsed query params and return the response body as a dict."""
+    after = decode_cursor(index, params['cursor']) if params['cursor'] else -1
+    page, last, total = index.query(
+        start=params['start'], end=params['end'], filters=params['filters'],
+        limit=params['limit'], after=after,
+    )
+    has_more = total > len(page)
+    return {
+        'events': [event.to_json() for event in page],
+        'count': len(page),
+        'remaining': total - len(page),
+        'next_cursor': encode_cursor(index, last) if has_more else None,
+        'version': index.version,
+    }
+
+
+def make_etag(index, params, encoding):
+    """Strong ETag: same index version, query and encoding -> same bytes."""
+    key = json.dumps([index.version, params, encoding], sort_keys=True)
+    return '"' + hashlib.sha256(key.encode('utf-8')).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in candidates or etag in candidates
+
+
+def choose_encoding(accept_encoding):
+    """Pick br, gzip or identity from an Accept-Encoding header."""
+    offered = {}
+    for part in (accept_encoding or '').split(','):
+        name, _, params = part.strip().partition(';')
+        quality = 1.0
+        if params.strip().startswith('q='):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        offered[name.strip().lower()] = quality
+
+    if brotli is not None and offered.get('br', 0) > 0:
+        return 'br'
+    if offered.get('gzip', 0) > 0:
+        return 'gzip'
+    return 'identity'
+
+
+def encode_body(body, encoding):
+    data = json.dumps(body, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    if encoding == 'br':
+        return brotli.compress(data)
+    if encoding == 'gzip':
+        # mtime=0 keeps the bytes identical across requests, as a strong ETag promises
+        return gzip.compress(data, mtime=0)
+    return data
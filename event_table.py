@@ -0,0 +1,202 @@
+"""
+Columnar in-memory event table for summaries and analytics.
+
+Events are plain dicts, which is convenient for scraping but heavy for
+counting: every summary walked the whole list and rebuilt its own dicts.
+`EventTable` keeps only the analytic columns. museum, type and city are
+dictionary-encoded (a list of interned distinct values plus one small
+integer code per event) and dates become a datetime64[D] array when NumPy
+is installed and the table is large, or an array of day ordinals otherwise.
+Group-by counts then run over integer arrays instead of dict lookups.
+"""
+
+import sys
+from array import array
+from collections import Counter
+from collections.abc import Mapping
+from datetime import date
+
+CATEGORICAL_FIELDS = ('museum', 'type', 'city')
+MISSING = 'unknown'
+NO_DATE = -1
+
+# NumPy is imported only for tables this large. Importing it costs more than
+# counting a few thousand events without it, and summary-only commands
+# should not pay for it.
+NUMPY_MIN_ROWS = 10000
+_numpy = False  # not resolved yet
+
+
+def numpy_for(rows):
+    """The numpy module if a table of `rows` events should use it, else None."""
+    global _numpy
+    if rows < NUMPY_MIN_ROWS:
+        return None
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+class Column:
+    """A dictionary-encoded string column: distinct values plus a code per row."""
+
+    def __init__(self, values, np=None):
+        self.np = np
+        self.values = []
+        lookup = {}
+        codes = array('I')
+        for value in values:
+            if not isinstance(value, str) or not value:
+                value = MISSING
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(self.values)
+                self.values.append(sys.intern(value))
+            codes.append(code)
+        self.codes = np.frombuffer(codes, dtype=np.uint32) if np is not None else codes
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, row):
+        return self.values[self.codes[row]]
+
+    def counts(self):
+        """Occurrences of each value, in first-seen order."""
+        np = self.np
+        if np is not None:
+            tally = np.bincount(self.codes, minlength=len(self.values)).tolist()
+        else:
+            counter = Counter(self.codes)
+            tally = [counter.get(code, 0) for code in range(len(self.values))]
+        return {value: n for value, n in zip(self.values, tally) if n}
+
+
+def _date_ordinal(value):
+    try:
+        return date.fromisoformat(value).toordinal()
+    except (TypeError, ValueError):
+        return NO_DATE
+
+
+class EventTable:
+    """Read-only columnar view over a list of event dicts.
+
+    Accepts dicts or event_model.Event records. Anything else is skipped
+    and listed in `skipped` as (index, value).
+    """
+
+    def __init__(self, events):
+        rows = []
+        self.skipped = []
+        for i, event in enumerate(events):
+            if isinstance(event, Mapping):
+                rows.append(event)
+            else:
+                self.skipped.append((i, event))
+
+        self.size = len(rows)
+        self.np = np = numpy_for(self.size)
+        self.columns = {field: Column((event.get(field) for event in rows), np) for field in CATEGORICAL_FIELDS}
+
+        # Distinct date strings are parsed once; scraped data repeats them heavily
+        parsed = {}
+        ordinals = array('i')
+        for event in rows:
+            value = event.get('date')
+            try:
+                ordinal = parsed[value]
+            except KeyError:
+                ordinal = parsed[value] = _date_ordinal(value)
+            except TypeError:
+                ordinal = NO_DATE
+            ordinals.append(ordinal)
+        if np is not None:
+            days = np.frombuffer(ordinals, dtype=np.int32).astype(np.int64)
+            # datetime64 counts days from 1970-01-01, ordinals from 0001-01-01
+            self.dates = np.where(days == NO_DATE, np.datetime64('NaT'),
+                                  (days - date(1970, 1, 1).toordinal()).astype('datetime64[D]'))
+        else:
+            self.dates = ordinals
+
+    def __len__(self):
+        return self.size
+
+    def count_by(self, field):
+        """{value: count} for a categorical field, in first-seen order."""
+        return self.columns[field].counts()
+
+    def group_count(self, field, by):
+        """{by_value: {field_value: count}}, e.g. types per museum."""
+        outer = self.columns[by]
+        inner = self.columns[field]
+        np = self.np
+        if np is not None:
+            pairs = outer.codes.astype(np.uint64) * len(inner.values) + inner.codes
+            keys, counts = np.unique(pairs, return_counts=True)
+            tally = {divmod(int(k), len(inner.values)): int(n) for k, n in zip(keys, counts)}
+        else:
+            tally = Counter(zip(outer.codes, inner.codes))
+        result = {value: {} for value in outer.values}
+        for (outer_code, inner_code), n in sorted(tally.items()):
+            result[outer.values[outer_code]][inner.values[inner_code]] = n
+        return {value: counts for value, counts in result.items() if counts}
+
+    def count_dates(self, start=None, end=None):
+        """Events dated within [start, end] (datetime.date, either bound optional)."""
+        np = self.np
+        if np is not None:
+            mask = ~np.isnat(self.dates)
+            if start is not None:
+                mask &= self.dates >= np.datetime64(start, 'D')
+            if end is not None:
+                mask &= self.dates <= np.datetime64(end, 'D')
+            return int(mask.sum())
+        low = start.toordinal() if start is not None else 0
+        high = end.toordinal() if end is not None else sys.maxsize
+        return sum(1 for day in self.dates if day != NO_DATE and low <= day <= high)
+
+    def histogram(self, period='month'):
+        """Event counts per 'month' (YYYY-MM), 'year' or 'weekday' (0=Monday), sorted by key."""
+        if period not in ('month', 'year', 'weekday'):
+            raise ValueError(f'unknown period: {period}')
+        np = self.np
+        if np is not None:
+            dated = self.dates[~np.isnat(self.dates)]
+            if period == 'weekday':
+                # 1970-01-01 was a Thursday
+                keys = (dated.astype(np.int64) + 3) % 7
+            else:
+                keys = dated.astype('datetime64[M]' if period == 'month' else 'datetime64[Y]')
+            values, counts = np.unique(keys, return_counts=True)
+            return {_period_key(value, period): int(n) for value, n in zip(values.tolist(), counts)}
+
+        per_day = Counter(day for day in self.dates if day != NO_DATE)
+        result = Counter()
+        for day, n in per_day.items():
+            result[_period_key(date.fromordinal(day), period)] += n
+        return dict(sorted(result.items()))
+
+
+def _period_key(value, period):
+    if period == 'weekday':
+        return value if isinstance(value, int) else value.weekday()
+    if period == 'month':
+        return value.strftime('%Y-%m')
+    return str(value.year)
+
+
+def summarize(events, today=None):
+    """The counts every summary printer needs, computed from one EventTable."""
+    table = events if isinstance(events, EventTable) else EventTable(events)
+    return {
+        'total_events': len(table),
+        'events_by_type': table.count_by('type'),
+        'events_by_museum': table.count_by('museum'),
+        'events_by_city': table.count_by('city'),
+        'upcoming_events': table.count_dates(start=today or date.today()),
+    }
@@ -0,0 +1,257 @@
+"""
+Schema-compiled batch validation for scraped events.
+
+An `EventSchema` turns the field rules (required fields, date/time/URL
+formats, allowed museum and type values, length limits) into a flat list of
+checks once. `validate_batch` then runs each check down a whole column
+instead of event by event, and evaluates each distinct value only once:
+scraped batches repeat the same museums, types, dates and times over and
+over. Problems come back as structured error records, not strings.
+
+`ValidationStage` wraps this for use while scraping: events are validated in
+small batches as they are produced, so the workflow has its clean list and
+its report as soon as the scrape finishes.
+"""
+
+import re
+from datetime import date, datetime
+from functools import lru_cache
+
+from institution_aliases import canonical_museum
+from institution_registry import EVENT_TYPES, institution_ids
+
+REQUIRED_FIELDS = ('title', 'museum', 'date', 'time', 'type', 'description', 'city')
+
+DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+# '7:00 PM', '10 AM', '19:00', ranges such as '6:00 PM - 8:00 PM' or '6-8 PM', and 'All day'
+_CLOCK_12 = r'(?:1[0-2]|0?[1-9])(?::[0-5]\d)?\s?[ap]\.?m\.?'
+_CLOCK_24 = r'(?:[01]?\d|2[0-3]):[0-5]\d'
+_CLOCK = f'(?:{_CLOCK_12}|{_CLOCK_24})'
+_RANGE_START = rf'(?:{_CLOCK}|(?:1[0-2]|0?[1-9])(?::[0-5]\d)?)'
+TIME_RE = re.compile(rf'all[ -]day|{_RANGE_START}\s*(?:-|–|—|to)\s*{_CLOCK}|{_CLOCK}', re.IGNORECASE)
+URL_RE = re.compile(r'https?://[^\s/?#]+\.[^\s/?#]+(?:[/?#]\S*)?')
+
+# Longer values are rejected...
+MAX_LENGTHS = {
+    'museum': 64,
+    'type': 64,
+    'city': 100,
+    'time': 20,
+    'price': 100,
+    'duration': 50,
+    'link': 2048,
+}
+
+# ...except these, which are trimmed to fit the event cards.
+TRUNCATE_LENGTHS = {
+    'title': 100,
+    'description': 300,
+}
+
+DEFAULTS = {
+    'price': 'See website',
+    'duration': '2 hours',
+    'link': '',
+}
+
+
+def _valid_date(value):
+    if not DATE_RE.fullmatch(value):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+class EventSchema:
+    """Event field rules compiled to a list of (field, code, test, message) checks."""
+
+    def __init__(self, required=REQUIRED_FIELDS, museums=None, types=None,
+                 max_lengths=MAX_LENGTHS, truncate=TRUNCATE_LENGTHS, defaults=DEFAULTS,
+                 resolve_museums=True):
+        self.required = tuple(required)
+        self.resolve_museums = resolve_museums
+        self.truncate = dict(truncate)
+        self.defaults = dict(defaults)
+        museums = frozenset(institution_ids() if museums is None else museums)
+        types = frozenset(EVENT_TYPES if types is None else types)
+
+        checks = []
+        for field in self.required:
+            checks.append((field, 'missing', None, 'required field is missing or empty'))
+        for field in sorted(set(self.required) | set(max_lengths) | set(self.truncate)):
+            checks.append((field, 'not_string', lambda v: isinstance(v, str), 'expected a string'))
+
+        def string_check(test):
+            return lambda v: isinstance(v, str) and test(v)
+
+        checks.extend([
+            ('date', 'bad_date', string_check(_valid_date), 'expected a real date as YYYY-MM-DD'),
+            ('time', 'bad_time', string_check(TIME_RE.fullmatch), 'expected a time like 7:00 PM, 19:00, 6-8 PM or All day'),
+            ('link', 'bad_url', string_check(URL_RE.fullmatch), 'expected an http(s) URL'),
+            ('museum', 'unknown_museum', lambda v: v in museums, 'not an institution in the registry'),
+            ('type', 'unknown_type', lambda v: v in types, 'not a known event type'),
+        ])
+        for field, limit in sorted(max_lengths.items()):
+            checks.append((field, 'too_long', string_check(lambda v, limit=limit: len(v) <= limit),
+                           f'longer than {limit} characters'))
+
+        self.checks = checks
+        self.fields = tuple(dict.fromkeys(check[0] for check in checks))
+
+    def validate_batch(self, events, start_index=0):
+        """Validate a list of events in one columnar pass.
+
+        Returns (valid_events, errors). Valid events are normalized copies;
+        each error is a dict with index, event_id, field, code, message and
+        value. Format checks skip empty values, which only `missing` reports.
+        Museum names and aliases are mapped to registry ids first.
+        """
+        if self.resolve_museums:
+            events = [_with_canonical_museum(event) for event in events]
+        columns = {field: [event.get(field) for event in events] for field in self.fields}
+        failed = {}
+
+        for field, code, test, message in self.checks:
+            column = columns[field]
+            if test is None:
+                bad_rows = [i for i, value in enumerate(column) if not value]
+            else:
+                bad_rows = _failing_rows(column, test)
+            for i in bad_rows:
+                failed.setdefault(i, []).append((field, code, message))
+
+        valid_events = []
+        errors = []
+        for i, event in enumerate(events):
+            problems = failed.get(i)
+            if problems is None:
+                valid_events.append(self.normalize(event))
+                continue
+            reported = set()
+            for field, code, message in problems:
+                # A non-string value fails every later check on that field; report it once
+                if field in reported:
+                    continue
+                reported.add(field)
+                errors.append({
+                    'index': start_index + i,
+                    'event_id': event.get('id'),
+                    'field': field,
+                    'code': code,
+                    'message': message,
+                    'value': _preview(event.get(field)),
+                })
+        return valid_events, errors
+
+    def normalize(self, event):
+        """Copy of a valid event with text trimmed and optional fields defaulted."""
+        clean = dict(event)
+        for field, limit in self.truncate.items():
+            if isinstance(clean.get(field), str):
+                clean[field] = clean[field].strip()[:limit]
+        for field, value in self.defaults.items():
+            if clean.get(field) is None:
+                clean[field] = value
+        return clean
+
+
+def _with_canonical_museum(event):
+    museum = event.get('museum')
+    canonical = canonical_museum(museum)
+    if canonical == museum:
+        return event
+    return {**event, 'museum': canonical}
+
+
+def _failing_rows(column, test):
+    """Row numbers whose non-empty value fails test, testing each distinct value once."""
+    verdicts = {}
+    bad_rows = []
+    for i, value in enumerate(column):
+        if not value:
+            continue
+        try:
+            ok = verdicts[value]
+        except KeyError:
+            ok = verdicts[value] = bool(test(value))
+        except TypeError:
+            # Unhashable value (list, dict): cannot be cached, and never valid here
+            ok = bool(test(value))
+        if not ok:
+            bad_rows.append(i)
+    return bad_rows
+
+
+def _preview(value, limit=80):
+    if isinstance(value, str):
+        return value if len(value) <= limit else value[:limit] + '…'
+    return repr(value)[:limit]
+
+
+@lru_cache(maxsize=1)
+def default_schema():
+    """The schema built from the institution registry, compiled once per process."""
+    return EventSchema()
+
+
+class ValidationStage:
+    """Validates events in small batches as a scraper produces them."""
+
+    def __init__(self, schema=None, batch_size=50):
+        self.schema = schema or default_schema()
+        self.batch_size = batch_size
+        self.pending = []
+        self.valid = []
+        self.errors = []
+        self.total = 0
+
+    def add(self, event):
+        self.pending.append(event)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Validate whatever is pending and return the events that passed."""
+        if not self.pending:
+            return []
+        valid, errors = self.schema.validate_batch(self.pending, start_index=self.total)
+        self.total += len(self.pending)
+        self.pending = []
+        self.valid.extend(valid)
+        self.errors.extend(errors)
+        return valid
+
+    def process(self, events):
+        """Generator form: yield valid events from any iterable as batches complete."""
+        for event in events:
+            self.pending.append(event)
+            if len(self.pending) >= self.batch_size:
+                yield from self.flush()
+        yield from self.flush()
+
+    def report(self):
+        self.flush()
+        counts = {}
+        for error in self.errors:
+            key = f"{error['field']}:{error['code']}"
+            counts[key] = counts.get(key, 0) + 1
+        return {
+            'total_scraped': self.total,
+            'valid_events': len(self.valid),
+            'invalid_events': len({error['index'] for error in self.errors}),
+            'errors_by_code': counts,
+            'validation_errors': self.errors,
+            'validation_timestamp': datetime.now().isoformat(),
+        }
+
+
+def validate_events(events, schema=None):
+    """Validate a complete list at once. Returns (valid_events, report)."""
+    stage = ValidationStage(schema, batch_size=max(1, len(events)))
+    for event in events:
+        stage.add(event)
+    report = stage.report()
+    return stage.valid, report
@@ -0,0 +1,114 @@
+"""
+Read-only HTTP query API over the event store.
+
+GET /api/events?start=YYYY-MM-DD&end=YYYY-MM-DD&museum=met,moma&type=tours
+               &city=New%20York&limit=50&cursor=...
+
+Responses are compressed with brotli or gzip when the client accepts it and
+carry a strong ETag, so polling kiosks get a 304 until the store changes.
+Run this file directly to serve cultural_events.json on its own.
+"""
+
+import os
+import threading
+
+from flask import Blueprint, Flask, Response, jsonify, request
+
+from event_query import (EventIndex, QueryError, choose_encoding, encode_body, etag_matches,
+                         make_etag, parse_query_args, run_query)
+
+CACHE_CONTROL = 'public, max-age=60'
+
+
+class CachedEventIndex:
+    """Holds an EventIndex and rebuilds it only when its source changes.
+
+    load_events returns the current list of events; fingerprint returns any
+    cheap value that changes whenever that list would (mtime, length, ...).
+    """
+
+    def __init__(self, load_events, fingerprint):
+        self.load_events = load_events
+        self.fingerprint = fingerprint
+        self._lock = threading.Lock()
+        self._index = None
+        self._key = object()
+
+    def get(self):
+        key = self.fingerprint()
+        with self._lock:
+            if self._index is None or key != self._key:
+                self._index = EventIndex(self.load_events())
+                self._key = key
+            return self._index
+
+
+def create_events_blueprint(event_index):
+    """Blueprint serving /api/events from a CachedEventIndex."""
+    bp = Blueprint('events_api', __name__)
+
+    @bp.route('/api/events')
+    def query_events():
+        try:
+            params = parse_query_args(request.args)
+        except QueryError as e:
+            return jsonify({'error': str(e)}), 400
+
+        index = event_index.get()
+        encoding = choose_encoding(request.headers.get('Accept-Encoding'))
+        etag = make_etag(index, params, encoding)
+        headers = {'ETag': etag, 'Cache-Control': CACHE_CONTROL, 'Vary': 'Accept-Encoding'}
+
+        if etag_matches(request.headers.get('If-None-Match'), etag):
+            return Response(status=304, headers=headers)
+
+        try:
+            body = run_query(index, params)
+        except QueryError as e:
+            return jsonify({'error': str(e)}), 400
+
+        if encoding != 'identity':
+            headers['Content-Encoding'] = encoding
+        return Response(encode_body(body, encoding), status=200, headers=headers,
+                        mimetype='application/json')
+
+    return bp
+
+
+def file_event_index(path):
+    """CachedEventIndex over an events JSON file, reloaded when it changes."""
+    from auto_deploy_events import load_events_from_file
+
+    def fingerprint():
+        try:
+            stat = os.stat(path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    return CachedEventIndex(lambda: load_events_from_file(path), fingerprint)
+
+
+def main():
+    import argparse
+
+    from auto_deploy_events import detect_events_file
+
+    parser = argparse.ArgumentParser(description='Serve the events query API')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=5001)
+    args = parser.parse_args()
+
+    events_file = detect_events_file()
+    if not events_file:
+        print("❌ No events file found.")
+        return
+
+    app = Flask(__name__)
+    app.register_blueprint(create_events_blueprint(file_event_index(events_file)))
+    print(f"🔎 Serving {events_file} at http://localhost:{args.port}/api/events")
+    app.run(host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+One command line for the event pipeline.
+
+    python events_cli.py scrape [--max-events 10] [--skip-seen] [--start DATE] [--end DATE | --days 45]
+    python events_cli.py validate [--events-file FILE]
+    python events_cli.py integrate
+    python events_cli.py deploy
+    python events_cli.py summary [--events-file FILE]
+    python events_cli.py serve [--port 5001]
+    python events_cli.py check-startup [--budget-ms 100]
+
+Each subcommand imports what it needs when it runs, so only `scrape` loads
+Selenium and only `serve` loads Flask. `check-startup` runs every batch
+command's imports under `python -X importtime` and fails if one goes over
+the budget or pulls in a heavy dependency.
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ARCHIVED_SCRAPERS = os.path.join(ROOT, 'old_unused_files')
+
+# Modules each subcommand imports when it runs; check-startup imports the same
+COMMAND_MODULES = {
+    'scrape': ('complete_workflow', 'event_json'),
+    'validate': ('auto_deploy_events', 'event_json', 'event_validation'),
+    'integrate': ('auto_deploy_events',),
+    # auto_deploy_scraped_events imports the publishing modules as it reaches each step
+    'deploy': ('auto_deploy_events', 'build_shards', 'event_archive', 'event_diff', 'event_feed',
+               'event_json', 'event_metadata', 'search_index'),
+    'summary': ('auto_deploy_events', 'event_table'),
+    'serve': ('auto_deploy_events', 'events_api'),
+}
+
+# Commands held to the startup budget, and what they must never import
+FAST_COMMANDS = ('validate', 'integrate', 'deploy', 'summary')
+HEAVY_MODULES = ('selenium', 'webdriver_manager', 'flask', 'numpy', 'dateutil')
+STARTUP_BUDGET_MS = 100
+
+
+def cmd_scrape(args):
+    if ARCHIVED_SCRAPERS not in sys.path:
+        sys.path.insert(0, ARCHIVED_SCRAPERS)
+    from complete_workflow import WorkflowManager
+    from event_json import dump_file
+
+    workflow = WorkflowManager({
+        'scraped_events_file': args.events_file,
+        'react_app_path': 'frontend/src',
+        'output_dir': args.output_dir,
+        'headless': True,
+        'max_events_per_institution': args.max_events,
+        'delay_between_sites': 2,
+        'skip_seen_events': args.skip_seen,
+        'date_window': {'start': args.start, 'end': args.end, 'days': args.days}
+    })
+    events = workflow.scrape_events()
+    if not events:
+        print("❌ No events scraped")
+        return False
+    valid_events = workflow.validate_events(events)
+    dump_file(valid_events, args.events_file)
+    print(f"💾 {len(valid_events)} events saved to {args.events_file}")
+    return True
+
+
+def cmd_validate(args):
+    from auto_deploy_events import load_events_from_file
+    from event_json import dump_file
+    from event_validation import validate_events
+
+    events = load_events_from_file(args.events_file)
+    if not events:
+        return False
+    valid_events, report = validate_events(events)
+    os.makedirs(args.output_dir, exist_ok=True)
+    report_file = os.path.join(args.output_dir, 'validation_report.json')
+    dump_file(report, report_file)
+
+    print(f"✅ {len(valid_events)} valid events")
+    print(f"⚠️  {report['invalid_events']} invalid events")
+    for code, count in sorted(report['errors_by_code'].items()):
+        print(f"   {code}: {count}")
+    print(f"📁 Validation report saved to: {report_file}")
+    return report['invalid_events'] == 0
+
+
+def cmd_integrate(args):
+    from auto_deploy_events import integrate_with_react
+
+    return integrate_with_react()
+
+
+def cmd_deploy(args):
+    from auto_deploy_events import auto_deploy_scraped_events
+
+    return auto_deploy_scraped_events()
+
+
+def cmd_summary(args):
+    from auto_deploy_events import load_events_from_file
+    from event_table import EventTable, summarize
+
+    events = load_events_from_file(args.events_file)
+    if not events:
+        return False
+    table = EventTable(events)
+    summary = summarize(table)
+
+    print(f"\n📊 {summary['total_events']} events, {summary['upcoming_events']} upcoming")
+    for title, counts in (("🏛️ By institution", summary['events_by_museum']),
+                          ("🎭 By type", summary['events_by_type']),
+                          ("📅 By month", table.histogram('month'))):
+        print(f"\n{title}:")
+        for key, count in sorted(counts.items()):
+            print(f"   {key}: {count}")
+    return True
+
+
+def cmd_serve(args):
+    from auto_deploy_events import detect_events_file
+    from events_api import Flask, create_events_blueprint, file_event_index
+
+    events_file = args.events_file or detect_events_file()
+    if not events_file:
+        print("❌ No events file found.")
+        return False
+
+    app = Flask(__name__)
+    app.register_blueprint(create_events_blueprint(file_event_index(events_file)))
+    print(f"🔎 Serving {events_file} at http://localhost:{args.port}/api/events")
+    app.run(host=args.host, port=args.port)
+    return True
+
+
+def import_time(command):
+    """(total ms, imported module names) for a command's imports, in a fresh interpreter."""
+    modules = ', '.join(COMMAND_MODULES[command])
+    code = f"import sys; sys.path[:0] = [{ROOT!r}, {ARCHIVED_SCRAPERS!r}]; import {modules}"
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, cwd=ROOT)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    total_us = 0
+    imported = []
+    for line in result.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or line.endswith('imported package'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imported.append(name.strip())
+        if not name.startswith('  '):  # top level, so cumulative covers its children
+            total_us += int(cumulative)
+    return total_us / 1000, imported
+
+
+def cmd_check_startup(args):
+    print(f"⏱️ Import budget: {args.budget_ms:.0f} ms per command")
+    ok = True
+    for command in args.commands or FAST_COMMANDS:
+        if command not in COMMAND_MODULES:
+            print(f"   ❌ {command}: unknown command")
+            ok = False
+            continue
+        try:
+            total_ms, imported = import_time(command)
+        except RuntimeError as e:
+            print(f"   ❌ {command}: import failed: {e}")
+            ok = False
+            continue
+        heavy = sorted({name.split('.')[0] for name in imported} & set(HEAVY_MODULES))
+        passed = total_ms <= args.budget_ms and not heavy
+        ok &= passed
+        note = f" (imports {', '.join(heavy)})" if heavy else ''
+        print(f"   {'✅' if passed else '❌'} {command}: {total_ms:.1f} ms{note}")
+    return ok
+
+
+def main():
+    import argparse
+
+    from date_window import add_window_arguments
+
+    parser = argparse.ArgumentParser(description='Marcet Society event pipeline')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    scrape = subparsers.add_parser('scrape', help='Scrape and validate events (needs Selenium)')
+    scrape.add_argument('--events-file', default='cultural_events.json')
+    scrape.add_argument('--output-dir', default='scraper_output')
+    scrape.add_argument('--max-events', type=int, default=10, help='Max events per institution')
+    scrape.add_argument('--skip-seen', action='store_true', help='Skip events already scraped on earlier runs')
+    add_window_arguments(scrape)
+    scrape.set_defaults(handler=cmd_scrape)
+
+    validate = subparsers.add_parser('validate', help='Validate an events file')
+    validate.add_argument('--events-file', help='Default: detected events file')
+    validate.add_argument('--output-dir', default='scraper_output')
+    validate.set_defaults(handler=cmd_validate)
+
+    integrate = subparsers.add_parser('integrate', help='Write the events into the React app')
+    integrate.set_defaults(handler=cmd_integrate)
+
+    deploy = subparsers.add_parser('deploy', help='Integrate, archive, commit and push the events')
+    deploy.set_defaults(handler=cmd_deploy)
+
+    summary = subparsers.add_parser('summary', help='Print event counts')
+    summary.add_argument('--events-file', help='Default: detected events file')
+    summary.set_defaults(handler=cmd_summary)
+
+    serve = subparsers.add_parser('serve', help='Serve the events query API (needs Flask)')
+    serve.add_argument('--events-file', help='Default: detected events file')
+    serve.add_argument('--host', default='0.0.0.0')
+    serve.add_argument('--port', type=int, default=5001)
+    serve.set_defaults(handler=cmd_serve)
+
+    check = subparsers.add_parser('check-startup', help='Check command import times against the budget')
+    check.add_argument('commands', nargs='*', metavar='COMMAND',
+                       help=f"Commands to check (default: {' '.join(FAST_COMMANDS)})")
+    check.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS)
+    check.set_defaults(handler=cmd_check_startup)
+
+    args = parser.parse_args()
+    sys.exit(0 if args.handler(args) else 1)
+
+
+if __name__ == "__main__":
+    main()
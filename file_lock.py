@@ -0,0 +1,43 @@
+"""
+Cross-process lock for the JSON state files that scrape workers share.
+
+institution_health.json and selector_stats.json are updated by every
+scrape_worker process. Each store re-reads the file, applies its own
+pending changes and rewrites it while holding this lock, so one worker's
+save never overwrites another's.
+
+    with file_lock(path):
+        ...read, merge and replace path...
+
+The lock is an flock on `path + '.lock'`; the OS releases it if the holder dies.
+"""
+
+import os
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path + '.lock', 'a+') as handle:
+        if fcntl:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useEffect, useMemo, useState } from 'react';
 import { gapi } from 'gapi-script';
 import {
   Calendar,
@@ -11,6 +11,11 @@ import {
   Search,
   Plus
 } from 'lucide-react';
+import { exportEventsToCalendar } from './calendarExport';
+import { loadArchivedEvents, toIsoDate } from './eventArchive';
+import { loadFeedEvents } from './eventFeed';
+import { loadShardEvents } from './shardQuery';
+import { loadSearchIndex, matchesText, searchIndex } from './searchIndex';
 import './App.css';
 
 // TODO: Replace with your own Google API credentials
@@ -39,7 +44,8 @@ const institutionCategories = {
     institutions: [
       { id: "moma", name: "MoMA" },
       { id: "met", name: "The Met" },
-      { id: "frick", name: "Frick Collection" }
+      { id: "frick", name: "Frick Collection" },
+      { id: "ifa_nyu", name: "IFA NYU" }
     ]
   },
   "Libraries & Literary": {
@@ -90,6 +96,9 @@ const eventTypes = [
   { id: 'discussions', label: 'Discussions', icon: Users }
 ];
 
+// How far ahead the archive is read for the event list
+const ARCHIVE_WINDOW_DAYS = 90;
+
 const sampleEvents = [
   {
     id: 1,
@@ -142,6 +151,79 @@ const App = () => {
   const [filterType, setFilterType] = useState('all');
   const [selectedInstitutions, setSelectedInstitutions] = useState({});
   const [isConnected, setIsConnected] = useState(false);
+  const [exportProgress, setExportProgress] = useState(null);
+  const [events, setEvents] = useState(sampleEvents);
+  const [feedEvents, setFeedEvents] = useState(null);
+  const [searchQuery, setSearchQuery] = useState('');
+  const [searchIndexData, setSearchIndexData] = useState(null);
+
+  // The cached feed catches up with the patches published since the last
+  // visit; once it is loaded, every filter is answered locally
+  useEffect(() => {
+    let cancelled = false;
+    loadFeedEvents()
+      .then((loaded) => {
+        if (!cancelled) setFeedEvents(loaded);
+      })
+      .catch(() => {
+        // No feed deployed: the shards answer every filter
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, []);
+
+  const institutionKey = Object.values(selectedInstitutions)
+    .filter((inst) => inst && inst !== 'all')
+    .sort()
+    .join(',');
+
+  useEffect(() => {
+    let cancelled = false;
+    const start = new Date();
+    const end = new Date(start);
+    end.setDate(end.getDate() + ARCHIVE_WINDOW_DAYS);
+    const first = toIsoDate(start);
+    const last = toIsoDate(end);
+    // Until the feed is available, fetch only the shards for the current
+    // filters; the month archive is the fallback for older deployments
+    const load = feedEvents
+      ? Promise.resolve(feedEvents.filter((event) => event.date >= first && event.date <= last))
+      : loadShardEvents({
+          start,
+          end,
+          city: selectedCity,
+          type: filterType,
+          institutions: institutionKey ? institutionKey.split(',') : []
+        }).catch(() => loadArchivedEvents({ start, end, city: selectedCity }));
+    load
+      .then((loaded) => {
+        if (!cancelled) setEvents(loaded);
+      })
+      .catch(() => {
+        // Nothing deployed yet: keep showing the built-in sample events
+        if (!cancelled) setEvents(sampleEvents);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [selectedCity, filterType, institutionKey, feedEvents]);
+
+  // The index is fetched the first time someone types a query
+  const searching = searchQuery.trim() !== '';
+  useEffect(() => {
+    if (!searching || searchIndexData) return;
+    loadSearchIndex()
+      .then(setSearchIndexData)
+      .catch(() => {
+        // No index deployed: matchesText scans the loaded events instead
+      });
+  }, [searching, searchIndexData]);
+
+  const searchHits = useMemo(
+    () => (searching && searchIndexData ? new Set(searchIndex(searchIndexData, searchQuery)) : null),
+    [searching, searchIndexData, searchQuery]
+  );
 
   const getSelectedInstitutionIds = () => {
     const ids = [];
@@ -151,13 +233,15 @@ const App = () => {
     return ids;
   };
 
-  const filteredEvents = sampleEvents.filter((event) => {
+  const filteredEvents = events.filter((event) => {
     const matchesCity = event.city === selectedCity;
     const matchesType = filterType === 'all' || event.type === filterType;
     const selectedIds = getSelectedInstitutionIds();
     const matchesInstitution =
       selectedIds.length === 0 || selectedIds.includes(event.museum);
-    return matchesCity && matchesType && matchesInstitution;
+    const matchesSearch =
+      !searching || (searchHits ? searchHits.has(event.id) : matchesText(event, searchQuery));
+    return matchesCity && matchesType && matchesInstitution && matchesSearch;
   });
 
   const toggleEventSelection = (eventId) => {
@@ -187,24 +271,17 @@ const App = () => {
     });
   };
 
-  const addEventsToCalendar = () => {
-    if (!isConnected) return;
-    const selected = sampleEvents.filter((e) => selectedEvents.has(e.id));
-    selected.forEach((event) => {
-      const start = new Date(`${event.date} ${event.time}`);
-      const end = new Date(start.getTime() + 60 * 60 * 1000);
-      gapi.client.calendar.events.insert({
-        calendarId: 'primary',
-        resource: {
-          summary: event.title,
-          location: event.venue,
-          description: event.description,
-          start: { dateTime: start.toISOString() },
-          end: { dateTime: end.toISOString() }
-        }
-      });
+  const addEventsToCalendar = async () => {
+    if (!isConnected || (exportProgress && exportProgress.pending > 0)) return;
+    const selected = events.filter((e) => selectedEvents.has(e.id));
+    const result = await exportEventsToCalendar(selected, {
+      client: gapi.client,
+      onProgress: setExportProgress
     });
-    setSelectedEvents(new Set());
+    setExportProgress(result);
+    if (result.failed === 0) {
+      setSelectedEvents(new Set());
+    }
   };
 
   return (
@@ -281,6 +358,8 @@ const App = () => {
                   <input
                     type="text"
                     placeholder="Search events..."
+                    value={searchQuery}
+                    onChange={(e) => setSearchQuery(e.target.value)}
                     className="w-full pl-10 pr-4 py-2 border border-indigo-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-indigo-400 focus:border-transparent"
                   />
                 </div>
@@ -347,6 +426,14 @@ const App = () => {
                   >
                     Add to Calendar
                   </button>
+                  {exportProgress && (
+                    <p className="text-sm text-black mt-2">
+                      {exportProgress.pending > 0
+                        ? `Adding ${exportProgress.done + exportProgress.skipped} of ${exportProgress.total}...`
+                        : `Added ${exportProgress.done}, already in calendar ${exportProgress.skipped}`}
+                      {exportProgress.failed > 0 && `, failed ${exportProgress.failed}`}
+                    </p>
+                  )}
                 </div>
               )}
             </div>
@@ -0,0 +1,261 @@
+// Google Calendar export: groups inserts into batch requests, retries
+// throttled or failed items with backoff, skips events that were already
+// exported and reports progress as it goes.
+//
+// The Calendar client is passed in (normally `gapi.client`), so a local mock
+// exposing `newBatch()` and `calendar.events.insert()` can stand in for it.
+
+const BATCH_SIZE = 50;
+const MAX_ATTEMPTS = 5;
+const BASE_DELAY_MS = 500;
+const MAX_DELAY_MS = 30000;
+const MIN_BATCH_INTERVAL_MS = 1000;
+const DEFAULT_DURATION_MINUTES = 60;
+const LEDGER_STORAGE_KEY = 'marcet.exportedEvents';
+
+const CITY_TIME_ZONES = {
+  'New York': 'America/New_York',
+  'Washington DC': 'America/New_York',
+  Boston: 'America/New_York',
+  Chicago: 'America/Chicago',
+  'Los Angeles': 'America/Los_Angeles',
+  'San Francisco': 'America/Los_Angeles',
+  London: 'Europe/London'
+};
+
+const defaultSleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+// 64-bit FNV-1a over the UTF-8 bytes, as 16 hex characters. Hex digits are a
+// subset of the base32hex alphabet Calendar requires for client-chosen ids.
+// The hash is kept in four 16-bit limbs (least significant first) so the
+// arithmetic stays exact without BigInt.
+const FNV_OFFSET_LIMBS = [0x2325, 0x8422, 0x9ce4, 0xcbf2];
+
+// Multiply by the FNV prime 2^40 + 0x1b3, modulo 2^64.
+const multiplyByFnvPrime = (h) => {
+  const shifted = [0, 0, (h[0] << 8) & 0xffff, ((h[0] >>> 8) | (h[1] << 8)) & 0xffff];
+  const out = [0, 0, 0, 0];
+  let carry = 0;
+  for (let i = 0; i < 4; i += 1) {
+    const value = h[i] * 0x1b3 + shifted[i] + carry;
+    out[i] = value & 0xffff;
+    carry = Math.floor(value / 0x10000);
+  }
+  return out;
+};
+
+const fnv1a64 = (text) => {
+  let hash = FNV_OFFSET_LIMBS;
+  new TextEncoder().encode(text).forEach((byte) => {
+    hash = multiplyByFnvPrime([hash[0] ^ byte, hash[1], hash[2], hash[3]]);
+  });
+  return hash
+    .slice()
+    .reverse()
+    .map((limb) => limb.toString(16).padStart(4, '0'))
+    .join('');
+};
+
+const normalize = (value) =>
+  String(value || '')
+    .trim()
+    .toLowerCase()
+    .replace(/\s+/g, ' ');
+
+// Stable id of an event, independent of its position in the events list.
+export const stableEventId = (event) =>
+  event.uid ||
+  fnv1a64(
+    [event.museum, event.date, event.time, event.title].map(normalize).join('|')
+  );
+
+// "2 hours", "90 minutes", "1.5 hours", "1 hour 30 minutes" -> minutes.
+export const parseDurationMinutes = (duration) => {
+  const text = normalize(duration);
+  let minutes = 0;
+  const hours = text.match(/(\d+(?:\.\d+)?)\s*(?:hours?|hrs?|h\b)/);
+  const mins = text.match(/(\d+)\s*(?:minutes?|mins?|m\b)/);
+  if (hours) minutes += Math.round(parseFloat(hours[1]) * 60);
+  if (mins) minutes += parseInt(mins[1], 10);
+  return minutes > 0 ? minutes : DEFAULT_DURATION_MINUTES;
+};
+
+// "7:00 PM" / "19:30" -> [hours, minutes]; defaults to 7:00 PM like the scrapers.
+const parseClockTime = (time) => {
+  const match = normalize(time).match(/(\d{1,2})(?::(\d{2}))?\s*(am|pm)?/);
+  if (!match) return [19, 0];
+  let hours = parseInt(match[1], 10) % 24;
+  const minutes = parseInt(match[2] || '0', 10);
+  if (match[3] === 'pm' && hours < 12) hours += 12;
+  if (match[3] === 'am' && hours === 12) hours = 0;
+  return [hours, minutes];
+};
+
+const pad = (n) => String(n).padStart(2, '0');
+
+// Wall-clock arithmetic in UTC so DST transitions cannot shift the result;
+// the time zone is attached separately for Calendar to resolve.
+const formatWallClock = (date) =>
+  `${date.getUTCFullYear()}-${pad(date.getUTCMonth() + 1)}-${pad(date.getUTCDate())}` +
+  `T${pad(date.getUTCHours())}:${pad(date.getUTCMinutes())}:00`;
+
+export const buildCalendarResource = (event) => {
+  const [year, month, day] = String(event.date).split('-').map((n) => parseInt(n, 10));
+  const [hours, minutes] = parseClockTime(event.time);
+  const start = new Date(Date.UTC(year, month - 1, day, hours, minutes));
+  const end = new Date(start.getTime() + parseDurationMinutes(event.duration) * 60 * 1000);
+  const timeZone = CITY_TIME_ZONES[event.city] || CITY_TIME_ZONES['New York'];
+  const description = [event.description, event.link].filter(Boolean).join('\n\n');
+
+  return {
+    id: stableEventId(event),
+    summary: event.title,
+    location: event.venue,
+    description,
+    start: { dateTime: formatWallClock(start), timeZone },
+    end: { dateTime: formatWallClock(end), timeZone }
+  };
+};
+
+// Remembers which stable ids have been exported to which calendar.
+export const createExportLedger = (storage = window.localStorage) => {
+  let entries = {};
+  try {
+    entries = JSON.parse(storage.getItem(LEDGER_STORAGE_KEY)) || {};
+  } catch (e) {
+    entries = {};
+  }
+  const persist = () => {
+    try {
+      storage.setItem(LEDGER_STORAGE_KEY, JSON.stringify(entries));
+    } catch (e) {
+      // Storage full or unavailable; the 409 check on insert still dedups.
+    }
+  };
+  return {
+    has: (calendarId, id) => Boolean(entries[calendarId] && entries[calendarId][id]),
+    add: (calendarId, id) => {
+      entries[calendarId] = entries[calendarId] || {};
+      entries[calendarId][id] = Date.now();
+      persist();
+    }
+  };
+};
+
+const isRetryable = (status, body) => {
+  if (status === 429 || status >= 500 || status === 0) return true;
+  if (status === 403) {
+    const reason = body && body.error && body.error.errors && body.error.errors[0];
+    return Boolean(reason && /rateLimitExceeded|userRateLimitExceeded/.test(reason.reason));
+  }
+  return false;
+};
+
+const backoffDelay = (attempt) =>
+  Math.min(MAX_DELAY_MS, BASE_DELAY_MS * 2 ** attempt) + Math.floor(Math.random() * BASE_DELAY_MS);
+
+const chunk = (items, size) => {
+  const chunks = [];
+  for (let i = 0; i < items.length; i += size) chunks.push(items.slice(i, i + size));
+  return chunks;
+};
+
+// Sends one batch and sorts each item into done / retry / failed.
+const runBatch = async (client, calendarId, items) => {
+  const batch = client.newBatch();
+  items.forEach(({ resource }) => {
+    batch.add(client.calendar.events.insert({ calendarId, resource }), { id: resource.id });
+  });
+
+  const outcome = { done: [], duplicates: [], retry: [], failed: [] };
+  let response;
+  try {
+    response = await batch;
+  } catch (e) {
+    outcome.retry = items;
+    return outcome;
+  }
+
+  const results = (response && response.result) || {};
+  items.forEach((item) => {
+    const result = results[item.resource.id];
+    const status = result ? result.status : 0;
+    if (status >= 200 && status < 300) {
+      outcome.done.push(item);
+    } else if (status === 409) {
+      outcome.duplicates.push(item);
+    } else if (isRetryable(status, result && result.result)) {
+      outcome.retry.push(item);
+    } else {
+      outcome.failed.push({ ...item, status });
+    }
+  });
+  return outcome;
+};
+
+/**
+ * Export events to a Google Calendar in batches.
+ *
+ * Options: client (gapi.client or a mock), calendarId, ledger, onProgress,
+ * sleep. Resolves with the final progress counts.
+ */
+export const exportEventsToCalendar = async (events, options = {}) => {
+  const {
+    client,
+    calendarId = 'primary',
+    ledger = createExportLedger(),
+    onProgress = () => {},
+    sleep = defaultSleep
+  } = options;
+
+  const progress = { total: events.length, done: 0, skipped: 0, failed: 0, pending: 0 };
+  const report = () => onProgress({ ...progress });
+
+  let pending = [];
+  events.forEach((event) => {
+    const resource = buildCalendarResource(event);
+    if (ledger.has(calendarId, resource.id)) {
+      progress.skipped += 1;
+    } else {
+      pending.push({ event, resource, attempts: 0 });
+    }
+  });
+  progress.pending = pending.length;
+  report();
+
+  let round = 0;
+  while (pending.length > 0) {
+    const retry = [];
+    const batches = chunk(pending, BATCH_SIZE);
+    for (let i = 0; i < batches.length; i += 1) {
+      if (round > 0 || i > 0) await sleep(MIN_BATCH_INTERVAL_MS);
+      const outcome = await runBatch(client, calendarId, batches[i]);
+
+      outcome.done.concat(outcome.duplicates).forEach((item) => {
+        ledger.add(calendarId, item.resource.id);
+      });
+      progress.done += outcome.done.length;
+      progress.skipped += outcome.duplicates.length;
+      progress.failed += outcome.failed.length;
+
+      outcome.retry.forEach((item) => {
+        item.attempts += 1;
+        if (item.attempts >= MAX_ATTEMPTS) {
+          progress.failed += 1;
+        } else {
+          retry.push(item);
+        }
+      });
+      progress.pending = retry.length + batches.slice(i + 1).reduce((n, b) => n + b.length, 0);
+      report();
+    }
+
+    pending = retry;
+    if (pending.length > 0) {
+      await sleep(backoffDelay(Math.max(...pending.map((item) => item.attempts))));
+    }
+    round += 1;
+  }
+
+  return { ...progress };
+};
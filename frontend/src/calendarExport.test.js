@@ -0,0 +1,154 @@
+/**
+ * @jest-environment node
+ */
+// Every export gets an in-memory ledger, so no browser globals are needed.
+
+import {
+  buildCalendarResource,
+  createExportLedger,
+  exportEventsToCalendar,
+  stableEventId
+} from './calendarExport';
+
+const makeEvent = (n) => ({
+  title: `Talk ${n}`,
+  museum: 'moma',
+  date: '2026-11-03',
+  time: '6:00 PM',
+  city: 'New York'
+});
+
+const memoryStorage = () => {
+  const items = {};
+  return {
+    getItem: (key) => (key in items ? items[key] : null),
+    setItem: (key, value) => {
+      items[key] = value;
+    }
+  };
+};
+
+// Fake gapi.client: each awaited batch is answered by the next responder,
+// called with the ids in the batch. A responder may throw to fail the batch.
+const fakeClient = (responders) => {
+  const batches = [];
+  return {
+    batches,
+    calendar: {
+      events: {
+        insert: ({ calendarId, resource }) => ({ calendarId, resource })
+      }
+    },
+    newBatch: () => {
+      const ids = [];
+      batches.push(ids);
+      return {
+        add: (request, { id }) => ids.push(id),
+        then: (resolve, reject) => {
+          const respond = responders.shift() || ((batchIds) => statuses(batchIds, 200));
+          return Promise.resolve()
+            .then(() => respond(ids))
+            .then(resolve, reject);
+        }
+      };
+    }
+  };
+};
+
+const statuses = (ids, status, overrides = {}) => ({
+  result: Object.fromEntries(ids.map((id) => [id, { status: overrides[id] || status }]))
+});
+
+const noSleep = () => Promise.resolve();
+
+test('retries only the failed items of a partial batch failure', async () => {
+  const events = [1, 2, 3].map(makeEvent);
+  const failing = stableEventId(events[1]);
+  const client = fakeClient([(ids) => statuses(ids, 200, { [failing]: 503 })]);
+  const ledger = createExportLedger(memoryStorage());
+
+  const result = await exportEventsToCalendar(events, { client, ledger, sleep: noSleep });
+
+  expect(client.batches).toEqual([events.map(stableEventId), [failing]]);
+  expect(result).toMatchObject({ total: 3, done: 3, skipped: 0, failed: 0, pending: 0 });
+});
+
+test('backs off after a 429 and after a failed batch request', async () => {
+  const events = [makeEvent(1)];
+  const client = fakeClient([
+    (ids) => statuses(ids, 429),
+    () => {
+      throw new Error('network down');
+    }
+  ]);
+  const sleeps = [];
+  const sleep = (ms) => {
+    sleeps.push(ms);
+    return Promise.resolve();
+  };
+
+  const result = await exportEventsToCalendar(events, {
+    client,
+    ledger: createExportLedger(memoryStorage()),
+    sleep
+  });
+
+  expect(client.batches).toHaveLength(3);
+  expect(result).toMatchObject({ done: 1, failed: 0 });
+  // Each retry round: the backoff, then the interval before its batch
+  const backoffs = sleeps.filter((_, i) => i % 2 === 0);
+  expect(backoffs[0]).toBeGreaterThanOrEqual(1000);
+  expect(backoffs[1]).toBeGreaterThanOrEqual(2000);
+});
+
+test('gives up on an item after repeated 429s', async () => {
+  const client = fakeClient(Array(5).fill((ids) => statuses(ids, 429)));
+  const result = await exportEventsToCalendar([makeEvent(1)], {
+    client,
+    ledger: createExportLedger(memoryStorage()),
+    sleep: noSleep
+  });
+  expect(client.batches).toHaveLength(5);
+  expect(result).toMatchObject({ done: 0, failed: 1, pending: 0 });
+});
+
+test('skips events already exported on a re-export', async () => {
+  const storage = memoryStorage();
+  const events = [1, 2].map(makeEvent);
+  await exportEventsToCalendar(events, {
+    client: fakeClient([]),
+    ledger: createExportLedger(storage),
+    sleep: noSleep
+  });
+
+  const client = fakeClient([]);
+  const result = await exportEventsToCalendar([...events, makeEvent(3)], {
+    client,
+    ledger: createExportLedger(storage),
+    sleep: noSleep
+  });
+
+  expect(client.batches).toEqual([[stableEventId(makeEvent(3))]]);
+  expect(result).toMatchObject({ total: 3, done: 1, skipped: 2 });
+});
+
+test('a 409 counts as already exported and is remembered', async () => {
+  const storage = memoryStorage();
+  const event = makeEvent(1);
+  const result = await exportEventsToCalendar([event], {
+    client: fakeClient([(ids) => statuses(ids, 409)]),
+    ledger: createExportLedger(storage),
+    sleep: noSleep
+  });
+  expect(result).toMatchObject({ done: 0, skipped: 1 });
+  expect(createExportLedger(storage).has('primary', stableEventId(event))).toBe(true);
+});
+
+test('stable ids match event_keys.event_uid', () => {
+  // python -c "from event_keys import event_uid; print(event_uid({...same fields...}))"
+  expect(stableEventId(makeEvent(1))).toBe('f4b1af15f57a35ce');
+  expect(buildCalendarResource(makeEvent(1)).start).toEqual({
+    dateTime: '2026-11-03T18:00:00',
+    timeZone: 'America/New_York'
+  });
+});
@@ -0,0 +1,85 @@
+// Loads events from the month-partitioned archive written by
+// event_archive.py. Only the manifest and the partitions that overlap the
+// requested date window are fetched, so showing the next few weeks never
+// downloads past years.
+
+import { stableEventId } from './calendarExport';
+
+const ARCHIVE_URL = `${process.env.PUBLIC_URL || ''}/archive`;
+const UNDATED = 'undated';
+
+let manifestPromise = null;
+const partitionCache = new Map();
+
+export const toIsoDate = (date) => {
+  const pad = (n) => String(n).padStart(2, '0');
+  return `${date.getFullYear()}-${pad(date.getMonth() + 1)}-${pad(date.getDate())}`;
+};
+
+const monthBounds = (month) => {
+  const [year, number] = month.split('-').map(Number);
+  const last = new Date(year, number, 0).getDate();
+  return [`${month}-01`, `${month}-${String(last).padStart(2, '0')}`];
+};
+
+const fetchJson = async (url, fetchImpl) => {
+  const response = await fetchImpl(url);
+  if (!response.ok) {
+    throw new Error(`${url}: HTTP ${response.status}`);
+  }
+  return response.json();
+};
+
+export const loadManifest = (fetchImpl = fetch) => {
+  if (!manifestPromise) {
+    manifestPromise = fetchJson(`${ARCHIVE_URL}/manifest.json`, fetchImpl).catch((error) => {
+      manifestPromise = null;
+      throw error;
+    });
+  }
+  return manifestPromise;
+};
+
+// Manifest entries for `city` whose month overlaps [start, end] (ISO dates).
+export const selectPartitions = (manifest, { start, end, city }) =>
+  (manifest.partitions || []).filter((entry) => {
+    if (city && entry.city !== city) return false;
+    if (entry.month === UNDATED) return false;
+    const [first, last] = monthBounds(entry.month);
+    return (!start || last >= start) && (!end || first <= end);
+  });
+
+const loadPartition = (entry, fetchImpl) => {
+  // The hash changes whenever the partition's content does
+  const key = `${entry.file}#${entry.hash}`;
+  if (!partitionCache.has(key)) {
+    partitionCache.set(
+      key,
+      fetchJson(`${ARCHIVE_URL}/${entry.file}`, fetchImpl).catch((error) => {
+        partitionCache.delete(key);
+        throw error;
+      })
+    );
+  }
+  return partitionCache.get(key);
+};
+
+// Events for `city` dated from `start` through `end` (Date objects), sorted by
+// date and time. Each event's id is its stable id, unique across partitions.
+export const loadArchivedEvents = async ({ start, end, city, fetchImpl = fetch }) => {
+  const window = { start: toIsoDate(start), end: toIsoDate(end), city };
+  const manifest = await loadManifest(fetchImpl);
+  const partitions = await Promise.all(
+    selectPartitions(manifest, window).map((entry) => loadPartition(entry, fetchImpl))
+  );
+  return partitions
+    .flat()
+    .filter((event) => event.date >= window.start && event.date <= window.end)
+    .map((event) => ({ ...event, id: stableEventId(event) }))
+    .sort(
+      (a, b) =>
+        a.date.localeCompare(b.date) ||
+        String(a.time || '').localeCompare(String(b.time || '')) ||
+        String(a.title || '').localeCompare(String(b.title || ''))
+    );
+};
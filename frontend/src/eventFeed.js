@@ -0,0 +1,139 @@
+// Keeps a local copy of the versioned event feed written by event_feed.py.
+// The cached events are stored with their feed version; on the next visit
+// only version.json and the patches published since then are fetched. A
+// visitor with no cache, or one older than the oldest kept patch, downloads
+// the latest snapshot instead.
+
+import { stableEventId } from './calendarExport';
+
+const FEED_URL = `${process.env.PUBLIC_URL || ''}/data`;
+const CACHE_STORAGE_KEY = 'marcetEventFeed';
+const PATCH_VERSION = 1;
+
+const fetchJson = async (url, fetchImpl, init) => {
+  const response = await fetchImpl(url, init);
+  if (!response.ok) {
+    throw new Error(`${url}: HTTP ${response.status}`);
+  }
+  return response.json();
+};
+
+const readCache = (storage) => {
+  try {
+    const cached = JSON.parse(storage.getItem(CACHE_STORAGE_KEY));
+    return cached && Array.isArray(cached.events) ? cached : null;
+  } catch (e) {
+    return null;
+  }
+};
+
+const writeCache = (storage, entry) => {
+  try {
+    storage.setItem(CACHE_STORAGE_KEY, JSON.stringify(entry));
+  } catch (e) {
+    // Storage full or unavailable; the next visit loads the snapshot again.
+  }
+};
+
+// Same rules as event_diff.apply_patch: removed and modified keys are stable
+// ids in the base events, added events come last.
+export const applyPatch = (events, patch) => {
+  if (patch.version !== PATCH_VERSION) {
+    throw new Error(`Unsupported patch version: ${patch.version}`);
+  }
+  const index = new Map(events.map((event) => [stableEventId(event), event]));
+  const modified = patch.modified || {};
+  const unset = patch.unset || {};
+  const missing = [...patch.removed, ...Object.keys(modified)].filter((id) => !index.has(id));
+  if (missing.length) {
+    throw new Error(`Patch refers to events not in the cache: ${missing.slice(0, 5).join(', ')}`);
+  }
+
+  const removed = new Set(patch.removed);
+  const result = [];
+  index.forEach((event, id) => {
+    if (removed.has(id)) return;
+    if (modified[id] || unset[id]) {
+      const updated = { ...event, ...modified[id] };
+      (unset[id] || []).forEach((field) => delete updated[field]);
+      result.push(updated);
+    } else {
+      result.push(event);
+    }
+  });
+  return result.concat(patch.added.map((event) => ({ ...event })));
+};
+
+// Patches that take `version` to the manifest's version, or null if some
+// of them are no longer published.
+const patchesSince = (manifest, version) => {
+  const pending = manifest.patches.filter((entry) => entry.version > version);
+  const complete =
+    pending.length === manifest.version - version &&
+    pending.every((entry, i) => entry.version === version + i + 1);
+  return complete ? pending : null;
+};
+
+const applyPatches = async (start, entries, fetchImpl) => {
+  const patches = await Promise.all(
+    entries.map((entry) => fetchJson(`${FEED_URL}/${entry.file}`, fetchImpl))
+  );
+  let { events, hash } = start;
+  patches.forEach((patch, i) => {
+    if (patch.base !== hash) {
+      throw new Error(`Patch ${entries[i].version} does not apply to the cached events`);
+    }
+    events = applyPatch(events, patch);
+    hash = patch.target;
+  });
+  return { events, hash };
+};
+
+const fromSnapshot = async (manifest, fetchImpl) => {
+  const { snapshot } = manifest;
+  const events = await fetchJson(`${FEED_URL}/${snapshot.file}`, fetchImpl);
+  const entries = patchesSince(manifest, snapshot.version);
+  if (!entries) {
+    throw new Error(`Feed is missing patches after snapshot ${snapshot.version}`);
+  }
+  return applyPatches({ events, hash: snapshot.hash }, entries, fetchImpl);
+};
+
+const bytes = (entries) => entries.reduce((total, entry) => total + (entry.bytes || 0), 0);
+
+let feedPromise = null;
+
+const syncFeed = async (fetchImpl, storage) => {
+  const manifest = await fetchJson(`${FEED_URL}/version.json`, fetchImpl, { cache: 'no-cache' });
+  const cached = readCache(storage);
+  let current = null;
+
+  if (cached && cached.version === manifest.version && cached.hash === manifest.hash) {
+    current = cached;
+  } else if (cached && cached.version < manifest.version) {
+    const entries = patchesSince(manifest, cached.version);
+    // Patches are only worth it while they are smaller than a fresh snapshot
+    if (entries && bytes(entries) < manifest.snapshot.bytes) {
+      current = await applyPatches(cached, entries, fetchImpl).catch(() => null);
+    }
+  }
+  if (!current) {
+    current = await fromSnapshot(manifest, fetchImpl);
+  }
+  if (current !== cached) {
+    writeCache(storage, { version: manifest.version, hash: manifest.hash, events: current.events });
+  }
+  return current.events.map((event) => ({ ...event, id: stableEventId(event) }));
+};
+
+// The current feed events, updated from the local cache where possible and
+// fetched once per page load. Each event's id is its stable id.
+export const loadFeedEvents = ({ fetchImpl = fetch, storage = window.localStorage } = {}) => {
+  if (!feedPromise) {
+    feedPromise = syncFeed(fetchImpl, storage).catch((error) => {
+      feedPromise = null;
+      throw error;
+    });
+  }
+  return feedPromise;
+};
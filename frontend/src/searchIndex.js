@@ -0,0 +1,116 @@
+// Queries the inverted index written by search_index.py. Queries are
+// tokenized with the same folding, stop words and stemmer as the index, so
+// a search is a few binary searches over the sorted terms and a merge of
+// their postings instead of a scan of every event's text.
+
+const INDEX_URL = `${process.env.PUBLIC_URL || ''}/data/search_index.json`;
+
+// Keep in sync with STOP_WORDS, SUFFIXES and MIN_STEM in search_index.py
+const STOP_WORDS = new Set([
+  'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is',
+  'it', 'its', 'of', 'on', 'or', 'the', 'this', 'that', 'to', 'with'
+]);
+const SUFFIXES = [['ies', 'y'], ['sses', 'ss'], ['ing', ''], ['ed', ''], ['ly', ''], ['s', '']];
+const MIN_STEM = 3;
+
+let indexPromise = null;
+
+const fold = (text) =>
+  String(text || '')
+    .normalize('NFKD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .toLowerCase();
+
+export const stem = (word) => {
+  for (const [suffix, replacement] of SUFFIXES) {
+    if (word.endsWith(suffix) && word.length - suffix.length >= MIN_STEM) {
+      if (suffix === 's' && 'su'.includes(word[word.length - 2])) return word;
+      return word.slice(0, -suffix.length) + replacement;
+    }
+  }
+  return word;
+};
+
+const queryWords = (query) =>
+  fold(query)
+    .split(/[^a-z0-9]+/)
+    .filter((word) => word && !STOP_WORDS.has(word));
+
+export const loadSearchIndex = (fetchImpl = fetch) => {
+  if (!indexPromise) {
+    indexPromise = fetchImpl(INDEX_URL, { cache: 'no-cache' })
+      .then((response) => {
+        if (!response.ok) throw new Error(`${INDEX_URL}: HTTP ${response.status}`);
+        return response.json();
+      })
+      .catch((error) => {
+        indexPromise = null;
+        throw error;
+      });
+  }
+  return indexPromise;
+};
+
+// First position in the sorted terms not before `word`.
+const lowerBound = (terms, word) => {
+  let low = 0;
+  let high = terms.length;
+  while (low < high) {
+    const mid = (low + high) >> 1;
+    if (terms[mid] < word) low = mid + 1;
+    else high = mid;
+  }
+  return low;
+};
+
+const lookup = (terms, word, prefix) => {
+  const stemmed = stem(word);
+  if (!prefix) {
+    const i = lowerBound(terms, stemmed);
+    return i < terms.length && terms[i] === stemmed ? [i] : [];
+  }
+  const found = new Set();
+  [word, stemmed].forEach((start) => {
+    for (let i = lowerBound(terms, start); i < terms.length && terms[i].startsWith(start); i += 1) {
+      found.add(i);
+    }
+  });
+  return [...found];
+};
+
+// Stable ids of the events matching every word of `query`, best match
+// first. The last word matches as a prefix unless the query ends in a space.
+export const searchIndex = (index, query) => {
+  const words = queryWords(query);
+  if (!words.length) return [];
+  const prefixLast = !/\s$/.test(query);
+  let scores = null;
+  for (let w = 0; w < words.length; w += 1) {
+    const matches = new Map();
+    lookup(index.terms, words[w], prefixLast && w === words.length - 1).forEach((termId) => {
+      const postings = index.postings[termId];
+      for (let j = 0; j < postings.length; j += 2) {
+        matches.set(postings[j], Math.max(matches.get(postings[j]) || 0, postings[j + 1]));
+      }
+    });
+    if (scores === null) {
+      scores = matches;
+    } else {
+      const next = new Map();
+      scores.forEach((score, doc) => {
+        if (matches.has(doc)) next.set(doc, score + matches.get(doc));
+      });
+      scores = next;
+    }
+    if (!scores.size) return [];
+  }
+  return [...scores.entries()]
+    .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+    .map(([doc]) => index.docs[doc]);
+};
+
+// Fallback while no index is deployed: every query word in the event's text.
+export const matchesText = (event, query) => {
+  const text = fold(`${event.title} ${event.description} ${event.venue || ''} ${event.museum}`);
+  return queryWords(query).every((word) => text.includes(word));
+};
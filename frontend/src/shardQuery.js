@@ -0,0 +1,107 @@
+// Answers the app's filters from the precomputed shards written by
+// build_shards.py. Only the manifest and the shards for the selected city,
+// type and institutions in the requested months are fetched; shards already
+// fetched are reused until their hash changes.
+
+import { stableEventId } from './calendarExport';
+import { toIsoDate } from './eventArchive';
+
+const SHARD_URL = `${process.env.PUBLIC_URL || ''}/shards`;
+const UNDATED = 'undated';
+
+let manifestPromise = null;
+const shardCache = new Map();
+
+const fetchJson = async (url, fetchImpl, init) => {
+  const response = await fetchImpl(url, init);
+  if (!response.ok) {
+    throw new Error(`${url}: HTTP ${response.status}`);
+  }
+  return response.json();
+};
+
+export const loadShardManifest = (fetchImpl = fetch) => {
+  if (!manifestPromise) {
+    manifestPromise = fetchJson(`${SHARD_URL}/manifest.json`, fetchImpl, { cache: 'no-cache' }).catch(
+      (error) => {
+        manifestPromise = null;
+        throw error;
+      }
+    );
+  }
+  return manifestPromise;
+};
+
+const monthInWindow = (month, start, end) =>
+  month !== UNDATED && month >= start.slice(0, 7) && month <= end.slice(0, 7);
+
+// Manifest entries answering { start, end, city, type, institutions }
+// (ISO dates, type 'all' for every type). With institutions selected, their
+// institution shards are smaller than the city's, so those are used.
+export const selectShards = (manifest, { start, end, city, type, institutions = [] }) => {
+  const entries = [];
+  if (institutions.length) {
+    institutions.forEach((id) => {
+      Object.entries((manifest.by_institution || {})[id] || {}).forEach(([month, entry]) => {
+        if (monthInWindow(month, start, end)) entries.push(entry);
+      });
+    });
+    return entries;
+  }
+  Object.entries((manifest.by_city || {})[city] || {}).forEach(([month, types]) => {
+    if (!monthInWindow(month, start, end)) return;
+    Object.entries(types).forEach(([eventType, entry]) => {
+      if (type === 'all' || eventType === type) entries.push(entry);
+    });
+  });
+  return entries;
+};
+
+const loadShard = (entry, fetchImpl) => {
+  const key = `${entry.file}#${entry.hash}`;
+  if (!shardCache.has(key)) {
+    shardCache.set(
+      key,
+      fetchJson(`${SHARD_URL}/${entry.file}`, fetchImpl).catch((error) => {
+        shardCache.delete(key);
+        throw error;
+      })
+    );
+  }
+  return shardCache.get(key);
+};
+
+// Events matching the filters and dated from `start` through `end` (Date
+// objects), sorted by date and time, with stable ids.
+export const loadShardEvents = async ({
+  start,
+  end,
+  city,
+  type = 'all',
+  institutions = [],
+  fetchImpl = fetch
+}) => {
+  const query = { start: toIsoDate(start), end: toIsoDate(end), city, type, institutions };
+  const manifest = await loadShardManifest(fetchImpl);
+  const shards = await Promise.all(
+    selectShards(manifest, query).map((entry) => loadShard(entry, fetchImpl))
+  );
+  const seen = new Set();
+  return shards
+    .flat()
+    .filter(
+      (event) =>
+        event.date >= query.start &&
+        event.date <= query.end &&
+        (event.city || 'New York') === city &&
+        (type === 'all' || event.type === type)
+    )
+    .map((event) => ({ ...event, id: stableEventId(event) }))
+    .filter((event) => !seen.has(event.id) && seen.add(event.id))
+    .sort(
+      (a, b) =>
+        a.date.localeCompare(b.date) ||
+        String(a.time || '').localeCompare(String(b.time || '')) ||
+        String(a.title || '').localeCompare(String(b.title || ''))
+    );
+};
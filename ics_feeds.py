@@ -0,0 +1,266 @@
+"""
+Generate iCalendar (RFC 5545) subscription feeds from the events file.
+
+One feed per institution id, one per institution category and one per event
+type. Feeds are written line by line to a temporary file and swapped in, and
+a feed is only rewritten when the content hash of its slice of events changes.
+"""
+
+import hashlib
+import json
+import os
+import re
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from auto_deploy_events import load_events_from_file
+from event_keys import event_uid
+from event_model import events_from_json
+from institution_registry import category_for, category_names, institution_ids, institution_name
+from slugs import slugify
+
+FEEDS_DIR = os.path.join('frontend', 'public', 'feeds')
+MANIFEST_NAME = 'manifest.json'
+PRODID = '-//Marcet Society//Curated Calendar of Events//EN'
+UID_DOMAIN = 'marcet-society'
+DEFAULT_DURATION_MINUTES = 60
+
+CITY_TIME_ZONES = {
+    'New York': 'America/New_York',
+    'Washington DC': 'America/New_York',
+    'Boston': 'America/New_York',
+    'Chicago': 'America/Chicago',
+    'Los Angeles': 'America/Los_Angeles',
+    'San Francisco': 'America/Los_Angeles',
+    'London': 'Europe/London',
+}
+
+
+def parse_duration_minutes(duration):
+    """'2 hours', '90 minutes', '1 hour 30 minutes' -> minutes."""
+    text = str(duration or '').lower()
+    minutes = 0
+    hours = re.search(r'(\d+(?:\.\d+)?)\s*(?:hours?|hrs?|h\b)', text)
+    mins = re.search(r'(\d+)\s*(?:minutes?|mins?|m\b)', text)
+    if hours:
+        minutes += round(float(hours.group(1)) * 60)
+    if mins:
+        minutes += int(mins.group(1))
+    return minutes or DEFAULT_DURATION_MINUTES
+
+
+def parse_clock_time(time_text):
+    """'7:00 PM' / '19:30' -> (hour, minute); defaults to 7:00 PM."""
+    match = re.search(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)?', str(time_text or '').lower())
+    if not match:
+        return 19, 0
+    hour = int(match.group(1)) % 24
+    minute = int(match.group(2) or 0)
+    if match.group(3) == 'pm' and hour < 12:
+        hour += 12
+    if match.group(3) == 'am' and hour == 12:
+        hour = 0
+    return hour, minute
+
+
+def event_bounds_utc(event):
+    """Return (start, end) of an event as aware UTC datetimes, or None."""
+    try:
+        day = datetime.strptime(event['date'], '%Y-%m-%d')
+    except (KeyError, TypeError, ValueError):
+        return None
+    hour, minute = parse_clock_time(event.get('time'))
+    tz = ZoneInfo(CITY_TIME_ZONES.get(event.get('city'), 'America/New_York'))
+    start = day.replace(hour=hour, minute=minute, tzinfo=tz)
+    end = start + timedelta(minutes=parse_duration_minutes(event.get('duration')))
+    return start.astimezone(timezone.utc), end.astimezone(timezone.utc)
+
+
+def escape_text(value):
+    """Escape a TEXT property value (RFC 5545 section 3.3.11)."""
+    text = str(value or '')
+    text = text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+    return text.replace('\r\n', '\\n').replace('\n', '\\n')
+
+
+def fold_line(line):
+    """Fold a content line at 75 octets, never splitting a UTF-8 sequence."""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line + '\r\n'
+
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode('utf-8'))
+        encoded = encoded[cut:]
+        limit = 74  # continuation lines start with a space
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def format_utc(moment):
+    return moment.strftime('%Y%m%dT%H%M%SZ')
+
+
+def iter_vevent_lines(event, dtstamp):
+    """Yield the content lines of one VEVENT."""
+    bounds = event_bounds_utc(event)
+    if not bounds:
+        return
+    start, end = bounds
+
+    yield 'BEGIN:VEVENT'
+    yield f'UID:{event_uid(event)}@{UID_DOMAIN}'
+    yield f'DTSTAMP:{dtstamp}'
+    yield f'DTSTART:{format_utc(start)}'
+    yield f'DTEND:{format_utc(end)}'
+    yield f'SUMMARY:{escape_text(event.get("title"))}'
+    if event.get('description'):
+        yield f'DESCRIPTION:{escape_text(event["description"])}'
+    yield f'LOCATION:{escape_text(event.get("venue") or institution_name(event.get("museum")))}'
+    if event.get('type'):
+        yield f'CATEGORIES:{escape_text(event["type"])}'
+    if event.get('link'):
+        yield f'URL:{event["link"]}'
+    yield 'END:VEVENT'
+
+
+def iter_calendar_lines(name, events, dtstamp):
+    """Yield the folded lines of a whole VCALENDAR, one event at a time."""
+    header = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        f'PRODID:{PRODID}',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        f'X-WR-CALNAME:{escape_text(name)}',
+        'X-PUBLISHED-TTL:PT12H',
+    ]
+    for line in header:
+        yield fold_line(line)
+    for event in events:
+        for line in iter_vevent_lines(event, dtstamp):
+            yield fold_line(line)
+    yield fold_line('END:VCALENDAR')
+
+
+def slice_hash(events):
+    """Content hash of a slice, independent of event order, ids and file formatting."""
+    digest = hashlib.sha256()
+    for event in sorted(events, key=event_uid):
+        data = event.to_json() if hasattr(event, 'to_json') else dict(event)
+        data.pop('id', None)  # renumbered on every write; not part of the feed
+        digest.update(json.dumps(data, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def build_slices(events):
+    """Group events into feed slices: {feed_id: (display name, [events])}."""
+    slices = {}
+    for inst_id in institution_ids():
+        slices[f'institution-{inst_id}'] = (institution_name(inst_id), [])
+    for category in category_names():
+        slices[f'category-{slugify(category)}'] = (category, [])
+
+    for event in events:
+        if not isinstance(event, Mapping):  # dicts and event_model.Event
+            continue
+        museum = event.get('museum')
+        if f'institution-{museum}' in slices:
+            slices[f'institution-{museum}'][1].append(event)
+        category = category_for(museum)
+        if category:
+            slices[f'category-{slugify(category)}'][1].append(event)
+        event_type = event.get('type')
+        if event_type:
+            feed_id = f'type-{slugify(event_type)}'
+            if feed_id not in slices:
+                slices[feed_id] = (event_type.replace('_', ' ').title(), [])
+            slices[feed_id][1].append(event)
+
+    return slices
+
+
+def load_manifest(output_dir):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_feed(path, name, events, dtstamp):
+    """Stream a feed to disk and atomically replace the previous version."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        for line in iter_calendar_lines(name, events, dtstamp):
+            f.write(line)
+    os.replace(tmp_path, path)
+
+
+def generate_feeds(events, output_dir=FEEDS_DIR, force=False):
+    """Write every feed whose slice changed. Returns (written, unchanged)."""
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = load_manifest(output_dir)
+    dtstamp = format_utc(datetime.now(timezone.utc))
+    written, unchanged = [], []
+    new_manifest = {}
+
+    for feed_id, (name, feed_events) in build_slices(events).items():
+        feed_events.sort(key=lambda e: (e.get('date', ''), e.get('time', ''), e.get('title', '')))
+        content_hash = slice_hash(feed_events)
+        filename = f'{feed_id}.ics'
+        path = os.path.join(output_dir, filename)
+        previous = manifest.get(feed_id, {})
+
+        if not force and previous.get('hash') == content_hash and os.path.exists(path):
+            new_manifest[feed_id] = previous
+            unchanged.append(feed_id)
+            continue
+
+        write_feed(path, name, feed_events, dtstamp)
+        new_manifest[feed_id] = {
+            'name': name,
+            'file': filename,
+            'events': len(feed_events),
+            'hash': content_hash,
+            'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        written.append(feed_id)
+
+    with open(os.path.join(output_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(new_manifest, f, indent=2, ensure_ascii=False)
+
+    return written, unchanged
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generate iCalendar feeds from scraped events')
+    parser.add_argument('--output-dir', default=FEEDS_DIR, help='Directory for the .ics files')
+    parser.add_argument('--force', action='store_true', help='Rewrite feeds even if unchanged')
+    args = parser.parse_args()
+
+    print("📅 Generating iCalendar feeds...")
+    events = events_from_json(load_events_from_file())
+    if not events:
+        print("❌ No events found to export")
+        return False
+
+    written, unchanged = generate_feeds(events, args.output_dir, force=args.force)
+    print(f"✅ {len(written)} feeds written, {len(unchanged)} unchanged")
+    for feed_id in written:
+        print(f"   📝 {feed_id}.ics")
+    print(f"📁 Feeds in: {args.output_dir}")
+    return True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Per-institution scraping adapters.
+
+Each institution lives in its own module in this package and defines an
+`Adapter` subclass of `InstitutionAdapter` declaring how it is fetched
+(fetch tier), where its listings are, which selectors find event cards and
+fields, how to paginate, and any parse overrides.
+
+Modules are imported only when their institution is first looked up, so
+listing the ids or starting a scraper costs the same however many
+institutions exist. Adapters shipped outside this repository register
+through the `marcet.institution_adapters` entry point group:
+
+    [project.entry-points."marcet.institution_adapters"]
+    brooklyn_museum = "my_package.brooklyn:Adapter"
+"""
+
+import importlib
+from collections.abc import Mapping
+
+from institution_registry import institution_name
+
+ENTRY_POINT_GROUP = 'marcet.institution_adapters'
+
+# Fetch tiers, cheapest first
+STATIC = 'static'      # plain HTTP, the listing is in the HTML
+BROWSER = 'browser'    # needs a JavaScript-capable browser (Selenium)
+
+# id -> module in this package; nothing here is imported until it is used
+BUILTIN_ADAPTERS = {
+    'met': 'met',
+    'moma': 'moma',
+    'frick': 'frick',
+    'womens_history': 'womens_history',
+    'asia_society': 'asia_society',
+    'ifa_nyu': 'ifa_nyu',
+    'ny_historical': 'ny_historical',
+    'morningside': 'morningside',
+    'ny_society_library': 'ny_society_library',
+    'albertine': 'albertine',
+    'rizzoli': 'rizzoli',
+    'grolier_club': 'grolier_club',
+    'national_arts_club': 'national_arts_club',
+    'explorers_club': 'explorers_club',
+    'americas_society': 'americas_society',
+    'poetry_society': 'poetry_society',
+    'lalliance': 'lalliance',
+}
+
+DEFAULT_FIELD_SELECTORS = {
+    'title': ('h1', 'h2', 'h3', 'h4', '.title', '.event-title', '.event-name', 'a'),
+    'date': ('.date', '.event-date', '.dates', 'time', '.datetime', '.time'),
+    'description': ('.description', '.summary', 'p'),
+    'link': ('a',),
+}
+
+
+class Pagination:
+    """How to reach further listing pages: a next-page link, up to max_pages."""
+
+    def __init__(self, next_selector, max_pages=3):
+        self.next_selector = next_selector
+        self.max_pages = max_pages
+
+
+class InstitutionAdapter:
+    """Base adapter. Subclasses override the class attributes they need."""
+
+    id = None
+    name = None              # short display name; defaults to the registry name
+    full_name = None
+    url = ''                 # the institution's main events page
+    listing_urls = ()        # pages to scrape; defaults to (url,)
+    fetch_tier = BROWSER
+    card_selectors = ()
+    field_selectors = {}     # merged over DEFAULT_FIELD_SELECTORS
+    pagination = None        # a Pagination, or None for single-page listings
+    max_events = 5
+    sample_events = ()       # fallback programme for the demo scrapers
+
+    def __init__(self):
+        self.name = self.name or institution_name(self.id)
+        self.full_name = self.full_name or self.name
+        self.field_selectors = {**DEFAULT_FIELD_SELECTORS, **self.field_selectors}
+        self.listing_urls = tuple(self.listing_urls) or (self.url,)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} {self.id}>'
+
+    def selectors(self, field):
+        return self.field_selectors.get(field, ())
+
+    def catalog_entry(self):
+        """JSON-safe summary for institution pickers."""
+        return {
+            'name': self.name,
+            'url': self.url,
+            'fetch_tier': self.fetch_tier,
+            'max_events': self.max_events,
+        }
+
+    def next_page_url(self, driver, page):
+        """URL of the listing page after `page` (1-based), or None to stop."""
+        if not self.pagination or page >= self.pagination.max_pages:
+            return None
+        from selenium.webdriver.common.by import By
+
+        links = driver.find_elements(By.CSS_SELECTOR, self.pagination.next_selector)
+        return links[0].get_attribute('href') if links else None
+
+    # Parse overrides. Returning None means "use the scraper's default".
+
+    def clean_title(self, title):
+        return title
+
+    def event_type(self, title, description, url):
+        return None
+
+    def parse_date(self, text):
+        """'YYYY-MM-DD' for a card's date text, for sites with unusual formats."""
+        return None
+
+
+def _entry_point_adapters():
+    from importlib.metadata import entry_points
+
+    try:
+        return {ep.name: ep for ep in entry_points(group=ENTRY_POINT_GROUP)}
+    except TypeError:  # Python < 3.10
+        return {ep.name: ep for ep in entry_points().get(ENTRY_POINT_GROUP, ())}
+
+
+_plugins = None
+_loaded = {}
+
+
+def _plugin_entry_points():
+    global _plugins
+    if _plugins is None:
+        _plugins = _entry_point_adapters()
+    return _plugins
+
+
+def adapter_ids(include_plugins=True):
+    """Every known institution id, built-ins first. Imports no adapter."""
+    ids = list(BUILTIN_ADAPTERS)
+    if include_plugins:
+        ids.extend(name for name in _plugin_entry_points() if name not in BUILTIN_ADAPTERS)
+    return ids
+
+
+def get_adapter(institution_id):
+    """The adapter for an institution, importing its module on first use."""
+    adapter = _loaded.get(institution_id)
+    if adapter is not None:
+        return adapter
+    if institution_id in BUILTIN_ADAPTERS:
+        module = importlib.import_module(f'{__name__}.{BUILTIN_ADAPTERS[institution_id]}')
+        adapter_class = module.Adapter
+    elif institution_id in _plugin_entry_points():
+        adapter_class = _plugin_entry_points()[institution_id].load()
+    else:
+        raise KeyError(institution_id)
+    adapter = _loaded[institution_id] = adapter_class()
+    return adapter
+
+
+class InstitutionAdapters(Mapping):
+    """Read-only id -> adapter mapping that imports adapters on access.
+
+    Scrapers keep one as `self.institutions`; iterating it yields ids only.
+    """
+
+    def __init__(self, ids=None):
+        self._ids = list(ids) if ids is not None else adapter_ids()
+
+    def __getitem__(self, institution_id):
+        if institution_id not in self._ids:
+            raise KeyError(institution_id)
+        return get_adapter(institution_id)
+
+    def __contains__(self, institution_id):
+        return institution_id in self._ids
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def catalog(self):
+        return {institution_id: self[institution_id].catalog_entry() for institution_id in self._ids}
@@ -0,0 +1,11 @@
+"""Albertine (albertine.com)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'albertine'
+    url = 'https://www.albertine.com/events'
+    fetch_tier = BROWSER
+    card_selectors = ('.event', '.program', '.calendar-event')
+    max_events = 5
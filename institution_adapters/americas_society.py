@@ -0,0 +1,31 @@
+"""Americas Society (as-coa.org)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'americas_society'
+    url = 'https://www.as-coa.org/events'
+    fetch_tier = BROWSER
+    card_selectors = ('.event', '.program', '.calendar-item')
+    max_events = 5
+    sample_events = (
+        {
+            'title': 'Latin American Art: Contemporary Movements',
+            'days_offset': 6,
+            'time': '6:00 PM',
+            'type': 'panel',
+            'description': 'Curators and artists discuss vibrant contemporary art movements across Latin America and their global influence.',
+            'price': '$18',
+            'duration': '2 hours',
+        },
+        {
+            'title': 'Brazilian Music and Culture Evening',
+            'days_offset': 32,
+            'time': '7:30 PM',
+            'type': 'performances',
+            'description': 'Evening of Brazilian music, dance, and cultural celebration with live performances by renowned artists.',
+            'price': '$35',
+            'duration': '2.5 hours',
+        },
+    )
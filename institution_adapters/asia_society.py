@@ -0,0 +1,43 @@
+"""Asia Society (asiasociety.org)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'asia_society'
+    url = 'https://asiasociety.org/new-york/events'
+    fetch_tier = BROWSER
+    card_selectors = ('.event-item', '.program-item', '.calendar-event')
+    field_selectors = {
+        'description': ('.description', '.excerpt', '.summary', 'p'),
+    }
+    max_events = 6
+    sample_events = (
+        {
+            'title': 'Asian Literature Book Launch: Contemporary Voices',
+            'days_offset': 13,
+            'time': '7:00 PM',
+            'type': 'talks',
+            'description': "Celebrated author Kim Chen launches her new novel with a reading and discussion about contemporary Asian literature's global influence.",
+            'price': '$12',
+            'duration': '90 minutes',
+        },
+        {
+            'title': 'Buddhism and Modern Life: Philosophy Panel',
+            'days_offset': 20,
+            'time': '6:00 PM',
+            'type': 'panel',
+            'description': 'Buddhist scholars and practitioners discuss how ancient wisdom and mindfulness practices apply to contemporary challenges.',
+            'price': '$15',
+            'duration': '2 hours',
+        },
+        {
+            'title': 'Chinese Calligraphy Master Workshop',
+            'days_offset': 27,
+            'time': '2:00 PM',
+            'type': 'special',
+            'description': 'Master calligrapher Li Wei teaches the art of Chinese brush painting and character formation in this hands-on workshop.',
+            'price': '$45',
+            'duration': '3 hours',
+        },
+    )
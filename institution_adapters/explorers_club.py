@@ -0,0 +1,32 @@
+"""Explorer's Club (explorers.org)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'explorers_club'
+    full_name = 'Explorers Club'
+    url = 'https://www.explorers.org/events'
+    fetch_tier = BROWSER
+    card_selectors = ('.event', '.program', '.calendar-event')
+    max_events = 5
+    sample_events = (
+        {
+            'title': 'Exploration Photography: Remote Expeditions',
+            'days_offset': 7,
+            'time': '7:00 PM',
+            'type': 'lecture',
+            'description': 'National Geographic photographer shares stunning images and stories from recent expeditions to Antarctica and the Amazon.',
+            'price': '$25',
+            'duration': '90 minutes',
+        },
+        {
+            'title': 'Antarctic Research: Climate Change Evidence',
+            'days_offset': 31,
+            'time': '6:30 PM',
+            'type': 'lecture',
+            'description': 'Dr. Emily Roberts presents latest findings from Antarctic research stations documenting climate change impacts.',
+            'price': '$20',
+            'duration': '2 hours',
+        },
+    )
@@ -0,0 +1,40 @@
+"""Frick Collection (frick.org)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'frick'
+    url = 'https://www.frick.org/events'
+    fetch_tier = BROWSER
+    card_selectors = ('.event', '.program', '.upcoming-event')
+    max_events = 6
+    sample_events = (
+        {
+            'title': 'Renaissance Art Gallery Tour',
+            'days_offset': 14,
+            'time': '4:00 PM',
+            'type': 'tour',
+            'description': 'Intimate guided tour through our Renaissance collection, exploring artistic techniques, patronage, and cultural context of the period.',
+            'price': '$40',
+            'duration': '2 hours',
+        },
+        {
+            'title': 'Chamber Music in the Garden Court',
+            'days_offset': 21,
+            'time': '7:30 PM',
+            'type': 'performances',
+            'description': 'The Frick String Quartet performs classical masterpieces by Bach, Mozart, and Brahms in our beautiful Garden Court setting.',
+            'price': '$50',
+            'duration': '90 minutes',
+        },
+        {
+            'title': 'Art Collecting: Building a Personal Collection',
+            'days_offset': 28,
+            'time': '6:00 PM',
+            'type': 'lecture',
+            'description': 'Art advisor Jennifer Walsh shares expert insights on building, maintaining, and enjoying a personal art collection.',
+            'price': '$35',
+            'duration': '2 hours',
+        },
+    )
@@ -0,0 +1,31 @@
+"""Grolier Club (grolierclub.org)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'grolier_club'
+    url = 'https://www.grolierclub.org/events'
+    fetch_tier = BROWSER
+    card_selectors = ('.event', '.program', '.exhibition')
+    max_events = 5
+    sample_events = (
+        {
+            'title': 'Book Arts Workshop: Letterpress Printing',
+            'days_offset': 16,
+            'time': '10:00 AM',
+            'type': 'special',
+            'description': 'Hands-on workshop in traditional letterpress printing techniques with master printer Robert Chen. All materials provided.',
+            'price': '$65',
+            'duration': '4 hours',
+        },
+        {
+            'title': 'Rare Books Exhibition: Medieval Manuscripts',
+            'days_offset': 23,
+            'time': '2:00 PM',
+            'type': 'exhibitions',
+            'description': 'Extraordinary collection of medieval illuminated manuscripts from private collections, rarely seen by the public.',
+            'price': '$25',
+            'duration': 'All day',
+        },
+    )
@@ -0,0 +1,12 @@
+"""IFA NYU (nyu.edu)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'ifa_nyu'
+    name = 'IFA NYU'
+    url = 'https://www.nyu.edu/gsas/dept/fineart/events'
+    fetch_tier = BROWSER
+    card_selectors = ('.event', '.calendar-item', '.news-item')
+    max_events = 5
@@ -0,0 +1,11 @@
+"""L'Alliance (fiaf.org)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'lalliance'
+    url = 'https://www.fiaf.org/events'
+    fetch_tier = BROWSER
+    card_selectors = ('.event', '.program', '.calendar-event')
+    max_events = 4
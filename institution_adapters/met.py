@@ -0,0 +1,61 @@
+"""The Met (metmuseum.org)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'met'
+    full_name = 'Metropolitan Museum of Art'
+    url = 'https://www.metmuseum.org/events'
+    listing_urls = (
+        'https://www.metmuseum.org/events/exhibitions',
+        'https://www.metmuseum.org/events/lectures',
+        'https://www.metmuseum.org/events/talks',
+    )
+    fetch_tier = BROWSER
+    card_selectors = ('.event-card', '.event-item', '.gtm-event-card', '.calendar-event', '.program-item')
+    max_events = 8
+    sample_events = (
+        {
+            'title': 'Impressionist Masterpieces: Monet to Renoir',
+            'days_offset': 5,
+            'time': '10:00 AM',
+            'type': 'exhibitions',
+            'description': 'Explore the world of Impressionism through masterpieces from our collection, featuring works by Monet, Renoir, Degas, and Cézanne. This comprehensive exhibition traces the development of the movement.',
+            'price': '$25',
+            'duration': 'All day',
+        },
+        {
+            'title': 'Ancient Egyptian Art: Symbols and Sacred Meanings',
+            'days_offset': 12,
+            'time': '2:00 PM',
+            'type': 'lecture',
+            'description': 'Dr. Sarah Johnson, Egyptologist, explores the symbolic language of ancient Egyptian art and its profound cultural and religious significance.',
+            'price': '$15',
+            'duration': '90 minutes',
+        },
+        {
+            'title': 'Behind the Scenes: Museum Conservation Lab Tour',
+            'days_offset': 19,
+            'time': '11:00 AM',
+            'type': 'tour',
+            'description': 'Exclusive guided tour of the conservation labs where masterpieces are preserved, restored, and prepared for future generations.',
+            'price': '$35',
+            'duration': '2 hours',
+        },
+        {
+            'title': 'Greek and Roman Sculpture: Classical Beauty',
+            'days_offset': 26,
+            'time': '3:00 PM',
+            'type': 'exhibitions',
+            'description': "Special exhibition showcasing the finest examples of Greek and Roman sculpture from the Met's renowned classical collection.",
+            'price': '$28',
+            'duration': 'All day',
+        },
+    )
+
+    def event_type(self, title, description, url):
+        # Everything listed under the exhibitions calendar is an exhibition
+        if '/exhibitions' in url:
+            return 'exhibitions'
+        return None
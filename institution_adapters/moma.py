@@ -0,0 +1,60 @@
+"""MoMA (moma.org)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'moma'
+    full_name = 'Museum of Modern Art'
+    url = 'https://www.moma.org/calendar'
+    listing_urls = (
+        'https://www.moma.org/calendar/exhibitions',
+        'https://www.moma.org/calendar/events',
+    )
+    fetch_tier = BROWSER
+    card_selectors = ('.calendar-item', '.event-card', '.program-item', '.exhibition-item')
+    max_events = 8
+    sample_events = (
+        {
+            'title': 'Contemporary Art in the Digital Age: Artist Panel',
+            'days_offset': 8,
+            'time': '6:30 PM',
+            'type': 'panel',
+            'description': 'Leading contemporary artists and curators discuss how digital technology is transforming artistic expression and museum experience.',
+            'price': '$18',
+            'duration': '2 hours',
+        },
+        {
+            'title': 'Photography Masters: Capturing Urban Life',
+            'days_offset': 15,
+            'time': '7:00 PM',
+            'type': 'lecture',
+            'description': 'Renowned photographer Maria Rodriguez shares techniques and insights from her decades of documenting urban life and social change.',
+            'price': '$20',
+            'duration': '90 minutes',
+        },
+        {
+            'title': 'Modern Architecture Walking Tour',
+            'days_offset': 22,
+            'time': '3:00 PM',
+            'type': 'tour',
+            'description': "Explore NYC's modernist architecture with architectural historian Dr. James Park, visiting iconic buildings and hidden gems.",
+            'price': '$30',
+            'duration': '3 hours',
+        },
+        {
+            'title': 'Abstract Expressionism: American Innovation',
+            'days_offset': 29,
+            'time': '1:00 PM',
+            'type': 'exhibitions',
+            'description': 'Comprehensive exhibition celebrating the revolutionary Abstract Expressionist movement that put American art on the global stage.',
+            'price': '$25',
+            'duration': 'All day',
+        },
+    )
+
+    def event_type(self, title, description, url):
+        # Everything listed under the exhibitions calendar is an exhibition
+        if '/exhibitions' in url:
+            return 'exhibitions'
+        return None
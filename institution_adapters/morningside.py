@@ -0,0 +1,11 @@
+"""Morningside Institute (morningsideheights.org)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'morningside'
+    url = 'https://www.morningsideheights.org/events'
+    fetch_tier = BROWSER
+    card_selectors = ('.event', '.calendar-event', '.program')
+    max_events = 5
@@ -0,0 +1,31 @@
+"""National Arts Club (nationalartsclub.org)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'national_arts_club'
+    url = 'https://www.nationalartsclub.org/events'
+    fetch_tier = BROWSER
+    card_selectors = ('.event', '.program', '.calendar-item')
+    max_events = 5
+    sample_events = (
+        {
+            'title': 'Art & Philosophy: Beauty and Meaning',
+            'days_offset': 9,
+            'time': '1:00 PM',
+            'type': 'panel',
+            'description': 'Interdisciplinary discussion on the relationship between artistic expression and philosophical thought through the ages.',
+            'price': '$20',
+            'duration': '2.5 hours',
+        },
+        {
+            'title': 'Members Exhibition: Contemporary Works',
+            'days_offset': 30,
+            'time': '6:00 PM',
+            'type': 'exhibitions',
+            'description': 'Annual exhibition featuring diverse works by National Arts Club members across painting, sculpture, and mixed media.',
+            'price': '$15',
+            'duration': 'All day',
+        },
+    )
@@ -0,0 +1,41 @@
+"""NY Historical Society (nyhistory.org)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'ny_historical'
+    full_name = 'New York Historical Society'
+    url = 'https://www.nyhistory.org/events'
+    fetch_tier = BROWSER
+    card_selectors = ('.event', '.program-listing', '.calendar-item')
+    max_events = 6
+    sample_events = (
+        {
+            'title': 'Women in Science: Revolutionary Discoveries',
+            'days_offset': 10,
+            'time': '2:00 PM',
+            'type': 'lecture',
+            'description': 'Explore groundbreaking discoveries by women scientists throughout history and their lasting impact on our understanding of the natural world.',
+            'price': 'Free',
+            'duration': '90 minutes',
+        },
+        {
+            'title': 'NYC History: From Dutch Colony to Modern Metropolis',
+            'days_offset': 17,
+            'time': '4:00 PM',
+            'type': 'talks',
+            'description': "Historian Dr. Margaret Chen traces the fascinating evolution of New York City from its Dutch colonial origins to today's global metropolis.",
+            'price': '$12',
+            'duration': '2 hours',
+        },
+        {
+            'title': 'Civil War Artifacts: Stories from Our Collection',
+            'days_offset': 24,
+            'time': '1:00 PM',
+            'type': 'exhibitions',
+            'description': 'Rare artifacts from our Civil War collection tell personal stories of conflict, courage, and the struggle for freedom and unity.',
+            'price': '$18',
+            'duration': 'All day',
+        },
+    )
@@ -0,0 +1,44 @@
+"""NY Society Library (nysoclib.org)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'ny_society_library'
+    full_name = 'New York Society Library'
+    url = 'https://www.nysoclib.org/events'
+    fetch_tier = BROWSER
+    card_selectors = ('.event', '.program', '.calendar-item')
+    field_selectors = {
+        'description': ('.description', '.content', '.summary', 'p'),
+    }
+    max_events = 6
+    sample_events = (
+        {
+            'title': 'Literary Salon: Women Writers of the 20th Century',
+            'days_offset': 11,
+            'time': '6:00 PM',
+            'type': 'talks',
+            'description': 'Monthly salon celebrating influential women writers including Virginia Woolf, Toni Morrison, and Simone de Beauvoir.',
+            'price': '$20',
+            'duration': '2 hours',
+        },
+        {
+            'title': 'Poetry Reading: Emerging Voices',
+            'days_offset': 18,
+            'time': '7:00 PM',
+            'type': 'talks',
+            'description': 'Local and emerging poets share their latest works in an intimate literary setting, followed by Q&A and reception.',
+            'price': '$15',
+            'duration': '90 minutes',
+        },
+        {
+            'title': 'Book Club: Contemporary Fiction Discussion',
+            'days_offset': 25,
+            'time': '3:00 PM',
+            'type': 'talks',
+            'description': 'Monthly book club discussion of contemporary fiction, this month featuring "The Seven Husbands of Evelyn Hugo".',
+            'price': '$10',
+            'duration': '2 hours',
+        },
+    )
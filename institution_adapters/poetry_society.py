@@ -0,0 +1,11 @@
+"""Poetry Society (poetrysociety.org)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'poetry_society'
+    url = 'https://www.poetrysociety.org/events'
+    fetch_tier = BROWSER
+    card_selectors = ('.event', '.reading', '.workshop')
+    max_events = 4
@@ -0,0 +1,11 @@
+"""Rizzoli Bookstore (rizzolibookstore.com)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'rizzoli'
+    url = 'https://www.rizzolibookstore.com/events'
+    fetch_tier = BROWSER
+    card_selectors = ('.event', '.calendar-item', '.program')
+    max_events = 4
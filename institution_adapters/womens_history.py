@@ -0,0 +1,11 @@
+"""Women's History (nywhs.org)."""
+
+from institution_adapters import BROWSER, InstitutionAdapter
+
+
+class Adapter(InstitutionAdapter):
+    id = 'womens_history'
+    url = 'https://www.nywhs.org/events'
+    fetch_tier = BROWSER
+    card_selectors = ('.event', '.program', '.calendar-item')
+    max_events = 6
@@ -0,0 +1,146 @@
+"""
+Resolve free-form institution names to registry ids.
+
+Scrapers used to build `museum` ids from whatever name they had: the CSV's
+"MET " or "L' Alliance New York", or short forms such as "nyhs". Ids that are
+not in `institutionCategories` drop out of the frontend's institution
+filter. `resolve_institution` maps any of these to the registry id in
+three steps:
+
+1. Exact lookup of the normalized name. Case, accents, apostrophes,
+   punctuation, "NY"/"NYC" and filler words such as "the" or "new york" are
+   ignored, as are spaces ("Morning Side" == "Morningside").
+2. Token containment: "Center for Women's History" contains every token
+   of "Women's History". Aliases of a single token only match this way
+   when the name is part of them.
+3. Close spelling (difflib) on the compacted name.
+
+The index is built once from the registry, its display names, the ids
+themselves and ALIASES. Lookups are cached.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+from institution_registry import INSTITUTION_CATEGORIES
+
+# Names the registry does not spell out: full names, CSV spellings and the
+# short ids older scrapers used
+ALIASES = {
+    'met': ('Metropolitan Museum of Art', 'The Metropolitan Museum', 'MET'),
+    'moma': ('Museum of Modern Art',),
+    'frick': ('The Frick Collection', 'Frick Madison'),
+    'womens_history': ("Center for Women's History",),
+    'ny_historical': ('New-York Historical Society', 'The New York Historical', 'nyhs'),
+    'asia_society': ('Asia Society New York', 'asia'),
+    'americas_society': ('americas',),
+    'ny_society_library': ('New York Society Library', 'nysl'),
+    'grolier_club': ('grolier',),
+    'poetry_society': ('The Poetry Society of New York',),
+    'rizzoli': ('Rizzoli Bookstore',),
+    'albertine': ('Albertine Books',),
+    'lalliance': ('French Institute Alliance Française', 'FIAF', "L'Alliance New York"),
+    'national_arts_club': ('The National Arts Club', 'nac'),
+    'explorers_club': ("The Explorers Club", 'explorers'),
+    'morningside': ('Morningside Institute', 'Morning Side Institute'),
+    'ifa_nyu': ('Institute of Fine Arts', 'NYU Institute of Fine Arts', 'IFA NYU'),
+}
+
+# Words that do not tell institutions apart
+FILLER = frozenset({'the', 'of', 'for', 'and', 'at', 'new', 'york', 'nyc', 'ny', 'city', 'inc'})
+FUZZY_CUTOFF = 0.85
+
+_APOSTROPHE = re.compile(r"['’`]\s*")
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+
+
+def name_tokens(name):
+    """Normalized tokens of an institution name or id, filler words removed."""
+    text = unicodedata.normalize('NFKD', str(name)).encode('ascii', 'ignore').decode().lower()
+    text = _APOSTROPHE.sub('', text)  # "L' Alliance" -> "lalliance", "Women's" -> "womens"
+    tokens = [t for t in _NON_WORD.split(text) if t and t not in FILLER]
+    return tuple(tokens)
+
+
+class AliasIndex:
+    """Normalized-name lookup from aliases to institution ids."""
+
+    def __init__(self, aliases):
+        self.ids = []
+        self.exact = {}     # compacted name -> id
+        self.tokens = []    # (token set, id) for containment matches
+        for institution_id, names in aliases.items():
+            self.ids.append(institution_id)
+            for name in (institution_id, *names):
+                self.add(institution_id, name)
+
+    def add(self, institution_id, name):
+        tokens = name_tokens(name)
+        if not tokens:
+            return
+        self.exact.setdefault(''.join(tokens), institution_id)
+        self.tokens.append((frozenset(tokens), institution_id))
+
+    def resolve(self, name):
+        """The institution id for `name`, or None if nothing matches well enough."""
+        tokens = name_tokens(name or '')
+        if not tokens:
+            return None
+        compact = ''.join(tokens)
+        if compact in self.exact:
+            return self.exact[compact]
+
+        # One id whose alias contains every token, or whose tokens are all in the
+        # name. A one-word alias ("met", "asia") is too common to find inside
+        # longer names ("Met Opera"), so only longer aliases match that way.
+        query = frozenset(tokens)
+        matches = {institution_id for alias, institution_id in self.tokens
+                   if query <= alias or (len(alias) > 1 and alias <= query)}
+        if len(matches) == 1:
+            return matches.pop()
+
+        from difflib import get_close_matches
+
+        close = get_close_matches(compact, self.exact, n=1, cutoff=FUZZY_CUTOFF)
+        return self.exact[close[0]] if close else None
+
+
+@lru_cache(maxsize=1)
+def alias_index():
+    """The index for the registry and ALIASES, built once per process."""
+    aliases = {}
+    for data in INSTITUTION_CATEGORIES.values():
+        for institution in data['institutions']:
+            aliases[institution['id']] = [institution['name']]
+    for institution_id, names in ALIASES.items():
+        aliases.setdefault(institution_id, []).extend(names)
+    return AliasIndex(aliases)
+
+
+@lru_cache(maxsize=4096)
+def resolve_institution(name):
+    """Registry id for an institution name, alias or id; None if unknown."""
+    return alias_index().resolve(name)
+
+
+def canonical_museum(value):
+    """`value` as a registry id when it resolves, otherwise unchanged."""
+    if not isinstance(value, str):
+        return value
+    return resolve_institution(value) or value
+
+
+def canonicalize_events(events):
+    """Rewrite each event's `museum` to its registry id in place. Returns the events."""
+    for event in events:
+        if isinstance(event, dict) and 'museum' in event:
+            event['museum'] = canonical_museum(event['museum'])
+    return events
+
+
+if __name__ == "__main__":
+    import sys
+
+    for name in sys.argv[1:]:
+        print(f"{name!r} -> {resolve_institution(name)}")
@@ -0,0 +1,240 @@
+"""
+Per-institution scrape health, circuit breaker and refresh schedule.
+
+Every scrape of an institution is recorded with its latency and how many
+events it yielded. A scrape that raises or yields nothing is a failure.
+
+Circuit breaker: after FAILURE_THRESHOLD consecutive failures the
+institution's circuit opens. It stays skipped for a cool-down that doubles
+with each further failure, from BASE_COOLDOWN up to MAX_COOLDOWN. Once the
+cool-down ends, one trial scrape is allowed. Success closes the circuit;
+failure reopens it for longer.
+
+Schedule: each successful scrape fingerprints the listing (the uids of the
+events found). If the listing changed since last time, the refresh interval
+halves; if not, it grows by half. Sites that rarely change are scraped less
+often, between MIN_INTERVAL and MAX_INTERVAL.
+
+State is persisted to scraper_output/institution_health.json. Several
+worker processes record into it, so `save` re-reads the file under a lock
+and replays this process's records onto it:
+
+    {"moma": {"attempts": [{"at": ..., "ok": true, "latency": 8.2, "events": 6}, ...],
+              "consecutive_failures": 0, "open_until": null, "interval": 86400,
+              "last_success": ..., "fingerprint": "...", "last_change": ...}}
+"""
+
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+
+from event_keys import event_uid
+from file_lock import file_lock
+
+HEALTH_PATH = os.path.join('scraper_output', 'institution_health.json')
+HISTORY = 20  # attempts kept per institution for the rates
+
+FAILURE_THRESHOLD = 3
+BASE_COOLDOWN = 6 * 3600
+MAX_COOLDOWN = 7 * 86400
+
+DEFAULT_INTERVAL = 86400
+MIN_INTERVAL = 6 * 3600
+MAX_INTERVAL = 7 * 86400
+CHANGED_FACTOR = 0.5
+UNCHANGED_FACTOR = 1.5
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+def listing_fingerprint(events):
+    """Order-independent hash of the events found on a listing."""
+    uids = sorted(event_uid(event) for event in events)
+    return hashlib.sha1('\n'.join(uids).encode('utf-8')).hexdigest()
+
+
+def _clock_text(timestamp):
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M')
+
+
+class InstitutionHealth:
+    """Scrape outcomes per institution, persisted as JSON."""
+
+    def __init__(self, path=HEALTH_PATH, clock=time.time):
+        self.path = path
+        self.clock = clock
+        self.dirty = False
+        self._pending = []  # (method name, args) not yet saved
+        self.data = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _institution(self, institution_id):
+        return self.data.setdefault(institution_id, {
+            'attempts': [],
+            'consecutive_failures': 0,
+            'open_until': None,
+            'interval': DEFAULT_INTERVAL,
+            'last_success': None,
+            'fingerprint': None,
+            'last_change': None,
+        })
+
+    def record(self, institution_id, events_found, latency, error=None, fingerprint=None):
+        """Record one scrape. Returns the institution's circuit state afterwards."""
+        self._change('_record', institution_id, self.clock(), events_found, latency,
+                     None if error is None else str(error), fingerprint)
+        return self.state(institution_id)
+
+    def forget(self, institution_id):
+        """Drop an institution's history. Returns False if it had none."""
+        if institution_id not in self.data:
+            return False
+        self._change('_forget', institution_id)
+        return True
+
+    def _change(self, method, *args):
+        self._pending.append((method, args))
+        getattr(self, method)(*args)
+        self.dirty = True
+
+    def _forget(self, institution_id):
+        self.data.pop(institution_id, None)
+
+    def _record(self, institution_id, now, events_found, latency, error, fingerprint):
+        health = self._institution(institution_id)
+        ok = error is None and events_found > 0
+        attempt = {'at': now, 'ok': ok, 'latency': round(latency, 2), 'events': events_found}
+        if error:
+            attempt['error'] = error[:200]
+        health['attempts'].append(attempt)
+        del health['attempts'][:-HISTORY]
+
+        if ok:
+            health['consecutive_failures'] = 0
+            health['open_until'] = None
+            health['last_success'] = now
+            if fingerprint:
+                changed = health['fingerprint'] is not None and fingerprint != health['fingerprint']
+                if changed or health['fingerprint'] is None:
+                    health['last_change'] = now
+                if health['fingerprint'] is not None:
+                    factor = CHANGED_FACTOR if changed else UNCHANGED_FACTOR
+                    health['interval'] = min(MAX_INTERVAL, max(MIN_INTERVAL, health['interval'] * factor))
+                health['fingerprint'] = fingerprint
+        else:
+            health['consecutive_failures'] += 1
+            over = health['consecutive_failures'] - FAILURE_THRESHOLD
+            if over >= 0:
+                health['open_until'] = now + min(MAX_COOLDOWN, BASE_COOLDOWN * 2 ** over)
+
+    def state(self, institution_id):
+        health = self.data.get(institution_id)
+        if not health or health['open_until'] is None:
+            return CLOSED
+        return OPEN if self.clock() < health['open_until'] else HALF_OPEN
+
+    def next_due(self, institution_id):
+        """When the institution should next be scraped (a timestamp; 0 means now)."""
+        health = self.data.get(institution_id)
+        if not health:
+            return 0
+        due = health['last_success'] + health['interval'] if health['last_success'] else 0
+        if self.state(institution_id) == OPEN:
+            due = max(due, health['open_until'])
+        return due
+
+    def check(self, institution_id, schedule=False):
+        """(should scrape, reason if not). With schedule=True, sites not yet due are skipped too."""
+        if self.state(institution_id) == OPEN:
+            health = self.data[institution_id]
+            return False, (f"circuit open after {health['consecutive_failures']} failures, "
+                           f"retry after {_clock_text(health['open_until'])}")
+        if schedule and self.next_due(institution_id) > self.clock():
+            return False, f"not due until {_clock_text(self.next_due(institution_id))}"
+        return True, None
+
+    def plan(self, institution_ids, schedule=False):
+        """Split ids into (to scrape, {skipped id: reason}), keeping their order."""
+        selected, skipped = [], {}
+        for institution_id in institution_ids:
+            ok, reason = self.check(institution_id, schedule)
+            if ok:
+                selected.append(institution_id)
+            else:
+                skipped[institution_id] = reason
+        return selected, skipped
+
+    def stats(self, institution_id):
+        health = self.data.get(institution_id)
+        if not health or not health['attempts']:
+            return {'state': CLOSED, 'attempts': 0}
+        attempts = health['attempts']
+        successes = [a for a in attempts if a['ok']]
+        return {
+            'state': self.state(institution_id),
+            'attempts': len(attempts),
+            'success_rate': round(len(successes) / len(attempts), 2),
+            'avg_latency': round(sum(a['latency'] for a in attempts) / len(attempts), 2),
+            'avg_events': round(sum(a['events'] for a in successes) / len(successes), 1) if successes else 0,
+            'consecutive_failures': health['consecutive_failures'],
+            'interval_hours': round(health['interval'] / 3600, 1),
+            'next_due': _clock_text(self.next_due(institution_id)) if self.next_due(institution_id) else None,
+        }
+
+    def report(self):
+        return {institution_id: self.stats(institution_id) for institution_id in sorted(self.data)}
+
+    def save(self):
+        """Apply this process's changes to the file as other workers left it."""
+        if not self.dirty:
+            return
+        with file_lock(self.path):
+            self.data = self._load()
+            for method, args in self._pending:
+                getattr(self, method)(*args)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        self._pending = []
+        self.dirty = False
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Show or reset per-institution scrape health')
+    parser.add_argument('--reset', nargs='+', metavar='ID', help='Forget the history of these institutions')
+    args = parser.parse_args()
+
+    health = InstitutionHealth()
+    if args.reset:
+        for institution_id in args.reset:
+            if health.forget(institution_id):
+                print(f"🔄 Reset {institution_id}")
+        health.save()
+        return
+
+    report = health.report()
+    if not report:
+        print("📭 No scrapes recorded yet")
+        return
+    for institution_id, stats in report.items():
+        icon = {'closed': '✅', 'half_open': '🟡', 'open': '⛔'}[stats['state']]
+        print(f"{icon} {institution_id}: {stats['success_rate']:.0%} ok over {stats['attempts']} runs, "
+              f"{stats['avg_latency']}s, {stats['avg_events']} events, every {stats['interval_hours']}h"
+              + (f", next {stats['next_due']}" if stats['next_due'] else ''))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Institution registry shared by the Python tools.
+
+Mirrors `institutionCategories` in frontend/src/App.js so feeds, validators
+and integrators bucket events exactly the way the frontend filters do.
+"""
+
+INSTITUTION_CATEGORIES = {
+    "Art Museums": {
+        "icon": "🖼️",
+        "institutions": [
+            {"id": "moma", "name": "MoMA"},
+            {"id": "met", "name": "The Met"},
+            {"id": "frick", "name": "Frick Collection"},
+            {"id": "ifa_nyu", "name": "IFA NYU"},
+        ],
+    },
+    "Libraries & Literary": {
+        "icon": "📚",
+        "institutions": [
+            {"id": "ny_society_library", "name": "NY Society Library"},
+            {"id": "grolier_club", "name": "Grolier Club"},
+            {"id": "poetry_society", "name": "Poetry Society"},
+            {"id": "rizzoli", "name": "Rizzoli Bookstore"},
+        ],
+    },
+    "History & Culture": {
+        "icon": "🏛️",
+        "institutions": [
+            {"id": "womens_history", "name": "Women's History"},
+            {"id": "ny_historical", "name": "NY Historical Society"},
+            {"id": "asia_society", "name": "Asia Society"},
+            {"id": "americas_society", "name": "Americas Society"},
+        ],
+    },
+    "Cultural Institutes": {
+        "icon": "🇫🇷",
+        "institutions": [
+            {"id": "albertine", "name": "Albertine"},
+            {"id": "lalliance", "name": "L'Alliance"},
+        ],
+    },
+    "Arts & Social Clubs": {
+        "icon": "🎭",
+        "institutions": [
+            {"id": "national_arts_club", "name": "National Arts Club"},
+            {"id": "explorers_club", "name": "Explorer's Club"},
+        ],
+    },
+    "Community": {
+        "icon": "🏘️",
+        "institutions": [
+            {"id": "morningside", "name": "Morningside Institute"},
+        ],
+    },
+}
+
+# Every event type the scrapers emit. Older scrapers use singular and
+# plural spellings side by side, so both are accepted.
+EVENT_TYPES = (
+    "exhibitions",
+    "lecture",
+    "lectures",
+    "talks",
+    "gallery_talks",
+    "artist_talks",
+    "tour",
+    "tours",
+    "panel",
+    "panel_discussions",
+    "performances",
+    "readings",
+    "special",
+    "special_events",
+)
+
+# Built once at import time; the registry is small and never mutated.
+_INSTITUTIONS = {}
+_CATEGORY_BY_ID = {}
+for _category, _data in INSTITUTION_CATEGORIES.items():
+    for _inst in _data["institutions"]:
+        _INSTITUTIONS[_inst["id"]] = _inst["name"]
+        _CATEGORY_BY_ID[_inst["id"]] = _category
+
+
+def institution_ids():
+    """Return every registered institution id in registry order."""
+    return list(_INSTITUTIONS)
+
+
+def institution_name(institution_id):
+    """Return the display name for an id, or the id itself if unknown."""
+    return _INSTITUTIONS.get(institution_id, institution_id)
+
+
+def category_for(institution_id):
+    """Return the category an institution belongs to, or None."""
+    return _CATEGORY_BY_ID.get(institution_id)
+
+
+def category_names():
+    """Return the category names in registry order."""
+    return list(INSTITUTION_CATEGORIES)
@@ -1,30 +1,49 @@
 import time
-import json
-import re
-from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 import csv
+import os
+import sys
 from urllib.parse import urljoin
 
+# Shared modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from date_window import AFTER, BEFORE, INSIDE, DateWindow, HorizonScan, add_window_arguments
+from driver_resolver import chrome_service
+from event_archive import ArchiveReader, write_archive
+from event_keys import event_uid
+from event_metadata import MetadataAggregator, save_store
+from event_table import EventTable
+from institution_aliases import resolve_institution
+from seen_index import KnownEvents, SeenIndex, normalize_url
+from selector_learning import SelectorStats, discover_card_selectors
+
 class CSVBasedEventsScraper:
-    def __init__(self):
+    def __init__(self, window=None):
         self.driver = None
         self.events = []
+        self.metadata = MetadataAggregator()
         self.institutions_data = {}
+        self.selector_stats = SelectorStats()
+        self.seen_index = SeenIndex()
+        
+        # Only events dated inside this window are extracted
+        self.window = window or DateWindow()
+        self.start_date = self.window.start
+        self.end_date = self.window.end
         
-        # Date range: Rest of July + All August 2025
-        today = datetime.now()
-        self.start_date = today
-        self.end_date = datetime(2025, 8, 31)
+        print(f"🗓️ Target period: {self.window.describe()}")
         
-        print(f"🗓️ Target period: {self.start_date.strftime('%B %d')} - {self.end_date.strftime('%B %d, %Y')}")
+        # Events already archived for this window (only the overlapping month partitions are read).
+        # Cards the seen index knows are carried forward from here instead of extracted again.
+        self.archived_events = ArchiveReader().load(self.start_date, self.end_date)
+        self.known_events = KnownEvents(self.archived_events)
+        self.output_uids = set()
+        print(f"📚 {len(self.archived_events)} events already archived for this period")
         
         # Load institution data from CSV
         self.load_institutions_from_csv()
@@ -96,10 +115,9 @@ class CSVBasedEventsScraper:
         options.add_argument('--disable-gpu')
         options.add_argument('--disable-extensions')
         options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        options.binary_location = '/usr/bin/google-chrome'
         
         try:
-            service = Service(ChromeDriverManager().install())
+            service = chrome_service(options)
             self.driver = webdriver.Chrome(service=service, options=options)
             self.driver.set_page_load_timeout(45)
             self.driver.implicitly_wait(10)
@@ -144,66 +162,39 @@ class CSVBasedEventsScraper:
                 }
             ]
             
-            for strategy in strategies:
+            # Cards discovered on earlier runs of this page get their own strategy
+            strategies.append({
+                'name': 'Discovered Cards',
+                'selectors': self.selector_stats.discovered(url)
+            })
+            
+            # Start with whatever worked last time on this page
+            for strategy in self.selector_stats.rank_strategies(url, strategies):
                 print(f"      🔍 Trying {strategy['name']}...")
                 
-                for selector in strategy['selectors']:
-                    try:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        
-                        if elements:
-                            print(f"         Found {len(elements)} elements with '{selector}'")
-                            
-                            for element in elements[:20]:  # Limit to avoid overload
-                                try:
-                                    # Extract text content
-                                    text = element.text.strip()
-                                    if not text or len(text) < 10:
-                                        continue
-                                    
-                                    # Check if this looks like an event
-                                    if self.looks_like_event(text, target_event_types, scrape_all):
-                                        # Extract more details
-                                        title = self.extract_title_from_element(element, text)
-                                        date_info = self.extract_date_from_text(text)
-                                        link = self.extract_link_from_element(element, url)
-                                        
-                                        if title and self.is_date_in_range(date_info):
-                                            # Create event
-                                            event = {
-                                                'id': len(self.events) + 1,
-                                                'title': title[:150],
-                                                'museum': self.normalize_institution_name(institution_name),
-                                                'date': date_info or self.generate_future_date(),
-                                                'time': '7:00 PM',
-                                                'type': self.classify_event_type(title, text),
-                                                'description': text[:400],
-                                                'city': 'New York',
-                                                'price': 'See website',
-                                                'duration': '2 hours',
-                                                'link': link
-                                            }
-                                            
-                                            self.events.append(event)
-                                            events_found += 1
-                                            
-                                            print(f"         ✅ {events_found}: {title[:60]}...")
-                                            
-                                            if events_found >= 10:  # Limit per page
-                                                break
-                                
-                                except Exception as e:
-                                    continue
-                            
-                            if events_found > 0:
-                                break  # Success with this selector
-                    
-                    except Exception as e:
-                        continue
+                for selector in self.selector_stats.rank(url, strategy['selectors'], include_discovered=False):
+                    events_found = self.extract_events_with_selector(
+                        selector, institution_name, url, target_event_types, scrape_all)
+                    self.selector_stats.record(url, selector, events_found)
+                    if events_found > 0:
+                        break  # Success with this selector
                 
                 if events_found > 0:
+                    self.selector_stats.record_strategy(url, strategy['name'])
                     break  # Success with this strategy
             
+            # Nothing matched: look for repeated card markup on the page itself
+            if events_found == 0:
+                for selector in discover_card_selectors(self.driver):
+                    print(f"      🔍 Trying discovered selector '{selector}'...")
+                    events_found = self.extract_events_with_selector(
+                        selector, institution_name, url, target_event_types, scrape_all)
+                    self.selector_stats.record(url, selector, events_found)
+                    if events_found > 0:
+                        self.selector_stats.add_discovered(url, [selector])
+                        self.selector_stats.record_strategy(url, 'Discovered Cards')
+                        break
+            
             print(f"      📊 Total events from this page: {events_found}")
             return events_found
             
@@ -211,6 +202,118 @@ class CSVBasedEventsScraper:
             print(f"      ❌ Error scraping {url}: {e}")
             return 0
     
+    def extract_events_with_selector(self, selector, institution_name, url, target_event_types, scrape_all):
+        """Extract up to 10 new events from the elements matching one selector
+        
+        Returns how many events the selector matched, including ones carried
+        forward because they were seen on an earlier run and dated ones outside
+        the window. Undated matches do not count.
+        """
+        events_found = 0
+        matched = 0
+        carried = 0
+        try:
+            elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+        except Exception:
+            return 0
+        
+        if elements:
+            print(f"         Found {len(elements)} elements with '{selector}'")
+        
+        scan = HorizonScan()
+        for element in elements[:20]:  # Limit to avoid overload
+            try:
+                # Extract text content
+                text = element.text.strip()
+                if not text or len(text) < 10:
+                    continue
+                
+                # Check if this looks like an event
+                if self.looks_like_event(text, target_event_types, scrape_all):
+                    # The date comes from the text already read; nothing else is
+                    # extracted for cards outside the window or without a date
+                    status, date_info = self.window.classify(text)
+                    scan.record(status)
+                    if status != INSIDE:
+                        # Dated cards outside the window still show the selector finds
+                        # events; undated text (headings, navigation) does not
+                        if status in (BEFORE, AFTER):
+                            matched += 1
+                        if scan.past_horizon:
+                            break  # Listings are in date order: the rest are later still
+                        continue
+                    
+                    # Skip events found on earlier runs before extracting details.
+                    # A link back to the listing page does not identify the event.
+                    link = self.extract_link_from_element(element, url)
+                    event_link = link if normalize_url(link) != normalize_url(url) else None
+                    if event_link and self.seen_index.seen_url(event_link):
+                        if self.carry_forward(self.known_events.find(url=event_link)):
+                            matched += 1
+                            carried += 1
+                            continue
+                        # Seen but no longer archived: extract it again
+                    
+                    # Extract more details
+                    title = self.extract_title_from_element(element, text)
+                    if not event_link and self.seen_index.seen_event(title, date_info):
+                        if self.carry_forward(self.known_events.find(title=title, date=date_info)):
+                            matched += 1
+                            carried += 1
+                            continue
+                    
+                    if title:
+                        # Create event
+                        event = {
+                            'id': len(self.events) + 1,
+                            'title': title[:150],
+                            'museum': self.normalize_institution_name(institution_name),
+                            'date': date_info,
+                            'time': '7:00 PM',
+                            'type': self.classify_event_type(title, text),
+                            'description': text[:400],
+                            'city': 'New York',
+                            'price': 'See website',
+                            'duration': '2 hours',
+                            'link': link
+                        }
+                        
+                        self.events.append(event)
+                        self.metadata.add(event)
+                        self.seen_index.mark(url=event_link, title=title, date=date_info)
+                        # Found again on another page: carried forward, not duplicated
+                        self.known_events.add(event)
+                        self.output_uids.add(event_uid(event))
+                        events_found += 1
+                        matched += 1
+                        
+                        print(f"         ✅ {events_found}: {title[:60]}...")
+                        
+                        if events_found >= 10:  # Limit per page
+                            break
+            
+            except Exception as e:
+                continue
+        
+        if scan.skipped:
+            print(f"         🗓️ Skipped outside the window: {scan.summary()}")
+        if carried:
+            print(f"         ⏭️ {carried} events seen on earlier runs, "
+                  f"carried forward from the archive")
+        return matched
+    
+    def carry_forward(self, known):
+        """Add an archived event to this run's output without extracting it. False if none."""
+        if known is None:
+            return False
+        uid = event_uid(known)
+        if uid not in self.output_uids:
+            self.output_uids.add(uid)
+            event = {**known, 'id': len(self.events) + 1}
+            self.events.append(event)
+            self.metadata.keep(event)
+        return True
+    
     def looks_like_event(self, text, target_event_types, scrape_all):
         """Check if text looks like an event we want"""
         if scrape_all:
@@ -250,29 +353,6 @@ class CSVBasedEventsScraper:
         
         return fallback_text[:100]
     
-    def extract_date_from_text(self, text):
-        """Extract date from text"""
-        # Look for date patterns
-        date_patterns = [
-            r'(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}',
-            r'\d{1,2}\/\d{1,2}\/\d{4}',
-            r'\d{4}-\d{2}-\d{2}'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                try:
-                    # Try to parse the date
-                    import dateutil.parser
-                    parsed_date = dateutil.parser.parse(match.group(), fuzzy=True)
-                    if self.start_date <= parsed_date <= self.end_date:
-                        return parsed_date.strftime('%Y-%m-%d')
-                except:
-                    continue
-        
-        return None
-    
     def extract_link_from_element(self, element, base_url):
         """Extract link from element"""
         try:
@@ -289,45 +369,13 @@ class CSVBasedEventsScraper:
         
         return base_url
     
-    def is_date_in_range(self, date_str):
-        """Check if date is in our target range"""
-        if not date_str:
-            return True  # Include events without clear dates
-        
-        try:
-            event_date = datetime.strptime(date_str, '%Y-%m-%d')
-            return self.start_date <= event_date <= self.end_date
-        except:
-            return True
-    
-    def generate_future_date(self):
-        """Generate a future date for events without clear dates"""
-        import random
-        days_ahead = random.randint(7, 45)  # 1-6 weeks ahead
-        future_date = self.start_date + timedelta(days=days_ahead)
-        return future_date.strftime('%Y-%m-%d')
-    
     def normalize_institution_name(self, name):
-        """Convert institution name to consistent format"""
-        name_mapping = {
-            'MoMA': 'moma',
-            'MET': 'met',
-            'Center for Women\'s History': 'womens_history',
-            'Asia Society New York': 'asia_society',
-            'The Frick Collection': 'frick',
-            'The New York Historical': 'ny_historical',
-            'Morning Side Institute': 'morningside',
-            'New York Society Library': 'ny_society_library',
-            'Albertine': 'albertine',
-            'Rizzoli Bookstore': 'rizzoli',
-            'Grolier Club': 'grolier_club',
-            'National Arts Club': 'national_arts_club',
-            'Explorers Club': 'explorers_club',
-            'The Poetry Society of New York': 'poetry_society',
-            'L\' Alliance New York': 'lalliance'
-        }
-        
-        return name_mapping.get(name, name.lower().replace(' ', '_'))
+        """Convert institution name to its registry id"""
+        institution_id = resolve_institution(name)
+        if institution_id is None:
+            institution_id = name.strip().lower().replace(' ', '_')
+            print(f"      ⚠️ '{name.strip()}' is not a known institution, using '{institution_id}'")
+        return institution_id
     
     def classify_event_type(self, title, description=""):
         """Classify event type"""
@@ -385,10 +433,7 @@ class CSVBasedEventsScraper:
             
             # Show summary
             if self.events:
-                institution_counts = {}
-                for event in self.events:
-                    museum = event['museum']
-                    institution_counts[museum] = institution_counts.get(museum, 0) + 1
+                institution_counts = EventTable(self.events).count_by('museum')
                 
                 print(f"\n📋 Events by institution:")
                 for museum, count in sorted(institution_counts.items()):
@@ -399,39 +444,49 @@ class CSVBasedEventsScraper:
         finally:
             if self.driver:
                 self.driver.quit()
+            self.selector_stats.save()
+            print(f"👀 Seen index: {self.seen_index.summary()}")
         
         return self.events
     
     def save_events(self, filename='csv_based_events.json'):
-        """Save scraped events"""
+        """Save scraped events, then commit the seen index marks made for them"""
         if not self.events:
             print("❌ No events to save")
+            self.seen_index.close(commit=False)
             return
         
-        # Create metadata
-        data_with_metadata = {
-            "events": self.events,
-            "metadata": {
-                "total_events": len(self.events),
-                "scrape_timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                "scrape_method": "CSV-based institution-specific scraping",
-                "institutions_scraped": len(self.institutions_data),
-                "source_csv": "NYC Cultural Institutions Sheet1.csv"
-            }
-        }
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data_with_metadata, f, indent=2, ensure_ascii=False)
+        # Same metadata block as the other scrapers, maintained as events were added
+        save_store(filename, self.events, self.metadata,
+                   scrape_method="CSV-based institution-specific scraping",
+                   institutions_in_csv=len(self.institutions_data),
+                   source_csv="NYC Cultural Institutions Sheet1.csv")
         
         print(f"💾 Events saved to {filename}")
+        
+        written, unchanged = write_archive(self.events)
+        print(f"📚 Archive updated: {len(written)} partitions written, {len(unchanged)} unchanged")
+        
+        # Only now are the marked events safely on disk
+        self.seen_index.close()
 
-if __name__ == "__main__":
-    scraper = CSVBasedEventsScraper()
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Scrape the institutions listed in nyc_institutions.csv')
+    add_window_arguments(parser)
+    args = parser.parse_args()
+    
+    scraper = CSVBasedEventsScraper(DateWindow.from_args(args))
     events = scraper.scrape_all_institutions()
     
     if events:
         scraper.save_events()
         print("\n🎯 Ready to integrate real events!")
     else:
+        scraper.seen_index.close(commit=False)
         print("❌ No events were scraped")
 
+if __name__ == "__main__":
+    main()
+
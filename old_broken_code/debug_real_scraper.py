@@ -1,15 +1,21 @@
+import os
+import sys
 import time
 import json
 from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+# Shared modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from driver_resolver import chrome_service
+from selector_learning import SelectorStats, discover_card_selectors
 
 class DebugScraper:
     def __init__(self):
         self.driver = None
+        self.selector_stats = SelectorStats()
     
     def setup_driver(self):
         """Setup Chrome driver"""
@@ -21,10 +27,9 @@ class DebugScraper:
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--disable-gpu')
         options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        options.binary_location = '/usr/bin/google-chrome'
         
         try:
-            service = Service(ChromeDriverManager().install())
+            service = chrome_service(options)
             self.driver = webdriver.Chrome(service=service, options=options)
             self.driver.set_page_load_timeout(30)
             self.driver.implicitly_wait(5)
@@ -78,6 +83,21 @@ class DebugScraper:
                 except Exception as e:
                     print(f"   ⚠️ Error with '{selector}': {e}")
             
+            # Repeated card-like markup the fixed selectors may have missed
+            discovered = discover_card_selectors(self.driver, limit=5)
+            if discovered:
+                print(f"🧩 Auto-discovered card selectors:")
+                for selector in discovered:
+                    count = len(self.driver.find_elements(By.CSS_SELECTOR, selector))
+                    print(f"   • '{selector}' ({count} elements)")
+            else:
+                print("🧩 No repeated card structures found")
+            
+            # What the scrapers have learned about this page so far
+            learned = self.selector_stats.data.get(url, {}).get('selectors', {})
+            for selector, stats in sorted(learned.items(), key=lambda item: -self.selector_stats.score(url, item[0])):
+                print(f"   📈 '{selector}': {stats['hits']} hits / {stats['misses']} misses")
+            
             # Look for any links that might be events
             all_links = self.driver.find_elements(By.CSS_SELECTOR, 'a')
             event_like_links = []
@@ -1,132 +1,55 @@
+import os
+import sys
 import time
-import json
 import re
-from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 import dateutil.parser
 from urllib.parse import urljoin
 
+# Shared modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from date_window import INSIDE, DateWindow, HorizonScan, add_window_arguments
+from driver_resolver import chrome_service
+from event_archive import ArchiveReader, write_archive
+from event_metadata import MetadataAggregator, save_store
+from institution_adapters import InstitutionAdapters
+from institution_health import OPEN, InstitutionHealth, listing_fingerprint
+
 class RealEventsScraperPro:
-    def __init__(self):
+    def __init__(self, window=None, force=False):
         self.driver = None
         self.events = []
+        # Skip failing sites and sites whose listings rarely change, unless forced
+        self.health = InstitutionHealth()
+        self.force = force
+        self.metadata = MetadataAggregator()
         self.target_event_types = [
             'exhibitions', 'special events', 'lectures', 'tours', 
             'symposia', 'panel discussions', 'artist talks', 'gallery talks'
         ]
         
-        # Define date range: Rest of July + All August
-        today = datetime.now()
-        self.start_date = today.replace(day=today.day)  # From today
-        self.end_date = datetime(2025, 8, 31)  # End of August
+        # Only events dated inside this window are extracted
+        self.window = window or DateWindow()
+        self.start_date = self.window.start
+        self.end_date = self.window.end
+        
+        print(f"🗓️ Scraping events from {self.window.describe()}")
         
-        print(f"🗓️ Scraping events from {self.start_date.strftime('%B %d')} to {self.end_date.strftime('%B %d, %Y')}")
+        # Events already archived for this window (only the overlapping month partitions are read).
+        # Institutions this run does not refresh keep these in the saved file.
+        self.archived_events = ArchiveReader().load(self.start_date, self.end_date)
+        print(f"📚 {len(self.archived_events)} events already archived for this period")
         
-        # Institution configurations with real URLs and selectors
-        self.institutions = {
-            'met': {
-                'name': 'The Met',
-                'urls': [
-                    'https://www.metmuseum.org/events/exhibitions',
-                    'https://www.metmuseum.org/events/lectures',
-                    'https://www.metmuseum.org/events/talks'
-                ],
-                'selectors': {
-                    'event_cards': ['.gtm-event-card', '.event-card', '.program-item'],
-                    'title': ['h3', 'h2', '.event-title', '.title'],
-                    'date': ['.date', '.event-date', 'time', '.datetime'],
-                    'description': ['.description', '.summary', 'p'],
-                    'link': ['a']
-                }
-            },
-            'moma': {
-                'name': 'MoMA',
-                'urls': [
-                    'https://www.moma.org/calendar/exhibitions',
-                    'https://www.moma.org/calendar/events'
-                ],
-                'selectors': {
-                    'event_cards': ['.calendar-item', '.exhibition-item', '.event-card'],
-                    'title': ['h3', 'h2', '.title'],
-                    'date': ['.date', '.dates', 'time'],
-                    'description': ['.description', '.summary'],
-                    'link': ['a']
-                }
-            },
-            'frick': {
-                'name': 'Frick Collection',
-                'urls': ['https://www.frick.org/events'],
-                'selectors': {
-                    'event_cards': ['.event', '.program', '.upcoming-event'],
-                    'title': ['h3', 'h2', '.event-title'],
-                    'date': ['.date', '.event-date'],
-                    'description': ['.description', '.summary'],
-                    'link': ['a']
-                }
-            },
-            'asia_society': {
-                'name': 'Asia Society',
-                'urls': ['https://asiasociety.org/new-york/events'],
-                'selectors': {
-                    'event_cards': ['.event-item', '.program-item'],
-                    'title': ['h3', 'h2', '.title'],
-                    'date': ['.date', '.event-date'],
-                    'description': ['.description', '.excerpt'],
-                    'link': ['a']
-                }
-            },
-            'ny_historical': {
-                'name': 'NY Historical Society',
-                'urls': ['https://www.nyhistory.org/events'],
-                'selectors': {
-                    'event_cards': ['.event', '.program-listing'],
-                    'title': ['h3', 'h2', '.event-title'],
-                    'date': ['.date', '.event-date'],
-                    'description': ['.description', '.summary'],
-                    'link': ['a']
-                }
-            },
-            'ny_society_library': {
-                'name': 'NY Society Library',
-                'urls': ['https://www.nysoclib.org/events'],
-                'selectors': {
-                    'event_cards': ['.event', '.program'],
-                    'title': ['h3', 'h2', '.title'],
-                    'date': ['.date', '.event-date'],
-                    'description': ['.description', '.content'],
-                    'link': ['a']
-                }
-            },
-            'grolier_club': {
-                'name': 'Grolier Club',
-                'urls': ['https://www.grolierclub.org/events'],
-                'selectors': {
-                    'event_cards': ['.event', '.exhibition', '.program'],
-                    'title': ['h3', 'h2', '.title'],
-                    'date': ['.date', '.dates'],
-                    'description': ['.description', '.summary'],
-                    'link': ['a']
-                }
-            },
-            'americas_society': {
-                'name': 'Americas Society',
-                'urls': ['https://www.as-coa.org/events'],
-                'selectors': {
-                    'event_cards': ['.event', '.program'],
-                    'title': ['h3', 'h2', '.title'],
-                    'date': ['.date', '.event-date'],
-                    'description': ['.description', '.summary'],
-                    'link': ['a']
-                }
-            }
-        }
+        # Institutions scraped by this tool; each adapter module is imported on first use
+        self.institutions = InstitutionAdapters([
+            'met', 'moma', 'frick', 'asia_society', 'ny_historical',
+            'ny_society_library', 'grolier_club', 'americas_society'
+        ])
     
     def setup_driver(self):
         """Setup Chrome driver for scraping"""
@@ -140,10 +63,9 @@ class RealEventsScraperPro:
         options.add_argument('--disable-extensions')
         options.add_argument('--disable-images')
         options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        options.binary_location = '/usr/bin/google-chrome'
         
         try:
-            service = Service(ChromeDriverManager().install())
+            service = chrome_service(options)
             self.driver = webdriver.Chrome(service=service, options=options)
             self.driver.set_page_load_timeout(30)
             self.driver.implicitly_wait(10)
@@ -177,7 +99,7 @@ class RealEventsScraperPro:
         return base_url
     
     def parse_date_intelligently(self, date_string):
-        """Parse dates intelligently from various formats"""
+        """Parse a date with dateutil, for text the window's own patterns miss"""
         if not date_string:
             return None
             
@@ -187,16 +109,16 @@ class RealEventsScraperPro:
             date_string = re.sub(r'[–—-].*$', '', date_string)  # Remove end dates
             date_string = date_string.strip()
             
-            # Try to parse with dateutil
-            parsed_date = dateutil.parser.parse(date_string, fuzzy=True)
-            
-            # Check if date is in our target range
-            if self.start_date <= parsed_date <= self.end_date:
-                return parsed_date.strftime('%Y-%m-%d')
+            return dateutil.parser.parse(date_string, fuzzy=True).strftime('%Y-%m-%d')
         except:
-            pass
-        
-        return None
+            return None
+    
+    def classify_date(self, institution, date_text):
+        """(window status, 'YYYY-MM-DD') for a card's date text"""
+        status, parsed_date = self.window.classify(institution.parse_date(date_text) or date_text)
+        if parsed_date is None:
+            status, parsed_date = self.window.classify(self.parse_date_intelligently(date_text))
+        return status, parsed_date
     
     def classify_event_type_intelligently(self, title, description=""):
         """Classify event type based on title and description"""
@@ -230,41 +152,51 @@ class RealEventsScraperPro:
     def scrape_institution_real_events(self, institution_id):
         """Scrape real events from institution"""
         institution = self.institutions[institution_id]
-        print(f"\n🏛️ Scraping REAL events from {institution['name']}...")
+        print(f"\n🏛️ Scraping REAL events from {institution.name}...")
         
         events_found = 0
+        first_new = len(self.events)
+        started = time.time()
+        error = None
+        pages = [(url, 1) for url in institution.listing_urls]
         
-        for url in institution['urls']:
+        while pages:
+            url, page = pages.pop(0)
             print(f"   📡 Checking: {url}")
             
             try:
                 self.driver.get(url)
                 time.sleep(5)  # Wait for page load
                 
+                scan = HorizonScan()
                 # Try different event card selectors
-                for card_selector in institution['selectors']['event_cards']:
+                for card_selector in institution.card_selectors:
                     try:
                         events = self.driver.find_elements(By.CSS_SELECTOR, card_selector)
                         print(f"      Found {len(events)} potential events with '{card_selector}'")
                         
+                        scan = HorizonScan()
                         for event_elem in events[:15]:  # Limit per selector
                             try:
-                                # Extract event details
-                                title = self.extract_text_safely(event_elem, institution['selectors']['title'])
-                                date_text = self.extract_text_safely(event_elem, institution['selectors']['date'])
-                                description = self.extract_text_safely(event_elem, institution['selectors']['description'])
-                                link = self.extract_link_safely(event_elem, url)
-                                
-                                if not title or len(title) < 5:
+                                # Read the date first: cards outside the window need nothing else
+                                date_text = self.extract_text_safely(event_elem, institution.selectors('date'))
+                                status, parsed_date = self.classify_date(institution, date_text)
+                                scan.record(status)
+                                if scan.past_horizon:
+                                    break  # Listings are in date order: the rest are later still
+                                if status != INSIDE:
                                     continue
                                 
-                                # Parse and validate date
-                                parsed_date = self.parse_date_intelligently(date_text)
-                                if not parsed_date:
+                                # Extract event details
+                                title = institution.clean_title(self.extract_text_safely(event_elem, institution.selectors('title')))
+                                if not title or len(title) < 5:
                                     continue
+                                description = self.extract_text_safely(event_elem, institution.selectors('description'))
+                                link = self.extract_link_safely(event_elem, url)
                                 
                                 # Classify event type
-                                event_type = self.classify_event_type_intelligently(title, description)
+                                event_type = (institution.event_type(title, description, url)
+                                              or self.classify_event_type_intelligently(title, description))
                                 
                                 # Check if it's a target event type
                                 if not self.is_target_event_type(event_type):
@@ -286,6 +218,7 @@ class RealEventsScraperPro:
                                 }
                                 
                                 self.events.append(event)
+                                self.metadata.add(event)
                                 events_found += 1
                                 
                                 print(f"      ✅ {events_found}: {title[:50]}...")
@@ -293,17 +226,34 @@ class RealEventsScraperPro:
                             except Exception as e:
                                 continue
                         
-                        if events_found > 0:
+                        if scan.skipped:
+                            print(f"      🗓️ {scan.summary()}")
+                        if events_found > 0 or scan.past_horizon:
                             break  # Success with this selector
                             
                     except Exception as e:
                         continue
+                
+                # Later pages only hold later dates once this one has passed the window
+                if scan.past_horizon:
+                    print(f"      ⏹️ Listing is past {self.end_date.isoformat()}, not paginating further")
+                else:
+                    next_url = institution.next_page_url(self.driver, page)
+                    if next_url:
+                        pages.insert(0, (next_url, page + 1))
                         
             except Exception as e:
                 print(f"      ❌ Error with {url}: {e}")
+                error = e
                 continue
         
-        print(f"   🎭 Total real events from {institution['name']}: {events_found}")
+        state = self.health.record(institution_id, events_found, time.time() - started,
+                                   error=None if events_found else error,
+                                   fingerprint=listing_fingerprint(self.events[first_new:]))
+        if state == OPEN:
+            print(f"   ⛔ {institution.name} keeps failing, skipping it until its cool-down ends")
+        
+        print(f"   🎭 Total real events from {institution.name}: {events_found}")
         return events_found
     
     def scrape_all_real_events(self):
@@ -317,7 +267,12 @@ class RealEventsScraperPro:
         try:
             total_events = 0
             
-            for institution_id in self.institutions.keys():
+            # Failing sites wait out their cool-down; unchanged sites wait until due
+            institution_ids, skipped = self.health.plan(self.institutions.keys(), schedule=not self.force)
+            for institution_id, reason in skipped.items():
+                print(f"⏸️ Skipping {institution_id}: {reason}")
+            
+            for institution_id in institution_ids:
                 events_count = self.scrape_institution_real_events(institution_id)
                 total_events += events_count
                 time.sleep(3)  # Be respectful to servers
@@ -325,7 +280,7 @@ class RealEventsScraperPro:
             print("\n" + "=" * 70)
             print(f"🎉 REAL EVENTS SCRAPING COMPLETE!")
             print(f"📊 Total real events found: {len(self.events)}")
-            print(f"🏛️ Institutions scraped: {len(self.institutions)}")
+            print(f"🏛️ Institutions scraped: {len(institution_ids)} of {len(self.institutions)}")
             
             # Show summary by type
             type_counts = {}
@@ -342,46 +297,48 @@ class RealEventsScraperPro:
         finally:
             if self.driver:
                 self.driver.quit()
+            self.health.save()
         
+        carried = self.carry_forward_unrefreshed()
+        if carried:
+            print(f"📚 Kept {carried} archived events of institutions not refreshed this run")
         return self.events
     
+    def carry_forward_unrefreshed(self):
+        """Add archived events of institutions that were skipped or found nothing this run
+        
+        Like refresh_scheduler.publish_events, an institution's events are only
+        replaced when a refresh found some, so saving never drops a site.
+        """
+        refreshed = {event['museum'] for event in self.events}
+        carried = 0
+        for event in self.archived_events:
+            museum = event.get('museum')
+            if museum in self.institutions and museum not in refreshed:
+                event = {**event, 'id': len(self.events) + 1}
+                self.events.append(event)
+                self.metadata.keep(event)
+                carried += 1
+        return carried
+    
     def save_real_events(self, filename='real_cultural_events.json'):
         """Save real events with metadata"""
         if not self.events:
             print("❌ No events to save")
             return
         
-        # Calculate metadata
-        institution_counts = {}
-        type_counts = {}
-        
-        for event in self.events:
-            museum = event.get('museum', 'unknown')
-            event_type = event.get('type', 'unknown')
-            
-            institution_counts[museum] = institution_counts.get(museum, 0) + 1
-            type_counts[event_type] = type_counts.get(event_type, 0) + 1
-        
-        # Create enhanced data structure
-        data_with_metadata = {
-            "events": self.events,
-            "metadata": {
-                "total_events": len(self.events),
-                "scrape_timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                "scrape_period": f"{self.start_date.strftime('%B %d')} - {self.end_date.strftime('%B %d, %Y')}",
-                "institutions_scraped": len(institution_counts),
-                "target_event_types": self.target_event_types,
-                "events_by_institution": institution_counts,
-                "events_by_type": type_counts,
-                "scraper_version": "Real Events Scraper Pro v1.0"
-            }
-        }
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data_with_metadata, f, indent=2, ensure_ascii=False)
+        # Counts were maintained as events were added
+        metadata = save_store(filename, self.events, self.metadata,
+                              scrape_period=self.window.describe(),
+                              target_event_types=self.target_event_types,
+                              scraper_version="Real Events Scraper Pro v1.0")
+        institution_counts = metadata['events_by_institution']
         
         print(f"💾 Real events saved to {filename}")
         
+        written, unchanged = write_archive(self.events)
+        print(f"📚 Archive updated: {len(written)} partitions written, {len(unchanged)} unchanged")
+        
         # Display summary
         print(f"\n📊 REAL EVENTS SUMMARY:")
         print(f"🎭 Total Events: {len(self.events)}")
@@ -389,8 +346,16 @@ class RealEventsScraperPro:
         for museum, count in institution_counts.items():
             print(f"   • {museum}: {count} events")
 
-if __name__ == "__main__":
-    scraper = RealEventsScraperPro()
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Scrape real events from NYC cultural institutions')
+    add_window_arguments(parser)
+    parser.add_argument('--force', action='store_true',
+                        help='Scrape sites that are not due yet (open circuits are still skipped)')
+    args = parser.parse_args()
+    
+    scraper = RealEventsScraperPro(DateWindow.from_args(args), force=args.force)
     real_events = scraper.scrape_all_real_events()
     
     if real_events:
@@ -400,3 +365,5 @@ if __name__ == "__main__":
     else:
         print("❌ No real events were scraped")
 
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,28 @@
-import json
-from datetime import datetime
+import os
+import sys
+
+# Shared modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from event_metadata import load_store, save_store
 
 print("🔄 Adding metadata to your existing events...")
 
-# Load current events
-with open('cultural_events.json', 'r', encoding='utf-8') as f:
-    events = json.load(f)
+# Load current events; handles both the old array format and the object with metadata
+events_list, aggregator, metadata = load_store('cultural_events.json')
 
-# Handle both old format (array) and new format (object)
-if isinstance(events, dict) and 'events' in events:
-    events_list = events['events']
+if metadata:
     print("ℹ️ File already has metadata format")
 else:
-    events_list = events
-    print(f"📊 Converting {len(events)} events to new format with metadata")
-
-# Calculate summary statistics
-institution_counts = {}
-type_counts = {}
-
-for event in events_list:
-    museum = event.get('museum', 'unknown')
-    event_type = event.get('type', 'unknown')
-    
-    institution_counts[museum] = institution_counts.get(museum, 0) + 1
-    type_counts[event_type] = type_counts.get(event_type, 0) + 1
+    print(f"📊 Converting {len(events_list)} events to new format with metadata")
+    # No freshness recorded yet: count every source as updated now
+    aggregator.add_many(events_list)
 
-# Create enhanced data structure with metadata
-data_with_metadata = {
-    "events": events_list,
-    "metadata": {
-        "total_events": len(events_list),
-        "scrape_timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        "institutions_scraped": len(institution_counts),
-        "events_by_institution": institution_counts,
-        "events_by_type": type_counts,
-        "scraper_version": "Enhanced Marcet Society Scraper v2.0",
-        "note": "Metadata added to existing scraped events"
-    }
-}
-
-# Save enhanced file
-with open('cultural_events.json', 'w', encoding='utf-8') as f:
-    json.dump(data_with_metadata, f, indent=2, ensure_ascii=False)
+# Save enhanced file with the shared metadata block
+metadata = save_store('cultural_events.json', events_list, aggregator,
+                      scraper_version="Enhanced Marcet Society Scraper v2.0",
+                      note="Metadata added to existing scraped events")
+institution_counts = metadata['events_by_institution']
+type_counts = metadata['events_by_type']
 
 print("✅ Successfully added metadata!")
 print(f"📊 Total events: {len(events_list)}")
@@ -55,4 +35,3 @@ for museum, count in sorted(institution_counts.items()):
 print("\n📋 Events by Type:")
 for event_type, count in sorted(type_counts.items()):
     print(f"   {event_type}: {count} events")
-
@@ -1,3 +1,5 @@
+import os
+import sys
 import time
 import json
 import re
@@ -8,77 +10,23 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+# Shared modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from driver_resolver import chrome_service
+from event_table import EventTable
+from institution_adapters import InstitutionAdapters
 
 class CompleteCulturalScraper:
     def __init__(self, headless=True):
         self.setup_driver(headless)
         self.events = []
         
-        # NYC Cultural Institutions with working links
-        self.institutions = {
-            'met': {
-                'name': 'Metropolitan Museum of Art',
-                'shortName': 'The Met',
-                'url': 'https://www.metmuseum.org/events',
-                'location': 'New York'
-            },
-            'moma': {
-                'name': 'Museum of Modern Art',
-                'shortName': 'MoMA',
-                'url': 'https://www.moma.org/calendar',
-                'location': 'New York'
-            },
-            'frick': {
-                'name': 'Frick Collection',
-                'shortName': 'Frick',
-                'url': 'https://www.frick.org/events',
-                'location': 'New York'
-            },
-            'asia': {
-                'name': 'Asia Society',
-                'shortName': 'Asia Society',
-                'url': 'https://asiasociety.org/new-york/events',
-                'location': 'New York'
-            },
-            'nyhs': {
-                'name': 'New York Historical Society',
-                'shortName': 'NY Historical',
-                'url': 'https://www.nyhistory.org/events',
-                'location': 'New York'
-            },
-            'nysl': {
-                'name': 'New York Society Library',
-                'shortName': 'NY Society Library',
-                'url': 'https://www.nysoclib.org/events',
-                'location': 'New York'
-            },
-            'grolier': {
-                'name': 'Grolier Club',
-                'shortName': 'Grolier Club',
-                'url': 'https://www.grolierclub.org/events',
-                'location': 'New York'
-            },
-            'nac': {
-                'name': 'National Arts Club',
-                'shortName': 'National Arts Club',
-                'url': 'https://www.nationalartsclub.org/events',
-                'location': 'New York'
-            },
-            'explorers': {
-                'name': 'Explorers Club',
-                'shortName': 'Explorers Club',
-                'url': 'https://www.explorers.org/events',
-                'location': 'New York'
-            },
-            'americas': {
-                'name': 'Americas Society',
-                'shortName': 'Americas Society',
-                'url': 'https://www.as-coa.org/events',
-                'location': 'New York'
-            }
-        }
+        # NYC Cultural Institutions with working links; each adapter carries its sample programme
+        self.institutions = InstitutionAdapters([
+            'met', 'moma', 'ny_historical', 'asia_society', 'frick', 'ny_society_library',
+            'grolier_club', 'national_arts_club', 'explorers_club', 'americas_society'
+        ])
     
     def setup_driver(self, headless=True):
         """Setup Chrome driver with stable configuration"""
@@ -128,15 +76,13 @@ class CompleteCulturalScraper:
         options.add_argument('--disable-ipc-flooding-protection')
         options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
-        options.binary_location = '/usr/bin/google-chrome'
-        
         # Clean user data directory
         import shutil
         import os
         if os.path.exists('/tmp/chrome-scraper'):
             shutil.rmtree('/tmp/chrome-scraper')
         
-        service = Service(ChromeDriverManager().install())
+        service = chrome_service(options)
         self.driver = webdriver.Chrome(service=service, options=options)
         self.driver.set_page_load_timeout(30)
         self.driver.implicitly_wait(10)
@@ -150,327 +96,26 @@ class CompleteCulturalScraper:
         
         today = datetime.now()
         
-        # Comprehensive events data for each institution
-        events_data = [
-            # Met Museum Events (4 events)
-            {
-                'title': 'Impressionist Masterpieces: Monet to Renoir',
-                'museum': 'met',
-                'days_offset': 5,
-                'time': '10:00 AM',
-                'type': 'exhibitions',
-                'description': 'Explore the world of Impressionism through masterpieces from our collection, featuring works by Monet, Renoir, Degas, and Cézanne. This comprehensive exhibition traces the development of the movement.',
-                'price': '$25',
-                'duration': 'All day'
-            },
-            {
-                'title': 'Ancient Egyptian Art: Symbols and Sacred Meanings',
-                'museum': 'met',
-                'days_offset': 12,
-                'time': '2:00 PM',
-                'type': 'lecture',
-                'description': 'Dr. Sarah Johnson, Egyptologist, explores the symbolic language of ancient Egyptian art and its profound cultural and religious significance.',
-                'price': '$15',
-                'duration': '90 minutes'
-            },
-            {
-                'title': 'Behind the Scenes: Museum Conservation Lab Tour',
-                'museum': 'met',
-                'days_offset': 19,
-                'time': '11:00 AM',
-                'type': 'tour',
-                'description': 'Exclusive guided tour of the conservation labs where masterpieces are preserved, restored, and prepared for future generations.',
-                'price': '$35',
-                'duration': '2 hours'
-            },
-            {
-                'title': 'Greek and Roman Sculpture: Classical Beauty',
-                'museum': 'met',
-                'days_offset': 26,
-                'time': '3:00 PM',
-                'type': 'exhibitions',
-                'description': 'Special exhibition showcasing the finest examples of Greek and Roman sculpture from the Met\'s renowned classical collection.',
-                'price': '$28',
-                'duration': 'All day'
-            },
-            
-            # MoMA Events (4 events)
-            {
-                'title': 'Contemporary Art in the Digital Age: Artist Panel',
-                'museum': 'moma',
-                'days_offset': 8,
-                'time': '6:30 PM',
-                'type': 'panel',
-                'description': 'Leading contemporary artists and curators discuss how digital technology is transforming artistic expression and museum experience.',
-                'price': '$18',
-                'duration': '2 hours'
-            },
-            {
-                'title': 'Photography Masters: Capturing Urban Life',
-                'museum': 'moma',
-                'days_offset': 15,
-                'time': '7:00 PM',
-                'type': 'lecture',
-                'description': 'Renowned photographer Maria Rodriguez shares techniques and insights from her decades of documenting urban life and social change.',
-                'price': '$20',
-                'duration': '90 minutes'
-            },
-            {
-                'title': 'Modern Architecture Walking Tour',
-                'museum': 'moma',
-                'days_offset': 22,
-                'time': '3:00 PM',
-                'type': 'tour',
-                'description': 'Explore NYC\'s modernist architecture with architectural historian Dr. James Park, visiting iconic buildings and hidden gems.',
-                'price': '$30',
-                'duration': '3 hours'
-            },
-            {
-                'title': 'Abstract Expressionism: American Innovation',
-                'museum': 'moma',
-                'days_offset': 29,
-                'time': '1:00 PM',
-                'type': 'exhibitions',
-                'description': 'Comprehensive exhibition celebrating the revolutionary Abstract Expressionist movement that put American art on the global stage.',
-                'price': '$25',
-                'duration': 'All day'
-            },
-            
-            # NY Historical Society Events (3 events)
-            {
-                'title': 'Women in Science: Revolutionary Discoveries',
-                'museum': 'nyhs',
-                'days_offset': 10,
-                'time': '2:00 PM',
-                'type': 'lecture',
-                'description': 'Explore groundbreaking discoveries by women scientists throughout history and their lasting impact on our understanding of the natural world.',
-                'price': 'Free',
-                'duration': '90 minutes'
-            },
-            {
-                'title': 'NYC History: From Dutch Colony to Modern Metropolis',
-                'museum': 'nyhs',
-                'days_offset': 17,
-                'time': '4:00 PM',
-                'type': 'talks',
-                'description': 'Historian Dr. Margaret Chen traces the fascinating evolution of New York City from its Dutch colonial origins to today\'s global metropolis.',
-                'price': '$12',
-                'duration': '2 hours'
-            },
-            {
-                'title': 'Civil War Artifacts: Stories from Our Collection',
-                'museum': 'nyhs',
-                'days_offset': 24,
-                'time': '1:00 PM',
-                'type': 'exhibitions',
-                'description': 'Rare artifacts from our Civil War collection tell personal stories of conflict, courage, and the struggle for freedom and unity.',
-                'price': '$18',
-                'duration': 'All day'
-            },
-            
-            # Asia Society Events (3 events)
-            {
-                'title': 'Asian Literature Book Launch: Contemporary Voices',
-                'museum': 'asia',
-                'days_offset': 13,
-                'time': '7:00 PM',
-                'type': 'talks',
-                'description': 'Celebrated author Kim Chen launches her new novel with a reading and discussion about contemporary Asian literature\'s global influence.',
-                'price': '$12',
-                'duration': '90 minutes'
-            },
-            {
-                'title': 'Buddhism and Modern Life: Philosophy Panel',
-                'museum': 'asia',
-                'days_offset': 20,
-                'time': '6:00 PM',
-                'type': 'panel',
-                'description': 'Buddhist scholars and practitioners discuss how ancient wisdom and mindfulness practices apply to contemporary challenges.',
-                'price': '$15',
-                'duration': '2 hours'
-            },
-            {
-                'title': 'Chinese Calligraphy Master Workshop',
-                'museum': 'asia',
-                'days_offset': 27,
-                'time': '2:00 PM',
-                'type': 'special',
-                'description': 'Master calligrapher Li Wei teaches the art of Chinese brush painting and character formation in this hands-on workshop.',
-                'price': '$45',
-                'duration': '3 hours'
-            },
-            
-            # Frick Collection Events (3 events)
-            {
-                'title': 'Renaissance Art Gallery Tour',
-                'museum': 'frick',
-                'days_offset': 14,
-                'time': '4:00 PM',
-                'type': 'tour',
-                'description': 'Intimate guided tour through our Renaissance collection, exploring artistic techniques, patronage, and cultural context of the period.',
-                'price': '$40',
-                'duration': '2 hours'
-            },
-            {
-                'title': 'Chamber Music in the Garden Court',
-                'museum': 'frick',
-                'days_offset': 21,
-                'time': '7:30 PM',
-                'type': 'performances',
-                'description': 'The Frick String Quartet performs classical masterpieces by Bach, Mozart, and Brahms in our beautiful Garden Court setting.',
-                'price': '$50',
-                'duration': '90 minutes'
-            },
-            {
-                'title': 'Art Collecting: Building a Personal Collection',
-                'museum': 'frick',
-                'days_offset': 28,
-                'time': '6:00 PM',
-                'type': 'lecture',
-                'description': 'Art advisor Jennifer Walsh shares expert insights on building, maintaining, and enjoying a personal art collection.',
-                'price': '$35',
-                'duration': '2 hours'
-            },
-            
-            # NY Society Library Events (3 events)
-            {
-                'title': 'Literary Salon: Women Writers of the 20th Century',
-                'museum': 'nysl',
-                'days_offset': 11,
-                'time': '6:00 PM',
-                'type': 'talks',
-                'description': 'Monthly salon celebrating influential women writers including Virginia Woolf, Toni Morrison, and Simone de Beauvoir.',
-                'price': '$20',
-                'duration': '2 hours'
-            },
-            {
-                'title': 'Poetry Reading: Emerging Voices',
-                'museum': 'nysl',
-                'days_offset': 18,
-                'time': '7:00 PM',
-                'type': 'talks',
-                'description': 'Local and emerging poets share their latest works in an intimate literary setting, followed by Q&A and reception.',
-                'price': '$15',
-                'duration': '90 minutes'
-            },
-            {
-                'title': 'Book Club: Contemporary Fiction Discussion',
-                'museum': 'nysl',
-                'days_offset': 25,
-                'time': '3:00 PM',
-                'type': 'talks',
-                'description': 'Monthly book club discussion of contemporary fiction, this month featuring "The Seven Husbands of Evelyn Hugo".',
-                'price': '$10',
-                'duration': '2 hours'
-            },
-            
-            # Grolier Club Events (2 events)
-            {
-                'title': 'Book Arts Workshop: Letterpress Printing',
-                'museum': 'grolier',
-                'days_offset': 16,
-                'time': '10:00 AM',
-                'type': 'special',
-                'description': 'Hands-on workshop in traditional letterpress printing techniques with master printer Robert Chen. All materials provided.',
-                'price': '$65',
-                'duration': '4 hours'
-            },
-            {
-                'title': 'Rare Books Exhibition: Medieval Manuscripts',
-                'museum': 'grolier',
-                'days_offset': 23,
-                'time': '2:00 PM',
-                'type': 'exhibitions',
-                'description': 'Extraordinary collection of medieval illuminated manuscripts from private collections, rarely seen by the public.',
-                'price': '$25',
-                'duration': 'All day'
-            },
-            
-            # National Arts Club Events (2 events)
-            {
-                'title': 'Art & Philosophy: Beauty and Meaning',
-                'museum': 'nac',
-                'days_offset': 9,
-                'time': '1:00 PM',
-                'type': 'panel',
-                'description': 'Interdisciplinary discussion on the relationship between artistic expression and philosophical thought through the ages.',
-                'price': '$20',
-                'duration': '2.5 hours'
-            },
-            {
-                'title': 'Members Exhibition: Contemporary Works',
-                'museum': 'nac',
-                'days_offset': 30,
-                'time': '6:00 PM',
-                'type': 'exhibitions',
-                'description': 'Annual exhibition featuring diverse works by National Arts Club members across painting, sculpture, and mixed media.',
-                'price': '$15',
-                'duration': 'All day'
-            },
-            
-            # Explorers Club Events (2 events)
-            {
-                'title': 'Exploration Photography: Remote Expeditions',
-                'museum': 'explorers',
-                'days_offset': 7,
-                'time': '7:00 PM',
-                'type': 'lecture',
-                'description': 'National Geographic photographer shares stunning images and stories from recent expeditions to Antarctica and the Amazon.',
-                'price': '$25',
-                'duration': '90 minutes'
-            },
-            {
-                'title': 'Antarctic Research: Climate Change Evidence',
-                'museum': 'explorers',
-                'days_offset': 31,
-                'time': '6:30 PM',
-                'type': 'lecture',
-                'description': 'Dr. Emily Roberts presents latest findings from Antarctic research stations documenting climate change impacts.',
-                'price': '$20',
-                'duration': '2 hours'
-            },
-            
-            # Americas Society Events (2 events)
-            {
-                'title': 'Latin American Art: Contemporary Movements',
-                'museum': 'americas',
-                'days_offset': 6,
-                'time': '6:00 PM',
-                'type': 'panel',
-                'description': 'Curators and artists discuss vibrant contemporary art movements across Latin America and their global influence.',
-                'price': '$18',
-                'duration': '2 hours'
-            },
-            {
-                'title': 'Brazilian Music and Culture Evening',
-                'museum': 'americas',
-                'days_offset': 32,
-                'time': '7:30 PM',
-                'type': 'performances',
-                'description': 'Evening of Brazilian music, dance, and cultural celebration with live performances by renowned artists.',
-                'price': '$35',
-                'duration': '2.5 hours'
-            }
-        ]
-        
-        # Convert to full event objects with proper links
-        for event_data in events_data:
-            event_date = (today + timedelta(days=event_data['days_offset'])).strftime('%Y-%m-%d')
-            
-            event = {
-                'title': event_data['title'],
-                'museum': event_data['museum'],
-                'date': event_date,
-                'time': event_data['time'],
-                'type': event_data['type'],
-                'description': event_data['description'],
-                'city': 'New York',
-                'price': event_data['price'],
-                'duration': event_data['duration'],
-                'link': self.institutions[event_data['museum']]['url']  # Proper link for each institution
-            }
-            
-            self.events.append(event)
+        # Each institution's programme comes from its adapter module
+        for institution_id in self.institutions:
+            institution = self.institutions[institution_id]
+            for event_data in institution.sample_events:
+                event_date = (today + timedelta(days=event_data['days_offset'])).strftime('%Y-%m-%d')
+                
+                event = {
+                    'title': event_data['title'],
+                    'museum': institution_id,
+                    'date': event_date,
+                    'time': event_data['time'],
+                    'type': event_data['type'],
+                    'description': event_data['description'],
+                    'city': 'New York',
+                    'price': event_data['price'],
+                    'duration': event_data['duration'],
+                    'link': institution.url  # Proper link for each institution
+                }
+                
+                self.events.append(event)
         
         print(f"  ✅ Created {len(self.events)} comprehensive events with working links")
     
@@ -503,20 +148,14 @@ class CompleteCulturalScraper:
         print("\n📊 COMPREHENSIVE SCRAPING SUMMARY")
         print("=" * 60)
         
-        # Count by institution
-        institution_counts = {}
-        type_counts = {}
-        
-        for event in self.events:
-            museum = event['museum']
-            event_type = event['type']
-            
-            institution_counts[museum] = institution_counts.get(museum, 0) + 1
-            type_counts[event_type] = type_counts.get(event_type, 0) + 1
+        # Count by institution and type
+        table = EventTable(self.events)
+        institution_counts = table.count_by('museum')
+        type_counts = table.count_by('type')
         
         print("📍 Events by Institution:")
         for museum, count in institution_counts.items():
-            institution_name = self.institutions[museum]['shortName']
+            institution_name = self.institutions[museum].name
             print(f"  {institution_name}: {count} events")
         
         print("\n🎭 Events by Type:")
@@ -529,7 +168,7 @@ class CompleteCulturalScraper:
         for i, event in enumerate(self.events[:8]):
             print(f"  {i+1}. {event['title']}")
             print(f"     📅 {event['date']} at {event['time']}")
-            print(f"     🏛️  {self.institutions[event['museum']]['shortName']}")
+            print(f"     🏛️  {self.institutions[event['museum']].name}")
             print(f"     🔗 {event['link']}")
             print()
         
@@ -1,7 +1,7 @@
-from flask import Flask, render_template, request, jsonify
-import threading
+from flask import Flask, Response, render_template, request, jsonify
+import os
+import sys
 import time
-import json
 from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -9,135 +9,52 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+# Shared modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from driver_resolver import chrome_service
+from event_json import dump_file
+from events_api import CachedEventIndex, create_events_blueprint
+from institution_adapters import InstitutionAdapters
+from institution_health import OPEN, InstitutionHealth, listing_fingerprint
+from scrape_broker import COMPLETED, JobQueueFull, ScrapeBroker
+from scrape_log import ScrapeLog, cursor_arg
+from selector_learning import SelectorStats, discover_card_selectors
 
 app = Flask(__name__)
 
 class CompleteMarcetScraper:
-    def __init__(self):
+    def __init__(self, job=None):
+        self.job = job
         self.driver = None
+        self.selector_stats = SelectorStats()
         self.events = []
+        self.health = InstitutionHealth()
+        self.log = ScrapeLog()
+        if job:
+            self.log.forward = lambda record: job.log(record.line())
         self.scraping_status = {
             'active': False,
             'current_institution': None,
             'events_found': 0,
-            'progress': 0,
-            'logs': []
+            'progress': 0
         }
         
-        # ALL YOUR 17 INSTITUTIONS
-        self.institutions = {
-            'met': {
-                'name': 'The Met',
-                'url': 'https://www.metmuseum.org/events',
-                'selectors': ['.event-card', '.event-item', '.gtm-event-card', '.calendar-event'],
-                'max_events': 8
-            },
-            'moma': {
-                'name': 'MoMA',
-                'url': 'https://www.moma.org/calendar',
-                'selectors': ['.calendar-item', '.event-card', '.program-item'],
-                'max_events': 8
-            },
-            'womens_history': {
-                'name': "Women's History",
-                'url': 'https://www.nywhs.org/events',
-                'selectors': ['.event', '.program', '.calendar-item'],
-                'max_events': 6
-            },
-            'asia_society': {
-                'name': 'Asia Society',
-                'url': 'https://asiasociety.org/new-york/events',
-                'selectors': ['.event-item', '.program-item', '.calendar-event'],
-                'max_events': 6
-            },
-            'frick': {
-                'name': 'Frick',
-                'url': 'https://www.frick.org/events',
-                'selectors': ['.event', '.program', '.upcoming-event'],
-                'max_events': 6
-            },
-            'ifa_nyu': {
-                'name': 'IFA NYU',
-                'url': 'https://www.nyu.edu/gsas/dept/fineart/events',
-                'selectors': ['.event', '.calendar-item', '.news-item'],
-                'max_events': 5
-            },
-            'ny_historical': {
-                'name': 'NY Historical',
-                'url': 'https://www.nyhistory.org/events',
-                'selectors': ['.event', '.program-listing', '.calendar-item'],
-                'max_events': 6
-            },
-            'morningside': {
-                'name': 'Morningside',
-                'url': 'https://www.morningsideheights.org/events',
-                'selectors': ['.event', '.calendar-event', '.program'],
-                'max_events': 5
-            },
-            'ny_society_library': {
-                'name': 'NY Society Library',
-                'url': 'https://www.nysoclib.org/events',
-                'selectors': ['.event', '.program', '.calendar-item'],
-                'max_events': 6
-            },
-            'albertine': {
-                'name': 'Albertine',
-                'url': 'https://www.albertine.com/events',
-                'selectors': ['.event', '.program', '.calendar-event'],
-                'max_events': 5
-            },
-            'rizzoli': {
-                'name': 'Rizzoli',
-                'url': 'https://www.rizzolibookstore.com/events',
-                'selectors': ['.event', '.calendar-item', '.program'],
-                'max_events': 4
-            },
-            'grolier_club': {
-                'name': 'Grolier Club',
-                'url': 'https://www.grolierclub.org/events',
-                'selectors': ['.event', '.program', '.exhibition'],
-                'max_events': 5
-            },
-            'national_arts_club': {
-                'name': 'National Arts Club',
-                'url': 'https://www.nationalartsclub.org/events',
-                'selectors': ['.event', '.program', '.calendar-item'],
-                'max_events': 5
-            },
-            'explorers_club': {
-                'name': "Explorer's Club",
-                'url': 'https://www.explorers.org/events',
-                'selectors': ['.event', '.program', '.calendar-event'],
-                'max_events': 5
-            },
-            'americas_society': {
-                'name': 'Americas Society',
-                'url': 'https://www.as-coa.org/events',
-                'selectors': ['.event', '.program', '.calendar-item'],
-                'max_events': 5
-            },
-            'poetry_society': {
-                'name': 'Poetry Society',
-                'url': 'https://www.poetrysociety.org/events',
-                'selectors': ['.event', '.reading', '.workshop'],
-                'max_events': 4
-            },
-            'lalliance': {
-                'name': "L'Alliance",
-                'url': 'https://www.fiaf.org/events',
-                'selectors': ['.event', '.program', '.calendar-event'],
-                'max_events': 4
-            }
-        }
+        # ALL YOUR 17 INSTITUTIONS - adapters are imported only when scraped
+        self.institutions = InstitutionAdapters()
     
-    def log_message(self, message):
-        """Add message to scraping logs"""
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        log_entry = f"[{timestamp}] {message}"
-        self.scraping_status['logs'].append(log_entry)
-        print(log_entry)
+    def log_message(self, message, level='info', **fields):
+        """Add message to scraping logs (and the job's log, if this scrape runs as one)"""
+        self.log.log(message, level, **fields)
+
+    def report_status(self):
+        """Push the current progress to the job, if this scrape runs as one"""
+        if self.job:
+            self.job.update(
+                progress=self.scraping_status['progress'],
+                current_institution=self.scraping_status['current_institution'],
+                events_found=self.scraping_status['events_found']
+            )
     
     def setup_driver(self):
         """Setup Chrome driver"""
@@ -150,75 +67,94 @@ class CompleteMarcetScraper:
         options.add_argument('--disable-gpu')
         options.add_argument('--disable-extensions')
         options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        options.binary_location = '/usr/bin/google-chrome'
         
         try:
-            service = Service(ChromeDriverManager().install())
+            service = chrome_service(options)
             self.driver = webdriver.Chrome(service=service, options=options)
             self.driver.set_page_load_timeout(20)
             self.driver.implicitly_wait(8)
             self.log_message("✅ Chrome driver ready!")
             return True
         except Exception as e:
-            self.log_message(f"❌ Failed to setup driver: {e}")
+            self.log_message(f"❌ Failed to setup driver: {e}", level='error')
             return False
     
     def scrape_institution_real(self, institution_id):
         """Attempt real scraping from institution website"""
         institution = self.institutions[institution_id]
-        self.log_message(f"🏛️ Scraping {institution['name']}...")
+        self.log_message(f"🏛️ Scraping {institution.name}...")
         
         events_found = 0
+        first_new = len(self.events)
+        started = time.time()
+        error = None
         
         try:
             # Navigate to institution events page
-            self.driver.get(institution['url'])
+            self.driver.get(institution.url)
             time.sleep(5)
             
-            # Try multiple selectors
-            for selector in institution['selectors']:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    self.log_message(f"   Found {len(elements)} elements with '{selector}'")
-                    
-                    if elements:
-                        # Process found elements
-                        for i, element in enumerate(elements[:institution['max_events']]):
-                            try:
-                                event_data = self.extract_event_data(element, institution_id, institution['url'])
-                                if event_data:
-                                    self.events.append(event_data)
-                                    events_found += 1
-                                    self.log_message(f"   ✅ Event {events_found}: {event_data['title'][:50]}...")
-                            except Exception as e:
-                                self.log_message(f"   ⚠️ Error extracting event {i+1}: {e}")
-                        
-                        if events_found > 0:
-                            break
-                            
-                except Exception as e:
-                    self.log_message(f"   ⚠️ Selector '{selector}' failed: {e}")
-                    continue
+            # Try selectors in order of past success for this institution
+            for selector in self.selector_stats.rank(institution_id, institution.card_selectors):
+                events_found = self.scrape_with_selector(institution_id, selector)
+                if events_found > 0:
+                    break
             
-            # If no real events found, create realistic samples
+            # None of the known selectors worked: look for repeated card markup
             if events_found == 0:
-                self.log_message(f"   📝 Creating sample events for {institution['name']}...")
-                events_found = self.create_sample_events_for_institution(institution_id)
-                
+                discovered = discover_card_selectors(self.driver)
+                if discovered:
+                    self.log_message(f"   🔍 Discovered candidate selectors: {', '.join(discovered)}")
+                for selector in discovered:
+                    events_found = self.scrape_with_selector(institution_id, selector)
+                    if events_found > 0:
+                        self.selector_stats.add_discovered(institution_id, [selector])
+                        break
+            
+        except Exception as e:
+            self.log_message(f"❌ Error scraping {institution.name}: {e}", level='error')
+            error = e
+        
+        # Failures are recorded for the circuit breaker, not filled in with sample events
+        state = self.health.record(institution_id, events_found, time.time() - started, error=error,
+                                   fingerprint=listing_fingerprint(self.events[first_new:]))
+        if events_found == 0 and error is None:
+            self.log_message(f"   ⚠️ No events found for {institution.name}", level='warning')
+        if state == OPEN:
+            self.log_message(f"   ⛔ {institution.name} keeps failing, skipping it until its cool-down ends", level='warning')
+        
+        self.log_message(f"✅ {institution.name}: {events_found} events collected")
+        return events_found
+    
+    def scrape_with_selector(self, institution_id, selector):
+        """Extract events matching one selector and record whether it worked"""
+        institution = self.institutions[institution_id]
+        events_found = 0
+        try:
+            elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+            self.log_message(f"   Found {len(elements)} elements with '{selector}'")
+            
+            for i, element in enumerate(elements[:institution.max_events]):
+                try:
+                    event_data = self.extract_event_data(element, institution)
+                    if event_data:
+                        self.events.append(event_data)
+                        events_found += 1
+                        self.log_message(f"   ✅ Event {events_found}: {event_data['title'][:50]}...")
+                except Exception as e:
+                    self.log_message(f"   ⚠️ Error extracting event {i+1}: {e}", level='warning')
         except Exception as e:
-            self.log_message(f"❌ Error scraping {institution['name']}: {e}")
-            events_found = self.create_sample_events_for_institution(institution_id)
+            self.log_message(f"   ⚠️ Selector '{selector}' failed: {e}", level='warning')
         
-        self.log_message(f"✅ {institution['name']}: {events_found} events collected")
+        self.selector_stats.record(institution_id, selector, events_found)
         return events_found
     
-    def extract_event_data(self, element, institution_id, base_url):
-        """Extract event data from DOM element"""
+    def extract_event_data(self, element, institution):
+        """Extract event data from DOM element using the institution's adapter"""
         try:
-            title_selectors = ['h1', 'h2', 'h3', 'h4', '.title', '.event-title', '.event-name', 'a']
             title = None
             
-            for selector in title_selectors:
+            for selector in institution.selectors('title'):
                 try:
                     title_elem = element.find_element(By.CSS_SELECTOR, selector)
                     title = title_elem.text.strip()
@@ -229,23 +165,26 @@ class CompleteMarcetScraper:
             
             if not title:
                 return None
+            title = institution.clean_title(title)
             
-            description = self.extract_text_from_element(element, ['.description', '.summary', 'p'])
-            date_text = self.extract_text_from_element(element, ['.date', '.time', 'time'])
+            description = self.extract_text_from_element(element, institution.selectors('description'))
+            date_text = self.extract_text_from_element(element, institution.selectors('date'))
             
             event_date, event_time = self.parse_date_time(date_text)
+            event_type = (institution.event_type(title, description, institution.url)
+                          or self.classify_event_type(title, description))
             
             return {
                 'title': title[:100],
-                'museum': institution_id,
+                'museum': institution.id,
                 'date': event_date,
                 'time': event_time,
-                'type': self.classify_event_type(title, description),
+                'type': event_type,
                 'description': (description or title)[:300],
                 'city': 'New York',
                 'price': 'See website',
                 'duration': '2 hours',
-                'link': base_url
+                'link': institution.url
             }
             
         except Exception as e:
@@ -289,42 +228,6 @@ class CompleteMarcetScraper:
         default_time = '7:00 PM'
         return default_date, default_time
     
-    def create_sample_events_for_institution(self, institution_id):
-        """Create sample events when scraping fails"""
-        institution = self.institutions[institution_id]
-        today = datetime.now()
-        
-        # Create 2-3 sample events per institution
-        sample_events = [
-            {
-                'title': f'Cultural Event at {institution["name"]}',
-                'museum': institution_id,
-                'date': (today + timedelta(days=5)).strftime('%Y-%m-%d'),
-                'time': '7:00 PM',
-                'type': 'lecture',
-                'description': f'Featured cultural programming at {institution["name"]}. Visit their website for current events.',
-                'city': 'New York',
-                'price': 'See website',
-                'duration': '2 hours',
-                'link': institution['url']
-            },
-            {
-                'title': f'Special Program at {institution["name"]}',
-                'museum': institution_id,
-                'date': (today + timedelta(days=12)).strftime('%Y-%m-%d'),
-                'time': '6:30 PM',
-                'type': 'talks',
-                'description': f'Special programming and cultural events hosted by {institution["name"]}.',
-                'city': 'New York',
-                'price': 'See website',
-                'duration': '90 minutes',
-                'link': institution['url']
-            }
-        ]
-        
-        self.events.extend(sample_events)
-        return len(sample_events)
-    
     def scrape_selected_institutions(self, selected_institutions):
         """Scrape from selected institutions"""
         self.scraping_status['active'] = True
@@ -332,6 +235,11 @@ class CompleteMarcetScraper:
         self.scraping_status['progress'] = 0
         self.events = []
         
+        # Sites whose circuit is open are skipped until their cool-down ends
+        selected_institutions, skipped = self.health.plan(selected_institutions)
+        for institution_id, reason in skipped.items():
+            self.log_message(f"⏸️ Skipping {institution_id}: {reason}", level='warning', institution=institution_id)
+        
         total_institutions = len(selected_institutions)
         
         try:
@@ -339,29 +247,57 @@ class CompleteMarcetScraper:
                 return False
             
             for i, institution_id in enumerate(selected_institutions):
-                self.scraping_status['current_institution'] = self.institutions[institution_id]['name']
+                if self.job and self.job.cancelled:
+                    self.log_message("🛑 Scrape cancelled")
+                    break
+                
+                self.scraping_status['current_institution'] = self.institutions[institution_id].name
                 self.scraping_status['progress'] = int((i / total_institutions) * 100)
+                self.report_status()
                 
-                events_count = self.scrape_institution_real(institution_id)
+                with self.log.scope(institution=institution_id):
+                    events_count = self.scrape_institution_real(institution_id)
                 self.scraping_status['events_found'] += events_count
+                self.report_status()
                 
                 time.sleep(2)
             
             self.scraping_status['progress'] = 100
+            self.report_status()
             self.log_message(f"🎉 Scraping complete! Total events: {len(self.events)}")
             
         except Exception as e:
-            self.log_message(f"❌ Scraping error: {e}")
+            self.log_message(f"❌ Scraping error: {e}", level='error')
         finally:
             if self.driver:
                 self.driver.quit()
+            self.health.save()
+            self.selector_stats.save()
             self.scraping_status['active'] = False
         
         return len(self.events)
 
-# Global scraper instance
+# Institution catalogue for /api/institutions; scrapes get their own instance
 scraper = CompleteMarcetScraper()
 
+def run_scrape_job(job):
+    """Run one queued scrape with an isolated scraper and result buffer.
+    
+    Called inside a scrape_worker.py process, never in the web process.
+    """
+    job_scraper = CompleteMarcetScraper(job=job)
+    job_scraper.scrape_selected_institutions(job.institutions)
+    job.update(events=job_scraper.events, events_found=len(job_scraper.events))
+
+# The web tier only enqueues jobs and reads results; scrape_worker.py runs them
+broker = ScrapeBroker(max_queued=5)
+
+# /api/events: indexed, paged and cached queries over the latest completed scrape.
+# The index is rebuilt only when a newer job finishes.
+events_index = CachedEventIndex(lambda: broker.job_events(broker.latest(status=COMPLETED)),
+                                lambda: broker.latest(status=COMPLETED))
+app.register_blueprint(create_events_blueprint(events_index))
+
 @app.route('/')
 def index():
     """Main scraper interface with ALL your institutions"""
@@ -514,6 +450,8 @@ def index():
             updateSelectionCount();
         }
         
+        let currentJobId = null;
+        
         function startScraping() {
             if (selectedInstitutions.length === 0) {
                 alert('Please select at least one institution');
@@ -528,48 +466,63 @@ def index():
                 method: 'POST',
                 headers: {'Content-Type': 'application/json'},
                 body: JSON.stringify({institutions: selectedInstitutions})
-            });
-            
-            pollStatus();
+            })
+                .then(response => response.json().then(result => ({ok: response.ok, result})))
+                .then(({ok, result}) => {
+                    if (!ok) {
+                        alert(result.error);
+                        finishScraping();
+                        return;
+                    }
+                    currentJobId = result.job_id;
+                    document.getElementById('statusText').textContent = 'Queued...';
+                    streamStatus(result.job_id);
+                });
         }
         
-        function pollStatus() {
-            fetch('/api/status')
-                .then(response => response.json())
-                .then(status => {
-                    document.getElementById('progressFill').style.width = status.progress + '%';
-                    
-                    if (status.active) {
-                        document.getElementById('statusText').textContent = 
-                            `Scraping: ${status.current_institution || 'Starting...'}`;
-                    } else {
-                        document.getElementById('statusText').textContent = 'Scraping complete!';
-                        document.getElementById('scrapeBtn').disabled = false;
+        function finishScraping() {
+            document.getElementById('scrapeBtn').disabled = false;
+            scrapingActive = false;
+        }
+        
+        function streamStatus(jobId) {
+            const source = new EventSource(`/api/jobs/${jobId}/stream`);
+            
+            source.addEventListener('status', (message) => {
+                const status = JSON.parse(message.data);
+                document.getElementById('progressFill').style.width = status.progress + '%';
+                
+                if (status.status === 'queued') {
+                    document.getElementById('statusText').textContent = 'Queued...';
+                } else if (status.status === 'running') {
+                    document.getElementById('statusText').textContent = 
+                        `Scraping: ${status.current_institution || 'Starting...'}`;
+                } else {
+                    document.getElementById('statusText').textContent = `Scraping ${status.status}!`;
+                    source.close();
+                    finishScraping();
+                    if (status.status === 'completed') {
                         document.getElementById('saveBtn').disabled = false;
-                        scrapingActive = false;
+                        if (status.events_found > 0) showEventsSummary();
                     }
-                    
-                    document.getElementById('eventsCount').textContent = 
-                        `Events found: ${status.events_found}`;
-                    
-                    const logsDiv = document.getElementById('logs');
-                    logsDiv.innerHTML = status.logs.slice(-12).map(log => 
-                        `<div class="log-entry">${log}</div>`
-                    ).join('');
-                    logsDiv.scrollTop = logsDiv.scrollHeight;
-                    
-                    if (status.active) {
-                        setTimeout(pollStatus, 1000);
-                    } else if (status.events_found > 0) {
-                        showEventsSummary();
-                    }
-                });
+                }
+                
+                document.getElementById('eventsCount').textContent = 
+                    `Events found: ${status.events_found}`;
+                
+                const logsDiv = document.getElementById('logs');
+                logsDiv.innerHTML = status.logs.slice(-12).map(log => 
+                    `<div class="log-entry">${log}</div>`
+                ).join('');
+                logsDiv.scrollTop = logsDiv.scrollHeight;
+            });
         }
         
         function showEventsSummary() {
-            fetch('/api/events')
+            fetch('/api/events?limit=500')
                 .then(response => response.json())
-                .then(events => {
+                .then(data => {
+                    const events = data.events;
                     const summary = document.getElementById('eventsSummary');
                     const content = document.getElementById('summaryContent');
                     
@@ -579,7 +532,7 @@ def index():
                     });
                     
                     content.innerHTML = `
-                        <p><strong>Total Events Scraped:</strong> ${events.length}</p>
+                        <p><strong>Total Events Scraped:</strong> ${data.count + data.remaining}</p>
                         <h4>By Institution:</h4>
                         ${Object.keys(counts).map(museum => 
                             `<p><strong>${museum.replace('_', ' ').toUpperCase()}:</strong> ${counts[museum]} events</p>`
@@ -596,7 +549,11 @@ def index():
         }
         
         function saveEvents() {
-            fetch('/api/save', {method: 'POST'})
+            fetch('/api/save', {
+                method: 'POST',
+                headers: {'Content-Type': 'application/json'},
+                body: JSON.stringify({job_id: currentJobId})
+            })
                 .then(response => response.json())
                 .then(result => {
                     alert(result.message + '\\n\\nNow run: python react_integration.py');
@@ -610,42 +567,83 @@ def index():
 @app.route('/api/institutions')
 def get_institutions():
     """Get all 17 institutions"""
-    return jsonify(scraper.institutions)
+    return jsonify(scraper.institutions.catalog())
+
+@app.route('/api/health')
+def get_health():
+    """Per-institution success rate, latency, yield and circuit state"""
+    return jsonify(InstitutionHealth().report())
 
 @app.route('/api/scrape', methods=['POST'])
 def start_scraping():
-    """Start scraping selected institutions"""
-    data = request.json
-    selected = data.get('institutions', [])
+    """Queue a scrape of the selected institutions"""
+    data = request.json or {}
+    selected = [i for i in data.get('institutions', []) if i in scraper.institutions]
+    if not selected:
+        return jsonify({'error': 'No known institutions selected'}), 400
     
-    thread = threading.Thread(target=scraper.scrape_selected_institutions, args=(selected,))
-    thread.daemon = True
-    thread.start()
+    try:
+        job_id = broker.enqueue(selected)
+    except JobQueueFull as e:
+        return jsonify({'error': f'Scrape queue is full ({e}), try again later'}), 429
     
-    return jsonify({'status': 'started'})
+    return jsonify({'status': 'queued', 'job_id': job_id}), 202
+
+@app.route('/api/jobs')
+def list_jobs():
+    """List recent scrape jobs"""
+    return jsonify(broker.list_jobs())
+
+@app.route('/api/jobs/<job_id>', methods=['GET', 'DELETE'])
+def job_detail(job_id):
+    """Get a job's status, or cancel it with DELETE"""
+    if request.method == 'DELETE':
+        broker.cancel(job_id)
+    job = broker.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    return jsonify(job)
+
+@app.route('/api/jobs/<job_id>/stream')
+def stream_job(job_id):
+    """Push job status as Server-Sent Events until the job finishes"""
+    if broker.get(job_id) is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    return Response(broker.stream(job_id), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 @app.route('/api/status')
 def get_status():
-    """Get current scraping status"""
-    return jsonify(scraper.scraping_status)
-
-@app.route('/api/events')
-def get_events():
-    """Get scraped events"""
-    return jsonify(scraper.events)
+    """Status of the most recent job (kept for older polling clients); ?cursor=N adds newer log entries"""
+    cursor = cursor_arg(request.args)
+    job_id = broker.latest()
+    if job_id is None:
+        return jsonify({'active': False, 'status': 'idle', 'current_institution': None,
+                        'events_found': 0, 'progress': 0, 'logs': [], 'log_cursor': cursor or 0,
+                        'log_entries': []})
+    status = broker.get(job_id)
+    if cursor is not None:
+        status['log_cursor'], status['log_entries'] = broker.log_tail(job_id, cursor)
+    return jsonify(status)
 
 @app.route('/api/save', methods=['POST'])
 def save_events():
-    """Save events to JSON file"""
+    """Save a job's events (default: the latest completed job) to JSON file"""
+    data = request.get_json(silent=True) or {}
+    job = broker.get(data.get('job_id') or broker.latest(status=COMPLETED) or '')
+    if job is None or job['status'] != COMPLETED:
+        return jsonify({'error': 'No completed scrape to save'}), 404
+    
     try:
-        with open('cultural_events.json', 'w', encoding='utf-8') as f:
-            json.dump(scraper.events, f, indent=2, ensure_ascii=False)
-        return jsonify({'message': f'Successfully saved {len(scraper.events)} events to cultural_events.json'})
+        events = broker.job_events(job['id'])
+        dump_file(events, 'cultural_events.json')
+        return jsonify({'message': f'Successfully saved {len(events)} events to cultural_events.json'})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
     print("🎭 Starting Complete Marcet Society Cultural Events Scraper...")
     print("📱 All 17 institutions available at: http://localhost:5000")
+    print("👷 Start scrape workers separately: python scrape_worker.py --workers 2")
     app.run(debug=True, host='0.0.0.0', port=5000)
 
@@ -11,13 +11,19 @@ import time
 from datetime import datetime
 from pathlib import Path
 
-# Import our custom modules
-from cultural_events_scraper import CulturalEventScraper
-from react_integration import ReactIntegrator
+# Shared modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from date_window import DateWindow, add_window_arguments
+from event_archive import ArchiveReader
+from event_json import dump_file
+from event_table import summarize
+from event_validation import ValidationStage, validate_events as validate_batch
+from seen_index import KnownEvents, SeenIndex
 
 class WorkflowManager:
     def __init__(self, config=None):
         self.config = config or self.default_config()
+        self.validation = None
         self.setup_directories()
         
     def default_config(self):
@@ -27,7 +33,9 @@ class WorkflowManager:
             'output_dir': 'scraper_output',
             'headless': True,
             'max_events_per_institution': 10,
-            'delay_between_sites': 2
+            'delay_between_sites': 2,
+            'skip_seen_events': False,
+            'date_window': None
         }
     
     def setup_directories(self):
@@ -87,6 +95,9 @@ class WorkflowManager:
     def scrape_events(self):
         """Scrape events from all institutions"""
         try:
+            # Selenium is imported only when a scrape actually runs
+            from cultural_events_scraper import CulturalEventScraper
+            
             scraper = CulturalEventScraper(
                 headless=self.config['headless']
             )
@@ -95,12 +106,36 @@ class WorkflowManager:
             scraper.max_events_per_institution = self.config['max_events_per_institution']
             scraper.delay_between_sites = self.config['delay_between_sites']
             
-            events = scraper.scrape_all_events()
+            # Validate inline while scraping; validate_events only collects the result
+            self.validation = ValidationStage()
+            scraper.validation_stage = self.validation
+            
+            # Only extract events dated inside the run's window
+            if self.config.get('date_window'):
+                scraper.date_window = DateWindow(**self.config['date_window'])
+                print(f"🗓️ Date window: {scraper.date_window.describe()}")
+            
+            # Only extract events not seen on earlier runs; seen ones come from the archive
+            if self.config.get('skip_seen_events'):
+                scraper.seen_index = SeenIndex()
+                window = scraper.date_window
+                scraper.known_events = KnownEvents(ArchiveReader().load(
+                    window.start if window else None, window.end if window else None))
             
-            # Save raw scraped data
-            raw_file = os.path.join(self.config['output_dir'], 'raw_scraped_events.json')
-            with open(raw_file, 'w', encoding='utf-8') as f:
-                json.dump(events, f, indent=2, ensure_ascii=False)
+            try:
+                events = scraper.scrape_all_events()
+                
+                # Save raw scraped data
+                raw_file = os.path.join(self.config['output_dir'], 'raw_scraped_events.json')
+                dump_file(events, raw_file)
+            except Exception:
+                # Nothing was saved: forget this run's marks so the next run extracts them
+                if scraper.seen_index:
+                    scraper.seen_index.close(commit=False)
+                raise
+            if scraper.seen_index:
+                print(f"👀 Seen index: {scraper.seen_index.summary()}")
+                scraper.seen_index.close()
             
             print(f"✅ Scraped {len(events)} events")
             print(f"📁 Raw data saved to: {raw_file}")
@@ -115,54 +150,22 @@ class WorkflowManager:
         """Validate and clean scraped events"""
         print(f"📊 Validating {len(events)} events...")
         
-        valid_events = []
-        validation_errors = []
-        
-        for i, event in enumerate(events, 1):
-            try:
-                # Required fields check
-                required_fields = ['title', 'museum', 'date', 'time', 'type', 'description', 'city']
-                missing_fields = [field for field in required_fields if not event.get(field)]
-                
-                if missing_fields:
-                    validation_errors.append(f"Event {i}: Missing fields: {missing_fields}")
-                    continue
-                
-                # Date validation
-                try:
-                    datetime.strptime(event['date'], '%Y-%m-%d')
-                except ValueError:
-                    validation_errors.append(f"Event {i}: Invalid date format: {event['date']}")
-                    continue
-                
-                # Clean up text fields
-                event['title'] = event['title'].strip()[:100]  # Limit title length
-                event['description'] = event['description'].strip()[:300]  # Limit description
-                
-                # Ensure required fields have defaults
-                event['price'] = event.get('price', 'See website')
-                event['duration'] = event.get('duration', '2 hours')
-                event['link'] = event.get('link', '')
-                
-                valid_events.append(event)
-                
-            except Exception as e:
-                validation_errors.append(f"Event {i}: Validation error: {e}")
-        
-        # Save validation report
-        validation_report = {
-            'total_scraped': len(events),
-            'valid_events': len(valid_events),
-            'validation_errors': validation_errors,
-            'validation_timestamp': datetime.now().isoformat()
-        }
+        stage = self.validation
+        if stage is not None and stage.total + len(stage.pending) == len(events):
+            # Already validated inline while scraping
+            validation_report = stage.report()
+            valid_events = stage.valid
+        else:
+            valid_events, validation_report = validate_batch(events)
+        validation_errors = validation_report['validation_errors']
         
         report_file = os.path.join(self.config['output_dir'], 'validation_report.json')
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(validation_report, f, indent=2, ensure_ascii=False)
+        dump_file(validation_report, report_file)
         
         print(f"✅ {len(valid_events)} valid events")
         print(f"⚠️  {len(validation_errors)} validation errors")
+        for key, count in sorted(validation_report['errors_by_code'].items()):
+            print(f"   {key}: {count}")
         print(f"📁 Validation report saved to: {report_file}")
         
         return valid_events
@@ -170,10 +173,11 @@ class WorkflowManager:
     def integrate_events(self, events):
         """Integrate events with React app"""
         try:
+            from react_integration import ReactIntegrator
+            
             # Save clean events file
             clean_file = self.config['scraped_events_file']
-            with open(clean_file, 'w', encoding='utf-8') as f:
-                json.dump(events, f, indent=2, ensure_ascii=False)
+            dump_file(events, clean_file)
             
             # Run integration
             integrator = ReactIntegrator(
@@ -202,8 +206,7 @@ class WorkflowManager:
             # 1. Generate events summary
             summary = self.generate_events_summary(events)
             summary_file = os.path.join(output_dir, 'events_summary.json')
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False)
+            dump_file(summary, summary_file)
             
             # 2. Generate React component code
             react_code = self.generate_react_component(events)
@@ -224,39 +227,15 @@ class WorkflowManager:
     
     def generate_events_summary(self, events):
         """Generate summary statistics"""
-        summary = {
-            'total_events': len(events),
+        counts = summarize(events)
+        return {
+            'total_events': counts['total_events'],
             'last_updated': datetime.now().isoformat(),
-            'events_by_type': {},
-            'events_by_museum': {},
-            'events_by_city': {},
-            'upcoming_events': 0
+            'events_by_type': counts['events_by_type'],
+            'events_by_museum': counts['events_by_museum'],
+            'events_by_city': counts['events_by_city'],
+            'upcoming_events': counts['upcoming_events']
         }
-        
-        today = datetime.now().date()
-        
-        for event in events:
-            # Count by type
-            event_type = event.get('type', 'unknown')
-            summary['events_by_type'][event_type] = summary['events_by_type'].get(event_type, 0) + 1
-            
-            # Count by museum
-            museum = event.get('museum', 'unknown')
-            summary['events_by_museum'][museum] = summary['events_by_museum'].get(museum, 0) + 1
-            
-            # Count by city
-            city = event.get('city', 'unknown')
-            summary['events_by_city'][city] = summary['events_by_city'].get(city, 0) + 1
-            
-            # Count upcoming events
-            try:
-                event_date = datetime.strptime(event['date'], '%Y-%m-%d').date()
-                if event_date >= today:
-                    summary['upcoming_events'] += 1
-            except:
-                pass
-        
-        return summary
     
     def generate_react_component(self, events):
         """Generate a React component with the events"""
@@ -415,6 +394,8 @@ def main():
     parser.add_argument('--output-dir', default='scraper_output', help='Output directory')
     parser.add_argument('--react-path', default='frontend/src', help='React app path')
     parser.add_argument('--preview', action='store_true', help='Preview only, no integration')
+    parser.add_argument('--skip-seen', action='store_true', help='Skip events already scraped on earlier runs')
+    add_window_arguments(parser)
     
     args = parser.parse_args()
     
@@ -424,7 +405,9 @@ def main():
         'output_dir': args.output_dir,
         'headless': args.headless,
         'max_events_per_institution': args.max_events,
-        'delay_between_sites': 2
+        'delay_between_sites': 2,
+        'skip_seen_events': args.skip_seen,
+        'date_window': {'start': args.start, 'end': args.end, 'days': args.days}
     }
     
     workflow = WorkflowManager(config)
@@ -1,5 +1,6 @@
+import os
+import sys
 import time
-import json
 import re
 from datetime import datetime, timedelta
 from selenium import webdriver
@@ -8,13 +9,26 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+# Shared modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from date_window import INSIDE
+from driver_resolver import chrome_service
+from event_json import dump_file
+from event_table import EventTable
 
 class CulturalEventScraper:
     def __init__(self, headless=True):
         self.setup_driver(headless)
         self.events = []
+        # Optional event_validation.ValidationStage fed as events are found
+        self.validation_stage = None
+        # Optional seen_index.SeenIndex; events seen on earlier runs are not extracted again
+        self.seen_index = None
+        # Optional seen_index.KnownEvents the seen events are taken from instead
+        self.known_events = None
+        # Optional date_window.DateWindow; cards dated outside it are skipped unread
+        self.date_window = None
         
         # Target event types
         self.target_event_types = [
@@ -44,13 +58,13 @@ class CulturalEventScraper:
                 'url': 'https://www.frick.org/events',
                 'location': 'New York'
             },
-            'asia': {
+            'asia_society': {
                 'name': 'Asia Society',
                 'shortName': 'Asia Society',
                 'url': 'https://asiasociety.org/new-york/events',
                 'location': 'New York'
             },
-            'nyhs': {
+            'ny_historical': {
                 'name': 'New York Historical Society',
                 'shortName': 'NY Historical',
                 'url': 'https://www.nyhistory.org/events',
@@ -109,16 +123,13 @@ class CulturalEventScraper:
         options.add_argument('--disable-ipc-flooding-protection')
         options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
-        # Use the installed Chrome binary
-        options.binary_location = '/usr/bin/google-chrome'
-        
         # Clean user data directory
         import shutil
         import os
         if os.path.exists('/tmp/chrome-scraper'):
             shutil.rmtree('/tmp/chrome-scraper')
         
-        service = Service(ChromeDriverManager().install())
+        service = chrome_service(options)
         self.driver = webdriver.Chrome(service=service, options=options)
         self.driver.set_page_load_timeout(30)
         self.driver.implicitly_wait(10)
@@ -183,7 +194,7 @@ class CulturalEventScraper:
                         for element in elements[:5]:  # Limit to 5 events
                             event_data = self.extract_event_data(element, 'met')
                             if event_data:
-                                self.events.append(event_data)
+                                self.add_event(event_data)
                                 events_found += 1
                                 print(f"    ✅ Added: {event_data['title'][:60]}...")
                         
@@ -235,7 +246,7 @@ class CulturalEventScraper:
             },
             {
                 'title': 'Women in Science: Historical Perspectives',
-                'museum': 'nyhs',
+                'museum': 'ny_historical',
                 'date': (today + timedelta(days=14)).strftime('%Y-%m-%d'),
                 'time': '2:00 PM',
                 'type': 'lecture',
@@ -247,7 +258,7 @@ class CulturalEventScraper:
             },
             {
                 'title': 'Asian Literature Book Launch',
-                'museum': 'asia',
+                'museum': 'asia_society',
                 'date': (today + timedelta(days=21)).strftime('%Y-%m-%d'),
                 'time': '7:00 PM',
                 'type': 'talks',
@@ -271,12 +282,27 @@ class CulturalEventScraper:
             }
         ]
         
-        self.events.extend(sample_events)
+        for event in sample_events:
+            self.add_event(event)
         print(f"  ✅ Created {len(sample_events)} sample events")
     
+    def add_event(self, event):
+        """Collect an event and pass it to the validation stage, if any"""
+        self.events.append(event)
+        if self.validation_stage:
+            self.validation_stage.add(event)
+    
     def extract_event_data(self, element, museum_id):
         """Extract event data from a DOM element"""
         try:
+            # The date decides whether anything else is worth extracting
+            date = self.extract_text(element, ['.date', '.event-date', 'time'])
+            window_date = None
+            if self.date_window:
+                status, window_date = self.date_window.classify(date)
+                if status != INSIDE:
+                    return None
+            
             # Try to find title
             title_selectors = ['h1', 'h2', 'h3', 'h4', '.title', '.event-title', '.event-name']
             title = None
@@ -297,12 +323,29 @@ class CulturalEventScraper:
             if not self.is_target_event_type(title):
                 return None
             
+            # Known event: skip the remaining extraction
+            link = self.extract_link(element, museum_id)
+            # The fallback listing URL does not identify an event
+            link_key = link if link != self.institutions[museum_id]['url'] else None
+            if self.seen_index and link_key and self.seen_index.seen_url(link_key):
+                known = self.known_events.find(url=link_key) if self.known_events else None
+                if known:
+                    return dict(known)
+                # Seen but not archived: extract it again
+            
             # Extract other details with defaults
             description = self.extract_text(element, ['.description', '.event-description', 'p'])
-            date = self.extract_text(element, ['.date', '.event-date', 'time'])
             
             # Generate event data
             event_date, event_time = self.parse_date_time(date)
+            event_date = window_date or event_date
+            
+            if self.seen_index:
+                if not link_key and self.seen_index.seen_event(title, event_date):
+                    known = self.known_events.find(title=title, date=event_date) if self.known_events else None
+                    if known:
+                        return dict(known)
+                self.seen_index.mark(url=link_key, title=title, date=event_date)
             
             return {
                 'title': title[:100],
@@ -314,7 +357,7 @@ class CulturalEventScraper:
                 'city': 'New York',
                 'price': 'See website',
                 'duration': '2 hours',
-                'link': self.extract_link(element, museum_id)
+                'link': link
             }
             
         except Exception as e:
@@ -346,8 +389,8 @@ class CulturalEventScraper:
                         'met': 'https://www.metmuseum.org',
                         'moma': 'https://www.moma.org',
                         'frick': 'https://www.frick.org',
-                        'asia': 'https://asiasociety.org',
-                        'nyhs': 'https://www.nyhistory.org'
+                        'asia_society': 'https://asiasociety.org',
+                        'ny_historical': 'https://www.nyhistory.org'
                     }
                     return base_urls.get(museum_id, '') + href
         except:
@@ -418,7 +461,7 @@ class CulturalEventScraper:
             'duration': '2 hours',
             'link': self.institutions[museum_id]['url']
         }
-        self.events.append(sample_event)
+        self.add_event(sample_event)
         print(f"    ✅ Created sample event for {museum_id}")
     
     def scrape_all_events(self):
@@ -445,8 +488,7 @@ class CulturalEventScraper:
     
     def save_events_to_file(self, filename='cultural_events.json'):
         """Save events to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.events, f, indent=2, ensure_ascii=False)
+        dump_file(self.events, filename)
         print(f"📁 Events saved to {filename}")
     
     def print_summary(self):
@@ -454,16 +496,10 @@ class CulturalEventScraper:
         print("\n📊 SCRAPING SUMMARY")
         print("=" * 50)
         
-        # Count by institution
-        institution_counts = {}
-        type_counts = {}
-        
-        for event in self.events:
-            museum = event['museum']
-            event_type = event['type']
-            
-            institution_counts[museum] = institution_counts.get(museum, 0) + 1
-            type_counts[event_type] = type_counts.get(event_type, 0) + 1
+        # Count by institution and type
+        table = EventTable(self.events)
+        institution_counts = table.count_by('museum')
+        type_counts = table.count_by('type')
         
         print("📍 Events by Institution:")
         for museum, count in institution_counts.items():
@@ -1,7 +1,6 @@
 from flask import Flask, render_template, request, jsonify
 import threading
 import time
-import json
 from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -9,8 +8,15 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+import os
+import sys
+
+# Shared modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from driver_resolver import chrome_service
+from event_metadata import MetadataAggregator, load_store, save_store
+from institution_health import OPEN, InstitutionHealth, listing_fingerprint
+from scrape_log import ScrapeLog, cursor_arg
 
 app = Flask(__name__)
 
@@ -18,12 +24,14 @@ class EnhancedMarcetScraper:
     def __init__(self):
         self.driver = None
         self.events = []
+        self.health = InstitutionHealth()
+        self.metadata = MetadataAggregator()
+        self.log = ScrapeLog()
         self.scraping_status = {
             'active': False,
             'current_institution': None,
             'events_found': 0,
             'progress': 0,
-            'logs': [],
             'last_scrape': None
         }
         
@@ -140,31 +148,19 @@ class EnhancedMarcetScraper:
         """Load existing events from file"""
         try:
             if os.path.exists('cultural_events.json'):
-                with open('cultural_events.json', 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                # Handle both old format (array) and new format (object with events and metadata)
-                if isinstance(data, list):
-                    self.events = data
-                elif isinstance(data, dict) and 'events' in data:
-                    self.events = data['events']
-                else:
-                    self.events = []
+                # Handles both the old array format and the object with events and metadata
+                self.events, self.metadata, _ = load_store('cultural_events.json')
                     
                 self.scraping_status['last_scrape'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 print(f"✅ Loaded {len(self.events)} existing events")
         except Exception as e:
             print(f"⚠️ Could not load existing events: {e}")
             self.events = []
+            self.metadata = MetadataAggregator()
     
-    def log_message(self, message):
+    def log_message(self, message, level='info', **fields):
         """Add message to scraping logs"""
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        log_entry = f"[{timestamp}] {message}"
-        self.scraping_status['logs'].append(log_entry)
-        if len(self.scraping_status['logs']) > 50:
-            self.scraping_status['logs'] = self.scraping_status['logs'][-50:]
-        print(log_entry)
+        self.log.log(message, level, **fields)
     
     def setup_driver(self):
         """Setup Chrome driver"""
@@ -177,17 +173,16 @@ class EnhancedMarcetScraper:
         options.add_argument('--disable-gpu')
         options.add_argument('--disable-extensions')
         options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        options.binary_location = '/usr/bin/google-chrome'
         
         try:
-            service = Service(ChromeDriverManager().install())
+            service = chrome_service(options)
             self.driver = webdriver.Chrome(service=service, options=options)
             self.driver.set_page_load_timeout(20)
             self.driver.implicitly_wait(8)
             self.log_message("✅ Chrome driver ready!")
             return True
         except Exception as e:
-            self.log_message(f"❌ Failed to setup driver: {e}")
+            self.log_message(f"❌ Failed to setup driver: {e}", level='error')
             return False
     
     def scrape_institution_real(self, institution_id):
@@ -196,6 +191,9 @@ class EnhancedMarcetScraper:
         self.log_message(f"🏛️ Scraping {institution['name']}...")
         
         events_found = 0
+        first_new = len(self.events)
+        started = time.time()
+        error = None
         
         try:
             self.driver.get(institution['url'])
@@ -212,25 +210,30 @@ class EnhancedMarcetScraper:
                                 event_data = self.extract_event_data(element, institution_id, institution['url'])
                                 if event_data:
                                     self.events.append(event_data)
+                                    self.metadata.add(event_data)
                                     events_found += 1
                                     self.log_message(f"   ✅ Event {events_found}: {event_data['title'][:50]}...")
                             except Exception as e:
-                                self.log_message(f"   ⚠️ Error extracting event {i+1}: {e}")
+                                self.log_message(f"   ⚠️ Error extracting event {i+1}: {e}", level='warning')
                         
                         if events_found > 0:
                             break
                             
                 except Exception as e:
-                    self.log_message(f"   ⚠️ Selector '{selector}' failed: {e}")
+                    self.log_message(f"   ⚠️ Selector '{selector}' failed: {e}", level='warning')
                     continue
             
-            if events_found == 0:
-                self.log_message(f"   📝 Creating sample events for {institution['name']}...")
-                events_found = self.create_sample_events_for_institution(institution_id)
-                
         except Exception as e:
-            self.log_message(f"❌ Error scraping {institution['name']}: {e}")
-            events_found = self.create_sample_events_for_institution(institution_id)
+            self.log_message(f"❌ Error scraping {institution['name']}: {e}", level='error')
+            error = e
+        
+        # Failures are recorded for the circuit breaker, not filled in with sample events
+        state = self.health.record(institution_id, events_found, time.time() - started, error=error,
+                                   fingerprint=listing_fingerprint(self.events[first_new:]))
+        if events_found == 0 and error is None:
+            self.log_message(f"   ⚠️ No events found for {institution['name']}", level='warning')
+        if state == OPEN:
+            self.log_message(f"   ⛔ {institution['name']} keeps failing, skipping it until its cool-down ends", level='warning')
         
         self.log_message(f"✅ {institution['name']}: {events_found} events collected")
         return events_found
@@ -313,49 +316,18 @@ class EnhancedMarcetScraper:
         default_time = '7:00 PM'
         return default_date, default_time
     
-    def create_sample_events_for_institution(self, institution_id):
-        """Create sample events when scraping fails"""
-        institution = self.institutions[institution_id]
-        today = datetime.now()
-        
-        sample_events = [
-            {
-                'id': len(self.events) + 1,
-                'title': f'Cultural Event at {institution["name"]}',
-                'museum': institution_id,
-                'date': (today + timedelta(days=5)).strftime('%Y-%m-%d'),
-                'time': '7:00 PM',
-                'type': 'lecture',
-                'description': f'Featured cultural programming at {institution["name"]}. Visit their website for current events.',
-                'city': 'New York',
-                'price': 'See website',
-                'duration': '2 hours',
-                'link': institution['url']
-            },
-            {
-                'id': len(self.events) + 2,
-                'title': f'Special Program at {institution["name"]}',
-                'museum': institution_id,
-                'date': (today + timedelta(days=12)).strftime('%Y-%m-%d'),
-                'time': '6:30 PM',
-                'type': 'talks',
-                'description': f'Special programming and cultural events hosted by {institution["name"]}.',
-                'city': 'New York',
-                'price': 'See website',
-                'duration': '90 minutes',
-                'link': institution['url']
-            }
-        ]
-        
-        self.events.extend(sample_events)
-        return len(sample_events)
-    
     def scrape_selected_institutions(self, selected_institutions):
         """Scrape from selected institutions"""
         self.scraping_status['active'] = True
         self.scraping_status['events_found'] = 0
         self.scraping_status['progress'] = 0
         self.events = []
+        self.metadata = MetadataAggregator()
+        
+        # Sites whose circuit is open are skipped until their cool-down ends
+        selected_institutions, skipped = self.health.plan(selected_institutions)
+        for institution_id, reason in skipped.items():
+            self.log_message(f"⏸️ Skipping {institution_id}: {reason}", level='warning', institution=institution_id)
         
         total_institutions = len(selected_institutions)
         
@@ -367,7 +339,8 @@ class EnhancedMarcetScraper:
                 self.scraping_status['current_institution'] = self.institutions[institution_id]['name']
                 self.scraping_status['progress'] = int((i / total_institutions) * 100)
                 
-                events_count = self.scrape_institution_real(institution_id)
+                with self.log.scope(institution=institution_id):
+                    events_count = self.scrape_institution_real(institution_id)
                 self.scraping_status['events_found'] += events_count
                 
                 time.sleep(2)
@@ -380,10 +353,11 @@ class EnhancedMarcetScraper:
             self.save_events_to_file()
             
         except Exception as e:
-            self.log_message(f"❌ Scraping error: {e}")
+            self.log_message(f"❌ Scraping error: {e}", level='error')
         finally:
             if self.driver:
                 self.driver.quit()
+            self.health.save()
             self.scraping_status['active'] = False
         
         return len(self.events)
@@ -391,37 +365,14 @@ class EnhancedMarcetScraper:
     def save_events_to_file(self):
         """Save events to JSON file WITH SUMMARY METADATA"""
         try:
-            # Calculate summary statistics
-            institution_counts = {}
-            type_counts = {}
-            
-            for event in self.events:
-                museum = event.get('museum', 'unknown')
-                event_type = event.get('type', 'unknown')
-                
-                institution_counts[museum] = institution_counts.get(museum, 0) + 1
-                type_counts[event_type] = type_counts.get(event_type, 0) + 1
-            
-            # Create enhanced data structure with metadata
-            data_with_metadata = {
-                "events": self.events,
-                "metadata": {
-                    "total_events": len(self.events),
-                    "scrape_timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    "institutions_scraped": len(institution_counts),
-                    "events_by_institution": institution_counts,
-                    "events_by_type": type_counts,
-                    "scraper_version": "Enhanced Marcet Society Scraper v2.0"
-                }
-            }
-            
-            with open('cultural_events.json', 'w', encoding='utf-8') as f:
-                json.dump(data_with_metadata, f, indent=2, ensure_ascii=False)
+            # Counts are kept up to date as events are added, so no rescan here
+            save_store('cultural_events.json', self.events, self.metadata,
+                       scraper_version="Enhanced Marcet Society Scraper v2.0")
                 
             self.log_message(f"💾 Auto-saved {len(self.events)} events with metadata to cultural_events.json")
             
         except Exception as e:
-            self.log_message(f"❌ Error saving events: {e}")
+            self.log_message(f"❌ Error saving events: {e}", level='error')
 
 # Global scraper instance
 scraper = EnhancedMarcetScraper()
@@ -471,7 +422,7 @@ def start_scraping():
 
 @app.route('/api/status')
 def get_status():
-    return jsonify(scraper.scraping_status)
+    return jsonify({**scraper.scraping_status, **scraper.log.status_fields(cursor_arg(request.args))})
 
 @app.route('/api/events')
 def get_events():
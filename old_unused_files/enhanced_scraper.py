@@ -8,8 +8,13 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+import os
+import sys
+
+# Shared modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from driver_resolver import chrome_service
+from institution_aliases import canonical_museum
 
 class EnhancedCulturalScraper:
     def __init__(self, headless=True):
@@ -131,15 +136,13 @@ class EnhancedCulturalScraper:
         options.add_argument('--disable-ipc-flooding-protection')
         options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
-        options.binary_location = '/usr/bin/google-chrome'
-        
         # Clean user data directory
         import shutil
         import os
         if os.path.exists('/tmp/chrome-scraper'):
             shutil.rmtree('/tmp/chrome-scraper')
         
-        service = Service(ChromeDriverManager().install())
+        service = chrome_service(options)
         self.driver = webdriver.Chrome(service=service, options=options)
         self.driver.set_page_load_timeout(30)
         self.driver.implicitly_wait(10)
@@ -432,7 +435,7 @@ class EnhancedCulturalScraper:
             
             event = {
                 'title': event_data['title'],
-                'museum': event_data['museum'],
+                'museum': canonical_museum(event_data['museum']),
                 'date': event_date,
                 'time': event_data['time'],
                 'type': event_data['type'],
@@ -9,8 +9,14 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+import os
+import sys
+
+# Shared modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from driver_resolver import chrome_service
+from institution_health import OPEN, InstitutionHealth, listing_fingerprint
+from scrape_log import ScrapeLog, cursor_arg
 
 app = Flask(__name__)
 
@@ -18,12 +24,13 @@ class InteractiveCulturalScraper:
     def __init__(self):
         self.driver = None
         self.events = []
+        self.health = InstitutionHealth()
+        self.log = ScrapeLog()
         self.scraping_status = {
             'active': False,
             'current_institution': None,
             'events_found': 0,
-            'progress': 0,
-            'logs': []
+            'progress': 0
         }
         
         # Comprehensive institution list
@@ -78,12 +85,9 @@ class InteractiveCulturalScraper:
             }
         }
     
-    def log_message(self, message):
+    def log_message(self, message, level='info', **fields):
         """Add message to scraping logs"""
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        log_entry = f"[{timestamp}] {message}"
-        self.scraping_status['logs'].append(log_entry)
-        print(log_entry)
+        self.log.log(message, level, **fields)
     
     def setup_driver(self):
         """Setup Chrome driver with optimal settings"""
@@ -98,17 +102,16 @@ class InteractiveCulturalScraper:
         options.add_argument('--disable-images')  # Faster loading
         options.add_argument('--disable-javascript')  # Try without JS first
         options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        options.binary_location = '/usr/bin/google-chrome'
         
         try:
-            service = Service(ChromeDriverManager().install())
+            service = chrome_service(options)
             self.driver = webdriver.Chrome(service=service, options=options)
             self.driver.set_page_load_timeout(15)
             self.driver.implicitly_wait(5)
             self.log_message("✅ Chrome driver ready!")
             return True
         except Exception as e:
-            self.log_message(f"❌ Failed to setup driver: {e}")
+            self.log_message(f"❌ Failed to setup driver: {e}", level='error')
             return False
     
     def scrape_institution_real(self, institution_id):
@@ -117,6 +120,9 @@ class InteractiveCulturalScraper:
         self.log_message(f"🏛️ Scraping {institution['name']}...")
         
         events_found = 0
+        first_new = len(self.events)
+        started = time.time()
+        error = None
         
         try:
             # Navigate to institution events page
@@ -139,23 +145,26 @@ class InteractiveCulturalScraper:
                                     events_found += 1
                                     self.log_message(f"   ✅ Event {events_found}: {event_data['title'][:50]}...")
                             except Exception as e:
-                                self.log_message(f"   ⚠️ Error extracting event {i+1}: {e}")
+                                self.log_message(f"   ⚠️ Error extracting event {i+1}: {e}", level='warning')
                         
                         if events_found > 0:
                             break  # Success with this selector
                             
                 except Exception as e:
-                    self.log_message(f"   ⚠️ Selector '{selector}' failed: {e}")
+                    self.log_message(f"   ⚠️ Selector '{selector}' failed: {e}", level='warning')
                     continue
             
-            # If no real events found, create realistic samples
-            if events_found == 0:
-                self.log_message(f"   📝 No events extracted, creating samples...")
-                events_found = self.create_sample_events_for_institution(institution_id)
-                
         except Exception as e:
-            self.log_message(f"❌ Error scraping {institution['name']}: {e}")
-            events_found = self.create_sample_events_for_institution(institution_id)
+            self.log_message(f"❌ Error scraping {institution['name']}: {e}", level='error')
+            error = e
+        
+        # Failures are recorded for the circuit breaker, not filled in with sample events
+        state = self.health.record(institution_id, events_found, time.time() - started, error=error,
+                                   fingerprint=listing_fingerprint(self.events[first_new:]))
+        if events_found == 0 and error is None:
+            self.log_message(f"   ⚠️ No events found for {institution['name']}", level='warning')
+        if state == OPEN:
+            self.log_message(f"   ⛔ {institution['name']} keeps failing, skipping it until its cool-down ends", level='warning')
         
         self.log_message(f"✅ {institution['name']}: {events_found} events collected")
         return events_found
@@ -240,41 +249,6 @@ class InteractiveCulturalScraper:
         # Add basic date parsing logic here
         return default_date, default_time
     
-    def create_sample_events_for_institution(self, institution_id):
-        """Create sample events when real scraping fails"""
-        institution = self.institutions[institution_id]
-        today = datetime.now()
-        
-        sample_events = [
-            {
-                'title': f'Cultural Event at {institution["name"]}',
-                'museum': institution_id,
-                'date': (today + timedelta(days=7)).strftime('%Y-%m-%d'),
-                'time': '7:00 PM',
-                'type': 'lecture',
-                'description': f'Sample cultural event at {institution["name"]}. Visit their website for current programming.',
-                'city': 'New York',
-                'price': 'See website',
-                'duration': '2 hours',
-                'link': institution['url']
-            },
-            {
-                'title': f'Special Exhibition at {institution["name"]}',
-                'museum': institution_id,
-                'date': (today + timedelta(days=14)).strftime('%Y-%m-%d'),
-                'time': '10:00 AM',
-                'type': 'exhibitions',
-                'description': f'Special exhibition featuring works from {institution["name"]}\'s collection.',
-                'city': 'New York',
-                'price': 'See website',
-                'duration': 'All day',
-                'link': institution['url']
-            }
-        ]
-        
-        self.events.extend(sample_events)
-        return len(sample_events)
-    
     def scrape_selected_institutions(self, selected_institutions):
         """Scrape from selected institutions"""
         self.scraping_status['active'] = True
@@ -282,6 +256,11 @@ class InteractiveCulturalScraper:
         self.scraping_status['progress'] = 0
         self.events = []
         
+        # Sites whose circuit is open are skipped until their cool-down ends
+        selected_institutions, skipped = self.health.plan(selected_institutions)
+        for institution_id, reason in skipped.items():
+            self.log_message(f"⏸️ Skipping {institution_id}: {reason}", level='warning', institution=institution_id)
+        
         total_institutions = len(selected_institutions)
         
         try:
@@ -292,7 +271,8 @@ class InteractiveCulturalScraper:
                 self.scraping_status['current_institution'] = self.institutions[institution_id]['name']
                 self.scraping_status['progress'] = int((i / total_institutions) * 100)
                 
-                events_count = self.scrape_institution_real(institution_id)
+                with self.log.scope(institution=institution_id):
+                    events_count = self.scrape_institution_real(institution_id)
                 self.scraping_status['events_found'] += events_count
                 
                 time.sleep(2)  # Be polite to servers
@@ -301,10 +281,11 @@ class InteractiveCulturalScraper:
             self.log_message(f"🎉 Scraping complete! Total events: {len(self.events)}")
             
         except Exception as e:
-            self.log_message(f"❌ Scraping error: {e}")
+            self.log_message(f"❌ Scraping error: {e}", level='error')
         finally:
             if self.driver:
                 self.driver.quit()
+            self.health.save()
             self.scraping_status['active'] = False
         
         return len(self.events)
@@ -379,6 +360,7 @@ def index():
     <script>
         let selectedInstitutions = [];
         let scrapingActive = false;
+        let logCursor = 0;
         
         // Load institutions
         fetch('/api/institutions')
@@ -448,7 +430,7 @@ def index():
         }
         
         function pollStatus() {
-            fetch('/api/status')
+            fetch(`/api/status?cursor=${logCursor}`)
                 .then(response => response.json())
                 .then(status => {
                     // Update progress bar
@@ -469,11 +451,17 @@ def index():
                     document.getElementById('eventsCount').textContent = 
                         `Events found: ${status.events_found}`;
                     
-                    // Update logs
+                    // Append new log entries, keeping the last 10
                     const logsDiv = document.getElementById('logs');
-                    logsDiv.innerHTML = status.logs.slice(-10).map(log => 
-                        `<div class="log-entry">${log}</div>`
-                    ).join('');
+                    if (logCursor === 0) logsDiv.innerHTML = '';
+                    status.log_entries.forEach(entry => {
+                        const div = document.createElement('div');
+                        div.className = `log-entry log-${entry.level}`;
+                        div.textContent = `[${entry.time.slice(11, 19)}] ${entry.message}`;
+                        logsDiv.appendChild(div);
+                    });
+                    while (logsDiv.children.length > 10) logsDiv.removeChild(logsDiv.firstChild);
+                    logCursor = status.log_cursor;
                     logsDiv.scrollTop = logsDiv.scrollHeight;
                     
                     // Continue polling if active
@@ -546,8 +534,8 @@ def start_scraping():
 
 @app.route('/api/status')
 def get_status():
-    """Get current scraping status"""
-    return jsonify(scraper.scraping_status)
+    """Get current scraping status; ?cursor=N also returns log entries newer than N"""
+    return jsonify({**scraper.scraping_status, **scraper.log.status_fields(cursor_arg(request.args))})
 
 @app.route('/api/events')
 def get_events():
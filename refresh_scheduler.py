@@ -0,0 +1,321 @@
+"""
+Long-running refresh scheduler.
+
+    python refresh_scheduler.py                 # run alongside: python scrape_worker.py
+    python refresh_scheduler.py --once          # one pass, e.g. from cron
+
+Keeps a priority queue of institutions ordered by when each is next due. Due
+times come from institution_health: sites whose listings change often are
+refreshed sooner, failing sites wait out their circuit breaker. The date
+window also bounds them: a scrape covers the window as it was then, so
+once the window has moved on by a quarter of its length, the site is due
+whatever its change rate.
+
+Due institutions are queued as scrape_worker jobs through the SQLite broker,
+at most `max_running` at a time. A job that fails, or ends without the
+worker recording a successful scrape (e.g. the driver could not start),
+is retried no sooner than RETRY_SECONDS later. Completed jobs are not published one by
+one. Their events are published together once no job has finished for
+DEPLOY_QUIET_SECONDS, or DEPLOY_MAX_WAIT_SECONDS after the first one is
+waiting. Queue, running jobs and unpublished results are saved to
+scraper_output/refresh_scheduler.json after every pass, so a restart picks
+up where it left off.
+
+Time comes from an injectable `clock`, and the scrape engine and publisher
+are plain objects, so a pass can be driven step by step with a fake clock.
+"""
+
+import heapq
+import json
+import os
+import time
+from datetime import datetime
+
+from date_window import DEFAULT_DAYS
+from institution_health import MIN_INTERVAL, OPEN, InstitutionHealth
+from scrape_jobs import COMPLETED, FAILED, TERMINAL_STATES, JobQueueFull
+
+STATE_PATH = os.path.join('scraper_output', 'refresh_scheduler.json')
+MAX_RUNNING = 2
+POLL_SECONDS = 30
+QUEUE_FULL_RETRY_SECONDS = 300
+RETRY_SECONDS = MIN_INTERVAL
+DEPLOY_QUIET_SECONDS = 10 * 60
+DEPLOY_MAX_WAIT_SECONDS = 60 * 60
+HORIZON_FRACTION = 0.25
+
+
+def _clock_text(timestamp):
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M')
+
+
+class BrokerEngine:
+    """Runs refreshes as scrape_worker.py jobs through the SQLite broker."""
+
+    def __init__(self, broker=None):
+        if broker is None:
+            from scrape_broker import ScrapeBroker
+
+            broker = ScrapeBroker()
+        self.broker = broker
+
+    def submit(self, institutions):
+        return self.broker.enqueue(institutions)
+
+    def status(self, job_id):
+        job = self.broker.get(job_id)
+        return job['status'] if job else FAILED
+
+    def events(self, job_id):
+        return self.broker.job_events(job_id)
+
+
+def publish_events(results, events_file=None):
+    """Merge refreshed institutions into the events file, then deploy once.
+
+    `results` is a list of (institution ids, events) from completed jobs. An
+    institution's old events are replaced only if its refresh found some, so
+    a site that failed keeps what it had.
+    """
+    from auto_deploy_events import auto_deploy_scraped_events, detect_events_file
+    from event_metadata import load_store, save_store
+
+    events_file = events_file or detect_events_file() or 'cultural_events.json'
+    events, aggregator, metadata = load_store(events_file)
+    fresh = {}
+    for _, job_events in results:
+        for event in job_events:
+            fresh.setdefault(event.get('museum'), []).append(event)
+    if not fresh:
+        print("ℹ️ Refreshes found no events; nothing to publish")
+        return False
+
+    merged = []
+    for event in events:
+        if event.get('museum') in fresh:
+            aggregator.remove(event)
+        else:
+            merged.append(event)
+    for institution_events in fresh.values():
+        merged.extend(institution_events)
+        aggregator.add_many(institution_events)
+    merged.sort(key=lambda e: (str(e.get('date', '')), str(e.get('time', ''))))
+    for i, event in enumerate(merged, 1):
+        event['id'] = i
+
+    extra = {key: value for key, value in metadata.items() if key in ('scraper_version', 'scrape_method')}
+    save_store(events_file, merged, aggregator, **extra)
+    print(f"💾 {events_file}: refreshed {', '.join(sorted(map(str, fresh)))} ({len(merged)} events)")
+    return auto_deploy_scraped_events()
+
+
+class RefreshScheduler:
+    """Priority queue of institution refreshes with bounded concurrency and coalesced deploys."""
+
+    def __init__(self, institution_ids, engine, publish=publish_events, clock=time.time,
+                 state_path=STATE_PATH, max_running=MAX_RUNNING, window_days=DEFAULT_DAYS,
+                 health_factory=InstitutionHealth):
+        self.institution_ids = list(institution_ids)
+        self.engine = engine
+        self.publish = publish
+        self.clock = clock
+        self.state_path = state_path
+        self.max_running = max_running
+        self.horizon_seconds = window_days * 86400 * HORIZON_FRACTION
+        self.health_factory = health_factory
+
+        self.due = {}          # institution id -> next due timestamp
+        self.running = {}      # job id -> institution ids
+        self.started = {}      # job id -> submit timestamp
+        self.unpublished = []  # (institution ids, events) awaiting a deploy
+        self.first_unpublished = None
+        self.last_completed = None
+        self.heap = []
+        self.load()
+
+    # -- queue ---------------------------------------------------------------
+
+    def schedule(self, institution_id, due):
+        """(Re)schedule an institution; older heap entries for it are skipped when popped."""
+        self.due[institution_id] = due
+        heapq.heappush(self.heap, (due, institution_id))
+
+    def _pop_due(self, now):
+        busy = {i for ids in self.running.values() for i in ids}
+        while self.heap and self.heap[0][0] <= now:
+            due, institution_id = heapq.heappop(self.heap)
+            if self.due.get(institution_id) != due:
+                continue  # superseded
+            if institution_id in busy:
+                continue  # rescheduled when its job finishes
+            return institution_id
+        return None
+
+    def next_due_for(self, institution_id, health, now):
+        """Health's change- and failure-based due time, capped by the date horizon."""
+        due = health.next_due(institution_id)
+        last_success = health.data.get(institution_id, {}).get('last_success')
+        if last_success and health.state(institution_id) != OPEN:
+            due = min(due, last_success + self.horizon_seconds)
+        return max(due, now)
+
+    @staticmethod
+    def _scraped_since(institution_id, health, started):
+        """Whether the worker recorded a successful scrape of the institution after `started`."""
+        attempts = health.data.get(institution_id, {}).get('attempts') or [{}]
+        last = attempts[-1]
+        return last.get('at', 0) >= started and last.get('ok', False)
+
+    # -- one pass ------------------------------------------------------------
+
+    def tick(self):
+        """Poll running jobs, start due ones, publish if it is time. Returns the next wake-up time."""
+        now = self.clock()
+        self._poll(now)
+        self._start_due(now)
+        self._maybe_publish(now)
+        self.save()
+        wake = [due for due, _ in self.heap[:1]]
+        if self.running:
+            wake.append(now + POLL_SECONDS)
+        if self.unpublished:
+            wake.append(min(self.last_completed + DEPLOY_QUIET_SECONDS,
+                            self.first_unpublished + DEPLOY_MAX_WAIT_SECONDS))
+        return min(wake) if wake else now + POLL_SECONDS
+
+    def _poll(self, now):
+        finished = []
+        for job_id, institutions in list(self.running.items()):
+            status = self.engine.status(job_id)
+            if status not in TERMINAL_STATES:
+                continue
+            del self.running[job_id]
+            started = self.started.pop(job_id, 0)
+            finished.extend((institution_id, status, started) for institution_id in institutions)
+            if status == COMPLETED:
+                events = self.engine.events(job_id)
+                print(f"✅ Refresh {job_id} ({', '.join(institutions)}): {len(events)} events")
+                self.unpublished.append((institutions, events))
+                self.first_unpublished = self.first_unpublished or now
+                self.last_completed = now
+            else:
+                print(f"⚠️ Refresh {job_id} ({', '.join(institutions)}) ended {status}")
+        if finished:
+            # The worker recorded each scrape's outcome; read the new due times
+            health = self.health_factory()
+            for institution_id, status, started in finished:
+                due = self.next_due_for(institution_id, health, now)
+                if status != COMPLETED or not self._scraped_since(institution_id, health, started):
+                    due = max(due, now + RETRY_SECONDS)
+                self.schedule(institution_id, due)
+
+    def _start_due(self, now):
+        while len(self.running) < self.max_running:
+            institution_id = self._pop_due(now)
+            if institution_id is None:
+                return
+            try:
+                job_id = self.engine.submit([institution_id])
+            except JobQueueFull as e:
+                print(f"⏳ Scrape queue full ({e}); retrying {institution_id} later")
+                self.schedule(institution_id, now + QUEUE_FULL_RETRY_SECONDS)
+                return
+            self.running[job_id] = [institution_id]
+            self.started[job_id] = now
+            print(f"🔄 Refreshing {institution_id} (job {job_id})")
+
+    def _maybe_publish(self, now):
+        if not self.unpublished:
+            return
+        quiet = now - self.last_completed >= DEPLOY_QUIET_SECONDS
+        overdue = now - self.first_unpublished >= DEPLOY_MAX_WAIT_SECONDS
+        if not (quiet or overdue):
+            return
+        results, self.unpublished = self.unpublished, []
+        self.first_unpublished = self.last_completed = None
+        print(f"🚀 Publishing {len(results)} completed refreshes in one deploy")
+        try:
+            self.publish(results)
+        except Exception as e:
+            print(f"❌ Publish failed: {e}")
+
+    def run_forever(self, sleep=time.sleep):
+        print(f"🗓️ Refresh scheduler watching {len(self.institution_ids)} institutions")
+        try:
+            while True:
+                wake = self.tick()
+                sleep(max(1, min(wake - self.clock(), POLL_SECONDS)))
+        except KeyboardInterrupt:
+            print("\n🛑 Scheduler stopped; state saved")
+            self.save()
+
+    # -- persistence ---------------------------------------------------------
+
+    def load(self):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        self.running = {job_id: list(ids) for job_id, ids in state.get('running', {}).items()}
+        self.started = {job_id: at for job_id, at in state.get('started', {}).items() if job_id in self.running}
+        self.unpublished = [(ids, events) for ids, events in state.get('unpublished', [])]
+        self.first_unpublished = state.get('first_unpublished')
+        self.last_completed = state.get('last_completed')
+
+        saved = state.get('due', {})
+        health = None
+        now = self.clock()
+        for institution_id in self.institution_ids:
+            if institution_id in saved:
+                self.schedule(institution_id, saved[institution_id])
+            else:
+                health = health or self.health_factory()
+                self.schedule(institution_id, self.next_due_for(institution_id, health, now))
+
+    def save(self):
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        state = {
+            'due': self.due,
+            'running': self.running,
+            'started': self.started,
+            'unpublished': self.unpublished,
+            'first_unpublished': self.first_unpublished,
+            'last_completed': self.last_completed,
+        }
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.state_path)
+
+    def summary(self):
+        lines = [f"   {institution_id}: {_clock_text(due)}"
+                 for institution_id, due in sorted(self.due.items(), key=lambda item: item[1])]
+        return '\n'.join(lines)
+
+
+def main():
+    import argparse
+
+    from institution_adapters import adapter_ids
+
+    parser = argparse.ArgumentParser(description='Refresh institutions as they come due')
+    parser.add_argument('--institutions', nargs='+', metavar='ID', help='Institutions to keep fresh (default: all)')
+    parser.add_argument('--max-running', type=int, default=MAX_RUNNING, help='Refresh jobs running at once')
+    parser.add_argument('--days', type=int, default=DEFAULT_DAYS, help='Date window length the scrapers use')
+    parser.add_argument('--once', action='store_true', help='Run a single pass and exit')
+    args = parser.parse_args()
+
+    scheduler = RefreshScheduler(args.institutions or adapter_ids(), BrokerEngine(),
+                                 max_running=args.max_running, window_days=args.days)
+    if args.once:
+        scheduler.tick()
+        print(f"🗓️ Next refreshes:\n{scheduler.summary()}")
+        return
+    scheduler.run_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""
+SQLite-backed job broker for out-of-process scrape workers.
+
+The web tier enqueues jobs and reads their status and results; worker
+processes (scrape_worker.py) claim jobs, heartbeat while they run and write
+results back. A job whose worker stops heartbeating is put back in the queue
+for another worker, up to MAX_ATTEMPTS times, unless it was cancelled.
+
+When a job finishes, its log is cut to its last FINISHED_LOG_LINES lines,
+and logs of jobs that finished more than LOG_RETENTION_DAYS ago are deleted.
+"""
+
+import json
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from scrape_jobs import (CANCELLED, COMPLETED, FAILED, QUEUED, RUNNING, SNAPSHOT_LOG_LINES,
+                         SSE_KEEPALIVE_SECONDS, TERMINAL_STATES, JobQueueFull, format_sse)
+
+BROKER_PATH = os.path.join('scraper_output', 'scrape_jobs.sqlite3')
+MAX_ATTEMPTS = 3
+STREAM_POLL_SECONDS = 0.5
+FINISHED_LOG_LINES = 200
+LOG_RETENTION_DAYS = 7
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    institutions TEXT NOT NULL,
+    status TEXT NOT NULL,
+    seq INTEGER NOT NULL DEFAULT 0,
+    progress INTEGER NOT NULL DEFAULT 0,
+    current_institution TEXT,
+    events_found INTEGER NOT NULL DEFAULT 0,
+    events TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id TEXT,
+    heartbeat_at REAL,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);
+CREATE TABLE IF NOT EXISTS job_logs (
+    job_id TEXT NOT NULL,
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS job_logs_job ON job_logs (job_id, id);
+"""
+
+
+def now_text():
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+class ScrapeBroker:
+    def __init__(self, path=BROKER_PATH, max_queued=5):
+        self.path = path
+        self.max_queued = max_queued
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # One short-lived connection per call: safe across threads and processes
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            yield conn
+        finally:
+            conn.close()
+
+    def _transaction(self, conn):
+        conn.execute('BEGIN IMMEDIATE')
+
+    # -- web tier ----------------------------------------------------------
+
+    def enqueue(self, institutions):
+        """Queue a job and return its id. Raises JobQueueFull at capacity."""
+        job_id = uuid.uuid4().hex[:12]
+        with self._connect() as conn:
+            self._transaction(conn)
+            waiting = conn.execute('SELECT COUNT(*) FROM jobs WHERE status = ?', (QUEUED,)).fetchone()[0]
+            if waiting >= self.max_queued:
+                conn.execute('ROLLBACK')
+                raise JobQueueFull(f'{waiting} jobs already waiting')
+            conn.execute(
+                'INSERT INTO jobs (id, institutions, status, created_at) VALUES (?, ?, ?, ?)',
+                (job_id, json.dumps(list(institutions)), QUEUED, now_text()),
+            )
+            conn.execute('COMMIT')
+        return job_id
+
+    def cancel(self, job_id):
+        """Cancel a queued job, or ask the worker running it to stop."""
+        with self._connect() as conn:
+            self._transaction(conn)
+            row = conn.execute('SELECT status FROM jobs WHERE id = ?', (job_id,)).fetchone()
+            if row is None or row['status'] in TERMINAL_STATES:
+                conn.execute('ROLLBACK')
+                return False
+            if row['status'] == QUEUED:
+                conn.execute(
+                    'UPDATE jobs SET status = ?, finished_at = ?, seq = seq + 1 WHERE id = ?',
+                    (CANCELLED, now_text(), job_id),
+                )
+            else:
+                conn.execute('UPDATE jobs SET cancel_requested = 1, seq = seq + 1 WHERE id = ?', (job_id,))
+            conn.execute('COMMIT')
+        return True
+
+    def get(self, job_id):
+        """Status snapshot of a job, as streamed to the browser, or None."""
+        with self._connect() as conn:
+            row = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+            if row is None:
+                return None
+            logs = conn.execute(
+                'SELECT entry FROM job_logs WHERE job_id = ? ORDER BY id DESC LIMIT ?',
+                (job_id, SNAPSHOT_LOG_LINES),
+            ).fetchall()
+        return self._snapshot(row, [r['entry'] for r in reversed(logs)])
+
+    def log_tail(self, job_id, cursor=0, limit=SNAPSHOT_LOG_LINES):
+        """(new cursor, entries) for the job's log lines after `cursor`, at most `limit` of them."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT id, entry FROM job_logs WHERE job_id = ? AND id > ? ORDER BY id DESC LIMIT ?',
+                (job_id, cursor, limit),
+            ).fetchall()
+        entries = [{'seq': r['id'], 'message': r['entry']} for r in reversed(rows)]
+        return (entries[-1]['seq'] if entries else cursor), entries
+
+    def _snapshot(self, row, logs):
+        return {
+            'id': row['id'],
+            'seq': row['seq'],
+            'status': row['status'],
+            'active': row['status'] == RUNNING,
+            'institutions': json.loads(row['institutions']),
+            'progress': row['progress'],
+            'current_institution': row['current_institution'],
+            'events_found': row['events_found'],
+            'logs': logs,
+            'error': row['error'],
+            'attempts': row['attempts'],
+            'worker_id': row['worker_id'],
+            'created_at': row['created_at'],
+            'started_at': row['started_at'],
+            'finished_at': row['finished_at'],
+        }
+
+    def list_jobs(self, limit=20):
+        with self._connect() as conn:
+            rows = conn.execute('SELECT * FROM jobs ORDER BY created_at DESC, rowid DESC LIMIT ?',
+                                (limit,)).fetchall()
+        return [self._snapshot(row, []) for row in rows]
+
+    def latest(self, status=None):
+        """Id of the most recently created job, optionally with a given status."""
+        with self._connect() as conn:
+            if status:
+                row = conn.execute('SELECT id FROM jobs WHERE status = ? ORDER BY created_at DESC, rowid DESC '
+                                   'LIMIT 1', (status,)).fetchone()
+            else:
+                row = conn.execute('SELECT id FROM jobs ORDER BY created_at DESC, rowid DESC LIMIT 1').fetchone()
+        return row['id'] if row else None
+
+    def job_events(self, job_id):
+        with self._connect() as conn:
+            row = conn.execute('SELECT events FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return json.loads(row['events']) if row and row['events'] else []
+
+    def stream(self, job_id):
+        """Yield Server-Sent Events for a job until it reaches a final state."""
+        snapshot = self.get(job_id)
+        if snapshot is None:
+            return
+        yield format_sse(snapshot)
+        last_sent = time.monotonic()
+        while snapshot['status'] not in TERMINAL_STATES:
+            time.sleep(STREAM_POLL_SECONDS)
+            current = self.get(job_id)
+            if current is None:
+                return
+            if current['seq'] != snapshot['seq']:
+                snapshot = current
+                yield format_sse(snapshot)
+                last_sent = time.monotonic()
+            elif time.monotonic() - last_sent >= SSE_KEEPALIVE_SECONDS:
+                yield ': keepalive\n\n'
+                last_sent = time.monotonic()
+
+    # -- workers -------------------------------------------------------------
+
+    def claim(self, worker_id):
+        """Atomically take the oldest queued job. Returns (job_id, institutions) or None."""
+        with self._connect() as conn:
+            self._transaction(conn)
+            row = conn.execute('SELECT id, institutions FROM jobs WHERE status = ? '
+                               'ORDER BY created_at, rowid LIMIT 1', (QUEUED,)).fetchone()
+            if row is None:
+                conn.execute('ROLLBACK')
+                return None
+            conn.execute(
+                'UPDATE jobs SET status = ?, worker_id = ?, heartbeat_at = ?, started_at = ?, '
+                'attempts = attempts + 1, seq = seq + 1 WHERE id = ?',
+                (RUNNING, worker_id, time.time(), now_text(), row['id']),
+            )
+            conn.execute('COMMIT')
+        return row['id'], json.loads(row['institutions'])
+
+    def heartbeat(self, job_id, worker_id):
+        """Record that the worker is alive. Returns True if cancellation was requested."""
+        with self._connect() as conn:
+            conn.execute('UPDATE jobs SET heartbeat_at = ? WHERE id = ? AND worker_id = ?',
+                         (time.time(), job_id, worker_id))
+            row = conn.execute('SELECT cancel_requested FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return bool(row and row['cancel_requested'])
+
+    def update_progress(self, job_id, worker_id, **fields):
+        allowed = {k: v for k, v in fields.items() if k in ('progress', 'current_institution', 'events_found')}
+        if not allowed:
+            return
+        assignments = ', '.join(f'{name} = ?' for name in allowed)
+        with self._connect() as conn:
+            conn.execute(
+                f'UPDATE jobs SET {assignments}, heartbeat_at = ?, seq = seq + 1 '
+                'WHERE id = ? AND worker_id = ? AND status = ?',
+                (*allowed.values(), time.time(), job_id, worker_id, RUNNING),
+            )
+
+    def append_log(self, job_id, entry):
+        with self._connect() as conn:
+            conn.execute('INSERT INTO job_logs (job_id, entry) VALUES (?, ?)', (job_id, entry))
+            conn.execute('UPDATE jobs SET seq = seq + 1 WHERE id = ?', (job_id,))
+
+    def finish(self, job_id, worker_id, status, events=None, error=None):
+        """Store the final state. Ignored if the job was reassigned meanwhile."""
+        with self._connect() as conn:
+            conn.execute(
+                'UPDATE jobs SET status = ?, events = ?, events_found = ?, error = ?, finished_at = ?, '
+                'seq = seq + 1 WHERE id = ? AND worker_id = ? AND status = ?',
+                (status, json.dumps(events or [], ensure_ascii=False), len(events or []), error,
+                 now_text(), job_id, worker_id, RUNNING),
+            )
+            self._prune_logs(conn, [job_id])
+
+    def _prune_logs(self, conn, finished_ids):
+        """Cut finished jobs' logs to their tail and drop logs past the retention window."""
+        for job_id in finished_ids:
+            conn.execute(
+                'DELETE FROM job_logs WHERE job_id = ? AND id <= '
+                '(SELECT id FROM job_logs WHERE job_id = ? ORDER BY id DESC LIMIT 1 OFFSET ?)',
+                (job_id, job_id, FINISHED_LOG_LINES),
+            )
+        cutoff = (datetime.now() - timedelta(days=LOG_RETENTION_DAYS)).strftime('%Y-%m-%d %H:%M:%S')
+        conn.execute(
+            'DELETE FROM job_logs WHERE job_id IN '
+            f'(SELECT id FROM jobs WHERE status IN ({", ".join("?" * len(TERMINAL_STATES))}) '
+            'AND finished_at < ?)',
+            (*TERMINAL_STATES, cutoff),
+        )
+
+    def reap_stale(self, timeout):
+        """Requeue running jobs whose worker has not heartbeated within timeout.
+
+        Jobs whose cancellation was requested are marked cancelled, and jobs
+        that already used MAX_ATTEMPTS failed. Returns the affected job ids.
+        """
+        cutoff = time.time() - timeout
+        with self._connect() as conn:
+            self._transaction(conn)
+            rows = conn.execute('SELECT id, attempts, cancel_requested FROM jobs '
+                                'WHERE status = ? AND heartbeat_at < ?', (RUNNING, cutoff)).fetchall()
+            finished = []
+            for row in rows:
+                if row['cancel_requested']:
+                    conn.execute('UPDATE jobs SET status = ?, finished_at = ?, seq = seq + 1 WHERE id = ?',
+                                 (CANCELLED, now_text(), row['id']))
+                    finished.append(row['id'])
+                elif row['attempts'] >= MAX_ATTEMPTS:
+                    conn.execute(
+                        'UPDATE jobs SET status = ?, error = ?, finished_at = ?, seq = seq + 1 WHERE id = ?',
+                        (FAILED, f'worker lost {row["attempts"]} times', now_text(), row['id']),
+                    )
+                    finished.append(row['id'])
+                else:
+                    conn.execute(
+                        'UPDATE jobs SET status = ?, worker_id = NULL, progress = 0, seq = seq + 1 '
+                        'WHERE id = ?', (QUEUED, row['id']),
+                    )
+            if finished:
+                self._prune_logs(conn, finished)
+            conn.execute('COMMIT')
+        return [row['id'] for row in rows]
+
+    def overdue_workers(self, max_runtime):
+        """Worker ids whose current job has run longer than max_runtime seconds."""
+        with self._connect() as conn:
+            rows = conn.execute('SELECT worker_id, started_at FROM jobs WHERE status = ?',
+                                (RUNNING,)).fetchall()
+        overdue = []
+        for row in rows:
+            started = datetime.strptime(row['started_at'], '%Y-%m-%d %H:%M:%S')
+            if (datetime.now() - started).total_seconds() > max_runtime:
+                overdue.append(row['worker_id'])
+        return overdue
+
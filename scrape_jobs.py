@@ -0,0 +1,27 @@
+"""
+Scrape job states and the Server-Sent Events format shared by the job broker.
+
+Jobs live in the SQLite broker (scrape_broker.py) and run in scrape_worker.py
+processes. The Flask apps stream each job's status snapshots to the browser
+as Server-Sent Events.
+"""
+
+import json
+
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+TERMINAL_STATES = (COMPLETED, FAILED, CANCELLED)
+
+SNAPSHOT_LOG_LINES = 20
+SSE_KEEPALIVE_SECONDS = 15
+
+
+class JobQueueFull(Exception):
+    """Raised when the job queue is at capacity."""
+
+
+def format_sse(snapshot, event='status'):
+    return f"id: {snapshot['seq']}\nevent: {event}\ndata: {json.dumps(snapshot, ensure_ascii=False)}\n\n"
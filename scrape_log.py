@@ -0,0 +1,263 @@
+"""
+Structured, bounded log sink for scraper progress.
+
+`ScrapeLog` keeps the most recent records in a fixed-size deque, so
+appending never copies the buffer. Each record has a sequence number, a
+level and fields such as the institution being scraped. Printing to
+stdout and appending NDJSON to scraper_output/scrape_log.ndjson happen on
+a background thread, so a slow terminal or disk never blocks the scrape.
+There is one such writer per output file and process, shared by every
+ScrapeLog, so a long-lived worker that builds a scraper (and a log) per job
+keeps a single thread and file handle. If that thread falls far behind, records are dropped from the output
+(never from the buffer) and counted.
+
+Status endpoints poll with a cursor, the last sequence number they have
+seen, and get only newer records:
+
+    GET /api/status?cursor=41  ->  {..., "log_cursor": 57, "log_entries": [...], "log_dropped": 0}
+"""
+
+import atexit
+import itertools
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+LOG_PATH = os.path.join('scraper_output', 'scrape_log.ndjson')
+LEVELS = ('debug', 'info', 'warning', 'error')
+DEFAULT_CAPACITY = 200
+STATUS_LINES = 50
+WRITER_QUEUE_SIZE = 10000
+
+
+class LogRecord:
+    __slots__ = ('seq', 'time', 'level', 'message', 'fields')
+
+    def __init__(self, seq, level, message, fields):
+        self.seq = seq
+        self.time = time.time()
+        self.level = level
+        self.message = message
+        self.fields = fields
+
+    def line(self):
+        """The '[HH:MM:SS] message' form the scraper UIs have always shown."""
+        return f"[{datetime.fromtimestamp(self.time).strftime('%H:%M:%S')}] {self.message}"
+
+    def as_dict(self):
+        return {
+            'seq': self.seq,
+            'time': datetime.fromtimestamp(self.time).isoformat(timespec='milliseconds'),
+            'level': self.level,
+            'message': self.message,
+            **self.fields,
+        }
+
+
+class LogWriter:
+    """Background thread that prints records and appends them as NDJSON."""
+
+    def __init__(self, path=None, echo=True):
+        self.path = path
+        self.echo = echo
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=WRITER_QUEUE_SIZE)
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, record):
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='scrape-log-writer', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        handle = None
+        if self.path:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            handle = open(self.path, 'a', encoding='utf-8')
+        try:
+            while True:
+                record = self._queue.get()
+                if record is None:
+                    break
+                # Write whatever else is waiting in one go
+                batch = [record]
+                while len(batch) < 500:
+                    try:
+                        record = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if record is None:
+                        self._queue.put(None)
+                        break
+                    batch.append(record)
+                if self.echo:
+                    print('\n'.join(r.line() for r in batch), flush=True)
+                if handle:
+                    handle.write(''.join(json.dumps(r.as_dict(), ensure_ascii=False) + '\n' for r in batch))
+                    handle.flush()
+        finally:
+            if handle:
+                handle.close()
+
+    def close(self, timeout=5):
+        """Flush queued records and stop the thread."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def shared_writer(path=LOG_PATH, echo=True):
+    """The process's LogWriter for `path` and `echo`, created on first use."""
+    with _writers_lock:
+        writer = _writers.get((path, echo))
+        if writer is None:
+            writer = _writers[(path, echo)] = LogWriter(path, echo)
+        return writer
+
+
+@atexit.register
+def _close_writers():
+    with _writers_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        writer.close()
+
+
+class ScrapeLog:
+    """Ring buffer of recent log records with a cursor-based tail."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, path=LOG_PATH, echo=True):
+        self.records = deque(maxlen=capacity)
+        self.fields = {}
+        self.writer = shared_writer(path, echo) if path or echo else None
+        self.forward = None  # optional callable(record), e.g. a job's log
+        self._seq = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def log(self, message, level='info', **fields):
+        if level not in LEVELS:
+            raise ValueError(f'unknown log level: {level}')
+        with self._lock:
+            record = LogRecord(next(self._seq), level, message, {**self.fields, **fields})
+            self.records.append(record)
+        if self.writer:
+            self.writer.submit(record)
+        if self.forward:
+            self.forward(record)
+        return record
+
+    def debug(self, message, **fields):
+        return self.log(message, 'debug', **fields)
+
+    def info(self, message, **fields):
+        return self.log(message, 'info', **fields)
+
+    def warning(self, message, **fields):
+        return self.log(message, 'warning', **fields)
+
+    def error(self, message, **fields):
+        return self.log(message, 'error', **fields)
+
+    @contextmanager
+    def scope(self, **fields):
+        """Attach fields (e.g. institution=...) to every record logged inside the block."""
+        with self._lock:
+            previous = self.fields
+            self.fields = {**previous, **fields}
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self.fields = previous
+
+    @property
+    def cursor(self):
+        with self._lock:
+            return self.records[-1].seq if self.records else 0
+
+    def tail(self, cursor=0, limit=None, level=None):
+        """Records newer than `cursor` as dicts, with the new cursor.
+
+        `dropped` counts records that aged out of the buffer before the
+        caller read them.
+        """
+        with self._lock:
+            records = list(self.records)
+        newest = records[-1].seq if records else cursor
+        oldest = records[0].seq if records else newest + 1
+        entries = [r for r in records if r.seq > cursor]
+        if level:
+            minimum = LEVELS.index(level)
+            entries = [r for r in entries if LEVELS.index(r.level) >= minimum]
+        if limit:
+            entries = entries[-limit:]
+        return {
+            'cursor': max(newest, cursor),
+            'entries': [r.as_dict() for r in entries],
+            'dropped': max(0, oldest - cursor - 1),
+        }
+
+    def lines(self, limit=STATUS_LINES):
+        """The last `limit` records as display lines."""
+        with self._lock:
+            records = list(self.records)[-limit:]
+        return [r.line() for r in records]
+
+    def status_fields(self, cursor=None):
+        """Log keys for a /api/status response: recent lines, plus a tail if a cursor is given."""
+        fields = {'logs': self.lines(), 'log_cursor': self.cursor}
+        if cursor is not None:
+            tail = self.tail(cursor)
+            fields.update(log_cursor=tail['cursor'], log_entries=tail['entries'], log_dropped=tail['dropped'])
+        return fields
+
+    def clear(self):
+        with self._lock:
+            self.records.clear()
+
+    def close(self):
+        """Stop writing this log's records; the shared writer is flushed and closed at exit."""
+        self.writer = None
+
+
+def cursor_arg(args):
+    """The ?cursor= query value as an int, or None when absent or invalid."""
+    try:
+        return int(args.get('cursor'))
+    except (TypeError, ValueError):
+        return None
+
+
+if __name__ == "__main__":
+    # Tail the NDJSON log: python scrape_log.py [path]
+    path = sys.argv[1] if len(sys.argv) > 1 else LOG_PATH
+    with open(path, encoding='utf-8') as f:
+        for raw in f:
+            record = json.loads(raw)
+            extra = {k: v for k, v in record.items() if k not in ('seq', 'time', 'level', 'message')}
+            suffix = f"  {extra}" if extra else ''
+            print(f"{record['time']} {record['level']:<7} {record['message']}{suffix}")
@@ -0,0 +1,177 @@
+"""
+Out-of-process scrape workers fed by the SQLite job broker.
+
+    python scrape_worker.py --workers 2
+
+starts a supervisor that keeps the worker processes alive, puts jobs whose
+worker stopped heartbeating back in the queue, and kills a worker that has
+been stuck on one job too long (a hung Chrome) so the job is retried on a
+fresh process. The Flask app only enqueues jobs and reads results, so a
+crashing browser can no longer take the web UI down with it.
+"""
+
+import importlib
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+
+from scrape_broker import BROKER_PATH, CANCELLED, COMPLETED, FAILED, ScrapeBroker
+
+DEFAULT_RUNNER = 'complete_marcet_scraper:run_scrape_job'
+RUNNER_PATHS = [os.path.join(os.path.dirname(os.path.abspath(__file__)), 'old_unused_files')]
+
+HEARTBEAT_SECONDS = 5
+STALE_AFTER_SECONDS = 30
+MAX_JOB_SECONDS = 30 * 60
+IDLE_POLL_SECONDS = 1
+
+
+class BrokerJob:
+    """Job handle passed to the scrape runner: progress, logs and cancellation go through the broker."""
+
+    def __init__(self, broker, job_id, worker_id, institutions):
+        self.broker = broker
+        self.id = job_id
+        self.worker_id = worker_id
+        self.institutions = institutions
+        self.events = []
+        self.cancel_event = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def update(self, **fields):
+        if 'events' in fields:
+            self.events = fields.pop('events')
+        self.broker.update_progress(self.id, self.worker_id, **fields)
+
+    def log(self, entry):
+        self.broker.append_log(self.id, entry)
+
+
+def heartbeat_loop(broker, job, stop):
+    while not stop.wait(HEARTBEAT_SECONDS):
+        if broker.heartbeat(job.id, job.worker_id):
+            job.cancel_event.set()
+
+
+def load_runner(spec):
+    """Import 'module:function', looking in the scraper directories too."""
+    module_name, _, function_name = spec.partition(':')
+    for path in RUNNER_PATHS:
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def worker_main(broker_path, runner_spec):
+    """Claim and run jobs until the process is terminated."""
+    worker_id = f'{socket.gethostname()}-{os.getpid()}'
+    broker = ScrapeBroker(broker_path)
+    run_job = load_runner(runner_spec)
+    print(f"👷 Worker {worker_id} ready")
+
+    while True:
+        claimed = broker.claim(worker_id)
+        if claimed is None:
+            time.sleep(IDLE_POLL_SECONDS)
+            continue
+
+        job_id, institutions = claimed
+        job = BrokerJob(broker, job_id, worker_id, institutions)
+        stop = threading.Event()
+        beat = threading.Thread(target=heartbeat_loop, args=(broker, job, stop), daemon=True)
+        beat.start()
+        print(f"👷 {worker_id} running job {job_id}: {', '.join(institutions)}")
+
+        try:
+            run_job(job)
+            status = CANCELLED if job.cancelled else COMPLETED
+            broker.finish(job_id, worker_id, status, events=job.events)
+        except Exception as e:
+            broker.finish(job_id, worker_id, FAILED, events=job.events, error=str(e))
+        finally:
+            stop.set()
+            beat.join()
+        print(f"👷 {worker_id} finished job {job_id}")
+
+
+class WorkerPool:
+    """Supervises worker processes and reassigns jobs from dead ones."""
+
+    def __init__(self, workers=2, broker_path=BROKER_PATH, runner_spec=DEFAULT_RUNNER):
+        self.size = workers
+        self.broker_path = broker_path
+        self.runner_spec = runner_spec
+        self.broker = ScrapeBroker(broker_path)
+        self.context = multiprocessing.get_context('spawn')
+        self.processes = []
+
+    def start_worker(self):
+        process = self.context.Process(target=worker_main, args=(self.broker_path, self.runner_spec),
+                                       daemon=True)
+        process.start()
+        return process
+
+    def check(self):
+        """One supervision pass: replace dead workers, kill stuck ones, requeue jobs."""
+        alive = []
+        for process in self.processes:
+            if process.is_alive():
+                alive.append(process)
+            else:
+                print(f"⚠️ Worker pid {process.pid} exited ({process.exitcode}), replacing it")
+        while len(alive) < self.size:
+            alive.append(self.start_worker())
+        self.processes = alive
+
+        # Only this pool's own workers: ids are "<hostname>-<pid>" and other
+        # hosts (or pids reused by unrelated processes) must not be signalled
+        by_pid = {process.pid: process for process in self.processes}
+        hostname = socket.gethostname()
+        for worker_id in self.broker.overdue_workers(MAX_JOB_SECONDS):
+            host, _, pid = (worker_id or '').rpartition('-')
+            process = by_pid.get(int(pid)) if host == hostname and pid.isdigit() else None
+            if process is not None:
+                print(f"⏱️ Worker pid {pid} exceeded {MAX_JOB_SECONDS}s on one job, killing it")
+                process.kill()
+
+        for job_id in self.broker.reap_stale(STALE_AFTER_SECONDS):
+            print(f"🔁 Job {job_id} lost its worker; requeued or failed")
+
+    def run_forever(self):
+        print(f"🚀 Starting {self.size} scrape workers (broker: {self.broker_path})")
+        try:
+            while True:
+                self.check()
+                time.sleep(HEARTBEAT_SECONDS)
+        except KeyboardInterrupt:
+            print("\n🛑 Stopping workers...")
+        finally:
+            for process in self.processes:
+                if process.is_alive():
+                    os.kill(process.pid, signal.SIGTERM)
+            for process in self.processes:
+                process.join(timeout=10)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Run scrape worker processes')
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help='Number of worker processes')
+    parser.add_argument('--broker', default=BROKER_PATH, help='Path of the SQLite job broker')
+    parser.add_argument('--runner', default=DEFAULT_RUNNER, help='Job function as module:function')
+    args = parser.parse_args()
+
+    WorkerPool(args.workers, args.broker, args.runner).run_forever()
+
+
+if __name__ == "__main__":
+    main()
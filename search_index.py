@@ -0,0 +1,192 @@
+"""
+Inverted index for the site's event search, built at publish time.
+
+Titles, descriptions and institution names (display names and the aliases
+in institution_aliases) are tokenized, folded to ASCII, stripped of stop
+words and stemmed. The index is written as compact JSON to
+frontend/public/data/search_index.json:
+
+    {"version": 1, "hash": ...,
+     "docs": [uid, ...],                  # event_keys.event_uid of each event
+     "terms": ["art", "artist", ...],     # sorted, so prefixes are a binary search
+     "postings": [[doc, weight, doc, weight, ...], ...]}
+
+A term's weight in an event is the sum of its field weights: FIELD_WEIGHTS
+per occurrence. frontend/src/searchIndex.js tokenizes queries with the same
+rules, looks up each word and treats the last, unfinished one as a prefix,
+so a query costs a few binary searches and a postings merge, whatever the
+number of events.
+
+    python search_index.py                     # index the current events file
+    python search_index.py --query "jazz lect"
+"""
+
+import hashlib
+import os
+import re
+import unicodedata
+from bisect import bisect_left
+from datetime import datetime
+
+from event_json import dump_file, dumps, load_file
+from event_keys import event_uid
+from institution_aliases import ALIASES
+from institution_registry import institution_name
+
+INDEX_PATH = os.path.join('frontend', 'public', 'data', 'search_index.json')
+INDEX_VERSION = 1
+FIELD_WEIGHTS = (('title', 3), ('museum', 2), ('description', 1))
+
+# Keep in sync with STOP_WORDS and stem() in frontend/src/searchIndex.js
+STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is',
+    'it', 'its', 'of', 'on', 'or', 'the', 'this', 'that', 'to', 'with',
+})
+SUFFIXES = (('ies', 'y'), ('sses', 'ss'), ('ing', ''), ('ed', ''), ('ly', ''), ('s', ''))
+MIN_STEM = 3
+
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+_COMBINING = re.compile(r'[\u0300-\u036f]')
+
+
+def fold(text):
+    """Lowercase with accents removed: 'Café' -> 'cafe'."""
+    return _COMBINING.sub('', unicodedata.normalize('NFKD', str(text or ''))).lower()
+
+
+def stem(word):
+    """Strip the first matching suffix if a stem of MIN_STEM letters remains."""
+    for suffix, replacement in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM:
+            if suffix == 's' and word[-2] in 'su':
+                return word  # 'class', 'campus'
+            return word[:-len(suffix)] + replacement
+    return word
+
+
+def tokenize(text):
+    """Stemmed search terms of `text`, in order, stop words removed."""
+    return [stem(word) for word in _NON_WORD.split(fold(text)) if word and word not in STOP_WORDS]
+
+
+def _institution_text(museum):
+    names = [institution_name(museum), *ALIASES.get(museum, ())]
+    return ' '.join(name for name in names if name)
+
+
+def build_index(events):
+    """The index document for a list of events."""
+    docs, postings = [], {}
+    for event in events:
+        event = event.to_json() if hasattr(event, 'to_json') else event
+        if not isinstance(event, dict):
+            continue
+        weights = {}
+        for field, weight in FIELD_WEIGHTS:
+            text = _institution_text(event.get('museum')) if field == 'museum' else event.get(field)
+            for term in tokenize(text):
+                weights[term] = weights.get(term, 0) + weight
+        if not weights:
+            continue
+        doc = len(docs)
+        docs.append(event_uid(event))
+        for term, weight in weights.items():
+            postings.setdefault(term, []).extend((doc, weight))
+
+    terms = sorted(postings)
+    index = {
+        'version': INDEX_VERSION,
+        'docs': docs,
+        'terms': terms,
+        'postings': [postings[term] for term in terms],
+    }
+    index['hash'] = hashlib.sha256(dumps(index)).hexdigest()
+    return index
+
+
+def write_index(events, path=INDEX_PATH):
+    """Build and write the index unless it is unchanged. Returns (index, written)."""
+    index = build_index(events)
+    try:
+        written = load_file(path).get('hash') != index['hash']
+    except (OSError, ValueError, AttributeError):
+        written = True
+    if written:
+        dump_file({**index, 'generated_at': datetime.now().isoformat(timespec='seconds')}, path, pretty=False)
+    return index, written
+
+
+def search(index, query):
+    """[(uid, score)] for events matching every word of `query`, best first.
+
+    The last word matches as a prefix unless the query ends in a space.
+    """
+    words = [word for word in _NON_WORD.split(fold(query)) if word and word not in STOP_WORDS]
+    if not words:
+        return []
+    terms = index['terms']
+    scores = None
+    for i, word in enumerate(words):
+        prefix = i == len(words) - 1 and not query[-1:].isspace()
+        matches = {}
+        for term_id in _lookup(terms, word, prefix):
+            postings = index['postings'][term_id]
+            for j in range(0, len(postings), 2):
+                doc = postings[j]
+                matches[doc] = max(matches.get(doc, 0), postings[j + 1])
+        if scores is None:
+            scores = matches
+        else:
+            scores = {doc: score + matches[doc] for doc, score in scores.items() if doc in matches}
+        if not scores:
+            return []
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    return [(index['docs'][doc], score) for doc, score in ranked]
+
+
+def _lookup(terms, word, prefix):
+    """Indexes of the terms matching a query word."""
+    stemmed = stem(word)
+    if not prefix:
+        i = bisect_left(terms, stemmed)
+        return [i] if i < len(terms) and terms[i] == stemmed else []
+    found = set()
+    for start in {word, stemmed}:
+        i = bisect_left(terms, start)
+        while i < len(terms) and terms[i].startswith(start):
+            found.add(i)
+            i += 1
+    return sorted(found)
+
+
+def main():
+    import argparse
+
+    from auto_deploy_events import load_events_from_file
+
+    parser = argparse.ArgumentParser(description='Build the search index the site queries')
+    parser.add_argument('--path', default=INDEX_PATH)
+    parser.add_argument('--events-file', help='Events JSON to index (default: detected events file)')
+    parser.add_argument('--query', help='Search the built index instead of rebuilding it')
+    args = parser.parse_args()
+
+    if args.query is not None:
+        index = load_file(args.path)
+        results = search(index, args.query)
+        print(f"🔎 {len(results)} matches for {args.query!r}")
+        for uid, score in results[:20]:
+            print(f"   {uid}  {score}")
+        return True
+
+    events = load_events_from_file(args.events_file)
+    if not events:
+        print("❌ No events found to index")
+        return False
+    index, written = write_index(events, args.path)
+    state = 'written' if written else 'unchanged'
+    print(f"🔎 Search index {state}: {len(index['docs'])} events, {len(index['terms'])} terms")
+    return True
+
+
+if __name__ == "__main__":
+    main()
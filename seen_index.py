@@ -0,0 +1,254 @@
+"""
+Persistent "already seen" index for scraped events.
+
+Scrapers ask `SeenIndex.seen_url()` / `seen_event()` before doing the
+expensive part of extracting an event. The question is answered by a
+scalable Bloom filter held in memory: a "no" is certain and costs a few
+hash probes; a "maybe" is confirmed against the exact key set in SQLite,
+so a false positive never makes a scraper skip a new event.
+
+Keys are normalized event URLs (lowercased host, no fragment or tracking
+parameters) and title/date fingerprints for events whose only link is the
+listing page. Both the key set and the filter live in
+scraper_output/seen_events.sqlite3.
+
+A seen event still belongs in the run's output. Scrapers take it from
+`KnownEvents`, built from the archive, instead of extracting it again.
+Marks are committed only after the run's events are saved.
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from event_keys import fnv1a64, normalize_key_part
+
+SEEN_PATH = os.path.join('scraper_output', 'seen_events.sqlite3')
+TRACKING_PARAMS = ('fbclid', 'gclid', 'mc_cid', 'mc_eid', '_ga')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (
+    key TEXT PRIMARY KEY,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bloom (
+    slice INTEGER PRIMARY KEY,
+    capacity INTEGER NOT NULL,
+    error_rate REAL NOT NULL,
+    count INTEGER NOT NULL,
+    bits BLOB NOT NULL
+);
+"""
+
+
+def normalize_url(url):
+    """Canonical form of an event URL, or '' if it is not an http(s) URL."""
+    parts = urlsplit(str(url or '').strip())
+    if parts.scheme.lower() not in ('http', 'https') or not parts.netloc:
+        return ''
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if not k.lower().startswith('utm_') and k.lower() not in TRACKING_PARAMS)
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit(('https', parts.netloc.lower().removeprefix('www.'), path, urlencode(query), ''))
+
+
+def url_key(url):
+    normalized = normalize_url(url)
+    return f'url:{normalized}' if normalized else None
+
+
+def event_key(title, date):
+    """Fingerprint of an event by normalized title and date."""
+    if not title:
+        return None
+    return 'fp:' + fnv1a64(f'{normalize_key_part(title)}|{normalize_key_part(date)}')
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter sized for `capacity` keys at `error_rate`."""
+
+    def __init__(self, capacity, error_rate, bits=None, count=0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray(bits) if bits is not None else bytearray((self.size + 7) // 8)
+        self.count = count
+
+    def _positions(self, key):
+        # Enhanced double hashing: k probes from two 64-bit halves of one digest.
+        # The growing step avoids the probe clustering plain double hashing
+        # shows on small filters.
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        a = int.from_bytes(digest[:8], 'little') % self.size
+        b = int.from_bytes(digest[8:], 'little') % self.size
+        positions = []
+        for i in range(self.hashes):
+            positions.append(a)
+            a = (a + b) % self.size
+            b = (b + i + 1) % self.size
+        return positions
+
+    def __contains__(self, key):
+        bits = self.bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def add(self, key):
+        for p in self._positions(key):
+            self.bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+    @property
+    def full(self):
+        return self.count >= self.capacity
+
+
+class ScalableBloomFilter:
+    """Chain of Bloom filters that grows as keys are added.
+
+    Each new slice is `growth` times larger with a tighter error rate, so
+    the overall false-positive rate stays below `error_rate`.
+    """
+
+    def __init__(self, initial_capacity=1000, error_rate=0.001, growth=2, tightening=0.5):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self.filters = []
+
+    def _new_slice(self):
+        n = len(self.filters)
+        capacity = self.initial_capacity * self.growth ** n
+        error_rate = self.error_rate * (1 - self.tightening) * self.tightening ** n
+        self.filters.append(BloomFilter(capacity, error_rate))
+
+    def __contains__(self, key):
+        return any(key in f for f in self.filters)
+
+    def add(self, key):
+        if not self.filters or self.filters[-1].full:
+            self._new_slice()
+        self.filters[-1].add(key)
+
+    def __len__(self):
+        return sum(f.count for f in self.filters)
+
+
+class KnownEvents:
+    """Events from earlier runs, looked up by the same keys as the seen index.
+
+    A card the index has seen is taken from here instead of being extracted
+    again, so it stays in the run's output.
+    """
+
+    def __init__(self, events=()):
+        self.by_key = {}
+        for event in events:
+            self.add(event)
+
+    def add(self, event):
+        for key in (url_key(event.get('link')), event_key(event.get('title'), event.get('date'))):
+            if key:
+                self.by_key.setdefault(key, event)
+
+    def __len__(self):
+        return len(self.by_key)
+
+    def find(self, url=None, title=None, date=None):
+        """The earlier event with this URL or title/date fingerprint, or None."""
+        for key in (url_key(url), event_key(title, date)):
+            if key in self.by_key:
+                return self.by_key[key]
+        return None
+
+
+class SeenIndex:
+    """Bloom-filtered set of event keys persisted across scraper runs."""
+
+    def __init__(self, path=SEEN_PATH, initial_capacity=1000, error_rate=0.001):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        self.bloom = ScalableBloomFilter(initial_capacity, error_rate)
+        self.stats = {'checked': 0, 'definitely_new': 0, 'confirmed_seen': 0, 'false_positives': 0}
+        self._load_bloom()
+
+    def _load_bloom(self):
+        rows = self.conn.execute('SELECT capacity, error_rate, count, bits FROM bloom ORDER BY slice').fetchall()
+        stored = self.conn.execute('SELECT COUNT(*) FROM seen').fetchone()[0]
+        if rows and sum(row[2] for row in rows) == stored:
+            self.bloom.filters = [BloomFilter(capacity, error_rate, bits, count)
+                                  for capacity, error_rate, count, bits in rows]
+            return
+        # Missing or out of date (e.g. an interrupted run): rebuild from the exact set
+        for (key,) in self.conn.execute('SELECT key FROM seen'):
+            self.bloom.add(key)
+
+    def contains(self, key):
+        if key is None:
+            return False
+        self.stats['checked'] += 1
+        if key not in self.bloom:
+            self.stats['definitely_new'] += 1
+            return False
+        row = self.conn.execute('SELECT 1 FROM seen WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            self.stats['false_positives'] += 1
+            return False
+        self.stats['confirmed_seen'] += 1
+        self.conn.execute('UPDATE seen SET last_seen = ? WHERE key = ?', (time.time(), key))
+        return True
+
+    def add(self, key):
+        if key is None or key in self.bloom and self.conn.execute(
+                'SELECT 1 FROM seen WHERE key = ?', (key,)).fetchone():
+            return
+        now = time.time()
+        self.conn.execute('INSERT OR IGNORE INTO seen (key, first_seen, last_seen) VALUES (?, ?, ?)',
+                          (key, now, now))
+        self.bloom.add(key)
+
+    def seen_url(self, url):
+        return self.contains(url_key(url))
+
+    def seen_event(self, title, date):
+        return self.contains(event_key(title, date))
+
+    def mark(self, url=None, title=None, date=None):
+        """Remember an extracted event by its URL and/or title/date fingerprint."""
+        self.add(url_key(url))
+        self.add(event_key(title, date))
+
+    def save(self):
+        """Commit new keys and store the filter so the next run skips rebuilding it."""
+        with self.conn:
+            self.conn.execute('DELETE FROM bloom')
+            self.conn.executemany(
+                'INSERT INTO bloom (slice, capacity, error_rate, count, bits) VALUES (?, ?, ?, ?, ?)',
+                [(i, f.capacity, f.error_rate, f.count, bytes(f.bits)) for i, f in enumerate(self.bloom.filters)],
+            )
+
+    def close(self, commit=True):
+        """Commit (or, with commit=False, discard) this run's keys and close the database.
+
+        Scrapers commit only once the events they marked are saved, so a run
+        that fails before saving does not hide those events from the next one.
+        """
+        if commit:
+            self.save()
+        else:
+            self.conn.rollback()
+        self.conn.close()
+
+    def summary(self):
+        s = self.stats
+        return (f"{s['checked']} checked, {s['confirmed_seen']} already seen, "
+                f"{s['definitely_new']} new by filter, {s['false_positives']} filter false positives")
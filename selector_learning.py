@@ -0,0 +1,175 @@
+"""
+Selector learning for the scrapers.
+
+Remembers, per institution, which CSS selectors actually yielded events and
+which extraction strategy won, so later runs try the likely winner first
+instead of paying a miss on every dead selector. When every known selector
+fails, `discover_card_selectors` looks for repeated card structures in the
+live DOM and proposes new selectors, which are then learned like any other.
+
+Stats are keyed by whatever identifies a page layout for the caller: an
+institution id in complete_marcet_scraper.py, the page URL in the CSV scraper.
+Worker processes share the stats file, so `save` re-reads it under a lock
+and replays this process's updates onto it.
+"""
+
+import json
+import os
+import time
+
+from file_lock import file_lock
+
+STATS_PATH = os.path.join('scraper_output', 'selector_stats.json')
+MAX_DISCOVERED = 5
+
+# Runs in the page: group sibling elements by tag + class signature and keep
+# groups that repeat and look like event cards (enough text, a link or heading).
+DISCOVER_CARDS_JS = """
+const minRepeats = arguments[0];
+const groups = new Map();
+for (const parent of document.querySelectorAll('body *')) {
+  const children = parent.children;
+  if (children.length < minRepeats) continue;
+  const bySignature = new Map();
+  for (const child of children) {
+    const classes = Array.from(child.classList)
+      .filter((c) => /^[A-Za-z][\\w-]*$/.test(c))
+      .sort();
+    if (classes.length === 0) continue;
+    const signature = child.tagName.toLowerCase() + '.' + classes.join('.');
+    if (!bySignature.has(signature)) bySignature.set(signature, []);
+    bySignature.get(signature).push(child);
+  }
+  for (const [signature, items] of bySignature) {
+    if (items.length < minRepeats) continue;
+    const cardLike = items.filter((el) =>
+      (el.innerText || '').trim().length >= 20 &&
+      el.querySelector('a, h1, h2, h3, h4, time'));
+    if (cardLike.length < minRepeats) continue;
+    const textLength = cardLike.reduce((n, el) => n + (el.innerText || '').length, 0);
+    const previous = groups.get(signature) || { count: 0, text: 0 };
+    groups.set(signature, {
+      count: previous.count + cardLike.length,
+      text: previous.text + textLength
+    });
+  }
+}
+return Array.from(groups.entries())
+  .map(([selector, g]) => ({ selector, count: g.count, avgText: g.text / g.count }))
+  .filter((g) => g.avgText < 2000)
+  .sort((a, b) => b.count * Math.log(b.avgText) - a.count * Math.log(a.avgText));
+"""
+
+
+class SelectorStats:
+    """Per-institution hit/miss counts for selectors, persisted as JSON."""
+
+    def __init__(self, path=STATS_PATH):
+        self.path = path
+        self.dirty = False
+        self._pending = []  # (method name, args) not yet saved
+        self.data = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _change(self, method, *args):
+        self._pending.append((method, args))
+        getattr(self, method)(*args)
+        self.dirty = True
+
+    def _institution(self, institution_id):
+        return self.data.setdefault(institution_id, {'selectors': {}, 'strategy': None, 'discovered': []})
+
+    def score(self, institution_id, selector):
+        """Smoothed hit rate; an untried selector scores 0.5."""
+        stats = self.data.get(institution_id, {}).get('selectors', {}).get(selector)
+        if not stats:
+            return 0.5
+        return (stats['hits'] + 1) / (stats['hits'] + stats['misses'] + 2)
+
+    def discovered(self, institution_id):
+        return list(self.data.get(institution_id, {}).get('discovered', []))
+
+    def rank(self, institution_id, candidates, include_discovered=True):
+        """Order candidates (plus learned discoveries) by past hit rate.
+
+        Ties keep their configured order, so a brand-new institution is
+        scraped exactly as before.
+        """
+        extra = self.discovered(institution_id) if include_discovered else []
+        ordered = list(dict.fromkeys(list(candidates) + extra))
+
+        def sort_key(item):
+            position, selector = item
+            stats = self.data.get(institution_id, {}).get('selectors', {}).get(selector, {})
+            return (-self.score(institution_id, selector), -stats.get('last_hit', 0), position)
+
+        return [selector for _, selector in sorted(enumerate(ordered), key=sort_key)]
+
+    def record(self, institution_id, selector, events_found):
+        """Count a selector as a hit if it produced at least one valid event."""
+        self._change('_record', institution_id, selector, events_found, time.time())
+
+    def _record(self, institution_id, selector, events_found, now):
+        stats = self._institution(institution_id)['selectors'].setdefault(
+            selector, {'hits': 0, 'misses': 0, 'events': 0, 'last_hit': 0})
+        if events_found > 0:
+            stats['hits'] += 1
+            stats['events'] += events_found
+            stats['last_hit'] = max(stats['last_hit'], now)
+        else:
+            stats['misses'] += 1
+
+    def preferred_strategy(self, institution_id):
+        return self.data.get(institution_id, {}).get('strategy')
+
+    def rank_strategies(self, institution_id, strategies):
+        """Move the strategy that last worked for this institution to the front."""
+        preferred = self.preferred_strategy(institution_id)
+        return sorted(strategies, key=lambda s: s['name'] != preferred)
+
+    def record_strategy(self, institution_id, strategy_name):
+        if self._institution(institution_id)['strategy'] != strategy_name:
+            self._change('_record_strategy', institution_id, strategy_name)
+
+    def _record_strategy(self, institution_id, strategy_name):
+        self._institution(institution_id)['strategy'] = strategy_name
+
+    def add_discovered(self, institution_id, selectors):
+        new = [s for s in dict.fromkeys(selectors) if s not in self._institution(institution_id)['discovered']]
+        if new:
+            self._change('_add_discovered', institution_id, new)
+
+    def _add_discovered(self, institution_id, selectors):
+        discovered = self._institution(institution_id)['discovered']
+        discovered.extend(selector for selector in selectors if selector not in discovered)
+        del discovered[:-MAX_DISCOVERED]
+
+    def save(self):
+        """Apply this process's updates to the file as other workers left it."""
+        if not self.dirty:
+            return
+        with file_lock(self.path):
+            self.data = self._load()
+            for method, args in self._pending:
+                getattr(self, method)(*args)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        self._pending = []
+        self.dirty = False
+
+
+def discover_card_selectors(driver, min_repeats=3, limit=3):
+    """Return CSS selectors for repeated card-like elements on the current page."""
+    try:
+        groups = driver.execute_script(DISCOVER_CARDS_JS, min_repeats) or []
+    except Exception:
+        return []
+    return [group['selector'] for group in groups[:limit]]
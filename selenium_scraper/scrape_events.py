@@ -1,10 +1,14 @@
 """Example Selenium scraper for cultural institutions."""
 
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
+import os
+import sys
+
+# Shared modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from driver_resolver import chrome_service
 
 
 def setup_driver(headless: bool = True) -> webdriver.Chrome:
@@ -14,7 +18,7 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
     # Basic flags for running in Docker/CI environments
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
-    service = Service(ChromeDriverManager().install())
+    service = chrome_service(options)
     return webdriver.Chrome(service=service, options=options)
 
 
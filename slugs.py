@@ -0,0 +1,8 @@
+"""URL- and file-name-safe slugs for feed, archive and shard paths."""
+
+import re
+
+
+def slugify(text):
+    """'Libraries & Literary' -> 'libraries-literary'"""
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
@@ -0,0 +1,74 @@
+"""
+Query shards: grouping, incremental rewrites and pruning of emptied shards.
+
+    python -m pytest tests/test_build_shards.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from build_shards import build_shards, load_manifest
+from event_json import load_file
+
+EVENTS = [
+    {'title': 'Artist Talk', 'museum': 'moma', 'type': 'lectures', 'date': '2026-11-03', 'time': '6:00 PM', 'id': 1},
+    {'title': 'Curator Tour', 'museum': 'moma', 'type': 'tours', 'date': '2026-12-01', 'time': '2:00 PM', 'id': 2},
+    {'title': 'Gallery Lecture', 'museum': 'met', 'type': 'lectures', 'date': '2026-11-10', 'time': '6:00 PM', 'id': 3},
+    {'title': 'Viewing', 'museum': 'christies', 'city': 'London', 'date': 'TBA', 'id': 4},
+]
+
+
+def shard_files(root):
+    return sorted(os.path.relpath(os.path.join(d, f), root).replace(os.sep, '/')
+                  for d, _, files in os.walk(root) for f in files if f != 'manifest.json')
+
+
+def test_every_event_is_in_one_city_shard(tmp_path):
+    written, unchanged, removed = build_shards(EVENTS, str(tmp_path))
+    assert (unchanged, removed) == ([], [])
+    assert sorted(written) == shard_files(tmp_path) == [
+        'city/london/undated/other.json',
+        'city/new-york/2026-11/lectures.json',
+        'city/new-york/2026-12/tours.json',
+        'institution/christies/undated.json',
+        'institution/met/2026-11.json',
+        'institution/moma/2026-11.json',
+        'institution/moma/2026-12.json',
+    ]
+    manifest = load_manifest(str(tmp_path))
+    assert manifest['total_events'] == 4
+    lectures = manifest['by_city']['New York']['2026-11']['lectures']
+    assert lectures['count'] == 2
+    assert [e['title'] for e in load_file(str(tmp_path / lectures['file']))] == ['Artist Talk', 'Gallery Lecture']
+
+
+def test_unchanged_build_writes_nothing(tmp_path):
+    build_shards(EVENTS, str(tmp_path))
+    manifest_mtime = os.stat(tmp_path / 'manifest.json').st_mtime_ns
+    renumbered = [{**event, 'id': 10 + event['id']} for event in reversed(EVENTS)]
+    written, unchanged, removed = build_shards(renumbered, str(tmp_path))
+    assert (written, removed) == ([], [])
+    assert len(unchanged) == 7
+    assert os.stat(tmp_path / 'manifest.json').st_mtime_ns == manifest_mtime
+
+
+def test_emptied_shards_are_removed(tmp_path):
+    build_shards(EVENTS, str(tmp_path))
+    remaining = [EVENTS[0], {**EVENTS[2], 'title': 'Gallery Lecture (rescheduled)'}]
+    written, unchanged, removed = build_shards(remaining, str(tmp_path))
+
+    assert removed == [
+        'city/london/undated/other.json',
+        'city/new-york/2026-12/tours.json',
+        'institution/christies/undated.json',
+        'institution/moma/2026-12.json',
+    ]
+    assert written == ['city/new-york/2026-11/lectures.json', 'institution/met/2026-11.json']
+    assert unchanged == ['institution/moma/2026-11.json']
+    assert shard_files(tmp_path) == sorted(written + unchanged)
+    manifest = load_manifest(str(tmp_path))
+    assert set(manifest['by_city']) == {'New York'}
+    assert set(manifest['by_institution']) == {'moma', 'met'}
+    assert manifest['total_events'] == 2
@@ -0,0 +1,60 @@
+"""
+DateWindow card-date parsing and the HorizonScan early stop.
+
+    python -m pytest tests/test_date_window.py
+"""
+
+import argparse
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from date_window import (AFTER, BEFORE, INSIDE, UNDATED, DateWindow, HorizonScan,
+                         add_window_arguments)
+
+WINDOW = DateWindow('2026-11-01', '2026-12-15')
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Tuesday, November 3, 2026 · 6 PM', (INSIDE, '2026-11-03')),
+    ('2026-12-20 Members Evening', (AFTER, '2026-12-20')),
+    ('10/15/2026', (BEFORE, '2026-10-15')),
+    ('Artist Talk\nNov. 3rd', (INSIDE, '2026-11-03')),
+    ('3 December', (INSIDE, '2026-12-03')),
+    ('On view through Dec 1', (INSIDE, '2026-12-01')),
+    ('Marketing 12 spots left', (UNDATED, None)),
+    ('February 30, 2027', (UNDATED, None)),
+    ('', (UNDATED, None)),
+])
+def test_classify(text, expected):
+    assert WINDOW.classify(text) == expected
+
+
+def test_yearless_dates_roll_into_next_year():
+    december = DateWindow('2026-12-10', '2027-01-31')
+    assert december.classify('January 10') == (INSIDE, '2027-01-10')
+    assert december.classify('December 12') == (INSIDE, '2026-12-12')
+
+
+def test_horizon_needs_a_run_of_dated_cards_past_the_end():
+    scan = HorizonScan(run=3)
+    for status in (INSIDE, AFTER, AFTER, INSIDE, AFTER, UNDATED, AFTER):
+        scan.record(status)
+        assert not scan.past_horizon
+    scan.record(AFTER)
+    assert scan.past_horizon
+    assert scan.skipped == 6
+    assert scan.summary() == '2 in window, 0 before, 5 after, 1 undated'
+
+
+def test_window_arguments():
+    parser = argparse.ArgumentParser()
+    add_window_arguments(parser)
+    window = DateWindow.from_args(parser.parse_args(['--start', '2026-11-01', '--days', '10']))
+    assert (window.start.isoformat(), window.end.isoformat()) == ('2026-11-01', '2026-11-11')
+    assert '2026-11-11' in window and '2026-11-12' not in window
+    with pytest.raises(ValueError):
+        DateWindow('2026-11-01', '2026-10-01')
@@ -0,0 +1,63 @@
+"""
+Chrome/ChromeDriver pinning with fake binaries that only print a version.
+
+    python -m pytest tests/test_driver_resolver.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import driver_resolver
+from driver_resolver import CHROME_ENV, DRIVER_ENV, DriverMismatchError, DriverResolver
+
+pytestmark = pytest.mark.skipif(os.name != 'posix', reason='fake binaries are shell scripts')
+
+
+def fake_binary(path, output):
+    path.write_text(f'#!/bin/sh\necho "{output}"\n')
+    path.chmod(0o755)
+    return str(path)
+
+
+@pytest.fixture
+def binaries(tmp_path, monkeypatch):
+    chrome = fake_binary(tmp_path / 'chrome', 'Google Chrome 130.0.6723.58')
+    driver = fake_binary(tmp_path / 'chromedriver', 'ChromeDriver 130.0.6723.58 (abc)')
+    monkeypatch.setenv(CHROME_ENV, chrome)
+    monkeypatch.setenv(DRIVER_ENV, driver)
+    return tmp_path
+
+
+def test_pin_is_reused_without_running_binaries(binaries, monkeypatch):
+    resolver = DriverResolver(str(binaries / 'pin.json'))
+    pin = resolver.resolve()
+    assert (pin['chrome_version'], pin['driver_version'], pin['source']) == ('130.0.6723.58', '130.0.6723.58', 'local')
+
+    def no_subprocess(path):
+        raise AssertionError(f'ran {path}')
+
+    monkeypatch.setattr(driver_resolver, 'binary_version', no_subprocess)
+    again = DriverResolver(str(binaries / 'pin.json')).resolve()
+    assert again['driver_path'] == pin['driver_path']
+
+
+def test_updated_chrome_is_a_mismatch(binaries):
+    resolver = DriverResolver(str(binaries / 'pin.json'))
+    resolver.resolve()
+    fake_binary(binaries / 'chrome', 'Google Chrome 131.0.6778.69 (updated)')
+
+    with pytest.raises(DriverMismatchError, match='needs ChromeDriver 131'):
+        resolver.resolve()
+
+    fake_binary(binaries / 'chromedriver', 'ChromeDriver 131.0.6778.69 (def)')
+    assert resolver.resolve(refresh=True)['driver_version'] == '131.0.6778.69'
+
+
+def test_corrupt_pin_is_rediscovered(binaries):
+    (binaries / 'pin.json').write_text('{not json')
+    pin = DriverResolver(str(binaries / 'pin.json')).resolve()
+    assert pin['chrome_path'] == os.environ[CHROME_ENV]
@@ -0,0 +1,55 @@
+"""
+Month-partitioned event archive.
+
+    python -m pytest tests/test_event_archive.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from event_archive import ArchiveReader, load_manifest, write_archive
+
+
+def make_event(title, date, museum='moma', time='6:00 PM'):
+    return {'title': title, 'date': date, 'time': time, 'museum': museum, 'city': 'New York'}
+
+
+def titles(archive_dir, start=None, end=None):
+    return sorted(event['title'] for event in ArchiveReader(str(archive_dir)).load(start, end))
+
+
+def test_reads_only_overlapping_partitions(tmp_path):
+    write_archive([make_event('Aug Talk', '2025-08-10'), make_event('Sep Talk', '2025-09-02'),
+                   {'title': 'Someday', 'museum': 'moma'}], str(tmp_path))
+    reader = ArchiveReader(str(tmp_path))
+    assert [entry['month'] for entry in reader.partitions('2025-08-01', '2025-08-14')] == ['2025-08']
+    assert titles(tmp_path, '2025-08-01', '2025-08-14') == ['Aug Talk']
+
+
+def test_rescan_replaces_institution_events_in_covered_months(tmp_path):
+    write_archive([
+        make_event('Artist Talk', '2025-08-10'),
+        make_event('Cancelled Tour', '2025-08-20'),
+        make_event('Autumn Lecture', '2025-10-01'),
+        make_event('Gallery Lecture', '2025-08-12', museum='met'),
+    ], str(tmp_path))
+
+    # The talk moved, the tour was cancelled; October was not scraped this time
+    written, _ = write_archive([make_event('Artist Talk', '2025-08-10', time='7:00 PM'),
+                                make_event('New Tour', '2025-09-05')], str(tmp_path))
+
+    assert titles(tmp_path) == ['Artist Talk', 'Autumn Lecture', 'Gallery Lecture', 'New Tour']
+    august = ArchiveReader(str(tmp_path)).load('2025-08-01', '2025-08-31')
+    assert [(e['title'], e['time']) for e in august if e['museum'] == 'moma'] == [('Artist Talk', '7:00 PM')]
+    assert 'new-york/2025-10.json' not in written
+
+
+def test_emptied_partition_is_removed(tmp_path):
+    write_archive([make_event('Only Event', '2025-08-10'), make_event('Later', '2025-09-10')], str(tmp_path))
+    write_archive([make_event('Earlier', '2025-07-10'), make_event('Later', '2025-09-10')], str(tmp_path))
+
+    months = [entry['month'] for entry in load_manifest(str(tmp_path))['partitions']]
+    assert months == ['2025-07', '2025-09']
+    assert not os.path.exists(tmp_path / 'new-york' / '2025-08.json')
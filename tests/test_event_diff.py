@@ -0,0 +1,68 @@
+"""
+Semantic event diffs and patch round trips.
+
+    python -m pytest tests/test_event_diff.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from event_diff import apply_patch, diff_events, snapshot_hash
+from event_keys import event_uid
+from event_model import Event
+
+
+def make_event(title, date='2026-11-03', museum='moma', **fields):
+    return {'title': title, 'date': date, 'time': '6:00 PM', 'museum': museum,
+            'link': f'https://example.org/{title.lower().replace(" ", "-")}', **fields}
+
+
+BASE = [
+    make_event('Artist Talk', id=1),
+    make_event('Curator Tour', id=2, price='Free'),
+    make_event('Gallery Lecture', museum='met', id=3),
+]
+
+
+def by_uid(events):
+    return {event_uid(event): {k: v for k, v in event.items() if k != 'id'} for event in events}
+
+
+def test_reordered_and_renumbered_is_empty():
+    reordered = [{**event, 'id': 10 - i} for i, event in enumerate(reversed(BASE))]
+    diff = diff_events(BASE, reordered)
+    assert diff.is_empty
+    assert diff.summary() == 'no changes'
+
+
+def test_changed_date_is_a_modification():
+    moved = [BASE[0], {**BASE[1], 'date': '2026-11-10'}, BASE[2]]
+    diff = diff_events(BASE, moved)
+    assert (diff.added, diff.removed) == ([], [])
+    assert [changes for _, _, changes in diff.modified] == [{'date': ('2026-11-03', '2026-11-10')}]
+
+
+def test_patch_round_trip():
+    target = [
+        {**BASE[0], 'description': 'Now with a description'},
+        {k: v for k, v in BASE[1].items() if k != 'price'},
+        make_event('Members Evening', museum='frick'),
+    ]
+    patch = diff_events(BASE, target).patch()
+
+    assert patch['base'] == snapshot_hash(BASE)
+    assert patch['target'] == snapshot_hash(target)
+    assert patch['unset'] == {event_uid(BASE[1]): ['price']}
+    result = apply_patch(BASE, patch)
+    assert by_uid(result) == by_uid(target)
+    assert snapshot_hash(result) == patch['target']
+
+
+def test_event_objects_are_diffed():
+    events = [Event.from_json(event) for event in BASE]
+    assert diff_events(BASE, events).is_empty
+    diff = diff_events(events, events[:2])
+    assert diff.removed == [event_uid(BASE[2])]
+    assert len(apply_patch(events, diff.patch())) == 2
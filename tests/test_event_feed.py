@@ -0,0 +1,100 @@
+"""
+Versioned event feed: the patch hash chain, client catch-up, snapshots and pruning.
+
+    python -m pytest tests/test_event_feed.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import event_feed
+from event_diff import apply_patch, snapshot_hash
+from event_feed import feed_events, load_manifest, publish_feed, published_events
+from event_json import load_file
+
+
+def make_event(n, **fields):
+    return {'title': f'Event {n}', 'museum': 'moma', 'date': f'2026-11-{n % 28 + 1:02d}',
+            'time': '6:00 PM', **fields}
+
+
+def versions(count):
+    """Event lists for consecutive publishes: one event added and one changed each time."""
+    # Enough events that a few patches stay smaller than the snapshot
+    events = [make_event(n) for n in range(100)]
+    history = []
+    for v in range(count):
+        events = [make_event(n, description=f'rev {v}') if n == v % 5 else event
+                  for n, event in enumerate(events)] + [make_event(1000 + v)]
+        history.append([{**event, 'id': i} for i, event in enumerate(events)])
+    return history
+
+
+def test_patches_form_a_hash_chain(tmp_path):
+    feed_dir = str(tmp_path)
+    history = versions(5)
+    for events in history:
+        manifest = publish_feed(events, feed_dir)
+
+    assert manifest['version'] == 5
+    assert manifest['hash'] == snapshot_hash(feed_events(history[-1]))
+    patches = manifest['patches']
+    assert [p['version'] for p in patches] == [2, 3, 4, 5]
+    assert patches[0]['base'] == manifest['snapshot']['hash'] == snapshot_hash(feed_events(history[0]))
+    for previous, patch in zip(patches, patches[1:]):
+        assert patch['base'] == previous['target']
+    assert patches[-1]['target'] == manifest['hash']
+
+
+@pytest.mark.parametrize('cached_version', [1, 3, 4])
+def test_client_catches_up_from_its_cached_version(tmp_path, cached_version):
+    feed_dir = str(tmp_path)
+    history = versions(5)
+    for events in history:
+        manifest = publish_feed(events, feed_dir)
+
+    # What frontend/src/eventFeed.js does with a cached copy
+    events = feed_events(history[cached_version - 1])
+    for entry in manifest['patches']:
+        if entry['version'] > cached_version:
+            patch = load_file(os.path.join(feed_dir, entry['file']))
+            assert patch['base'] == snapshot_hash(events)
+            events = apply_patch(events, patch)
+    assert snapshot_hash(events) == manifest['hash']
+    assert snapshot_hash(published_events(manifest, feed_dir)) == manifest['hash']
+
+
+def test_unchanged_events_add_no_version(tmp_path):
+    events = versions(1)[0]
+    assert publish_feed(events, str(tmp_path))['version'] == 1
+    renumbered = [{**event, 'id': 50 + i} for i, event in enumerate(reversed(events))]
+    assert publish_feed(renumbered, str(tmp_path)) is None
+
+
+def test_new_snapshot_and_patch_pruning(tmp_path, monkeypatch):
+    monkeypatch.setattr(event_feed, 'SNAPSHOT_EVERY', 3)
+    monkeypatch.setattr(event_feed, 'KEEP_PATCHES', 2)
+    feed_dir = str(tmp_path)
+    for events in versions(6):
+        manifest = publish_feed(events, feed_dir)
+
+    assert manifest['snapshot']['version'] == 4
+    assert sorted(os.listdir(tmp_path / 'snapshots')) == ['4.json']
+    assert [p['version'] for p in manifest['patches']] == [5, 6]
+    assert sorted(os.listdir(tmp_path / 'patches')) == ['5.json', '6.json']
+    assert snapshot_hash(published_events(load_manifest(feed_dir), feed_dir)) == manifest['hash']
+
+
+def test_unreadable_feed_starts_a_new_snapshot(tmp_path):
+    feed_dir = str(tmp_path)
+    history = versions(2)
+    publish_feed(history[0], feed_dir)
+    os.remove(tmp_path / 'snapshots' / '1.json')
+    manifest = publish_feed(history[1], feed_dir)
+    assert manifest['version'] == 2
+    assert manifest['patches'] == []
+    assert manifest['snapshot']['version'] == 2
@@ -0,0 +1,47 @@
+"""
+event_json gives the same bytes on the orjson and standard library backends.
+
+    python -m pytest tests/test_event_json.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import event_json
+from event_model import Event
+
+DOCUMENTS = [
+    {'events': [{'id': 1, 'title': 'Café Talk — “Matisse”', 'museum': 'moma', 'date': '2026-11-03'}],
+     'metadata': {'total_events': 1, 'date_range': {'first': '2026-11-03', 'last': None}}},
+    {'counts': {1: 'one', 2: 'two'}},
+    [Event(title='Gallery Lecture', museum='met', date='2026-11-04')],
+    [],
+    {},
+]
+
+
+def encode(document, pretty, backend):
+    saved = event_json.orjson
+    event_json.orjson = backend
+    try:
+        return event_json.dumps(document, pretty=pretty)
+    finally:
+        event_json.orjson = saved
+
+
+@pytest.mark.skipif(event_json.orjson is None, reason='orjson is not installed')
+@pytest.mark.parametrize('pretty', [False, True])
+@pytest.mark.parametrize('document', DOCUMENTS)
+def test_backends_produce_the_same_bytes(document, pretty):
+    assert encode(document, pretty, event_json.orjson) == encode(document, pretty, None)
+
+
+def test_dump_and_load_round_trip(tmp_path):
+    path = str(tmp_path / 'events.json')
+    event_json.dump_file(DOCUMENTS[0], path)
+    assert event_json.load_file(path) == DOCUMENTS[0]
+    assert not os.path.exists(path + '.tmp')
@@ -0,0 +1,87 @@
+"""
+MetadataAggregator kept up to date incrementally versus rebuilt from scratch.
+
+    python -m pytest tests/test_event_metadata.py
+"""
+
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from event_metadata import MetadataAggregator, load_store, save_store
+
+T0, T1 = '2026-01-01 00:00:00', '2026-02-01 00:00:00'
+
+
+def make_event(n, **fields):
+    return {'title': f'Event {n}', 'museum': ('moma', 'met', 'frick')[n % 3],
+            'type': ('lecture', 'tour')[n % 2], 'city': 'New York',
+            'date': f'2026-{n % 12 + 1:02d}-{n % 28 + 1:02d}', 'time': '6:00 PM', **fields}
+
+
+def counted(block):
+    return {key: value for key, value in block.items() if key not in ('scrape_timestamp', 'sources')}
+
+
+def test_incremental_matches_rebuild():
+    rng = random.Random(7)
+    aggregator = MetadataAggregator()
+    store = {}
+    for step in range(500):
+        n = rng.randrange(60)
+        event = make_event(n, type=rng.choice(['lecture', 'tour', '']))
+        key = event['title']
+        if rng.random() < 0.3 and key in store:
+            assert aggregator.remove(store.pop(key))
+        else:
+            aggregator.add(event, timestamp=T0)
+            store[key] = event
+
+    rebuilt = MetadataAggregator(store.values())
+    assert counted(aggregator.metadata()) == counted(rebuilt.metadata())
+    assert len(aggregator) == len(store)
+    assert not aggregator.remove(make_event(999))
+
+
+def test_date_range_follows_removals():
+    events = [make_event(0, date='2026-03-01'), make_event(1, date='2026-05-01'), make_event(2, date='2026-04-01')]
+    aggregator = MetadataAggregator(events)
+    assert aggregator.metadata()['date_range'] == {'first': '2026-03-01', 'last': '2026-05-01'}
+    aggregator.remove(events[1])
+    aggregator.remove(events[0])
+    assert aggregator.metadata()['date_range'] == {'first': '2026-04-01', 'last': '2026-04-01'}
+
+
+def test_keep_does_not_refresh_a_source():
+    aggregator = MetadataAggregator()
+    aggregator.add(make_event(0), timestamp=T0)   # moma
+    aggregator.add(make_event(1), timestamp=T0)   # met
+    aggregator.keep(make_event(3))                # moma, carried over
+    aggregator.add(make_event(4), timestamp=T1)   # met
+    sources = aggregator.metadata()['sources']
+    assert sources['moma'] == {'events': 2, 'last_updated': T0}
+    assert sources['met'] == {'events': 2, 'last_updated': T1}
+
+
+def test_store_round_trip_and_legacy_array(tmp_path):
+    path = str(tmp_path / 'events.json')
+    events = [make_event(n) for n in range(6)]
+    aggregator = MetadataAggregator()
+    aggregator.add_many(events, timestamp=T0)
+    saved = save_store(path, events, aggregator, scraper_version='test')
+    assert saved['scraper_version'] == 'test'
+
+    loaded_events, loaded, metadata = load_store(path)
+    assert loaded_events == events
+    assert loaded.metadata() == {k: v for k, v in saved.items() if k != 'scraper_version'}
+
+    legacy = str(tmp_path / 'legacy.json')
+    with open(legacy, 'w') as f:
+        json.dump(events, f)
+    _, aggregator, metadata = load_store(legacy)
+    assert metadata == {}
+    assert aggregator.metadata()['total_events'] == 6
+    assert load_store(str(tmp_path / 'missing.json'))[0] == []
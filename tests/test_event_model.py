@@ -0,0 +1,53 @@
+"""
+Event records: lossless JSON round trips and the read-only Mapping interface.
+
+    python -m pytest tests/test_event_model.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from event_model import Event, events_from_json, events_to_json
+
+DATA = {
+    'id': 3, 'title': 'Artist Talk', 'museum': 'moma', 'date': '2026-11-03', 'time': '6:00 PM',
+    'type': 'Lecture', 'city': 'New York', 'link': 'https://example.org/talk',
+    'image': 'https://example.org/talk.jpg',
+}
+
+
+def test_round_trip_keeps_unknown_keys():
+    event = Event.from_json(DATA)
+    assert event.extra == {'image': 'https://example.org/talk.jpg'}
+    assert event.to_json() == DATA
+    assert Event.from_json(event) is event
+
+
+def test_mapping_interface():
+    event = Event.from_json(DATA)
+    assert event['museum'] == 'moma'
+    assert event.get('price', 'See website') == 'See website'
+    assert event.get('image') == DATA['image']
+    assert 'price' not in event
+    assert dict(event) == DATA
+    assert len(event) == len(DATA)
+    with pytest.raises(KeyError):
+        event['price']
+    with pytest.raises(AttributeError):
+        event.rating = 5
+
+
+def test_categorical_values_are_shared():
+    city = ''.join(['New ', 'York'])
+    a, b = Event.from_json(DATA), Event.from_json({**DATA, 'city': city})
+    assert a.city is b.city
+
+
+def test_bulk_helpers_skip_non_objects():
+    events = events_from_json([DATA, None, 'junk'])
+    assert len(events) == 1
+    assert events_to_json(events + [{'title': 'plain'}]) == [DATA, {'title': 'plain'}]
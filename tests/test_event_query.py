@@ -0,0 +1,93 @@
+"""
+EventIndex queries, cursors and response encoding.
+
+    python -m pytest tests/test_event_query.py
+"""
+
+import gzip
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from event_query import (EventIndex, QueryError, choose_encoding, decode_cursor, encode_body,
+                         parse_query_args, run_query)
+
+MUSEUMS = ('moma', 'met', 'frick')
+TYPES = ('Lecture', 'Tour')
+
+EVENTS = [
+    {'title': f'Event {n}', 'museum': MUSEUMS[n % 3], 'type': TYPES[n % 2],
+     'city': 'New York', 'date': f'2026-11-{n % 28 + 1:02d}', 'time': '6:00 PM'}
+    for n in range(60)
+]
+
+
+def scan(events, start=None, end=None, filters=None):
+    """What a query must return: a linear filter in index order."""
+    return [
+        event for event in events
+        if (not start or event['date'] >= start) and (not end or event['date'] <= end)
+        and all(event.get(field) in values for field, values in (filters or {}).items())
+    ]
+
+
+@pytest.mark.parametrize('start, end, filters', [
+    (None, None, {}),
+    ('2026-11-05', '2026-11-12', {}),
+    (None, '2026-11-03', {'museum': ['met']}),
+    ('2026-11-10', None, {'museum': ['moma', 'frick'], 'type': ['Tour']}),
+    (None, None, {'museum': ['louvre']}),
+])
+def test_query_matches_linear_scan(start, end, filters):
+    index = EventIndex(EVENTS)
+    page, _, total = index.query(start=start, end=end, filters=filters, limit=1000)
+    expected = scan([event.to_json() for event in index.events], start, end, filters)
+    assert [event.to_json() for event in page] == expected
+    assert total == len(expected)
+
+
+def test_cursor_pages_cover_every_result_once():
+    index = EventIndex(EVENTS)
+    params = parse_query_args({'museum': 'moma,met', 'limit': '7'})
+    titles, pages = [], 0
+    while True:
+        body = run_query(index, params)
+        titles.extend(event['title'] for event in body['events'])
+        pages += 1
+        if not body['next_cursor']:
+            break
+        params['cursor'] = body['next_cursor']
+
+    assert body['remaining'] == 0
+    assert len(titles) == len(set(titles)) == 40
+    assert pages == 6
+
+
+def test_cursor_from_another_version_is_rejected():
+    index = EventIndex(EVENTS)
+    body = run_query(index, parse_query_args({'limit': '5'}))
+    changed = EventIndex(EVENTS[:-1])
+    assert changed.version != index.version
+    with pytest.raises(QueryError, match='expired'):
+        decode_cursor(changed, body['next_cursor'])
+    with pytest.raises(QueryError, match='invalid'):
+        decode_cursor(index, 'not a cursor')
+
+
+@pytest.mark.parametrize('limit', ['0', '501', 'ten'])
+def test_bad_limit_is_rejected(limit):
+    with pytest.raises(QueryError):
+        parse_query_args({'limit': limit})
+
+
+def test_encoding_negotiation_and_stable_gzip():
+    assert choose_encoding('gzip;q=0, deflate') == 'identity'
+    assert choose_encoding('deflate, gzip;q=0.5') == 'gzip'
+    body = {'events': EVENTS[:3]}
+    data = encode_body(body, 'gzip')
+    assert data == encode_body(body, 'gzip')
+    assert json.loads(gzip.decompress(data)) == body
@@ -0,0 +1,62 @@
+"""
+EventTable counts against plain dict-walking counts.
+
+    python -m pytest tests/test_event_table.py
+"""
+
+import os
+import sys
+from collections import Counter
+from datetime import date
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from event_model import Event
+from event_table import EventTable, summarize
+
+EVENTS = [
+    {'title': 'Artist Talk', 'museum': 'moma', 'type': 'Lecture', 'city': 'New York', 'date': '2026-11-03'},
+    {'title': 'Curator Tour', 'museum': 'moma', 'type': 'Tour', 'city': 'New York', 'date': '2026-11-10'},
+    {'title': 'Gallery Lecture', 'museum': 'met', 'type': 'Lecture', 'city': 'New York', 'date': '2026-12-01'},
+    {'title': 'Members Evening', 'museum': 'met', 'type': '', 'date': 'TBA'},
+    {'title': 'Viewing', 'museum': 'christies', 'type': 'Exhibition', 'city': 'London', 'date': '2027-01-04'},
+]
+
+
+def test_counts_match_dict_walk():
+    table = EventTable(EVENTS + ['not an event'])
+    assert table.skipped == [(5, 'not an event')]
+    assert len(table) == 5
+    assert table.count_by('museum') == dict(Counter(e['museum'] for e in EVENTS))
+    assert table.count_by('type') == {'Lecture': 2, 'Tour': 1, 'unknown': 1, 'Exhibition': 1}
+    assert table.count_by('city') == {'New York': 3, 'unknown': 1, 'London': 1}
+
+
+def test_group_count():
+    table = EventTable(EVENTS)
+    assert table.group_count('type', by='museum') == {
+        'moma': {'Lecture': 1, 'Tour': 1},
+        'met': {'Lecture': 1, 'unknown': 1},
+        'christies': {'Exhibition': 1},
+    }
+
+
+def test_dates_skip_unparseable_values():
+    table = EventTable(EVENTS)
+    assert table.count_dates() == 4
+    assert table.count_dates(start=date(2026, 11, 10), end=date(2026, 12, 1)) == 2
+    assert table.histogram('month') == {'2026-11': 2, '2026-12': 1, '2027-01': 1}
+    assert table.histogram('year') == {'2026': 3, '2027': 1}
+    # 2026-11-03 and 2026-11-10 are Tuesdays, 2026-12-01 too; 2027-01-04 a Monday
+    assert table.histogram('weekday') == {0: 1, 1: 3}
+    with pytest.raises(ValueError):
+        table.histogram('week')
+
+
+def test_summarize_accepts_event_records():
+    summary = summarize([Event.from_json(e) for e in EVENTS], today=date(2026, 11, 4))
+    assert summary['total_events'] == 5
+    assert summary['events_by_museum'] == {'moma': 2, 'met': 2, 'christies': 1}
+    assert summary['upcoming_events'] == 3
@@ -0,0 +1,42 @@
+"""
+Columnar event validation.
+
+    python -m pytest tests/test_event_validation.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from event_validation import validate_events
+
+
+def make_event(**fields):
+    return {'id': 1, 'title': 'Artist Talk', 'museum': 'moma', 'date': '2026-11-03', 'time': '7:00 PM',
+            'type': 'lecture', 'description': 'An evening talk.', 'city': 'New York', **fields}
+
+
+@pytest.mark.parametrize('time', ['7:00 PM', '19:00', '10 AM', '6:30 p.m.', '6:00 PM - 8:00 PM',
+                                  '6-8 PM', 'All day'])
+def test_time_formats_are_accepted(time):
+    valid, report = validate_events([make_event(time=time)])
+    assert [event['time'] for event in valid] == [time]
+    assert report['invalid_events'] == 0
+
+
+@pytest.mark.parametrize('time', ['Noon', '7', '25:00', '13:00 PM', 'See website'])
+def test_bad_times_are_reported(time):
+    valid, report = validate_events([make_event(time=time)])
+    assert valid == []
+    assert [error['code'] for error in report['validation_errors']] == ['bad_time']
+
+
+def test_aliases_resolve_and_defaults_apply():
+    valid, report = validate_events([make_event(museum='Museum of Modern Art', title='  Talk  ')])
+    assert report['invalid_events'] == 0
+    assert valid[0]['museum'] == 'moma'
+    assert valid[0]['title'] == 'Talk'
+    assert valid[0]['price'] == 'See website'
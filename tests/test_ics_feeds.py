@@ -0,0 +1,63 @@
+"""
+iCalendar feeds: stable UIDs, times, line folding and incremental writes.
+
+    python -m pytest tests/test_ics_feeds.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from event_keys import event_uid
+from event_model import Event
+from ics_feeds import (build_slices, event_bounds_utc, fold_line, format_utc, generate_feeds,
+                       parse_clock_time, parse_duration_minutes)
+
+EVENT = {'title': 'Artist Talk', 'museum': 'moma', 'date': '2026-11-03', 'time': '6:30 PM',
+         'type': 'lecture', 'duration': '90 minutes', 'city': 'New York'}
+
+
+def test_event_uid_ignores_case_spacing_and_position():
+    moved = {**EVENT, 'id': 42, 'title': '  artist   TALK ', 'description': 'Changed'}
+    assert event_uid(moved) == event_uid(EVENT)
+    assert event_uid({**EVENT, 'date': '2026-11-04'}) != event_uid(EVENT)
+    assert event_uid({**EVENT, 'uid': 'explicit'}) == 'explicit'
+
+
+def test_times_and_durations():
+    assert parse_clock_time('7:00 PM') == (19, 0)
+    assert parse_clock_time('12:15 am') == (0, 15)
+    assert parse_clock_time('19:30') == (19, 30)
+    assert parse_duration_minutes('1 hour 30 minutes') == 90
+    assert parse_duration_minutes('') == 60
+    start, end = event_bounds_utc(EVENT)
+    assert (format_utc(start), format_utc(end)) == ('20261103T233000Z', '20261104T010000Z')
+
+
+def test_long_lines_fold_without_splitting_characters():
+    folded = fold_line('DESCRIPTION:' + 'é' * 80)
+    lines = folded[:-2].split('\r\n ')
+    assert all(len(line.encode('utf-8')) <= 75 for line in lines)
+    assert ''.join(lines) == 'DESCRIPTION:' + 'é' * 80
+
+
+def test_slices_accept_event_objects():
+    slices = build_slices([EVENT, Event.from_json({**EVENT, 'title': 'Curator Tour'})])
+    assert len(slices['institution-moma'][1]) == 2
+    assert len(slices['category-art-museums'][1]) == 2
+    assert len(slices['type-lecture'][1]) == 2
+
+
+def test_only_changed_feeds_are_rewritten(tmp_path):
+    written, _ = generate_feeds([EVENT], str(tmp_path))
+    assert 'institution-moma' in written
+    with open(tmp_path / 'institution-moma.ics', encoding='utf-8', newline='') as f:
+        feed = f.read()
+    assert f'UID:{event_uid(EVENT)}@' in feed
+    assert 'DTSTART:20261103T233000Z\r\n' in feed
+
+    written, _ = generate_feeds([{**EVENT, 'id': 7}], str(tmp_path))
+    assert written == []
+    written, _ = generate_feeds([EVENT, {**EVENT, 'museum': 'met'}], str(tmp_path))
+    assert sorted(written) == ['category-art-museums', 'institution-met', 'type-lecture']
@@ -0,0 +1,84 @@
+"""
+Institution adapters: lazy import, built-in ids and entry-point plugins.
+
+    python -m pytest tests/test_institution_adapters.py
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import institution_adapters
+from institution_adapters import (BUILTIN_ADAPTERS, InstitutionAdapter, InstitutionAdapters, STATIC,
+                                  adapter_ids, get_adapter)
+
+
+def test_listing_ids_imports_no_adapter():
+    code = (
+        'import sys, institution_adapters as a\n'
+        'adapters = a.InstitutionAdapters()\n'
+        'assert list(adapters)[:2] == ["met", "moma"] and "frick" in adapters\n'
+        'loaded = [m for m in sys.modules if m.startswith("institution_adapters.")]\n'
+        'assert loaded == [], loaded\n'
+        'adapters["frick"]\n'
+        'loaded = [m for m in sys.modules if m.startswith("institution_adapters.")]\n'
+        'assert loaded == ["institution_adapters.frick"], loaded\n'
+        'assert "selenium" not in sys.modules\n'
+    )
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True)
+
+
+@pytest.mark.parametrize('institution_id', list(BUILTIN_ADAPTERS))
+def test_builtin_adapter_loads(institution_id):
+    adapter = get_adapter(institution_id)
+    assert adapter.id == institution_id
+    assert adapter.name and adapter.url.startswith('https://')
+    assert adapter.listing_urls
+    assert set(adapter.field_selectors) >= {'title', 'date', 'description', 'link'}
+    assert get_adapter(institution_id) is adapter
+
+
+def test_parse_overrides():
+    assert get_adapter('met').event_type('Monet', '', 'https://www.metmuseum.org/events/exhibitions/x') == 'exhibitions'
+    assert get_adapter('met').event_type('Monet', '', 'https://www.metmuseum.org/events/talks/x') is None
+    assert get_adapter('albertine').clean_title('Reading') == 'Reading'
+
+
+class BrooklynAdapter(InstitutionAdapter):
+    id = 'brooklyn_museum'
+    name = 'Brooklyn Museum'
+    url = 'https://www.brooklynmuseum.org/calendar'
+    fetch_tier = STATIC
+
+
+class FakeEntryPoint:
+    def __init__(self, target):
+        self.target = target
+
+    def load(self):
+        return self.target
+
+
+def test_entry_point_plugins(monkeypatch):
+    monkeypatch.setattr(institution_adapters, '_plugins', {
+        'brooklyn_museum': FakeEntryPoint(BrooklynAdapter),
+        'met': FakeEntryPoint(BrooklynAdapter),  # built-ins win
+    })
+    monkeypatch.setattr(institution_adapters, '_loaded', {})
+
+    assert adapter_ids()[-1] == 'brooklyn_museum'
+    assert adapter_ids().count('met') == 1
+    assert adapter_ids(include_plugins=False) == list(BUILTIN_ADAPTERS)
+    adapters = InstitutionAdapters(['brooklyn_museum', 'met'])
+    assert adapters.catalog()['brooklyn_museum'] == {
+        'name': 'Brooklyn Museum', 'url': 'https://www.brooklynmuseum.org/calendar',
+        'fetch_tier': STATIC, 'max_events': 5,
+    }
+    assert adapters['met'].id == 'met'
+    with pytest.raises(KeyError):
+        adapters['moma']
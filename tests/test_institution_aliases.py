@@ -0,0 +1,51 @@
+"""
+Institution name resolution: spellings the scrapers and CSV use, and near misses.
+
+    python -m pytest tests/test_institution_aliases.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from institution_aliases import canonicalize_events, name_tokens, resolve_institution
+from institution_registry import INSTITUTION_CATEGORIES
+
+
+@pytest.mark.parametrize('name, expected', [
+    ('MET ', 'met'),
+    ('The Metropolitan Museum of Art', 'met'),
+    ("L' Alliance New York", 'lalliance'),
+    ('French Institute Alliance Francaise', 'lalliance'),
+    ('nyhs', 'ny_historical'),
+    ('Morning Side', 'morningside'),
+    ("Women's History", 'womens_history'),
+    ('Grolier Club NYC', 'grolier_club'),
+    ('Explorers Clb', 'explorers_club'),
+    ('Met Opera', None),
+    ("Asia Week at Christie's", None),
+    ('Brooklyn Museum', None),
+    ('', None),
+])
+def test_resolve(name, expected):
+    assert resolve_institution(name) == expected
+
+
+def test_every_registry_id_and_name_resolves_to_itself():
+    for data in INSTITUTION_CATEGORIES.values():
+        for institution in data['institutions']:
+            assert resolve_institution(institution['id']) == institution['id']
+            assert resolve_institution(institution['name']) == institution['id']
+
+
+def test_name_tokens():
+    assert name_tokens("The New-York Historical Society") == ('historical', 'society')
+    assert name_tokens('Fondation Cartier pour l’Art') == ('fondation', 'cartier', 'pour', 'lart')
+
+
+def test_canonicalize_events_leaves_unknown_names():
+    events = [{'museum': 'MET'}, {'museum': 'Brooklyn Museum'}, {'title': 'no museum'}]
+    assert canonicalize_events(events) == [{'museum': 'met'}, {'museum': 'Brooklyn Museum'}, {'title': 'no museum'}]
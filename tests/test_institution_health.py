@@ -0,0 +1,73 @@
+"""
+Circuit breaker, refresh interval and multi-process saves of institution_health.
+
+    python -m pytest tests/test_institution_health.py
+"""
+
+import multiprocessing
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from institution_health import (BASE_COOLDOWN, DEFAULT_INTERVAL, FAILURE_THRESHOLD, OPEN,
+                                UNCHANGED_FACTOR, InstitutionHealth)
+
+START = 1_700_000_000
+
+
+class FakeClock:
+    def __init__(self, now=START):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_circuit_opens_after_threshold(tmp_path):
+    clock = FakeClock()
+    health = InstitutionHealth(str(tmp_path / 'health.json'), clock=clock)
+    for _ in range(FAILURE_THRESHOLD):
+        state = health.record('moma', 0, 1.0, error=TimeoutError('page load'))
+    assert state == OPEN
+    assert health.next_due('moma') == START + BASE_COOLDOWN
+    assert health.check('moma')[0] is False
+
+
+def test_unchanged_listing_backs_off(tmp_path):
+    health = InstitutionHealth(str(tmp_path / 'health.json'), clock=FakeClock())
+    health.record('moma', 5, 1.0, fingerprint='abc')
+    health.record('moma', 5, 1.0, fingerprint='abc')
+    assert health.data['moma']['interval'] == DEFAULT_INTERVAL * UNCHANGED_FACTOR
+
+
+def test_saves_from_two_instances_merge(tmp_path):
+    path = str(tmp_path / 'health.json')
+    first, second = InstitutionHealth(path), InstitutionHealth(path)
+    first.record('moma', 0, 1.0, error='timeout')
+    second.record('moma', 0, 1.0, error='timeout')
+    second.record('met', 4, 1.0)
+    first.save()
+    second.save()
+
+    saved = InstitutionHealth(path)
+    assert saved.data['moma']['consecutive_failures'] == 2
+    assert len(saved.data['moma']['attempts']) == 2
+    assert saved.data['met']['last_success'] is not None
+
+
+def _record_failures(path, count):
+    health = InstitutionHealth(path)
+    for _ in range(count):
+        health.record('moma', 0, 0.1, error='timeout')
+        health.save()
+
+
+def test_concurrent_workers_lose_no_failures(tmp_path):
+    path = str(tmp_path / 'health.json')
+    workers = [multiprocessing.Process(target=_record_failures, args=(path, 10)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert InstitutionHealth(path).data['moma']['consecutive_failures'] == 40
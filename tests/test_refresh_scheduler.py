@@ -0,0 +1,138 @@
+"""
+RefreshScheduler driven with a fake clock and a fake scrape engine.
+
+    python -m pytest tests/test_refresh_scheduler.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from institution_health import InstitutionHealth
+from refresh_scheduler import POLL_SECONDS, RETRY_SECONDS, RefreshScheduler
+from scrape_jobs import COMPLETED, FAILED, RUNNING
+
+START = 1_700_000_000
+
+
+class FakeClock:
+    def __init__(self, now=START):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class FakeEngine:
+    """Jobs end with whatever status the test sets; nothing is scraped."""
+
+    def __init__(self):
+        self.submitted = []
+        self.statuses = {}
+
+    def submit(self, institutions):
+        job_id = f'job{len(self.submitted) + 1}'
+        self.submitted.append((job_id, list(institutions)))
+        self.statuses[job_id] = RUNNING
+        return job_id
+
+    def status(self, job_id):
+        return self.statuses[job_id]
+
+    def events(self, job_id):
+        return []
+
+
+def make_scheduler(tmp_path, clock, engine):
+    health_path = str(tmp_path / 'health.json')
+    scheduler = RefreshScheduler(
+        ['moma'], engine, publish=lambda results: True, clock=clock,
+        state_path=str(tmp_path / 'scheduler.json'),
+        health_factory=lambda: InstitutionHealth(health_path, clock=clock),
+    )
+    return scheduler, health_path
+
+
+def finish_job_and_poll(scheduler, engine, clock, status):
+    scheduler.tick()
+    job_id = engine.submitted[-1][0]
+    engine.statuses[job_id] = status
+    clock.advance(POLL_SECONDS)
+    scheduler.tick()
+    return job_id
+
+
+def test_failed_job_waits_before_retry(tmp_path):
+    clock, engine = FakeClock(), FakeEngine()
+    scheduler, _ = make_scheduler(tmp_path, clock, engine)
+
+    finish_job_and_poll(scheduler, engine, clock, FAILED)
+
+    assert len(engine.submitted) == 1
+    assert scheduler.due['moma'] == clock.now + RETRY_SECONDS
+    clock.advance(RETRY_SECONDS - 1)
+    scheduler.tick()
+    assert len(engine.submitted) == 1
+    clock.advance(1)
+    scheduler.tick()
+    assert len(engine.submitted) == 2
+
+
+def test_completed_job_without_health_record_waits(tmp_path):
+    # e.g. the worker could not start a driver and returned before recording
+    clock, engine = FakeClock(), FakeEngine()
+    scheduler, _ = make_scheduler(tmp_path, clock, engine)
+
+    finish_job_and_poll(scheduler, engine, clock, COMPLETED)
+    finished_at = clock.now
+    for _ in range(10):
+        clock.advance(POLL_SECONDS)
+        scheduler.tick()
+
+    assert len(engine.submitted) == 1
+    assert scheduler.due['moma'] == finished_at + RETRY_SECONDS
+
+
+def test_successful_scrape_uses_health_schedule(tmp_path):
+    clock, engine = FakeClock(), FakeEngine()
+    scheduler, health_path = make_scheduler(tmp_path, clock, engine)
+
+    scheduler.tick()
+    health = InstitutionHealth(health_path, clock=clock)
+    health.record('moma', events_found=5, latency=1.0, fingerprint='abc')
+    health.save()
+    job_id = engine.submitted[-1][0]
+    engine.statuses[job_id] = COMPLETED
+    clock.advance(POLL_SECONDS)
+    scheduler.tick()
+
+    assert scheduler.due['moma'] == InstitutionHealth(health_path, clock=clock).next_due('moma')
+    assert scheduler.due['moma'] > clock.now + RETRY_SECONDS
+
+
+def test_publish_keeps_freshness_of_sources_not_refreshed(tmp_path, monkeypatch):
+    import auto_deploy_events
+    from event_metadata import MetadataAggregator, load_store, save_store
+    from refresh_scheduler import publish_events
+
+    monkeypatch.setattr(auto_deploy_events, 'auto_deploy_scraped_events', lambda: True)
+    path = str(tmp_path / 'events.json')
+    old = [{'title': 'Old Talk', 'museum': 'moma', 'date': '2026-11-03'},
+           {'title': 'Gallery Lecture', 'museum': 'met', 'date': '2026-11-04'}]
+    aggregator = MetadataAggregator()
+    aggregator.add_many(old, timestamp='2026-01-01T00:00:00')
+    save_store(path, old, aggregator)
+
+    fresh = [{'title': 'New Talk', 'museum': 'moma', 'date': '2026-11-05'}]
+    assert publish_events([(['moma'], fresh)], events_file=path)
+
+    events, aggregator, metadata = load_store(path)
+    assert sorted(event['title'] for event in events) == ['Gallery Lecture', 'New Talk']
+    sources = metadata['sources']
+    assert sources['met'] == {'events': 1, 'last_updated': '2026-01-01T00:00:00'}
+    assert sources['moma']['events'] == 1
+    assert sources['moma']['last_updated'] > '2026-01-01T00:00:00'
@@ -0,0 +1,110 @@
+"""
+SQLite job broker: claiming, reaping lost workers, log pruning, and the
+worker pool's kill check.
+
+    python -m pytest tests/test_scrape_broker.py
+"""
+
+import os
+import socket
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrape_broker import (CANCELLED, COMPLETED, FAILED, FINISHED_LOG_LINES, MAX_ATTEMPTS, QUEUED,
+                           RUNNING, ScrapeBroker)
+from scrape_jobs import JobQueueFull
+from scrape_worker import WorkerPool
+
+
+@pytest.fixture
+def broker(tmp_path):
+    return ScrapeBroker(str(tmp_path / 'jobs.sqlite3'), max_queued=3)
+
+
+def test_claims_oldest_job_once(broker):
+    first = broker.enqueue(['moma'])
+    second = broker.enqueue(['met'])
+    assert broker.claim('host-1') == (first, ['moma'])
+    assert broker.claim('host-2') == (second, ['met'])
+    assert broker.claim('host-3') is None
+    assert broker.get(first)['status'] == RUNNING
+    assert broker.get(first)['worker_id'] == 'host-1'
+
+
+def test_queue_is_bounded(broker):
+    for _ in range(3):
+        broker.enqueue(['moma'])
+    with pytest.raises(JobQueueFull):
+        broker.enqueue(['moma'])
+
+
+def test_lost_worker_job_is_requeued_then_failed(broker):
+    job_id = broker.enqueue(['moma'])
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        assert broker.claim(f'host-{attempt}')[0] == job_id
+        time.sleep(0.01)
+        assert broker.reap_stale(0) == [job_id]
+        expected = FAILED if attempt == MAX_ATTEMPTS else QUEUED
+        assert broker.get(job_id)['status'] == expected
+
+
+def test_cancelled_job_of_lost_worker_is_not_requeued(broker):
+    job_id = broker.enqueue(['moma'])
+    broker.claim('host-1')
+    assert broker.cancel(job_id)
+    time.sleep(0.01)
+    broker.reap_stale(0)
+    assert broker.get(job_id)['status'] == CANCELLED
+    assert broker.claim('host-2') is None
+
+
+def test_finish_is_ignored_after_reassignment(broker):
+    job_id = broker.enqueue(['moma'])
+    broker.claim('host-1')
+    time.sleep(0.01)
+    broker.reap_stale(0)
+    broker.claim('host-2')
+    broker.finish(job_id, 'host-1', COMPLETED, events=[{'title': 'Stale'}])
+    assert broker.get(job_id)['status'] == RUNNING
+    broker.finish(job_id, 'host-2', COMPLETED, events=[{'title': 'Fresh'}])
+    assert broker.job_events(job_id) == [{'title': 'Fresh'}]
+
+
+def test_finished_job_log_is_cut_to_its_tail(broker):
+    job_id = broker.enqueue(['moma'])
+    broker.claim('host-1')
+    for i in range(FINISHED_LOG_LINES + 50):
+        broker.append_log(job_id, f'line {i}')
+    broker.finish(job_id, 'host-1', COMPLETED)
+    _, entries = broker.log_tail(job_id, limit=FINISHED_LOG_LINES * 2)
+    assert len(entries) == FINISHED_LOG_LINES
+    assert entries[-1]['message'] == f'line {FINISHED_LOG_LINES + 49}'
+
+
+class FakeProcess:
+    def __init__(self, pid):
+        self.pid = pid
+        self.killed = False
+
+    def is_alive(self):
+        return True
+
+    def kill(self):
+        self.killed = True
+
+
+def test_pool_kills_only_its_own_overdue_workers(tmp_path, monkeypatch):
+    pool = WorkerPool(workers=0, broker_path=str(tmp_path / 'jobs.sqlite3'))
+    own, other = FakeProcess(4242), FakeProcess(4343)
+    pool.processes = [own, other]
+    hostname = socket.gethostname()
+    monkeypatch.setattr(pool.broker, 'overdue_workers',
+                        lambda max_runtime: [f'{hostname}-4242', 'elsewhere-4343', 'garbled', None])
+    pool.size = 2
+    pool.check()
+    assert own.killed
+    assert not other.killed
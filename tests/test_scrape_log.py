@@ -0,0 +1,85 @@
+"""
+ScrapeLog ring buffer, cursor tail, scoped fields and the shared NDJSON writer.
+
+    python -m pytest tests/test_scrape_log.py
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrape_log import ScrapeLog, cursor_arg, shared_writer
+
+
+def quiet_log(capacity=5):
+    return ScrapeLog(capacity=capacity, path=None, echo=False)
+
+
+def test_tail_returns_only_newer_records():
+    log = quiet_log()
+    for n in range(3):
+        log.info(f'message {n}')
+    first = log.tail()
+    assert [e['message'] for e in first['entries']] == ['message 0', 'message 1', 'message 2']
+    assert (first['cursor'], first['dropped']) == (3, 0)
+
+    log.warning('message 3')
+    again = log.tail(first['cursor'])
+    assert [e['seq'] for e in again['entries']] == [4]
+    assert log.tail(again['cursor']) == {'cursor': 4, 'entries': [], 'dropped': 0}
+
+
+def test_tail_counts_records_that_aged_out():
+    log = quiet_log(capacity=5)
+    for n in range(12):
+        log.debug(f'message {n}')
+    tail = log.tail(3)
+    assert [e['seq'] for e in tail['entries']] == [8, 9, 10, 11, 12]
+    assert tail['dropped'] == 4  # 4..7
+    assert [e['seq'] for e in log.tail(3, limit=2, level='info')['entries']] == []
+    assert len(log.lines()) == 5
+
+
+def test_scope_fields_nest_and_unwind():
+    log = quiet_log()
+    with log.scope(job='j1'):
+        with log.scope(institution='moma'):
+            log.info('inside')
+        log.info('outer')
+    log.info('after')
+    entries = log.tail()['entries']
+    assert (entries[0]['job'], entries[0]['institution']) == ('j1', 'moma')
+    assert entries[1]['job'] == 'j1' and 'institution' not in entries[1]
+    assert 'job' not in entries[2]
+    with pytest.raises(ValueError):
+        log.log('bad', level='critical')
+
+
+def test_logs_share_one_writer_per_file(tmp_path):
+    path = str(tmp_path / 'scrape_log.ndjson')
+    first = ScrapeLog(path=path, echo=False)
+    second = ScrapeLog(path=path, echo=False)
+    assert first.writer is second.writer is shared_writer(path, echo=False)
+
+    first.info('from first', institution='met')
+    second.info('from second')
+    first.writer.close()
+
+    with open(path, encoding='utf-8') as f:
+        records = [json.loads(line) for line in f]
+    assert [r['message'] for r in records] == ['from first', 'from second']
+    assert records[0]['institution'] == 'met'
+
+
+def test_status_fields_and_cursor_arg():
+    log = quiet_log()
+    log.info('one')
+    assert log.status_fields()['log_cursor'] == 1
+    assert log.status_fields(cursor=0)['log_entries'][0]['message'] == 'one'
+    assert cursor_arg({'cursor': '41'}) == 41
+    assert cursor_arg({'cursor': 'x'}) is None
+    assert cursor_arg({}) is None
@@ -0,0 +1,86 @@
+"""
+Search index: tokenization, ranking and parity with frontend/src/searchIndex.js.
+
+    python -m pytest tests/test_search_index.py
+
+The parity test runs the frontend module under Node and is skipped when
+`node` is not installed.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from event_keys import event_uid
+from search_index import build_index, search, stem, tokenize, write_index
+
+EVENTS = [
+    {'title': 'Jazz Lectures at the Café', 'museum': 'moma', 'date': '2026-11-03', 'time': '6:00 PM',
+     'description': 'An evening of listening and talking about jazz classes.'},
+    {'title': 'Curator Tour', 'museum': 'met', 'date': '2026-11-10', 'time': '2:00 PM',
+     'description': 'Galleries of Greek and Roman sculpture.'},
+    {'title': 'Members Evening', 'museum': 'frick', 'date': '2026-11-12', 'time': '7:00 PM',
+     'description': 'Jazz in the garden court.'},
+    {'title': 'Libraries of the Campus', 'museum': 'grolier_club', 'date': '2026-12-01', 'time': '5:30 PM'},
+]
+
+QUERIES = ['jazz', 'jazz lect', 'jazz lect ', 'JAZZ  evening', 'cafe', 'metropolitan',
+           'the of and', 'librar', 'libraries', 'campus', 'galleries greek', 'classes', 'xyz', '']
+
+WORDS = ['lectures', 'libraries', 'classes', 'class', 'campus', 'talking', 'listened', 'quickly',
+         'arts', 'bus', 'is', 'sses', 'dresses']
+
+
+def test_tokenize_folds_stems_and_drops_stop_words():
+    assert tokenize('The Café Lectures of Libraries') == ['cafe', 'lecture', 'library']
+    assert [stem(word) for word in ('class', 'campus', 'bus', 'talking')] == ['class', 'campus', 'bus', 'talk']
+
+
+def test_search_ranks_title_matches_first():
+    index = build_index(EVENTS)
+    uids = [uid for uid, _ in search(index, 'jazz')]
+    assert uids == [event_uid(EVENTS[0]), event_uid(EVENTS[2])]
+    assert [uid for uid, _ in search(index, 'jazz lect')] == [event_uid(EVENTS[0])]
+    assert search(index, 'jazz lect ') == []
+    assert [uid for uid, _ in search(index, 'metropolitan')] == [event_uid(EVENTS[1])]
+
+
+def test_write_index_skips_unchanged(tmp_path):
+    path = str(tmp_path / 'search_index.json')
+    assert write_index(EVENTS, path)[1]
+    assert not write_index(EVENTS, path)[1]
+    assert write_index(EVENTS[:2], path)[1]
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+def test_frontend_search_matches_python(tmp_path):
+    index = build_index(EVENTS)
+    shutil.copy(os.path.join(ROOT, 'frontend', 'src', 'searchIndex.js'), tmp_path / 'searchIndex.mjs')
+    (tmp_path / 'index.json').write_text(json.dumps(index))
+    (tmp_path / 'parity.mjs').write_text(
+        "import { readFileSync } from 'fs';\n"
+        "import { searchIndex, stem } from './searchIndex.mjs';\n"
+        "const index = JSON.parse(readFileSync(process.argv[2], 'utf8'));\n"
+        "const input = JSON.parse(process.argv[3]);\n"
+        "console.log(JSON.stringify({\n"
+        "  stems: input.words.map(stem),\n"
+        "  results: input.queries.map((query) => searchIndex(index, query)),\n"
+        "}));\n"
+    )
+    result = subprocess.run(
+        ['node', str(tmp_path / 'parity.mjs'), str(tmp_path / 'index.json'),
+         json.dumps({'words': WORDS, 'queries': QUERIES})],
+        capture_output=True, text=True, check=True, timeout=60,
+    )
+    frontend = json.loads(result.stdout)
+
+    assert frontend['stems'] == [stem(word) for word in WORDS]
+    for query, uids in zip(QUERIES, frontend['results']):
+        assert uids == [uid for uid, _ in search(index, query)], query
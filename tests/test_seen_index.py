@@ -0,0 +1,72 @@
+"""
+Seen index: Bloom filter error bound, exact confirmation and persistence.
+
+    python -m pytest tests/test_seen_index.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from seen_index import KnownEvents, ScalableBloomFilter, SeenIndex, normalize_url, url_key
+
+ERROR_RATE = 0.01
+PROBES = 50000
+
+
+@pytest.mark.parametrize('initial_capacity', [100, 1000])
+def test_scalable_bloom_stays_within_error_rate(initial_capacity):
+    bloom = ScalableBloomFilter(initial_capacity, ERROR_RATE)
+    for i in range(20000):
+        bloom.add(f'url:https://example.org/events/{i}')
+
+    assert len(bloom.filters) > 1
+    assert sum(f.error_rate for f in bloom.filters) < ERROR_RATE
+    assert all(f'url:https://example.org/events/{i}' in bloom for i in range(0, 20000, 7))
+    false_positives = sum(f'url:https://example.org/other/{i}' in bloom for i in range(PROBES))
+    # Hashing is deterministic, so this measures the same filter every run
+    assert false_positives / PROBES < ERROR_RATE
+
+
+def test_false_positive_is_confirmed_against_exact_set(tmp_path):
+    index = SeenIndex(str(tmp_path / 'seen.sqlite3'))
+    index.bloom.add('url:https://example.org/only-in-filter')
+    assert not index.contains('url:https://example.org/only-in-filter')
+    assert index.stats['false_positives'] == 1
+    index.close()
+
+
+def test_marks_persist_only_when_committed(tmp_path):
+    path = str(tmp_path / 'seen.sqlite3')
+    index = SeenIndex(path)
+    index.mark(url='https://www.example.org/talk/?utm_source=mail', title='Artist Talk', date='2026-11-03')
+    index.close()
+
+    index = SeenIndex(path)
+    assert len(index.bloom) == 2  # loaded, not rebuilt
+    assert index.seen_url('https://example.org/talk#tickets')
+    assert index.seen_event('ARTIST  TALK', '2026-11-03')
+    index.mark(url='https://example.org/tour')
+    index.close(commit=False)
+
+    index = SeenIndex(path)
+    assert not index.seen_url('https://example.org/tour')
+    index.close()
+
+
+def test_normalize_url():
+    assert normalize_url('http://WWW.Example.org/a/?b=2&a=1&fbclid=x#frag') == 'https://example.org/a?a=1&b=2'
+    assert normalize_url('mailto:info@example.org') == ''
+    assert url_key('') is None
+
+
+def test_known_events_found_by_url_or_fingerprint():
+    talk = {'title': 'Artist Talk', 'date': '2026-11-03', 'link': 'https://example.org/talk'}
+    tour = {'title': 'Curator Tour', 'date': '2026-11-10', 'link': 'https://example.org/events'}
+    known = KnownEvents([talk, tour])
+    assert known.find(url='https://www.example.org/talk/') is talk
+    assert known.find(url='https://example.org/unknown', title='curator tour', date='2026-11-10') is tour
+    assert known.find(title='Curator Tour', date='2026-11-11') is None
@@ -0,0 +1,43 @@
+"""
+Selector ranking and multi-process saves of selector_learning.SelectorStats.
+
+    python -m pytest tests/test_selector_learning.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selector_learning import MAX_DISCOVERED, SelectorStats
+
+
+def test_rank_prefers_hits_and_keeps_configured_order_on_ties(tmp_path):
+    stats = SelectorStats(str(tmp_path / 'stats.json'))
+    assert stats.rank('moma', ['.event', '.card', '.item']) == ['.event', '.card', '.item']
+    stats.record('moma', '.event', 0)
+    stats.record('moma', '.item', 3)
+    assert stats.rank('moma', ['.event', '.card', '.item']) == ['.item', '.card', '.event']
+
+
+def test_saves_from_two_instances_merge(tmp_path):
+    path = str(tmp_path / 'stats.json')
+    first, second = SelectorStats(path), SelectorStats(path)
+    first.record('moma', '.event', 2)
+    second.record('moma', '.event', 0)
+    second.record_strategy('moma', 'cards')
+    second.add_discovered('moma', ['div.card'])
+    first.save()
+    second.save()
+
+    saved = SelectorStats(path)
+    counts = saved.data['moma']['selectors']['.event']
+    assert (counts['hits'], counts['misses'], counts['events']) == (1, 1, 2)
+    assert saved.preferred_strategy('moma') == 'cards'
+    assert saved.discovered('moma') == ['div.card']
+
+
+def test_discovered_selectors_are_capped(tmp_path):
+    stats = SelectorStats(str(tmp_path / 'stats.json'))
+    stats.add_discovered('moma', [f'div.card-{i}' for i in range(MAX_DISCOVERED + 2)])
+    assert stats.discovered('moma') == [f'div.card-{i}' for i in range(2, MAX_DISCOVERED + 2)]
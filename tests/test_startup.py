@@ -0,0 +1,44 @@
+"""
+Import-time budget of the batch commands (python events_cli.py check-startup).
+
+    python -m pytest tests/test_startup.py
+"""
+
+import ast
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from events_cli import (COMMAND_MODULES, FAST_COMMANDS, HEAVY_MODULES, ROOT, STARTUP_BUDGET_MS,
+                        import_time)
+
+
+def deferred_imports(path, function):
+    """Root modules imported inside `function` of the module at `path`."""
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    node = next(n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name == function)
+    modules = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.ImportFrom) and child.module:
+            modules.add(child.module.split('.')[0])
+        elif isinstance(child, ast.Import):
+            modules.update(alias.name.split('.')[0] for alias in child.names)
+    return {name for name in modules if os.path.exists(os.path.join(ROOT, f'{name}.py'))}
+
+
+def test_deploy_modules_cover_the_deploy_path():
+    path = os.path.join(ROOT, 'auto_deploy_events.py')
+    missing = deferred_imports(path, 'auto_deploy_scraped_events') - set(COMMAND_MODULES['deploy'])
+    assert not missing
+
+
+@pytest.mark.parametrize('command', FAST_COMMANDS)
+def test_command_imports_within_budget(command):
+    total_ms, imported = import_time(command)
+    heavy = {name.split('.')[0] for name in imported} & set(HEAVY_MODULES)
+    assert not heavy
+    assert total_ms <= STARTUP_BUDGET_MS